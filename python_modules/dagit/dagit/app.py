@@ -10,6 +10,7 @@
 from dagster.core.execution.compute_logs import warn_if_compute_logs_disabled
 from dagster.core.instance import is_dagit_telemetry_enabled
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
 from dagster.core.telemetry import log_workspace_stats
 from dagster.core.workspace.context import IWorkspaceProcessContext, WorkspaceProcessContext
 from dagster.seven import json
@@ -106,6 +107,12 @@ def view(run_id, step_key, file_type):
         try:
             io_type = ComputeIOType(file_type)
             result = manager.get_local_path(run_id, step_key, io_type)
+            if not os.path.exists(result) and isinstance(manager, LocalComputeLogManager):
+                # the logs of finished steps may have been compressed
+                compressed_result = manager.get_compressed_path(run_id, step_key, io_type)
+                if compressed_result:
+                    result = compressed_result
+                    out_name = f"{out_name}{os.path.splitext(compressed_result)[1]}"
             if not os.path.exists(result):
                 result = io.BytesIO()
             timeout = None if manager.is_watch_completed(run_id, step_key) else 0
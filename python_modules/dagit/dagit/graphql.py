@@ -1,16 +1,22 @@
+import os
 from abc import ABC, abstractmethod
 from asyncio import Queue, get_event_loop
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Union
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 
 from dagit.templates.playground import TEMPLATE
 from dagster import check
+from dagster_graphql.implementation.response_cache import (
+    ResponseCache,
+    get_response_cache_key,
+    is_mutation,
+)
 from graphene import Schema
 from graphql.error import GraphQLError
 from graphql.error import format_error as format_graphql_error
 from graphql.execution import ExecutionResult
 from rx import Observable
-from rx.concurrency import thread_pool_scheduler
+from rx.concurrency import ThreadPoolScheduler
 from starlette import status
 from starlette.applications import Starlette
 from starlette.concurrency import run_in_threadpool
@@ -38,13 +44,75 @@ class GraphQLWS(str, Enum):
     STOP = "stop"
 
 
+def get_subscription_max_workers() -> int:
+    return int(os.getenv("DAGIT_SUBSCRIPTION_MAX_WORKERS", "32"))
+
+
 class GraphQLServer(ABC):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(self, app_path_prefix: str = "", subscription_max_workers: Optional[int] = None):
         self._app_path_prefix = app_path_prefix
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
 
+        # GraphQL operations are executed with starlette's run_in_threadpool, which already runs
+        # them on the event loop's bounded default executor in a copy of the current context.
+        # Subscription observables are scheduled on a bounded pool of their own, rather than rx's
+        # global scheduler, which starts a thread for every subscription.
+        subscription_max_workers = (
+            check.opt_int_param(subscription_max_workers, "subscription_max_workers")
+            or get_subscription_max_workers()
+        )
+        self._subscription_scheduler = ThreadPoolScheduler(max_workers=subscription_max_workers)
+
+        self._response_cache = self.build_response_cache()
+
+    def _execute_graphql(self, conn: HTTPConnection, query, **kwargs):
+        return self._graphql_schema.execute(
+            query,
+            context=self.make_request_context(conn),
+            **kwargs,
+        )
+
+    def _execute_graphql_query(
+        self, conn: HTTPConnection, query, variables, operation_name
+    ) -> ExecutionResult:
+        cache = self._response_cache
+        if not cache or not cache.is_cacheable(operation_name):
+            result = self._execute_graphql(
+                conn,
+                query,
+                variables=variables,
+                operation_name=operation_name,
+                middleware=self._graphql_middleware,
+            )
+            if cache and is_mutation(query, operation_name):
+                cache.invalidate()
+            return result
+
+        request_context = self.make_request_context(conn)
+        return cache.get_or_execute(
+            get_response_cache_key(request_context, query, variables, operation_name),
+            lambda: self._graphql_schema.execute(
+                query,
+                context=request_context,
+                variables=variables,
+                operation_name=operation_name,
+                middleware=self._graphql_middleware,
+            ),
+        )
+
+    def build_response_cache(self) -> Optional[ResponseCache]:
+        return None
+
+    async def response_cache_stats_endpoint(self, _request: Request):
+        if not self._response_cache:
+            return JSONResponse({"enabled": False})
+
+        return JSONResponse(
+            {"enabled": self._response_cache.enabled, **self._response_cache.get_stats().to_dict()}
+        )
+
     @abstractmethod
     def build_graphql_schema(self) -> Schema:
         raise NotImplementedError()
@@ -113,12 +181,7 @@ async def graphql_http_endpoint(self, request: Request):
         operation_name = data.get("operationName")
 
         result = await run_in_threadpool(
-            self._graphql_schema.execute,
-            query,
-            variables=variables,
-            operation_name=operation_name,
-            context=self.make_request_context(request),
-            middleware=self._graphql_middleware,
+            self._execute_graphql_query, request, query, variables, operation_name
         )
 
         error_data = [format_graphql_error(err) for err in result.errors] if result.errors else None
@@ -162,14 +225,16 @@ async def graphql_ws_endpoint(self, websocket: WebSocket):
                         variables = data.get("variables")
                         operation_name = data.get("operation_name")
 
-                        request_context = self.make_request_context(websocket)
-                        async_result = self._graphql_schema.execute(
+                        async_result = await run_in_threadpool(
+                            self._execute_graphql,
+                            websocket,
                             query,
                             variables=variables,
                             operation_name=operation_name,
-                            context=request_context,
                             allow_subscriptions=True,
                         )
+                        if self._response_cache and is_mutation(query, operation_name):
+                            self._response_cache.invalidate()
                     except GraphQLError as error:
                         payload = format_graphql_error(error)
                         await _send_message(websocket, GraphQLWS.ERROR, payload, operation_id)
@@ -186,7 +251,7 @@ async def graphql_ws_endpoint(self, websocket: WebSocket):
 
                     # in the future we should get back async gen directly, back compat for now
                     disposable, async_gen = _disposable_and_async_gen_from_obs(
-                        async_result, event_loop
+                        async_result, event_loop, self._subscription_scheduler
                     )
 
                     observables[operation_id] = disposable
@@ -262,7 +327,7 @@ async def _send_message(
     return await websocket.send_json(data)
 
 
-def _disposable_and_async_gen_from_obs(obs: Observable, loop):
+def _disposable_and_async_gen_from_obs(obs: Observable, loop, scheduler: ThreadPoolScheduler):
     """
     Compatability layer for legacy Observable to async generator
 
@@ -272,7 +337,7 @@ def _disposable_and_async_gen_from_obs(obs: Observable, loop):
     queue: Queue = Queue()
 
     # process observable in a thread, handle results in aio loop
-    disposable = obs.subscribe_on(thread_pool_scheduler).subscribe(
+    disposable = obs.subscribe_on(scheduler).subscribe(
         on_next=lambda i: loop.call_soon_threadsafe(queue.put_nowait, i)
     )
 
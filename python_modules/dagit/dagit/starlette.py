@@ -2,7 +2,7 @@
 import io
 import uuid
 from os import path
-from typing import List
+from typing import List, Optional
 
 import nbformat
 from dagster import DagsterInstance
@@ -11,10 +11,17 @@
 from dagster.cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster.core.debug import DebugRunPayload
 from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
 from dagster.core.workspace.context import WorkspaceProcessContext, WorkspaceRequestContext
 from dagster.seven import json
 from dagster.utils import Counter, traced_counter
 from dagster_graphql import __version__ as dagster_graphql_version
+from dagster_graphql.implementation.response_cache import (
+    ResponseCache,
+    get_instance_watermark,
+    get_response_cache_ttl,
+    get_response_cache_watermark_interval,
+)
 from dagster_graphql.schema import create_schema
 from graphene import Schema
 from nbconvert import HTMLExporter
@@ -50,9 +57,14 @@
 
 
 class DagitWebserver(GraphQLServer):
-    def __init__(self, process_context: WorkspaceProcessContext, app_path_prefix: str = ""):
+    def __init__(
+        self,
+        process_context: WorkspaceProcessContext,
+        app_path_prefix: str = "",
+        subscription_max_workers: Optional[int] = None,
+    ):
         self._process_context = process_context
-        super().__init__(app_path_prefix)
+        super().__init__(app_path_prefix, subscription_max_workers)
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -60,6 +72,14 @@ def build_graphql_schema(self) -> Schema:
     def build_graphql_middleware(self) -> list:
         return []
 
+    def build_response_cache(self) -> ResponseCache:
+        instance = self._process_context.instance
+        return ResponseCache(
+            ttl_seconds=get_response_cache_ttl(),
+            get_watermark=lambda: get_instance_watermark(instance),
+            watermark_interval_seconds=get_response_cache_watermark_interval(),
+        )
+
     def relative_path(self, rel: str) -> str:
         return path.join(path.dirname(__file__), rel)
 
@@ -117,24 +137,28 @@ async def download_compute_logs_endpoint(self, request: Request):
         step_key = request.path_params["step_key"]
         file_type = request.path_params["file_type"]
         context = self.make_request_context(request)
+        manager = context.instance.compute_log_manager
 
-        file = context.instance.compute_log_manager.get_local_path(
+        file = manager.get_local_path(
             run_id,
             step_key,
             ComputeIOType(file_type),
         )
+        filename = f"{run_id}_{step_key}.{file_type}"
+
+        if not path.exists(file) and isinstance(manager, LocalComputeLogManager):
+            # the logs of finished steps may have been compressed
+            compressed_file = manager.get_compressed_path(
+                run_id, step_key, ComputeIOType(file_type)
+            )
+            if compressed_file:
+                file = compressed_file
+                filename = f"{filename}{path.splitext(compressed_file)[1]}"
 
         if not path.exists(file):
             raise HTTPException(404)
 
-        return FileResponse(
-            context.instance.compute_log_manager.get_local_path(
-                run_id,
-                step_key,
-                ComputeIOType(file_type),
-            ),
-            filename=f"{run_id}_{step_key}.{file_type}",
-        )
+        return FileResponse(file, filename=filename)
 
     def index_html_endpoint(self, _request: Request):
         """
@@ -199,6 +223,7 @@ def build_routes(self):
         return (
             [
                 Route("/dagit_info", self.dagit_info_endpoint),
+                Route("/graphql_cache_stats", self.response_cache_stats_endpoint),
                 Route(
                     "/graphql",
                     self.graphql_http_endpoint,
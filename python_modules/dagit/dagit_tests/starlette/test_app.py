@@ -69,6 +69,25 @@ def test_graphql_post(empty_app):
     assert response.json() == {"data": {"__typename": "DagitQuery"}}
 
 
+def test_graphql_response_cache(empty_app):
+    client = TestClient(empty_app)
+    stats = client.get("/graphql_cache_stats").json()
+    assert stats["enabled"]
+
+    query = {
+        "query": "query RootWorkspaceQuery { __typename }",
+        "operationName": "RootWorkspaceQuery",
+    }
+    for _ in range(3):
+        response = client.post("/graphql", json=query)
+        assert response.status_code == 200, response.text
+        assert response.json() == {"data": {"__typename": "DagitQuery"}}
+
+    new_stats = client.get("/graphql_cache_stats").json()
+    assert new_stats["hits"] - stats["hits"] >= 2
+    assert new_stats["misses"] - stats["misses"] <= 1
+
+
 def test_graphql_ws_error(empty_app):
     # wtf pylint
     # pylint: disable=not-context-manager
@@ -1,5 +1,6 @@
 from dagster import AssetKey, DagsterEventType, EventRecordsFilter, check, seven
 
+from .loader import get_batch_run_loader
 from .utils import capture_error
 
 
@@ -64,22 +65,33 @@ def get_asset_nodes_by_asset_key(graphene_info):
 def get_asset_nodes(graphene_info):
     from ..schema.asset_graph import GrapheneAssetNode
 
-    return [
-        GrapheneAssetNode(repository, external_asset_node)
+    external_asset_nodes = [
+        (repository, external_asset_node)
         for location in graphene_info.context.repository_locations
         for repository in location.get_repositories().values()
         for external_asset_node in repository.get_external_asset_nodes()
     ]
+    get_batch_run_loader(graphene_info).add_asset_keys(
+        [external_asset_node.asset_key for _, external_asset_node in external_asset_nodes]
+    )
+    return [
+        GrapheneAssetNode(repository, external_asset_node)
+        for repository, external_asset_node in external_asset_nodes
+    ]
 
 
 def get_asset_node(graphene_info, asset_key):
+    from ..schema.asset_graph import GrapheneAssetNode
     from ..schema.errors import GrapheneAssetNotFoundError
 
     check.inst_param(asset_key, "asset_key", AssetKey)
-    node = next((n for n in get_asset_nodes(graphene_info) if n.assetKey == asset_key), None)
-    if not node:
-        return GrapheneAssetNotFoundError(asset_key=asset_key)
-    return node
+    for location in graphene_info.context.repository_locations:
+        for repository in location.get_repositories().values():
+            external_asset_node = repository.get_external_asset_node(asset_key)
+            if external_asset_node:
+                return GrapheneAssetNode(repository, external_asset_node)
+
+    return GrapheneAssetNotFoundError(asset_key=asset_key)
 
 
 def get_asset(graphene_info, asset_key):
@@ -5,8 +5,7 @@
     RepositoryHandle,
     RepositorySelector,
 )
-from dagster.core.storage.pipeline_run import PipelineRunsFilter
-from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, TagType, get_tag_type
+from dagster.core.storage.tags import TagType, get_tag_type
 from graphql.execution.base import ResolveInfo
 
 from .utils import capture_error
@@ -178,25 +177,20 @@ def get_partition_set_partition_statuses(graphene_info, repository_handle, parti
     result = graphene_info.context.get_external_partition_names(
         repository_handle, partition_set_name
     )
-    all_partition_set_runs = graphene_info.context.instance.get_runs(
-        PipelineRunsFilter(tags={PARTITION_SET_TAG: partition_set_name})
-    )
-    runs_by_partition = {}
-    for run in all_partition_set_runs:
-        partition_name = run.tags.get(PARTITION_NAME_TAG)
-        if not partition_name or partition_name in runs_by_partition:
-            # all_partition_set_runs is in descending order by creation time, we should ignore
-            # runs for the same partition if we've already considered the partition
-            continue
-        runs_by_partition[partition_name] = run
+    run_partition_data_by_name = {
+        run_partition_data.partition: run_partition_data
+        for run_partition_data in graphene_info.context.instance.get_run_partition_data(
+            partition_set_name, partition_keys=result.partition_names
+        )
+    }
 
     return GraphenePartitionStatuses(
         results=[
             GraphenePartitionStatus(
                 id=f"{partition_set_name}:{partition_name}",
                 partitionName=partition_name,
-                runStatus=runs_by_partition[partition_name].status
-                if runs_by_partition.get(partition_name)
+                runStatus=run_partition_data_by_name[partition_name].status
+                if run_partition_data_by_name.get(partition_name)
                 else None,
             )
             for partition_name in result.partition_names
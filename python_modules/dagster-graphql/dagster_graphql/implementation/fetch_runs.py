@@ -9,6 +9,7 @@
 from graphql.execution.base import ResolveInfo
 
 from .external import ensure_valid_config, get_external_pipeline_or_raise
+from .loader import get_batch_run_loader
 from .utils import UserFacingGraphQLError, capture_error
 
 
@@ -77,10 +78,9 @@ def get_run_group(graphene_info, run_id):
         return GrapheneRunGroupNotFoundError(run_id)
     root_run_id, run_group = result
     run_group_run_ids = [run.run_id for run in run_group]
-    records_by_id = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(PipelineRunsFilter(run_ids=run_group_run_ids))
-    }
+    records = instance.get_run_records(PipelineRunsFilter(run_ids=run_group_run_ids))
+    get_batch_run_loader(graphene_info).add_run_records(records)
+    records_by_id = {record.pipeline_run.run_id: record for record in records}
     return GrapheneRunGroup(
         root_run_id=root_run_id,
         runs=[GrapheneRun(records_by_id.get(run_id)) for run_id in run_group_run_ids],
@@ -95,11 +95,10 @@ def get_runs(graphene_info, filters, cursor=None, limit=None):
     check.opt_int_param(limit, "limit")
 
     instance = graphene_info.context.instance
+    records = instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+    get_batch_run_loader(graphene_info).add_run_records(records)
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    return [GrapheneRun(record) for record in records]
 
 
 IN_PROGRESS_STATUSES = [
@@ -117,29 +116,40 @@ def get_in_progress_runs_by_step(graphene_info, job_names, step_keys):
 
     instance = graphene_info.context.instance
 
-    in_progress_records = []
-    for job_name in job_names:
-        in_progress_records.extend(
-            instance.get_run_records(
-                PipelineRunsFilter(pipeline_name=job_name, statuses=IN_PROGRESS_STATUSES)
-            )
+    # fetch the in progress runs of all of the jobs, along with their step stats and execution plan
+    # snapshots, in a constant number of queries
+    job_names = sorted(set(job_names))
+    if not job_names:
+        return []
+
+    in_progress_records = instance.get_run_records(
+        PipelineRunsFilter(pipeline_names=job_names, statuses=IN_PROGRESS_STATUSES)
+    )
+    run_ids = [record.pipeline_run.run_id for record in in_progress_records]
+    step_stats_by_run_id = instance.get_run_step_stats_by_run_id(run_ids, step_keys)
+    execution_plan_snapshots = instance.get_execution_plan_snapshots(
+        list(
+            {
+                record.pipeline_run.execution_plan_snapshot_id
+                for record in in_progress_records
+                if record.pipeline_run.execution_plan_snapshot_id
+            }
         )
+    )
 
     in_progress_runs_by_step = {}
     unstarted_runs_by_step = {}
 
     for record in in_progress_records:
         run = record.pipeline_run
-        step_stats = graphene_info.context.instance.get_run_step_stats(run.run_id, step_keys)
+        step_stats = step_stats_by_run_id[run.run_id]
         for step_stat in step_stats:
             if step_stat.status == StepEventStatus.IN_PROGRESS:
                 if step_stat.step_key not in in_progress_runs_by_step:
                     in_progress_runs_by_step[step_stat.step_key] = []
                 in_progress_runs_by_step[step_stat.step_key].append(GrapheneRun(record))
 
-        asset_names = graphene_info.context.instance.get_execution_plan_snapshot(
-            run.execution_plan_snapshot_id
-        ).step_keys_to_execute
+        asset_names = execution_plan_snapshots[run.execution_plan_snapshot_id].step_keys_to_execute
 
         for step_key in asset_names:
             # step_stats only contains stats for steps that are in progress or complete
@@ -179,10 +189,9 @@ def get_run_groups(graphene_info, filters=None, cursor=None, limit=None):
     instance = graphene_info.context.instance
     run_groups = instance.get_run_groups(filters=filters, cursor=cursor, limit=limit)
     run_ids = {run.run_id for run_group in run_groups.values() for run in run_group.get("runs", [])}
-    records_by_ids = {
-        record.pipeline_run.run_id: record
-        for record in instance.get_run_records(PipelineRunsFilter(run_ids=list(run_ids)))
-    }
+    records = instance.get_run_records(PipelineRunsFilter(run_ids=list(run_ids)))
+    get_batch_run_loader(graphene_info).add_run_records(records)
+    records_by_ids = {record.pipeline_run.run_id: record for record in records}
 
     for root_run_id in run_groups:
         run_groups[root_run_id]["runs"] = [
@@ -233,7 +242,7 @@ def get_execution_plan(graphene_info, selector, run_config, mode):
 def get_stats(graphene_info, run_id):
     from ..schema.pipelines.pipeline_run_stats import GrapheneRunStatsSnapshot
 
-    stats = graphene_info.context.instance.get_run_stats(run_id)
+    stats = get_batch_run_loader(graphene_info).get_run_stats(run_id)
     stats.id = "stats-{run_id}"
     return GrapheneRunStatsSnapshot(stats)
 
@@ -241,5 +250,8 @@ def get_stats(graphene_info, run_id):
 def get_step_stats(graphene_info, run_id, step_keys=None):
     from ..schema.logs.events import GrapheneRunStepStats
 
-    step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    if step_keys:
+        step_stats = graphene_info.context.instance.get_run_step_stats(run_id, step_keys)
+    else:
+        step_stats = get_batch_run_loader(graphene_info).get_run_step_stats(run_id)
     return [GrapheneRunStepStats(stats) for stats in step_stats]
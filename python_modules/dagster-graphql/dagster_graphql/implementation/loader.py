@@ -1,11 +1,19 @@
 from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional
 
-from dagster import DagsterInstance, check
+from dagster import AssetKey, DagsterInstance, check
+from dagster.core.events.log import EventLogEntry
+from dagster.core.execution.stats import RunStepKeyStatsSnapshot
 from dagster.core.host_representation import ExternalRepository
 from dagster.core.scheduler.instigation import InstigatorType
-from dagster.core.storage.pipeline_run import JobBucket, TagBucket
+from dagster.core.snap import ExecutionPlanSnapshot
+from dagster.core.storage.pipeline_run import (
+    JobBucket,
+    PipelineRunStatsSnapshot,
+    RunRecord,
+    TagBucket,
+)
 from dagster.core.storage.tags import SCHEDULE_NAME_TAG, SENSOR_NAME_TAG
 
 
@@ -142,3 +150,100 @@ def get_sensor_state(self, sensor_state):
         )
         states = self._get(RepositoryDataType.SENSOR_STATES, sensor_state, 1)
         return states[0] if states else None
+
+
+class RunDataType(Enum):
+    RUN_STATS = "run_stats"
+    STEP_STATS = "step_stats"
+    EXECUTION_PLAN_SNAPSHOTS = "execution_plan_snapshots"
+    LATEST_MATERIALIZATIONS = "latest_materializations"
+
+
+class BatchRunLoader:
+    """
+    A request-scoped batch loader for the data that is fetched for each run or asset in a graphql
+    request: run stats, step stats, execution plan snapshots and latest asset materializations.
+    This loader is instantiated once per request, see `get_batch_run_loader`.
+
+    Whenever a list of runs (or asset nodes) is resolved, its records (or asset keys) are added to
+    the loader. The first time a piece of data is requested for one of them, it is fetched for all
+    of the added runs (or assets) that don't have it yet in a single roundtrip to the DB.
+
+    Example: When the stats of the first run on the runs page are requested, the stats of every run
+    on the page are fetched in one query, and the other runs read them from the in-memory loader
+    cache, so the page costs a constant number of queries instead of one per run.
+    """
+
+    def __init__(self, instance: DagsterInstance):
+        self._instance = instance
+        self._run_records: Dict[str, RunRecord] = {}
+        self._asset_keys: Dict[AssetKey, None] = {}
+        self._data: Dict[RunDataType, Dict[Any, Any]] = defaultdict(dict)
+
+    def add_run_records(self, records: Iterable[RunRecord]):
+        for record in check.list_param(list(records), "records", of_type=RunRecord):
+            self._run_records[record.pipeline_run.run_id] = record
+
+    def add_asset_keys(self, asset_keys: Iterable[AssetKey]):
+        for asset_key in check.list_param(list(asset_keys), "asset_keys", of_type=AssetKey):
+            self._asset_keys[asset_key] = None
+
+    def _get(self, data_type, key):
+        check.inst_param(data_type, "data_type", RunDataType)
+        if key not in self._data[data_type]:
+            self._fetch(data_type, key)
+        return self._data[data_type].get(key)
+
+    def _fetch(self, data_type, key):
+        # fetch the requested key along with every other known key that hasn't been fetched yet
+        fetched = self._data[data_type]
+        if data_type == RunDataType.EXECUTION_PLAN_SNAPSHOTS:
+            known_keys = [
+                record.pipeline_run.execution_plan_snapshot_id
+                for record in self._run_records.values()
+                if record.pipeline_run.execution_plan_snapshot_id
+            ]
+        elif data_type == RunDataType.LATEST_MATERIALIZATIONS:
+            known_keys = list(self._asset_keys)
+        else:
+            known_keys = list(self._run_records)
+        keys = list(dict.fromkeys([key] + [k for k in known_keys if k not in fetched]))
+
+        if data_type == RunDataType.RUN_STATS:
+            fetched.update(self._instance.get_run_stats_by_run_id(keys))
+        elif data_type == RunDataType.STEP_STATS:
+            fetched.update(self._instance.get_run_step_stats_by_run_id(keys))
+        elif data_type == RunDataType.EXECUTION_PLAN_SNAPSHOTS:
+            snapshots = self._instance.get_execution_plan_snapshots(keys)
+            fetched.update({snapshot_id: snapshots.get(snapshot_id) for snapshot_id in keys})
+        elif data_type == RunDataType.LATEST_MATERIALIZATIONS:
+            events = self._instance.get_latest_materialization_events(keys)
+            fetched.update({asset_key: events.get(asset_key) for asset_key in keys})
+        else:
+            check.failed(f"Unknown data type for {self.__class__.__name__}: {data_type}")
+
+    def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
+        return self._get(RunDataType.RUN_STATS, check.str_param(run_id, "run_id"))
+
+    def get_run_step_stats(self, run_id: str) -> List[RunStepKeyStatsSnapshot]:
+        return self._get(RunDataType.STEP_STATS, check.str_param(run_id, "run_id"))
+
+    def get_execution_plan_snapshot(self, snapshot_id: str) -> Optional[ExecutionPlanSnapshot]:
+        return self._get(
+            RunDataType.EXECUTION_PLAN_SNAPSHOTS, check.str_param(snapshot_id, "snapshot_id")
+        )
+
+    def get_latest_materialization_event(self, asset_key: AssetKey) -> Optional[EventLogEntry]:
+        return self._get(
+            RunDataType.LATEST_MATERIALIZATIONS,
+            check.inst_param(asset_key, "asset_key", AssetKey),
+        )
+
+
+def get_batch_run_loader(graphene_info) -> BatchRunLoader:
+    """Returns the batch run loader of the graphql request, which lives as long as the request
+    context."""
+    loaders = graphene_info.context.loaders
+    if BatchRunLoader.__name__ not in loaders:
+        loaders[BatchRunLoader.__name__] = BatchRunLoader(graphene_info.context.instance)
+    return loaders[BatchRunLoader.__name__]
@@ -1,7 +1,9 @@
 import os
+import weakref
 from enum import Enum
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 from time import sleep
+from typing import Any, Callable, Dict, Set
 
 import gevent
 from dagster import check
@@ -20,6 +22,107 @@ def get_chunk_size() -> int:
     return int(os.getenv("DAGIT_EVENT_LOAD_CHUNK_SIZE", "10000"))
 
 
+class SharedEventLogWatcher:
+    """Watches the event log of a run on behalf of all of the subscriptions to it, so that any
+    number of clients watching the same run cost a single event log storage watcher.
+
+    Each subscriber has its own cursor. When a subscriber is added, it is first caught up on the
+    events after its cursor, and then receives each new event that the storage watcher reports.
+    """
+
+    def __init__(self, instance, run_id: str):
+        self._instance = instance
+        self._run_id = check.str_param(run_id, "run_id")
+        # held while reporting events to the subscribers
+        self._lock = Lock()
+        # held while starting or ending the storage watcher, which can't be done while holding
+        # self._lock since storages may report events while holding their own locks
+        self._watch_lock = Lock()
+        # cursor of each subscriber, keyed by its callback
+        self._cursors: Dict[Callable, int] = {}
+        # cursor of the storage watcher, None if it isn't running
+        self._cursor = None
+        # callbacks that the watcher is registered for, guarded by the registry lock
+        self.registered_callbacks: Set[Callable] = set()
+
+    def add_subscriber(self, cursor: int, callback: Callable):
+        with self._watch_lock:
+            with self._lock:
+                # events are only reported to the subscribers while holding the lock, so the
+                # storage watcher can't have reported an event that the catch up doesn't include
+                events = self._instance.logs_after(self._run_id, cursor)
+                cursor += len(events)
+                for event in events:
+                    callback(event)
+
+                self._cursors[callback] = cursor
+                start_watching = self._cursor is None
+                if start_watching:
+                    self._cursor = cursor
+
+            if start_watching:
+                self._instance.watch_event_logs(self._run_id, cursor, self._handle_new_event)
+
+    def remove_subscriber(self, callback: Callable):
+        with self._watch_lock:
+            with self._lock:
+                self._cursors.pop(callback, None)
+                end_watching = not self._cursors and self._cursor is not None
+                if end_watching:
+                    self._cursor = None
+
+            if end_watching:
+                self._instance.end_watch_event_logs(self._run_id, self._handle_new_event)
+
+    def _handle_new_event(self, event):
+        with self._lock:
+            if self._cursor is None:
+                return
+
+            self._cursor += 1
+            for callback, cursor in list(self._cursors.items()):
+                # skip the event for subscribers that already got it while catching up
+                if cursor < self._cursor:
+                    self._cursors[callback] = self._cursor
+                    callback(event)
+
+
+_shared_watchers_lock = Lock()
+_shared_watchers: "weakref.WeakKeyDictionary[Any, Dict[str, SharedEventLogWatcher]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def watch_event_logs(instance, run_id: str, cursor: int, callback: Callable):
+    """Calls the callback with each event in the event log of the run after the cursor, sharing a
+    single storage watcher between all of the callbacks watching the same run."""
+    # the registry lock is only held while looking up the watcher, which stays in the registry
+    # until all of the callbacks registered with it are removed. The subscriber is caught up while
+    # only holding the watcher's locks, so loading the events of one run doesn't block watching
+    # other runs.
+    with _shared_watchers_lock:
+        watchers = _shared_watchers.setdefault(instance, {})
+        if run_id not in watchers:
+            watchers[run_id] = SharedEventLogWatcher(instance, run_id)
+        watcher = watchers[run_id]
+        watcher.registered_callbacks.add(callback)
+
+    watcher.add_subscriber(cursor, callback)
+
+
+def end_watch_event_logs(instance, run_id: str, callback: Callable):
+    with _shared_watchers_lock:
+        watcher = _shared_watchers.get(instance, {}).get(run_id)
+        if not watcher or callback not in watcher.registered_callbacks:
+            return
+
+        watcher.registered_callbacks.remove(callback)
+        if not watcher.registered_callbacks:
+            del _shared_watchers[instance][run_id]
+
+    watcher.remove_subscriber(callback)
+
+
 class PipelineRunObservableSubscribe:
     def __init__(self, instance, run_id, after_cursor=None):
         self.instance = instance
@@ -69,7 +172,7 @@ def load_events(self):
 
     def watch_events(self):
         self.state = State.WATCHING
-        self.instance.watch_event_logs(self.run_id, self.after_cursor, self.handle_new_event)
+        watch_event_logs(self.instance, self.run_id, self.after_cursor, self.handle_new_event)
 
     def background_event_loading(self, sleep_fn):
         chunk_size = get_chunk_size()
@@ -102,7 +205,7 @@ def dispose(self):
         self.observer = None
 
         if self.state is State.WATCHING:
-            self.instance.end_watch_event_logs(self.run_id, self.handle_new_event)
+            end_watch_event_logs(self.instance, self.run_id, self.handle_new_event)
         elif self.state is State.LOADING:
             self.stopping.set()
 
@@ -0,0 +1,273 @@
+"""Caches the results of the expensive GraphQL queries that Dagit polls.
+
+Many Dagit views poll the same queries every few seconds from every open tab, and recomputing
+them from storage each time multiplies the database load by the number of tabs. The response
+cache serves a computed result for as long as it is still valid:
+
+- Results are keyed on the query, its variables, its operation name and the version of the
+  workspace that it was computed against, so reloading a repository location misses the cache.
+- Results expire after a short TTL.
+- All results are invalidated when a mutation is executed, and when the storage watermark of the
+  instance (the latest run update and the latest asset materialization) changes. The watermark is
+  checked at most once per interval, no matter how many requests are being served.
+
+Concurrent requests for the same result wait for a single computation of it.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, FrozenSet, Hashable, NamedTuple, Optional, Tuple
+
+from dagster import check
+from dagster.core.events import DagsterEventType
+from graphql import parse
+from graphql.error import GraphQLError
+from graphql.execution import ExecutionResult
+from graphql.utils.get_operation_ast import get_operation_ast
+
+# operations of the Dagit views that are polled the most
+DEFAULT_CACHED_OPERATIONS = frozenset(
+    [
+        "RootWorkspaceQuery",
+        "AssetNamespaceTableQuery",
+        "RunGroupPanelQuery",
+        "PartitionStatusQuery",
+        "PartitionSetLoaderQuery",
+        "PartitionHealthQuery",
+    ]
+)
+
+DEFAULT_MAX_ENTRIES = 1000
+
+
+def get_response_cache_ttl() -> float:
+    return float(os.getenv("DAGIT_GRAPHQL_CACHE_TTL", "10"))
+
+
+def get_response_cache_watermark_interval() -> float:
+    return float(os.getenv("DAGIT_GRAPHQL_CACHE_WATERMARK_INTERVAL", "1"))
+
+
+class ResponseCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self._asdict(), "hit_rate": self.hit_rate}
+
+
+class _CacheEntry(NamedTuple):
+    result: ExecutionResult
+    created: float
+
+
+class ResponseCache:
+    """A short-lived cache of GraphQL execution results, shared between all of the requests that a
+    GraphQL server handles.
+
+    Args:
+        ttl_seconds (float): How long a result is served for after it is computed.
+        get_watermark (Optional[Callable[[], Hashable]]): Returns a value that changes whenever
+            the results may have changed. All results are invalidated when it does.
+        watermark_interval_seconds (float): How often to check the watermark.
+        max_entries (int): The number of results to keep. The least recently used results are
+            evicted first.
+        cached_operations (FrozenSet[str]): The names of the operations whose results are cached.
+        clock (Callable[[], float]): Returns the current time in seconds.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        get_watermark: Optional[Callable[[], Hashable]] = None,
+        watermark_interval_seconds: float = 1.0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        cached_operations: FrozenSet[str] = DEFAULT_CACHED_OPERATIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._get_watermark = check.opt_callable_param(get_watermark, "get_watermark")
+        self._watermark_interval_seconds = check.numeric_param(
+            watermark_interval_seconds, "watermark_interval_seconds"
+        )
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        self._cached_operations = frozenset(
+            check.set_param(set(cached_operations), "cached_operations", of_type=str)
+        )
+        self._clock = check.callable_param(clock, "clock")
+
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        # futures of the results that are being computed, so that concurrent requests for the
+        # same result wait for it instead of computing it again
+        self._pending: Dict[Hashable, Future] = {}
+        # incremented on each invalidation, so that results computed across an invalidation are
+        # not cached
+        self._generation = 0
+
+        self._watermark_lock = threading.Lock()
+        self._watermark: Optional[Hashable] = None
+        self._watermark_checked: Optional[float] = None
+
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0
+
+    def is_cacheable(self, operation_name: Optional[str]) -> bool:
+        return self.enabled and operation_name in self._cached_operations
+
+    def get_stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=len(self._entries),
+            )
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    def get_or_execute(
+        self, key: Hashable, execute_fn: Callable[[], ExecutionResult]
+    ) -> ExecutionResult:
+        """Returns the cached result for the key, or computes it with the given function. Results
+        with errors are returned but not cached."""
+        self._check_watermark()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and self._clock() - entry.created < self._ttl_seconds:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return entry.result
+
+            pending = self._pending.get(key)
+            if pending:
+                # another request is computing the result
+                self._hits += 1
+            else:
+                self._misses += 1
+                future: Future = Future()
+                self._pending[key] = future
+                generation = self._generation
+
+        if pending:
+            return pending.result()
+
+        try:
+            result = execute_fn()
+        except Exception as exc:
+            with self._lock:
+                del self._pending[key]
+            future.set_exception(exc)
+            raise
+
+        with self._lock:
+            del self._pending[key]
+            if not result.errors and generation == self._generation:
+                self._entries[key] = _CacheEntry(result, self._clock())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+        future.set_result(result)
+        return result
+
+    def _check_watermark(self):
+        if not self._get_watermark:
+            return
+
+        # only one request checks the watermark at a time, the others use the cached results
+        # until it is checked
+        if not self._watermark_lock.acquire(blocking=False):
+            return
+
+        try:
+            now = self._clock()
+            if (
+                self._watermark_checked is not None
+                and now - self._watermark_checked < self._watermark_interval_seconds
+            ):
+                return
+
+            watermark = self._get_watermark()
+            if self._watermark_checked is not None and watermark != self._watermark:
+                self.invalidate()
+            self._watermark = watermark
+            self._watermark_checked = now
+        finally:
+            self._watermark_lock.release()
+
+
+def get_response_cache_key(
+    context, query: str, variables: Optional[Dict[str, Any]], operation_name: Optional[str]
+) -> Tuple[Hashable, ...]:
+    return (
+        query,
+        json.dumps(variables, sort_keys=True) if variables else None,
+        operation_name,
+        get_workspace_version(context),
+    )
+
+
+def get_workspace_version(context) -> Tuple[Tuple[str, float], ...]:
+    """Changes whenever a repository location in the workspace is loaded or reloaded."""
+    return tuple(
+        (location_name, entry.update_timestamp)
+        for location_name, entry in context.get_workspace_snapshot().items()
+    )
+
+
+def get_instance_watermark(instance) -> Tuple[Hashable, ...]:
+    """Changes whenever a run is created or changes status, or an asset is materialized."""
+    from dagster.core.storage.event_log.base import EventRecordsFilter
+
+    # Both queries read the last row of an index: idx_run_update_timestamp and idx_event_type
+    run_records = instance.get_run_records(limit=1, order_by="update_timestamp")
+    materialization_records = list(
+        instance.get_event_records(
+            EventRecordsFilter(event_type=DagsterEventType.ASSET_MATERIALIZATION), limit=1
+        )
+    )
+    return (
+        (
+            run_records[0].pipeline_run.run_id,
+            run_records[0].pipeline_run.status,
+            run_records[0].update_timestamp,
+        )
+        if run_records
+        else None,
+        materialization_records[0].storage_id if materialization_records else None,
+    )
+
+
+def is_mutation(query: str, operation_name: Optional[str]) -> bool:
+    if "mutation" not in query:
+        return False
+
+    try:
+        document = parse(query)
+    except GraphQLError:
+        return False
+
+    operation = get_operation_ast(document, operation_name)
+    return operation is not None and operation.operation == "mutation"
@@ -8,6 +8,7 @@
     ExternalTimeWindowPartitionsDefinitionData,
 )
 
+from ..implementation.loader import get_batch_run_loader
 from . import external
 from .asset_key import GrapheneAssetKey
 from .errors import GrapheneAssetNotFoundError
@@ -155,14 +156,21 @@ def resolve_assetMaterializations(self, graphene_info, **kwargs):
 
         limit = kwargs.get("limit")
         partitions = kwargs.get("partitions")
-        if self._fetched_materialization and limit == 1 and not partitions and not before_timestamp:
+        if limit == 1 and not partitions and not before_timestamp:
+            latest_materialization = (
+                self._latest_materialization
+                if self._fetched_materialization
+                else get_batch_run_loader(graphene_info).get_latest_materialization_event(
+                    self._external_asset_node.asset_key
+                )
+            )
             return (
                 [
                     GrapheneMaterializationEvent(
-                        event=self._latest_materialization,
+                        event=latest_materialization,
                     )
                 ]
-                if self._latest_materialization
+                if latest_materialization
                 else []
             )
 
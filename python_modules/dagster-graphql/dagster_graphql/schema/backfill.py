@@ -3,6 +3,7 @@
 from dagster.core.execution.backfill import BulkActionStatus, PartitionBackfill
 from dagster.core.storage.pipeline_run import PipelineRunsFilter
 
+from ..implementation.loader import get_batch_run_loader
 from .errors import (
     GrapheneInvalidOutputError,
     GrapheneInvalidStepError,
@@ -116,13 +117,12 @@ def resolve_runs(self, graphene_info, **kwargs):
         from .pipelines.pipeline import GrapheneRun
 
         filters = PipelineRunsFilter.for_backfill(self._backfill_job.backfill_id)
-        return [
-            GrapheneRun(record)
-            for record in graphene_info.context.instance.get_run_records(
-                filters=filters,
-                limit=kwargs.get("limit"),
-            )
-        ]
+        records = graphene_info.context.instance.get_run_records(
+            filters=filters,
+            limit=kwargs.get("limit"),
+        )
+        get_batch_run_loader(graphene_info).add_run_records(records)
+        return [GrapheneRun(record) for record in records]
 
     def resolve_numRequested(self, graphene_info):
         filters = PipelineRunsFilter.for_backfill(self._backfill_job.backfill_id)
@@ -9,7 +9,7 @@
 from dagster.core.workspace import WorkspaceLocationEntry, WorkspaceLocationLoadStatus
 from dagster_graphql.implementation.fetch_runs import get_in_progress_runs_by_step
 from dagster_graphql.implementation.fetch_solids import get_solid, get_solids
-from dagster_graphql.implementation.loader import RepositoryScopedBatchLoader
+from dagster_graphql.implementation.loader import RepositoryScopedBatchLoader, get_batch_run_loader
 
 from .asset_graph import GrapheneAssetNode
 from .errors import GraphenePythonError, GrapheneRepositoryNotFoundError
@@ -246,10 +246,14 @@ def resolve_displayMetadata(self, _graphene_info):
             if value is not None
         ]
 
-    def resolve_assetNodes(self, _graphene_info):
+    def resolve_assetNodes(self, graphene_info):
+        external_asset_nodes = self._repository.get_external_asset_nodes()
+        get_batch_run_loader(graphene_info).add_asset_keys(
+            [external_asset_node.asset_key for external_asset_node in external_asset_nodes]
+        )
         return [
             GrapheneAssetNode(self._repository, external_asset_node)
-            for external_asset_node in self._repository.get_external_asset_nodes()
+            for external_asset_node in external_asset_nodes
         ]
 
     def resolve_inProgressRunsByStep(self, graphene_info):
@@ -21,7 +21,7 @@
 
 from ..implementation.fetch_schedules import get_schedule_next_tick
 from ..implementation.fetch_sensors import get_sensor_next_tick
-from ..implementation.loader import RepositoryScopedBatchLoader
+from ..implementation.loader import RepositoryScopedBatchLoader, get_batch_run_loader
 from .errors import GraphenePythonError
 from .repository_origin import GrapheneRepositoryOrigin
 from .tags import GraphenePipelineTag
@@ -126,10 +126,9 @@ def resolve_runs(self, graphene_info):
         if not run_ids:
             return []
 
-        records_by_id = {
-            record.pipeline_run.run_id: record
-            for record in instance.get_run_records(PipelineRunsFilter(run_ids=run_ids))
-        }
+        records = instance.get_run_records(PipelineRunsFilter(run_ids=run_ids))
+        get_batch_run_loader(graphene_info).add_run_records(records)
+        records_by_id = {record.pipeline_run.run_id: record for record in records}
 
         return [GrapheneRun(records_by_id[run_id]) for run_id in run_ids if run_id in records_by_id]
 
@@ -319,19 +318,19 @@ def resolve_runs(self, graphene_info, **kwargs):
                 if self._job_state.job_type == InstigatorType.SENSOR
                 else self._batch_loader.get_run_records_for_schedule(self._job_state.name, limit)
             )
+            get_batch_run_loader(graphene_info).add_run_records(records)
             return [GrapheneRun(record) for record in records]
 
         if self._job_state.job_type == InstigatorType.SENSOR:
             filters = PipelineRunsFilter.for_sensor(self._job_state)
         else:
             filters = PipelineRunsFilter.for_schedule(self._job_state)
-        return [
-            GrapheneRun(record)
-            for record in graphene_info.context.instance.get_run_records(
-                filters=filters,
-                limit=kwargs.get("limit"),
-            )
-        ]
+        records = graphene_info.context.instance.get_run_records(
+            filters=filters,
+            limit=kwargs.get("limit"),
+        )
+        get_batch_run_loader(graphene_info).add_run_records(records)
+        return [GrapheneRun(record) for record in records]
 
     def resolve_runsCount(self, graphene_info):
         if self._job_state.job_type == InstigatorType.SENSOR:
@@ -14,7 +14,7 @@
 from ...implementation.fetch_runs import get_runs, get_stats, get_step_stats
 from ...implementation.fetch_schedules import get_schedules_for_pipeline
 from ...implementation.fetch_sensors import get_sensors_for_pipeline
-from ...implementation.loader import RepositoryScopedBatchLoader
+from ...implementation.loader import RepositoryScopedBatchLoader, get_batch_run_loader
 from ...implementation.utils import UserFacingGraphQLError, capture_error
 from ..asset_key import GrapheneAssetKey
 from ..dagster_types import GrapheneDagsterType, GrapheneDagsterTypeOrError, to_dagster_type
@@ -260,9 +260,7 @@ def resolve_executionPlan(self, graphene_info):
         ):
             return None
 
-        instance = graphene_info.context.instance
-
-        execution_plan_snapshot = instance.get_execution_plan_snapshot(
+        execution_plan_snapshot = get_batch_run_loader(graphene_info).get_execution_plan_snapshot(
             self._pipeline_run.execution_plan_snapshot_id
         )
         return (
@@ -326,7 +324,7 @@ def resolve_startTime(self, graphene_info):
         # If a user has not migrated in 0.13.15, then run_record will not have start_time and end_time. So it will be necessary to fill this data using the run_stats. Since we potentially make this call multiple times, we cache the result.
         if run_record.start_time is None and self._pipeline_run.status in STARTED_STATUSES:
             if self._run_stats is None or self._run_stats.start_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = get_batch_run_loader(graphene_info).get_run_stats(self.runId)
             return self._run_stats.start_time
         return run_record.start_time
 
@@ -334,7 +332,7 @@ def resolve_endTime(self, graphene_info):
         run_record = self._get_run_record(graphene_info.context.instance)
         if run_record.end_time is None and self._pipeline_run.status in COMPLETED_STATUSES:
             if self._run_stats is None or self._run_stats.end_time is None:
-                self._run_stats = graphene_info.context.instance.get_run_stats(self.runId)
+                self._run_stats = get_batch_run_loader(graphene_info).get_run_stats(self.runId)
             return self._run_stats.end_time
         return run_record.end_time
 
@@ -649,6 +647,7 @@ def resolve_runs(self, graphene_info, **kwargs):
             records = self._batch_loader.get_run_records_for_job(
                 self._external_pipeline.name, kwargs.get("limit")
             )
+            get_batch_run_loader(graphene_info).add_run_records(records)
             return [GrapheneRun(record) for record in records]
 
         # otherwise, fall back to the default implementation
@@ -678,6 +677,9 @@ def resolve_assetNodes(self, graphene_info, **kwargs):
             )
         else:
             events_by_key = {}
+            get_batch_run_loader(graphene_info).add_asset_keys(
+                [node.asset_key for node in matching]
+            )
 
         return [
             GrapheneAssetNode(
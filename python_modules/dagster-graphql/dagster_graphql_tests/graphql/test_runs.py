@@ -196,6 +196,32 @@
 }
 """
 
+RUNS_WITH_STATS_QUERY = """
+{
+  pipelineRunsOrError {
+    ... on PipelineRuns {
+      results {
+        runId
+        stats {
+          ... on RunStatsSnapshot {
+            stepsSucceeded
+          }
+        }
+        stepStats {
+          stepKey
+          status
+        }
+        executionPlan {
+          steps {
+            key
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 
 def _get_runs_data(result, run_id):
     for run_data in result.data["pipelineOrError"]["runs"]:
@@ -846,3 +872,30 @@ def test_repository_batching():
             # We should have a single batch call to fetch run records, instead of 3 separate calls
             # to fetch run records (which is fetched to instantiate GrapheneRun)
             assert counts.get("DagsterInstance.get_run_records") == 1
+
+
+def test_run_batching():
+    with instance_for_test() as instance:
+        repo = get_repo_at_time_1()
+        foo_pipeline = repo.get_pipeline("foo_pipeline")
+        run_ids = [execute_pipeline(foo_pipeline, instance=instance).run_id for i in range(3)]
+        with define_out_of_process_context(__file__, "get_repo_at_time_1", instance) as context:
+            traced_counter.set(Counter())
+            result = execute_dagster_graphql(context, RUNS_WITH_STATS_QUERY)
+            assert result.data
+            runs = result.data["pipelineRunsOrError"]["results"]
+            assert set(run["runId"] for run in runs) == set(run_ids)
+            for run in runs:
+                assert run["stats"]["stepsSucceeded"] == 1
+                assert [step_stats["status"] for step_stats in run["stepStats"]] == ["SUCCESS"]
+                assert len(run["executionPlan"]["steps"]) == 1
+
+            # the stats, step stats and execution plans of all of the runs are fetched in a single
+            # batch call each, instead of one call per run
+            counts = traced_counter.get().counts()
+            assert counts == {
+                "DagsterInstance.get_run_records": 1,
+                "DagsterInstance.get_run_stats_by_run_id": 1,
+                "DagsterInstance.get_run_step_stats_by_run_id": 1,
+                "DagsterInstance.get_execution_plan_snapshots": 1,
+            }
@@ -2,6 +2,7 @@
 import time
 from collections import namedtuple
 from contextlib import contextmanager
+from unittest import mock
 from unittest.mock import Mock
 
 import pytest
@@ -114,3 +115,56 @@ def test_using_instance(before_watch_config: NumEventsAndCursor, num_events_afte
                 total_num_events + 1,
             )
         )
+
+
+def _received_messages(observable_subscribe):
+    return [
+        int(event_record.message)
+        for call in observable_subscribe.observer.on_next.call_args_list
+        for event_record in call[0][0][0]
+    ]
+
+
+def test_shared_watcher():
+    with create_test_instance_and_storage() as (instance, storage):
+        event_storer = EventStorer(storage)
+        event_storer.store_n_events(2)
+
+        with mock.patch.object(
+            storage, "watch", wraps=storage.watch
+        ) as watch_mock, mock.patch.object(
+            storage, "end_watch", wraps=storage.end_watch
+        ) as end_watch_mock:
+            observable_subscribes = [
+                PipelineRunObservableSubscribe(instance, RUN_ID, after_cursor=after_cursor)
+                for after_cursor in [-1, 0, 1]
+            ]
+            for observable_subscribe in observable_subscribes[:2]:
+                observable_subscribe(Mock())
+
+            event_storer.store_n_events(2)
+
+            # a subscriber that starts watching after the others catches up on the events that
+            # they already received
+            observable_subscribes[2](Mock())
+
+            event_storer.store_n_events(2)
+
+            attempts = 10
+            while (
+                any(len(_received_messages(o)) < 6 - i for i, o in enumerate(observable_subscribes))
+                and attempts > 0
+            ):
+                time.sleep(0.1)
+                attempts -= 1
+
+            # all of the subscribers receive every event after their cursor exactly once, from a
+            # single storage watcher
+            assert _received_messages(observable_subscribes[0]) == [1, 2, 3, 4, 5, 6]
+            assert _received_messages(observable_subscribes[1]) == [2, 3, 4, 5, 6]
+            assert _received_messages(observable_subscribes[2]) == [3, 4, 5, 6]
+            assert watch_mock.call_count == 1
+
+            for observable_subscribe in observable_subscribes:
+                observable_subscribe.dispose()
+            assert end_watch_mock.call_count == 1
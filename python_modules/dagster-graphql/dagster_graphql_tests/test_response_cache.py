@@ -0,0 +1,149 @@
+import threading
+
+from dagster import job, op
+from dagster.core.test_utils import instance_for_test
+from dagster_graphql.implementation.response_cache import (
+    ResponseCache,
+    get_instance_watermark,
+    is_mutation,
+)
+from graphql.execution import ExecutionResult
+
+
+class Clock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+class Executor:
+    def __init__(self, errors=None):
+        self.num_calls = 0
+        self._errors = errors
+
+    def __call__(self):
+        self.num_calls += 1
+        return ExecutionResult(data={"num_calls": self.num_calls}, errors=self._errors)
+
+
+def test_response_cache_ttl():
+    clock = Clock()
+    cache = ResponseCache(ttl_seconds=10, clock=clock)
+    execute = Executor()
+
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 1}
+    clock.time = 9
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 1}
+    assert cache.get_or_execute("other_key", execute).data == {"num_calls": 2}
+
+    clock.time = 10
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 3}
+
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 3, 2)
+    assert stats.hit_rate == 0.25
+
+
+def test_response_cache_invalidation():
+    watermark = {"value": 0}
+    clock = Clock()
+    cache = ResponseCache(
+        ttl_seconds=10,
+        get_watermark=lambda: watermark["value"],
+        watermark_interval_seconds=1,
+        clock=clock,
+    )
+    execute = Executor()
+
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 1}
+    cache.invalidate()
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 2}
+
+    # the watermark is only checked once per interval
+    watermark["value"] = 1
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 2}
+    clock.time = 1
+    assert cache.get_or_execute("key", execute).data == {"num_calls": 3}
+    assert cache.get_stats().invalidations == 2
+
+
+def test_response_cache_skips_errors():
+    cache = ResponseCache(ttl_seconds=10, clock=Clock())
+    execute = Executor(errors=[Exception("oops")])
+
+    cache.get_or_execute("key", execute)
+    cache.get_or_execute("key", execute)
+    assert execute.num_calls == 2
+    assert cache.get_stats().size == 0
+
+
+def test_response_cache_coalesces_concurrent_requests():
+    cache = ResponseCache(ttl_seconds=10, clock=Clock())
+    started = threading.Event()
+    release = threading.Event()
+    num_calls = []
+
+    def execute():
+        num_calls.append(1)
+        started.set()
+        release.wait()
+        return ExecutionResult(data={}, errors=None)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_execute("key", execute)))
+        for _ in range(5)
+    ]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(num_calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+
+
+def test_response_cache_max_entries():
+    cache = ResponseCache(ttl_seconds=10, max_entries=2, clock=Clock())
+    execute = Executor()
+
+    for key in ["a", "b", "a", "c"]:
+        cache.get_or_execute(key, execute)
+
+    # "b" is the least recently used result
+    assert cache.get_stats().size == 2
+    cache.get_or_execute("b", execute)
+    assert execute.num_calls == 4
+
+
+def test_is_mutation():
+    assert is_mutation("mutation LaunchRun { launchRun { __typename } }", "LaunchRun")
+    assert not is_mutation("query RootWorkspaceQuery { __typename }", "RootWorkspaceQuery")
+    assert not is_mutation(
+        "query Q { __typename } mutation M { __typename }",
+        "Q",
+    )
+    assert not is_mutation("mutation {", None)
+
+
+def test_instance_watermark():
+    @op
+    def my_op():
+        return 1
+
+    @job
+    def my_job():
+        my_op()
+
+    with instance_for_test() as instance:
+        watermark = get_instance_watermark(instance)
+        assert watermark == (None, None)
+
+        assert my_job.execute_in_process(instance=instance).success
+        assert get_instance_watermark(instance) != watermark
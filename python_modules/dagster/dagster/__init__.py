@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from dagster.builtins import Any, Bool, Float, Int, Nothing, String
 from dagster.config import Enum, EnumValue, Field, Permissive, Selector, Shape
 from dagster.config.config_schema import ConfigSchema
@@ -172,15 +174,7 @@
 from dagster.core.execution.validate_run_config import validate_run_config
 from dagster.core.executor.base import Executor
 from dagster.core.executor.init import InitExecutorContext
-from dagster.core.instance import DagsterInstance
-from dagster.core.launcher import DefaultRunLauncher
 from dagster.core.log_manager import DagsterLogManager
-from dagster.core.storage.event_log import (
-    EventLogEntry,
-    EventLogRecord,
-    EventRecordsFilter,
-    RunShardedEventsCursor,
-)
 from dagster.core.storage.file_manager import FileHandle, LocalFileHandle, local_file_manager
 from dagster.core.storage.fs_io_manager import custom_path_fs_io_manager, fs_io_manager
 from dagster.core.storage.io_manager import IOManager, IOManagerDefinition, io_manager
@@ -210,23 +204,52 @@
 from dagster.utils import file_relative_path
 from dagster.utils.alert import make_email_on_run_failure_sensor
 from dagster.utils.backcompat import ExperimentalWarning
+from dagster.utils.deferred_imports import deferred_imports as _deferred_imports
 from dagster.utils.log import get_dagster_logger
 from dagster.utils.partitions import (
     create_offset_partition_selector,
     date_partition_range,
     identity_partition_selector,
 )
-from dagster.utils.test import (
-    check_dagster_type,
-    execute_solid,
-    execute_solid_within_pipeline,
-    execute_solids_within_pipeline,
-)
 
 from .version import __version__
 
 from dagster.config.source import BoolSource, StringSource, IntSource  # isort:skip
 
+# The modules that define these names import sqlalchemy, alembic or grpc, which make up a large
+# part of the time it takes to `import dagster`. They are imported on first access instead, so
+# that processes that only need the definitions API (e.g. step subprocesses) don't pay that cost.
+_DEFERRED_IMPORTS = {
+    "DagsterInstance": "dagster.core.instance",
+    "DefaultRunLauncher": "dagster.core.launcher",
+    "EventLogEntry": "dagster.core.storage.event_log",
+    "EventLogRecord": "dagster.core.storage.event_log",
+    "EventRecordsFilter": "dagster.core.storage.event_log",
+    "RunShardedEventsCursor": "dagster.core.storage.event_log",
+    "check_dagster_type": "dagster.utils.test",
+    "execute_solid": "dagster.utils.test",
+    "execute_solid_within_pipeline": "dagster.utils.test",
+    "execute_solids_within_pipeline": "dagster.utils.test",
+}
+
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.launcher import DefaultRunLauncher
+    from dagster.core.storage.event_log import (
+        EventLogEntry,
+        EventLogRecord,
+        EventRecordsFilter,
+        RunShardedEventsCursor,
+    )
+    from dagster.utils.test import (
+        check_dagster_type,
+        execute_solid,
+        execute_solid_within_pipeline,
+        execute_solids_within_pipeline,
+    )
+
+__getattr__, __dir__ = _deferred_imports(__name__, _DEFERRED_IMPORTS)
+
 
 __all__ = [
     # Definition
@@ -2,16 +2,21 @@
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
 
-def sync_get_streaming_external_repositories_data_grpc(api_client, repository_location):
+def sync_get_streaming_external_repositories_data_grpc(
+    api_client, repository_location, repository_names=None
+):
     from dagster.core.host_representation import (
         RepositoryLocation,
         ExternalRepositoryOrigin,
     )
 
     check.inst_param(repository_location, "repository_location", RepositoryLocation)
+    if repository_names is None:
+        repository_names = repository_location.repository_names
+    check.set_param(repository_names, "repository_names", of_type=str)
 
     repo_datas = {}
-    for repository_name in repository_location.repository_names:
+    for repository_name in repository_names:
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=ExternalRepositoryOrigin(
@@ -57,3 +57,49 @@ def sync_get_external_sensor_execution_data_grpc(
         raise DagsterUserCodeProcessError.from_error_info(result.error)
 
     return result
+
+
+def sync_get_external_sensor_execution_data_batches_grpc(
+    api_client,
+    instance,
+    repository_handle,
+    sensor_name,
+    last_completion_time,
+    last_run_key,
+    cursor,
+    run_request_batch_size,
+):
+    check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
+    check.str_param(sensor_name, "sensor_name")
+    check.opt_float_param(last_completion_time, "last_completion_time")
+    check.opt_str_param(last_run_key, "last_run_key")
+    check.int_param(run_request_batch_size, "run_request_batch_size")
+
+    origin = repository_handle.get_external_origin()
+
+    # the batches are all read before any of them is handled, so that the sensor evaluation on the
+    # server isn't held open (and doesn't run into its deadline) while the caller launches runs
+    serialized_results = list(
+        api_client.external_sensor_execution_batches(
+            sensor_execution_args=SensorExecutionArgs(
+                repository_origin=origin,
+                instance_ref=instance.get_ref(),
+                sensor_name=sensor_name,
+                last_completion_time=last_completion_time,
+                last_run_key=last_run_key,
+                cursor=cursor,
+                run_request_batch_size=run_request_batch_size,
+            )
+        )
+    )
+
+    for serialized_result in serialized_results:
+        result = check.inst(
+            deserialize_json_to_dagster_namedtuple(serialized_result),
+            (SensorExecutionData, ExternalSensorExecutionErrorData),
+        )
+
+        if isinstance(result, ExternalSensorExecutionErrorData):
+            raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+        yield result
@@ -19,12 +19,14 @@
 from dagster.core.utils import coerce_valid_log_level
 from dagster.grpc import DagsterGrpcClient, DagsterGrpcServer
 from dagster.grpc.impl import core_execute_run
-from dagster.grpc.types import ExecuteRunArgs, ExecuteStepArgs, ResumeRunArgs
+from dagster.grpc.server import DEFAULT_CONTROL_RPC_MAX_WORKERS
+from dagster.grpc.types import ExecuteRunArgs, ExecuteStepArgs, GrpcServerMetrics, ResumeRunArgs
 from dagster.serdes import deserialize_as, serialize_dagster_namedtuple
 from dagster.seven import nullcontext
 from dagster.utils.hosted_user_process import recon_pipeline_from_origin
 from dagster.utils.interrupts import capture_interrupts
 from dagster.utils.log import configure_loggers
+from tabulate import tabulate
 
 
 @click.group(name="api", hidden=True)
@@ -326,6 +328,30 @@ def execute_step_command(input_json):
     default=None,
     help="Maximum number of (threaded) workers to use in the GRPC server",
 )
+@click.option(
+    "--control-max-workers",
+    type=click.INT,
+    required=False,
+    default=DEFAULT_CONTROL_RPC_MAX_WORKERS,
+    help="Maximum number of (threaded) workers reserved for control RPCs like Ping, Heartbeat and "
+    "GetServerId, which are served separately from RPCs that run user code",
+)
+@click.option(
+    "--rpc-max-workers",
+    type=click.STRING,
+    multiple=True,
+    help="Limit the concurrency of a single RPC method by serving it from its own pool of "
+    "(threaded) workers, e.g. `--rpc-max-workers ExternalSensorExecution=2`. Can be repeated.",
+)
+@click.option(
+    "--num-worker-processes",
+    type=click.INT,
+    required=False,
+    default=None,
+    help="If set, RPCs that run user code (sensors, schedules, partition functions, execution plan "
+    "and repository snapshots) are served by this many worker processes that each have the "
+    "repositories loaded, so that CPU-bound user code can use multiple cores",
+)
 @click.option(
     "--heartbeat",
     is_flag=True,
@@ -403,6 +429,9 @@ def grpc_command(
     socket=None,
     host=None,
     max_workers=None,
+    control_max_workers=DEFAULT_CONTROL_RPC_MAX_WORKERS,
+    rpc_max_workers=None,
+    num_worker_processes=None,
     heartbeat=False,
     heartbeat_timeout=30,
     lazy_load_user_code=False,
@@ -420,6 +449,15 @@ def grpc_command(
     if not (port or socket and not (port and socket)):
         raise click.UsageError("You must pass one and only one of --port/-p or --socket/-s.")
 
+    rpc_max_workers_by_method = {}
+    for rpc_max_workers_str in rpc_max_workers or []:
+        method_name, _, method_max_workers = rpc_max_workers_str.partition("=")
+        if not method_max_workers.isdigit():
+            raise click.UsageError(
+                f"Invalid --rpc-max-workers value {rpc_max_workers_str}, expected <method>=<workers>"
+            )
+        rpc_max_workers_by_method[method_name] = int(method_max_workers)
+
     configure_loggers(log_level=coerce_valid_log_level(log_level))
     logger = logging.getLogger("dagster.code_server")
 
@@ -459,6 +497,9 @@ def grpc_command(
             host=host,
             loadable_target_origin=loadable_target_origin,
             max_workers=max_workers,
+            control_max_workers=control_max_workers,
+            rpc_max_workers=rpc_max_workers_by_method,
+            num_worker_processes=num_worker_processes,
             heartbeat=heartbeat,
             heartbeat_timeout=heartbeat_timeout,
             lazy_load_user_code=lazy_load_user_code,
@@ -534,3 +575,69 @@ def grpc_health_check_command(port=None, socket=None, host="localhost", use_ssl=
     status = client.health_check_query()
     if status != "SERVING":
         sys.exit(1)
+
+
+@api_cli.command(
+    name="grpc-metrics", help="Print per-method RPC latencies of a running dagster GRPC server"
+)
+@click.option(
+    "--port",
+    "-p",
+    type=click.INT,
+    required=False,
+    help="Port over which to serve. You must pass one and only one of --port/-p or --socket/-s.",
+)
+@click.option(
+    "--socket",
+    "-s",
+    type=click.Path(),
+    required=False,
+    help="Serve over a UDS socket. You must pass one and only one of --port/-p or --socket/-s.",
+)
+@click.option(
+    "--host",
+    "-h",
+    type=click.STRING,
+    required=False,
+    default="localhost",
+    help="Hostname at which to serve. Default is localhost.",
+)
+@click.option(
+    "--use-ssl",
+    is_flag=True,
+    help="Whether to connect to the gRPC server over SSL",
+)
+def grpc_metrics_command(port=None, socket=None, host="localhost", use_ssl=False):
+    if seven.IS_WINDOWS and port is None:
+        raise click.UsageError(
+            "You must pass a valid --port/-p on Windows: --socket/-s not supported."
+        )
+    if not (port or socket and not (port and socket)):
+        raise click.UsageError("You must pass one and only one of --port/-p or --socket/-s.")
+
+    client = DagsterGrpcClient(port=port, socket=socket, host=host, use_ssl=use_ssl)
+    metrics = deserialize_as(client.get_server_metrics(), GrpcServerMetrics)
+
+    click.echo(f"Server ID: {metrics.server_id}")
+    click.echo(
+        tabulate(
+            [
+                [
+                    method_name,
+                    histogram.count,
+                    histogram.error_count,
+                    metrics.rpcs_in_flight.get(method_name, 0),
+                    f"{histogram.mean_seconds:.3f}",
+                    _format_bucket_bound(histogram.percentile_upper_bound(50)),
+                    _format_bucket_bound(histogram.percentile_upper_bound(99)),
+                    f"{histogram.max_seconds:.3f}",
+                ]
+                for method_name, histogram in sorted(metrics.rpc_latencies.items())
+            ],
+            headers=["Method", "Calls", "Errors", "In flight", "Mean", "p50 <=", "p99 <=", "Max"],
+        )
+    )
+
+
+def _format_bucket_bound(bound):
+    return f"{bound:.3f}" if bound is not None else "overflow"
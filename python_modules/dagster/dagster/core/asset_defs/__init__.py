@@ -1,5 +1,6 @@
 from .asset import AssetsDefinition
 from .asset_in import AssetIn
+from .asset_staleness import StaleAsset, get_stale_assets, select_stale_assets
 from .assets_job import build_assets_job
 from .decorators import asset, multi_asset
 from .foreign_asset import ForeignAsset
@@ -0,0 +1,356 @@
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    cast,
+)
+
+from dagster import check
+from dagster.core.definitions.events import AssetKey
+from dagster.core.definitions.partition import PartitionsDefinition
+from dagster.core.definitions.partition_key_range import PartitionKeyRange
+from dagster.core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster.core.events.log import EventLogEntry
+from dagster.core.storage.tags import CODE_VERSION_TAG
+from dagster.utils.backcompat import experimental
+
+from .asset import AssetsDefinition
+from .asset_partitions import get_upstream_partitions_for_partition_range
+
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
+
+class StaleAsset(NamedTuple):
+    """An asset that needs to be recomputed.
+
+    Attributes:
+        asset_key (AssetKey): The key of the asset.
+        partition_keys (Optional[AbstractSet[str]]): For partitioned assets, the keys of the
+            partitions that need to be recomputed. None for unpartitioned assets.
+    """
+
+    asset_key: AssetKey
+    partition_keys: Optional[AbstractSet[str]] = None
+
+
+@experimental
+def get_stale_assets(
+    instance: "DagsterInstance", assets: Sequence[AssetsDefinition]
+) -> Mapping[AssetKey, StaleAsset]:
+    """Determines which of the given assets, or which of their partitions, need to be recomputed.
+
+    An asset partition is stale if:
+
+    - It has never been materialized.
+    - Its op has a version, and the asset was last materialized with a different version.
+    - One of the upstream asset partitions it depends on was materialized after it.
+    - One of the upstream asset partitions it depends on is stale, since recomputing the upstream
+      asset will make it out of date in turn.
+
+    Upstream assets that aren't among the given assets are treated as sources: they're never stale
+    themselves, but their materializations still make downstream assets stale.
+
+    The materialization state of all of the assets is fetched from the instance in a few batched
+    queries, so this can be called on every tick of a sensor. The code versions of partitioned
+    assets are compared per partition, so for versioned partitioned assets, the latest
+    materialization of each partition is fetched.
+
+    Args:
+        instance (DagsterInstance): The instance that the assets are materialized in.
+        assets (Sequence[AssetsDefinition]): The assets to check.
+
+    Returns:
+        Mapping[AssetKey, StaleAsset]: The stale assets, keyed by asset key. Assets that are up to
+            date are omitted.
+    """
+    from dagster.core.instance import DagsterInstance
+
+    check.inst_param(instance, "instance", DagsterInstance)
+    check.list_param(assets, "assets", of_type=AssetsDefinition)
+
+    assets_defs_by_key = {
+        asset_key: assets_def for assets_def in assets for asset_key in assets_def.asset_keys
+    }
+    upstream_asset_keys_by_key = {
+        asset_key: list(assets_def.input_defs_by_asset_key.keys())
+        for asset_key, assets_def in assets_defs_by_key.items()
+    }
+    all_asset_keys = list(
+        set(assets_defs_by_key.keys()).union(
+            *[set(upstream_keys) for upstream_keys in upstream_asset_keys_by_key.values()]
+        )
+    )
+
+    versioned_asset_keys = [
+        asset_key
+        for asset_key, assets_def in assets_defs_by_key.items()
+        if assets_def.op.version is not None
+    ]
+    versioned_partitioned_asset_keys = [
+        asset_key
+        for asset_key in versioned_asset_keys
+        if assets_defs_by_key[asset_key].partitions_def is not None
+    ]
+    latest_events = instance.get_latest_materialization_events(
+        [
+            asset_key
+            for asset_key in versioned_asset_keys
+            if asset_key not in versioned_partitioned_asset_keys
+        ]
+    )
+    latest_events_by_partition = (
+        instance.get_latest_materialization_events_by_partition(versioned_partitioned_asset_keys)
+        if versioned_partitioned_asset_keys
+        else {}
+    )
+    latest_storage_id_by_partition = instance.get_latest_storage_id_by_partition(all_asset_keys)
+    partition_index = _PartitionIndex()
+
+    stale_assets: Dict[AssetKey, StaleAsset] = {}
+    for asset_key in _toposort_asset_keys(upstream_asset_keys_by_key):
+        assets_def = assets_defs_by_key[asset_key]
+        storage_id_by_partition = latest_storage_id_by_partition[asset_key]
+
+        if assets_def.partitions_def is None:
+            partition_keys: Sequence[Optional[str]] = [None]
+            latest_storage_ids = [max(storage_id_by_partition.values(), default=None)]
+            code_changed = [_has_code_version_changed(assets_def, latest_events.get(asset_key))]
+        else:
+            partition_keys = partition_index.get_partition_keys(assets_def.partitions_def)
+            latest_storage_ids = [
+                storage_id_by_partition.get(partition_key) for partition_key in partition_keys
+            ]
+            # each partition is compared with the version of its own latest materialization
+            events_by_partition = latest_events_by_partition.get(asset_key, {})
+            code_changed = [
+                _has_code_version_changed(assets_def, events_by_partition.get(partition_key))
+                for partition_key in partition_keys
+            ]
+
+        stale_partition_keys = set()
+        for partition_key, latest_storage_id, partition_code_changed in zip(
+            partition_keys, latest_storage_ids, code_changed
+        ):
+            if (
+                latest_storage_id is None
+                or partition_code_changed
+                or any(
+                    _is_upstream_newer_or_stale(
+                        upstream_partition_keys,
+                        latest_storage_id,
+                        stale_assets.get(upstream_key),
+                        latest_storage_id_by_partition[upstream_key],
+                    )
+                    for upstream_key, upstream_partition_keys in _get_upstream_partition_keys(
+                        assets_def,
+                        partition_key,
+                        upstream_asset_keys_by_key[asset_key],
+                        assets_defs_by_key,
+                        partition_index,
+                    )
+                )
+            ):
+                stale_partition_keys.add(partition_key)
+
+        if not stale_partition_keys:
+            continue
+
+        stale_assets[asset_key] = StaleAsset(
+            asset_key,
+            cast(Set[str], stale_partition_keys) if assets_def.partitions_def else None,
+        )
+
+    return stale_assets
+
+
+@experimental
+def select_stale_assets(
+    instance: "DagsterInstance", assets: Sequence[AssetsDefinition]
+) -> Tuple[List[AssetsDefinition], List[AssetsDefinition]]:
+    """Splits the given assets into the ones that need to be recomputed and the ones that are up
+    to date, as determined by :py:func:`get_stale_assets`.
+
+    The two lists can be passed as the ``assets`` and ``source_assets`` arguments of
+    :py:func:`build_assets_job`, to build a job that only recomputes the stale part of the asset
+    graph and loads the rest.
+
+    Args:
+        instance (DagsterInstance): The instance that the assets are materialized in.
+        assets (Sequence[AssetsDefinition]): The assets to split.
+
+    Returns:
+        Tuple[List[AssetsDefinition], List[AssetsDefinition]]: The assets definitions that compute
+            at least one stale asset, and the remaining assets definitions.
+    """
+    stale_assets = get_stale_assets(instance, assets)
+
+    stale_assets_defs = []
+    up_to_date_assets_defs = []
+    for assets_def in assets:
+        if any(asset_key in stale_assets for asset_key in assets_def.asset_keys):
+            stale_assets_defs.append(assets_def)
+        else:
+            up_to_date_assets_defs.append(assets_def)
+
+    return stale_assets_defs, up_to_date_assets_defs
+
+
+def _toposort_asset_keys(
+    upstream_asset_keys_by_key: Mapping[AssetKey, Sequence[AssetKey]]
+) -> List[AssetKey]:
+    # orders the given asset keys so that each asset comes after the upstream assets among them
+    toposorted_asset_keys: List[AssetKey] = []
+    visited: Set[AssetKey] = set()
+    for root_asset_key in upstream_asset_keys_by_key:
+        if root_asset_key in visited:
+            continue
+
+        visited.add(root_asset_key)
+        stack = [(root_asset_key, iter(upstream_asset_keys_by_key[root_asset_key]))]
+        while stack:
+            asset_key, upstream_asset_keys = stack[-1]
+            upstream_asset_key = next(upstream_asset_keys, None)
+            if upstream_asset_key is None:
+                stack.pop()
+                toposorted_asset_keys.append(asset_key)
+            elif (
+                upstream_asset_key in upstream_asset_keys_by_key
+                and upstream_asset_key not in visited
+            ):
+                visited.add(upstream_asset_key)
+                stack.append(
+                    (upstream_asset_key, iter(upstream_asset_keys_by_key[upstream_asset_key]))
+                )
+
+    return toposorted_asset_keys
+
+
+def _has_code_version_changed(
+    assets_def: AssetsDefinition, latest_event: Optional[EventLogEntry]
+) -> bool:
+    code_version = assets_def.op.version
+    if code_version is None or latest_event is None or not latest_event.dagster_event:
+        return False
+
+    materialization = latest_event.dagster_event.step_materialization_data.materialization
+    return materialization.tags.get(CODE_VERSION_TAG) != code_version
+
+
+def _get_upstream_partition_keys(
+    assets_def: AssetsDefinition,
+    partition_key: Optional[str],
+    upstream_asset_keys: Sequence[AssetKey],
+    assets_defs_by_key: Mapping[AssetKey, AssetsDefinition],
+    partition_index: "_PartitionIndex",
+) -> Iterator[Tuple[AssetKey, Optional[Sequence[str]]]]:
+    # Yields each upstream asset key, along with the keys of the upstream partitions that the given
+    # partition depends on. The partition keys are None if it depends on the whole upstream asset.
+    for upstream_asset_key in upstream_asset_keys:
+        upstream_assets_def = assets_defs_by_key.get(upstream_asset_key)
+        if (
+            partition_key is None
+            or upstream_assets_def is None
+            or upstream_assets_def.partitions_def is None
+        ):
+            yield upstream_asset_key, None
+            continue
+
+        upstream_partition_key_range = get_upstream_partitions_for_partition_range(
+            assets_def,
+            upstream_assets_def,
+            upstream_asset_key,
+            PartitionKeyRange(partition_key, partition_key),
+        )
+        yield upstream_asset_key, partition_index.get_partition_keys_in_range(
+            upstream_assets_def.partitions_def, upstream_partition_key_range
+        )
+
+
+def _is_upstream_newer_or_stale(
+    upstream_partition_keys: Optional[Sequence[str]],
+    storage_id: int,
+    upstream_stale_asset: Optional[StaleAsset],
+    upstream_storage_id_by_partition: Mapping[Optional[str], int],
+) -> bool:
+    if upstream_partition_keys is None:
+        return upstream_stale_asset is not None or any(
+            upstream_storage_id > storage_id
+            for upstream_storage_id in upstream_storage_id_by_partition.values()
+        )
+
+    if upstream_stale_asset and any(
+        upstream_partition_key in cast(AbstractSet[str], upstream_stale_asset.partition_keys)
+        for upstream_partition_key in upstream_partition_keys
+    ):
+        return True
+
+    return any(
+        upstream_storage_id_by_partition.get(upstream_partition_key, -1) > storage_id
+        for upstream_partition_key in upstream_partition_keys
+    )
+
+
+class _PartitionIndex:
+    # Caches the partition keys of each partitions definition, along with the position of each key,
+    # so that partition key ranges can be expanded without scanning all of the keys
+    def __init__(self):
+        self._partition_keys_by_def_id: Dict[int, Sequence[str]] = {}
+        self._positions_by_def_id: Dict[int, Mapping[str, int]] = {}
+
+    def get_partition_keys(self, partitions_def: PartitionsDefinition) -> Sequence[str]:
+        def_id = id(partitions_def)
+        if def_id not in self._partition_keys_by_def_id:
+            self._partition_keys_by_def_id[def_id] = partitions_def.get_partition_keys()
+        return self._partition_keys_by_def_id[def_id]
+
+    def get_partition_keys_in_range(
+        self, partitions_def: PartitionsDefinition, partition_key_range: PartitionKeyRange
+    ) -> Sequence[str]:
+        partition_keys = self.get_partition_keys(partitions_def)
+        start = self._get_position(partitions_def, partition_key_range.start)
+        end = self._get_position(partitions_def, partition_key_range.end)
+        if start is None or end is None:
+            return []
+
+        # clip an endpoint that falls outside of the known partitions to the first or last key
+        return partition_keys[max(start, 0) : min(end, len(partition_keys) - 1) + 1]
+
+    def _get_position(
+        self, partitions_def: PartitionsDefinition, partition_key: str
+    ) -> Optional[int]:
+        # Returns the position of the key in the order of the partitions definition, which is -1 or
+        # the number of partitions for a key that falls before or after all of the partitions. None
+        # if the key can't be placed in the order.
+        partition_keys = self.get_partition_keys(partitions_def)
+        def_id = id(partitions_def)
+        if def_id not in self._positions_by_def_id:
+            self._positions_by_def_id[def_id] = {
+                key: position for position, key in enumerate(partition_keys)
+            }
+        position = self._positions_by_def_id[def_id].get(partition_key)
+        if position is not None:
+            return position
+
+        if not partition_keys or not isinstance(partitions_def, TimeWindowPartitionsDefinition):
+            return None
+
+        # a time window key that isn't a partition, e.g. one that a partition mapping produced for
+        # a time before the first partition, is placed by the start of its time window
+        try:
+            start_time = partitions_def.start_time_for_partition_key(partition_key)
+        except ValueError:
+            return None
+        if start_time < partitions_def.start_time_for_partition_key(partition_keys[0]):
+            return -1
+        if start_time > partitions_def.start_time_for_partition_key(partition_keys[-1]):
+            return len(partition_keys)
+        return None
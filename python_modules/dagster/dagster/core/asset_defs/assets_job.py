@@ -17,7 +17,8 @@
 from dagster.core.definitions.partition import PartitionedConfig, PartitionsDefinition
 from dagster.core.definitions.partition_key_range import PartitionKeyRange
 from dagster.core.definitions.resource_definition import ResourceDefinition
-from dagster.core.errors import DagsterInvalidDefinitionError
+from dagster.core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster.core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
 from dagster.core.execution.context.input import InputContext, build_input_context
 from dagster.core.execution.context.output import build_output_context
 from dagster.core.storage.root_input_manager import RootInputManagerDefinition, root_input_manager
@@ -45,6 +46,11 @@ def build_assets_job(
     The dependencies between the ops in the job are determined by the asset dependencies defined
     in the metadata on the provided asset nodes.
 
+    If the assets are partitioned with a TimeWindowPartitionsDefinition, a single run of the job can
+    cover a range of partitions, e.g. with ``execute_in_process(partition_key_range=...)``. The
+    IO managers then receive the whole range through ``context.asset_partition_key_range`` and
+    ``context.asset_partitions_time_window``.
+
     Args:
         name (str): The name of the job.
         assets (List[AssetsDefinition]): A list of assets or
@@ -118,43 +124,42 @@ def build_job_partitions_from_assets(
                 f"'{second_asset_key}' have different partitions definitions. "
             )
 
+    partitions_def = cast(PartitionsDefinition, first_assets_with_partitions_def.partitions_def)
     assets_defs_by_asset_key = {
         asset_key: assets_def for assets_def in assets for asset_key in assets_def.asset_keys
     }
 
-    def asset_partitions_for_job_partition(
-        job_partition_key: str,
-    ) -> Mapping[AssetKey, PartitionKeyRange]:
-        return {
-            asset_key: PartitionKeyRange(job_partition_key, job_partition_key)
-            for assets_def in assets
-            for asset_key in assets_def.asset_keys
-            if assets_def.partitions_def
-        }
-
-    def run_config_for_partition_fn(partition_key: str) -> Dict[str, Any]:
-        ops_config: Dict[str, Any] = {}
-        asset_partitions_by_asset_key = asset_partitions_for_job_partition(partition_key)
+    def run_config_for_partition_key_range_fn(
+        job_partition_key_range: PartitionKeyRange,
+    ) -> Dict[str, Any]:
+        if job_partition_key_range.start != job_partition_key_range.end and not isinstance(
+            partitions_def, TimeWindowPartitionsDefinition
+        ):
+            raise DagsterInvariantViolationError(
+                "A single run can only cover a range of partitions of assets that are partitioned "
+                "with a TimeWindowPartitionsDefinition."
+            )
 
+        ops_config: Dict[str, Any] = {}
         for assets_def in assets:
             outputs_dict: Dict[str, Dict[str, Any]] = {}
             if assets_def.partitions_def is not None:
-                for asset_key, output_def in assets_def.output_defs_by_asset_key.items():
-                    asset_partition_key_range = asset_partitions_by_asset_key[asset_key]
+                for output_def in assets_def.output_defs_by_asset_key.values():
                     outputs_dict[output_def.name] = {
-                        "start": asset_partition_key_range.start,
-                        "end": asset_partition_key_range.end,
+                        "start": job_partition_key_range.start,
+                        "end": job_partition_key_range.end,
                     }
 
             inputs_dict: Dict[str, Dict[str, Any]] = {}
             for in_asset_key, input_def in assets_def.input_defs_by_asset_key.items():
-                upstream_assets_def = assets_defs_by_asset_key[in_asset_key]
+                upstream_assets_def = assets_defs_by_asset_key.get(in_asset_key)
                 if (
                     assets_def.partitions_def is not None
+                    and upstream_assets_def is not None
                     and upstream_assets_def.partitions_def is not None
                 ):
                     upstream_partition_key_range = get_upstream_partitions_for_partition_range(
-                        assets_def, upstream_assets_def, in_asset_key, asset_partition_key_range
+                        assets_def, upstream_assets_def, in_asset_key, job_partition_key_range
                     )
                     inputs_dict[input_def.name] = {
                         "start": upstream_partition_key_range.start,
@@ -173,8 +178,11 @@ def run_config_for_partition_fn(partition_key: str) -> Dict[str, Any]:
         return {"ops": ops_config}
 
     return PartitionedConfig(
-        partitions_def=cast(PartitionsDefinition, first_assets_with_partitions_def.partitions_def),
-        run_config_for_partition_fn=lambda p: run_config_for_partition_fn(p.name),
+        partitions_def=partitions_def,
+        run_config_for_partition_fn=lambda p: run_config_for_partition_key_range_fn(
+            PartitionKeyRange(p.name, p.name)
+        ),
+        run_config_for_partition_key_range_fn=run_config_for_partition_key_range_fn,
     )
 
 
@@ -32,6 +32,7 @@ def asset(
     dagster_type: Optional[DagsterType] = None,
     partitions_def: Optional[PartitionsDefinition] = None,
     partition_mappings: Optional[Mapping[str, PartitionMapping]] = None,
+    version: Optional[str] = None,
 ) -> Callable[[Callable[..., Any]], AssetsDefinition]:
     """Create a definition for how to compute an asset.
 
@@ -68,6 +69,9 @@ def asset(
             If no entry is provided for a particular asset dependency, the partition mapping defaults
             to the default partition mapping for the partitions definition, which is typically maps
             partition keys to the same partition keys in upstream assets.
+        version (Optional[str]): (Experimental) The version of the asset's computation. It's
+            recorded on the asset's materializations, and assets that were last materialized with a
+            different version are considered stale.
 
     Examples:
 
@@ -94,6 +98,7 @@ def inner(fn: Callable[..., Any]) -> AssetsDefinition:
             dagster_type=dagster_type,
             partitions_def=partitions_def,
             partition_mappings=partition_mappings,
+            version=check.opt_str_param(version, "version"),
         )(fn)
 
     return inner
@@ -114,6 +119,7 @@ def __init__(
         dagster_type: Optional[DagsterType] = None,
         partitions_def: Optional[PartitionsDefinition] = None,
         partition_mappings: Optional[Mapping[str, PartitionMapping]] = None,
+        version: Optional[str] = None,
     ):
         self.name = name
         self.namespace = namespace
@@ -127,6 +133,7 @@ def __init__(
         self.dagster_type = dagster_type
         self.partitions_def = partitions_def
         self.partition_mappings = partition_mappings
+        self.version = version
 
     def __call__(self, fn: Callable) -> AssetsDefinition:
         asset_name = self.name or fn.__name__
@@ -138,7 +145,14 @@ def __call__(self, fn: Callable) -> AssetsDefinition:
         partition_fn: Optional[Callable] = None
         if self.partitions_def:
 
+            partitions_def = self.partitions_def
+
             def partition_fn(context):  # pylint: disable=function-redefined
+                # runs of asset jobs can cover a range of partitions
+                if context.has_asset_partitions:
+                    return partitions_def.get_partition_keys_in_range(
+                        context.asset_partition_key_range
+                    )
                 return [context.partition_key]
 
         out = Out(
@@ -164,6 +178,7 @@ def partition_fn(context):  # pylint: disable=function-redefined
                     "output_partitions": Field(dict, is_required=False),
                 }
             },
+            version=self.version,
         )(fn)
 
         out_asset_key = AssetKey(list(filter(None, [self.namespace, asset_name])))
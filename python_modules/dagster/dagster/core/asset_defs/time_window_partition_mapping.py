@@ -1,10 +1,11 @@
-from datetime import datetime, timedelta
 from typing import cast
 
-from dagster import check
-from dagster.core.definitions.partition import PartitionsDefinition, ScheduleType
+from dagster.core.definitions.partition import PartitionsDefinition
 from dagster.core.definitions.partition_key_range import PartitionKeyRange
-from dagster.core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster.core.definitions.time_window_partitions import (
+    TimeWindow,
+    TimeWindowPartitionsDefinition,
+)
 from dagster.core.errors import DagsterInvalidDefinitionError
 
 from .partition_mapping import PartitionMapping
@@ -59,7 +60,7 @@ def _map_partitions(
         from_partition_key_range: PartitionKeyRange,
     ) -> PartitionKeyRange:
         if not isinstance(from_partitions_def, TimeWindowPartitionsDefinition) or not isinstance(
-            from_partitions_def, TimeWindowPartitionsDefinition
+            to_partitions_def, TimeWindowPartitionsDefinition
         ):
             raise DagsterInvalidDefinitionError(
                 "TimeWindowPartitionMappings can only operate on TimeWindowPartitionsDefinitions"
@@ -70,38 +71,11 @@ def _map_partitions(
         if to_partitions_def.timezone != from_partitions_def.timezone:
             raise DagsterInvalidDefinitionError("Timezones don't match")
 
-        to_period = to_partitions_def.schedule_type
-        from_period = from_partitions_def.schedule_type
-
-        from_start_dt = datetime.strptime(from_partition_key_range.start, from_partitions_def.fmt)
-        from_end_dt = datetime.strptime(from_partition_key_range.end, from_partitions_def.fmt)
-
-        if to_period > from_period:
-            to_start_dt = round_datetime_to_period(from_start_dt, to_period)
-            to_end_dt = round_datetime_to_period(from_end_dt, to_period)
-        elif to_period < from_period:
-            to_start_dt = from_start_dt
-            to_end_dt = (from_end_dt + from_period.delta) - to_period.delta
-        else:
-            to_start_dt = from_start_dt
-            to_end_dt = from_end_dt
-
-        return PartitionKeyRange(
-            to_start_dt.strftime(to_partitions_def.fmt),
-            to_end_dt.strftime(to_partitions_def.fmt),
-        )
-
-
-def round_datetime_to_period(dt: datetime, period: ScheduleType) -> datetime:
-    if period == ScheduleType.MONTHLY:
-        return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    elif period == ScheduleType.WEEKLY:
-        return (dt - timedelta(days=dt.weekday())).replace(
-            hour=0, minute=0, second=0, microsecond=0
+        return to_partitions_def.get_partition_key_range_for_time_window(
+            TimeWindow(
+                from_partitions_def.time_window_for_partition_key(
+                    from_partition_key_range.start
+                ).start,
+                from_partitions_def.time_window_for_partition_key(from_partition_key_range.end).end,
+            )
         )
-    elif period == ScheduleType.DAILY:
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
-    elif period == ScheduleType.HOURLY:
-        return dt.replace(minute=0, second=0, microsecond=0)
-    else:
-        check.failed("Unknown schedule type")
@@ -5,6 +5,7 @@
 
 from dagster import check, seven
 from dagster.core.errors import DagsterInvalidAssetKey
+from dagster.core.storage.tags import SYSTEM_TAG_PREFIX
 from dagster.serdes import DefaultNamedTupleSerializer, whitelist_for_serdes
 from dagster.utils.backcompat import experimental_arg_warning, experimental_class_param_warning
 
@@ -386,7 +387,9 @@ def __new__(
             check.is_tuple(asset_key, of_type=str)
             asset_key = AssetKey(asset_key)
 
-        if tags:
+        # system tags (e.g. the code version attached by the framework) are not user opt-ins to
+        # the experimental tags param, so only warn for user-provided tags
+        if tags and any(not key.startswith(SYSTEM_TAG_PREFIX) for key in tags):
             experimental_class_param_warning("tags", "AssetMaterialization")
 
         metadata = check.opt_dict_param(metadata, "metadata", key_type=str)
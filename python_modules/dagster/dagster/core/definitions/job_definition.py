@@ -21,13 +21,16 @@
     OpSelectionData,
     parse_op_selection,
 )
+from dagster.core.storage.tags import PARTITION_SET_TAG
 from dagster.core.utils import str_format_set
+from dagster.utils import merge_dicts
 
 from .executor_definition import ExecutorDefinition
 from .graph_definition import GraphDefinition, SubselectedGraphDefinition
 from .hook_definition import HookDefinition
 from .mode import ModeDefinition
 from .partition import PartitionSetDefinition
+from .partition_key_range import PartitionKeyRange
 from .pipeline_definition import PipelineDefinition
 from .preset import PresetDefinition
 from .resource_definition import ResourceDefinition
@@ -93,6 +96,7 @@ def execute_in_process(
         partition_key: Optional[str] = None,
         raise_on_error: bool = True,
         op_selection: Optional[List[str]] = None,
+        partition_key_range: Optional[PartitionKeyRange] = None,
     ) -> "ExecuteInProcessResult":
         """
         Execute the Job in-process, gathering results in-memory.
@@ -119,6 +123,11 @@ def execute_in_process(
                 (downstream dependencies) within 3 levels down.
                 * ``['*some_op', 'other_op_a', 'other_op_b+']``: select ``some_op`` and all its
                 ancestors, ``other_op_a`` itself, and ``other_op_b`` and its direct child ops.
+            partition_key_range (Optional[PartitionKeyRange]): (Experimental) A range of partition
+                keys to execute in a single run. Can only be used for jobs whose partitioned config
+                supports partition key ranges, like asset jobs whose assets are partitioned by
+                time windows. The run counts as a run of each partition in the range in the
+                partition status of the job.
         Returns:
             :py:class:`~dagster.ExecuteInProcessResult`
 
@@ -129,6 +138,14 @@ def execute_in_process(
         run_config = check.opt_dict_param(run_config, "run_config")
         op_selection = check.opt_list_param(op_selection, "op_selection", str)
         partition_key = check.opt_str_param(partition_key, "partition_key")
+        partition_key_range = check.opt_inst_param(
+            partition_key_range, "partition_key_range", PartitionKeyRange
+        )
+        check.invariant(
+            not (partition_key and partition_key_range),
+            "Cannot provide both partition_key and partition_key_range arguments to "
+            "`execute_in_process`",
+        )
 
         check.invariant(
             len(self._mode_definitions) == 1,
@@ -167,6 +184,30 @@ def execute_in_process(
                 "Cannot provide both run_config and partition_key arguments to `execute_in_process`",
             )
             run_config = base_mode.partitioned_config.get_run_config(partition_key)
+            run_tags = {"partition": partition_key}
+        elif partition_key_range:
+            if not base_mode.partitioned_config:
+                check.failed(
+                    f"Provided partition key range for job `{self._name}` without a partitioned "
+                    "config"
+                )
+            check.invariant(
+                not run_config,
+                "Cannot provide both run_config and partition_key_range arguments to "
+                "`execute_in_process`",
+            )
+            partitioned_config = base_mode.partitioned_config
+            run_config = partitioned_config.get_run_config_for_partition_key_range(
+                partition_key_range
+            )
+            # range runs are in the partition set of the job, so that they are counted for each
+            # partition in their range
+            run_tags = merge_dicts(
+                partitioned_config.get_tags_for_partition_key_range(partition_key_range),
+                {PARTITION_SET_TAG: check.not_none(self.get_partition_set_def()).name},
+            )
+        else:
+            run_tags = None
 
         return core_execute_in_process(
             node=self._graph_def,
@@ -175,7 +216,7 @@ def execute_in_process(
             instance=instance,
             output_capturing_enabled=True,
             raise_on_error=raise_on_error,
-            run_tags={"partition": partition_key} if partition_key else None,
+            run_tags=run_tags,
         )
 
     @property
@@ -23,8 +23,13 @@
     user_code_error_boundary,
 )
 from ..storage.pipeline_run import PipelineRun
-from ..storage.tags import check_tags
+from ..storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    check_tags,
+)
 from .mode import DEFAULT_MODE_NAME
+from .partition_key_range import PartitionKeyRange
 from .run_request import RunRequest, SkipReason
 from .schedule_definition import ScheduleDefinition, ScheduleEvaluationContext
 from .utils import check_valid_name
@@ -173,6 +178,25 @@ def __str__(self) -> str:
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> List[str]:
         return [partition.name for partition in self.get_partitions(current_time)]
 
+    def get_partition(
+        self, partition_key: str, current_time: Optional[datetime] = None
+    ) -> Optional[Partition[T]]:
+        for partition in self.get_partitions(current_time):
+            if partition.name == partition_key:
+                return partition
+
+        return None
+
+    def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) -> List[str]:
+        """Returns the keys between the start and end keys of the given range, inclusive."""
+        partition_keys = self.get_partition_keys()
+        return partition_keys[
+            partition_keys.index(partition_key_range.start) : partition_keys.index(
+                partition_key_range.end
+            )
+            + 1
+        ]
+
     def get_default_partition_mapping(self):
         from dagster.core.asset_defs.partition_mapping import IdentityPartitionMapping
 
@@ -479,14 +503,14 @@ def get_partitions(self, current_time: Optional[datetime] = None) -> List[Partit
         return self._partitions_def.get_partitions(current_time)
 
     def get_partition(self, name: str) -> Partition[T]:
-        for partition in self.get_partitions():
-            if partition.name == name:
-                return partition
+        partition = self._partitions_def.get_partition(name)
+        if partition is None:
+            check.failed("Partition name {} not found!".format(name))
 
-        check.failed("Partition name {} not found!".format(name))
+        return partition
 
     def get_partition_names(self, current_time: Optional[datetime] = None) -> List[str]:
-        return [part.name for part in self.get_partitions(current_time)]
+        return self._partitions_def.get_partition_keys(current_time)
 
     def create_schedule_definition(
         self,
@@ -706,12 +730,18 @@ def __init__(
         partitions_def: PartitionsDefinition[T],  # pylint: disable=unsubscriptable-object
         run_config_for_partition_fn: Callable[[Partition[T]], Dict[str, Any]],
         decorated_fn: Optional[Callable[..., Dict[str, Any]]] = None,
+        run_config_for_partition_key_range_fn: Optional[
+            Callable[[PartitionKeyRange], Dict[str, Any]]
+        ] = None,
     ):
         self._partitions = check.inst_param(partitions_def, "partitions_def", PartitionsDefinition)
         self._run_config_for_partition_fn = check.callable_param(
             run_config_for_partition_fn, "run_config_for_partition_fn"
         )
         self._decorated_fn = decorated_fn
+        self._run_config_for_partition_key_range_fn = check.opt_callable_param(
+            run_config_for_partition_key_range_fn, "run_config_for_partition_key_range_fn"
+        )
 
     @property
     def partitions_def(self) -> PartitionsDefinition[T]:  # pylint: disable=unsubscriptable-object
@@ -722,19 +752,50 @@ def run_config_for_partition_fn(self) -> Callable[[Partition[T]], Dict[str, Any]
         return self._run_config_for_partition_fn
 
     def get_partition_keys(self, current_time: Optional[datetime] = None) -> List[str]:
-        return [partition.name for partition in self.partitions_def.get_partitions(current_time)]
+        return self.partitions_def.get_partition_keys(current_time)
 
     def get_run_config(self, partition_key: str) -> Dict[str, Any]:
-        matching = [
-            partition
-            for partition in self.partitions_def.get_partitions()
-            if partition.name == partition_key
-        ]
-        if not matching:
+        partition = self.partitions_def.get_partition(partition_key)
+        if partition is None:
             raise DagsterUnknownPartitionError(
                 f"Could not find a partition with key `{partition_key}`"
             )
-        return self.run_config_for_partition_fn(matching[0])
+        return self.run_config_for_partition_fn(partition)
+
+    @property
+    def supports_partition_key_ranges(self) -> bool:
+        """Whether a single run can cover a range of partitions."""
+        return self._run_config_for_partition_key_range_fn is not None
+
+    def get_run_config_for_partition_key_range(
+        self, partition_key_range: PartitionKeyRange
+    ) -> Dict[str, Any]:
+        """Returns the run config for a single run that covers all of the partitions in the given
+        range, for partitioned configs that support partition key ranges.
+        """
+        check.inst_param(partition_key_range, "partition_key_range", PartitionKeyRange)
+        if self._run_config_for_partition_key_range_fn is None:
+            raise DagsterInvalidInvocationError(
+                "This partitioned config does not support runs over a range of partitions."
+            )
+
+        for partition_key in [partition_key_range.start, partition_key_range.end]:
+            if self.partitions_def.get_partition(partition_key) is None:
+                raise DagsterUnknownPartitionError(
+                    f"Could not find a partition with key `{partition_key}`"
+                )
+
+        return self._run_config_for_partition_key_range_fn(partition_key_range)
+
+    def get_tags_for_partition_key_range(
+        self, partition_key_range: PartitionKeyRange
+    ) -> Dict[str, str]:
+        """Returns the tags that identify a run that covers the partitions in the given range."""
+        check.inst_param(partition_key_range, "partition_key_range", PartitionKeyRange)
+        return {
+            ASSET_PARTITION_RANGE_START_TAG: partition_key_range.start,
+            ASSET_PARTITION_RANGE_END_TAG: partition_key_range.end,
+        }
 
     def __call__(self, *args, **kwargs):
         if self._decorated_fn is None:
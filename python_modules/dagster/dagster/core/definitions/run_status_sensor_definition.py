@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime
-from typing import Any, Callable, List, NamedTuple, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Union, cast
 
 import pendulum
 from dagster import check
@@ -13,7 +13,6 @@
 )
 from dagster.core.errors import RunStatusSensorExecutionError, user_code_error_boundary
 from dagster.core.events import PIPELINE_RUN_STATUS_TO_EVENT_TYPE, DagsterEvent
-from dagster.core.instance import DagsterInstance
 from dagster.core.storage.pipeline_run import (
     DagsterRun,
     PipelineRun,
@@ -31,6 +30,9 @@
 from dagster.utils import utc_datetime_from_timestamp
 from dagster.utils.error import serializable_error_info_from_exc_info
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 @whitelist_for_serdes
 class RunStatusSensorCursor(
@@ -74,7 +76,7 @@ class RunStatusSensorContext(
             ("sensor_name", str),
             ("dagster_run", DagsterRun),
             ("dagster_event", DagsterEvent),
-            ("instance", DagsterInstance),
+            ("instance", "DagsterInstance"),
         ],
     )
 ):
@@ -89,6 +91,8 @@ class RunStatusSensorContext(
 
     def __new__(cls, sensor_name, dagster_run, dagster_event, instance):
 
+        from dagster.core.instance import DagsterInstance
+
         return super(RunStatusSensorContext, cls).__new__(
             cls,
             sensor_name=check.str_param(sensor_name, "sensor_name"),
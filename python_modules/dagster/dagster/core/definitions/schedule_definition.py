@@ -18,8 +18,6 @@
     ScheduleExecutionError,
     user_code_error_boundary,
 )
-from ..instance import DagsterInstance
-from ..instance.ref import InstanceRef
 from ..storage.pipeline_run import PipelineRun
 from ..storage.tags import check_tags
 from .graph_definition import GraphDefinition
@@ -30,6 +28,9 @@
 from .utils import check_valid_name
 
 if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.instance.ref import InstanceRef
+
     from .decorators.schedule import DecoratedScheduleFunction
 
 
@@ -52,8 +53,10 @@ class ScheduleEvaluationContext:
     __slots__ = ["_instance_ref", "_scheduled_execution_time", "_exit_stack", "_instance"]
 
     def __init__(
-        self, instance_ref: Optional[InstanceRef], scheduled_execution_time: Optional[datetime]
+        self, instance_ref: "Optional[InstanceRef]", scheduled_execution_time: Optional[datetime]
     ):
+        from dagster.core.instance import InstanceRef
+
         self._exit_stack = ExitStack()
         self._instance = None
 
@@ -70,6 +73,8 @@ def __exit__(self, _exception_type, _exception_value, _traceback):
 
     @property
     def instance(self) -> "DagsterInstance":
+        from dagster.core.instance import DagsterInstance
+
         # self._instance_ref should only ever be None when this ScheduleEvaluationContext was
         # constructed under test.
         if not self._instance_ref:
@@ -92,7 +97,8 @@ def scheduled_execution_time(self) -> Optional[datetime]:
 
 
 def build_schedule_context(
-    instance: Optional[DagsterInstance] = None, scheduled_execution_time: Optional[datetime] = None
+    instance: "Optional[DagsterInstance]" = None,
+    scheduled_execution_time: Optional[datetime] = None,
 ) -> ScheduleEvaluationContext:
     """Builds schedule execution context using the provided parameters.
 
@@ -114,6 +120,8 @@ def build_schedule_context(
 
     """
 
+    from dagster.core.instance import DagsterInstance
+
     check.opt_inst_param(instance, "instance", DagsterInstance)
     return ScheduleEvaluationContext(
         instance_ref=instance.get_ref() if instance and instance.is_persistent else None,
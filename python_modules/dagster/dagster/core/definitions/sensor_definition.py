@@ -5,6 +5,7 @@
     Any,
     Callable,
     Generator,
+    Iterator,
     List,
     NamedTuple,
     Optional,
@@ -19,8 +20,6 @@
     DagsterInvalidInvocationError,
     DagsterInvariantViolationError,
 )
-from dagster.core.instance import DagsterInstance
-from dagster.core.instance.ref import InstanceRef
 from dagster.serdes import whitelist_for_serdes
 from dagster.seven import funcsigs
 from dagster.utils import ensure_gen
@@ -36,6 +35,8 @@
 
 if TYPE_CHECKING:
     from dagster.core.events.log import EventLogEntry
+    from dagster.core.instance import DagsterInstance
+    from dagster.core.instance.ref import InstanceRef
 
 DEFAULT_SENSOR_DAEMON_INTERVAL = 30
 
@@ -64,13 +65,15 @@ class SensorEvaluationContext:
 
     def __init__(
         self,
-        instance_ref: Optional[InstanceRef],
+        instance_ref: "Optional[InstanceRef]",
         last_completion_time: Optional[float],
         last_run_key: Optional[str],
         cursor: Optional[str],
         repository_name: Optional[str],
-        instance: Optional[DagsterInstance] = None,
+        instance: "Optional[DagsterInstance]" = None,
     ):
+        from dagster.core.instance import DagsterInstance, InstanceRef
+
         self._exit_stack = ExitStack()
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
         self._last_completion_time = check.opt_float_param(
@@ -88,7 +91,9 @@ def __exit__(self, _exception_type, _exception_value, _traceback):
         self._exit_stack.close()
 
     @property
-    def instance(self) -> DagsterInstance:
+    def instance(self) -> "DagsterInstance":
+        from dagster.core.instance import DagsterInstance
+
         # self._instance_ref should only ever be None when this SensorEvaluationContext was
         # constructed under test.
         if not self._instance:
@@ -302,7 +307,78 @@ def evaluate_tick(self, context: "SensorEvaluationContext") -> "SensorExecutionD
 
         check.inst_param(context, "context", SensorEvaluationContext)
         result = list(ensure_gen(self._evaluation_fn(context)))
+        return self._build_execution_data(context, result)
+
+    def evaluate_tick_in_batches(
+        self, context: "SensorEvaluationContext", run_request_batch_size: int
+    ) -> Iterator["SensorExecutionData"]:
+        """Evaluate sensor using the provided context, yielding its run requests in batches as the
+        evaluation function produces them.
+
+        Every batch but the last one holds ``run_request_batch_size`` run requests, along with the
+        cursor of the context at the time that the last of them was produced. Such a batch is only
+        yielded once the evaluation function has produced the next run request, and it is marked
+        as safe to checkpoint if the cursor changed in between. Otherwise, the cursor of the batch
+        may already account for run requests in later batches. The last batch holds the remaining
+        run requests, the skip message or run reactions if there were no run requests, and the
+        final cursor.
+
+        Args:
+            context (SensorEvaluationContext): The context with which to evaluate this sensor.
+            run_request_batch_size (int): The number of run requests in each batch.
+        Returns:
+            Iterator[SensorExecutionData]: The batches of the evaluation's results.
+        """
+
+        check.inst_param(context, "context", SensorEvaluationContext)
+        check.int_param(run_request_batch_size, "run_request_batch_size")
+        check.invariant(run_request_batch_size > 0, "run_request_batch_size must be positive")
+
+        result = []
+        run_requests: List[RunRequest] = []
+        batch_cursor = None
+        has_yielded_run_requests = False
+        for item in ensure_gen(self._evaluation_fn(context)):
+            if not isinstance(item, RunRequest):
+                result.append(item)
+                continue
+
+            if len(run_requests) == run_request_batch_size:
+                self.check_valid_run_requests(run_requests)
+                yield SensorExecutionData(
+                    run_requests,
+                    None,
+                    batch_cursor,
+                    [],
+                    safe_to_checkpoint=context.cursor != batch_cursor,
+                )
+                has_yielded_run_requests = True
+                run_requests = []
+
+            run_requests.append(item)
+            if len(run_requests) == run_request_batch_size:
+                batch_cursor = context.cursor
+
+        if not has_yielded_run_requests:
+            yield self._build_execution_data(context, result + run_requests)
+            return
+
+        if any(isinstance(item, SkipReason) for item in result):
+            check.failed(
+                "Expected a single SkipReason or one or more RunRequests: received both "
+                "RunRequest and SkipReason"
+            )
+        check.invariant(
+            not any(isinstance(item, PipelineRunReaction) for item in result),
+            "Expected one or more RunRequests or one or more PipelineRunReactions: received both",
+        )
 
+        self.check_valid_run_requests(run_requests)
+        yield SensorExecutionData(run_requests, None, context.cursor, [])
+
+    def _build_execution_data(
+        self, context: "SensorEvaluationContext", result: List[Any]
+    ) -> "SensorExecutionData":
         skip_message: Optional[str] = None
 
         run_requests: List[RunRequest]
@@ -419,6 +495,7 @@ class SensorExecutionData(
             ("skip_message", Optional[str]),
             ("cursor", Optional[str]),
             ("pipeline_run_reactions", Optional[List[PipelineRunReaction]]),
+            ("safe_to_checkpoint", bool),
         ],
     )
 ):
@@ -428,6 +505,7 @@ def __new__(
         skip_message: Optional[str] = None,
         cursor: Optional[str] = None,
         pipeline_run_reactions: Optional[List[PipelineRunReaction]] = None,
+        safe_to_checkpoint: bool = False,
     ):
         check.opt_list_param(run_requests, "run_requests", RunRequest)
         check.opt_str_param(skip_message, "skip_message")
@@ -442,6 +520,7 @@ def __new__(
             skip_message=skip_message,
             cursor=cursor,
             pipeline_run_reactions=pipeline_run_reactions,
+            safe_to_checkpoint=check.bool_param(safe_to_checkpoint, "safe_to_checkpoint"),
         )
 
 
@@ -474,7 +553,7 @@ def _wrapped_fn(context):
 
 
 def build_sensor_context(
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
     cursor: Optional[str] = None,
     repository_name: Optional[str] = None,
 ) -> SensorEvaluationContext:
@@ -498,6 +577,8 @@ def build_sensor_context(
 
     """
 
+    from dagster.core.instance import DagsterInstance
+
     check.opt_inst_param(instance, "instance", DagsterInstance)
     check.opt_str_param(cursor, "cursor")
     check.opt_str_param(repository_name, "repository_name")
@@ -1,10 +1,22 @@
 from datetime import datetime
-from typing import Any, Callable, Dict, List, NamedTuple, Optional, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+    overload,
+)
 
 import pendulum
 from dagster import check
+from dagster.seven.compat.pendulum import PendulumDateTime
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
-from dagster.utils.schedules import schedule_execution_time_iterator
 
 from .partition import (
     DEFAULT_DATE_FORMAT,
@@ -12,8 +24,8 @@
     PartitionedConfig,
     PartitionsDefinition,
     ScheduleType,
-    get_cron_schedule,
 )
+from .partition_key_range import PartitionKeyRange
 
 
 class TimeWindow(NamedTuple):
@@ -56,50 +68,56 @@ def __new__(
     def get_partitions(
         self, current_time: Optional[datetime] = None
     ) -> List[Partition[TimeWindow]]:
-        current_timestamp = (
+        num_partitions = self.get_num_partitions(current_time)
+        start_times = [self._get_partition_start_time(i) for i in range(num_partitions + 1)]
+        return [
+            Partition(
+                value=TimeWindow(start_times[i], start_times[i + 1]),
+                name=start_times[i].strftime(self.fmt),
+            )
+            for i in range(num_partitions)
+        ]
+
+    def get_partition_keys(self, current_time: Optional[datetime] = None) -> List[str]:
+        return list(self.get_partition_key_sequence(current_time))
+
+    def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) -> List[str]:
+        return self.get_partition_key_sequence().get_partition_keys_in_range(partition_key_range)
+
+    def get_partition(
+        self, partition_key: str, current_time: Optional[datetime] = None
+    ) -> Optional[Partition[TimeWindow]]:
+        partition_keys = self.get_partition_key_sequence(current_time)
+        if partition_key not in partition_keys:
+            return None
+
+        return Partition(
+            value=self.time_window_for_partition_key(partition_key), name=partition_key
+        )
+
+    def get_partition_key_sequence(
+        self, current_time: Optional[datetime] = None
+    ) -> "TimeWindowPartitionKeys":
+        """Returns the partition keys that exist at the given time, as a sequence that computes
+        each key when it is accessed instead of building the full list up front.
+
+        Args:
+            current_time (Optional[datetime]): The time at which to evaluate the partitions.
+                Defaults to the current time.
+        """
+        return TimeWindowPartitionKeys(self, self.get_num_partitions(current_time))
+
+    def get_num_partitions(self, current_time: Optional[datetime] = None) -> int:
+        current_dt = (
             pendulum.instance(current_time, tz=self.timezone)
             if current_time
             else pendulum.now(self.timezone)
-        ).timestamp()
-
-        start_timestamp = pendulum.instance(self.start, tz=self.timezone).timestamp()
-        iterator = schedule_execution_time_iterator(
-            start_timestamp=start_timestamp,
-            cron_schedule=get_cron_schedule(schedule_type=self.schedule_type),
-            execution_timezone=self.timezone,
         )
 
-        partitions: List[Partition[TimeWindow]] = []
-        prev_time = next(iterator)
-        while prev_time.timestamp() < start_timestamp:
-            prev_time = next(iterator)
-
-        end_offset = self.end_offset
-        partitions_past_current_time = 0
-        while True:
-            next_time = next(iterator)
-            if (
-                next_time.timestamp() <= current_timestamp
-                or partitions_past_current_time < end_offset
-            ):
-                partitions.append(
-                    Partition(
-                        value=TimeWindow(prev_time, next_time),
-                        name=prev_time.strftime(self.fmt),
-                    )
-                )
-
-                if next_time.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-            prev_time = next_time
-
-        if end_offset < 0:
-            partitions = partitions[:end_offset]
-
-        return partitions
+        # The number of partitions whose time windows have ended by the current time
+        num_complete_partitions = max(self._get_partition_index_for_time(current_dt), 0)
+
+        return max(num_complete_partitions + self.end_offset, 0)
 
     def __str__(self) -> str:
         partition_def_str = f"{self.schedule_type.value.capitalize()}, starting {self.start.strftime(self.fmt)} {self.timezone}."
@@ -108,24 +126,187 @@ def __str__(self) -> str:
         return partition_def_str
 
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
-        start = self.start_time_for_partition_key(partition_key)
-        iterator = schedule_execution_time_iterator(
-            start_timestamp=start.timestamp(),
-            cron_schedule=get_cron_schedule(schedule_type=self.schedule_type),
-            execution_timezone=self.timezone,
+        index = self._get_partition_index_for_time(self.start_time_for_partition_key(partition_key))
+        return TimeWindow(
+            self._get_partition_start_time(index), self._get_partition_start_time(index + 1)
         )
-        next(iterator)
-        return TimeWindow(start, next(iterator))
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
         return pendulum.instance(datetime.strptime(partition_key, self.fmt), tz=self.timezone)
 
+    def get_partition_key_range_for_time_window(self, time_window: TimeWindow) -> PartitionKeyRange:
+        """Returns the range of partition keys whose time windows overlap the given time window,
+        whether or not those partitions exist yet.
+        """
+        start_index = self._get_partition_index_for_time(time_window.start)
+        end_index = self._get_partition_index_for_time(time_window.end)
+        if self._get_partition_start_time(end_index) >= time_window.end:
+            end_index -= 1
+
+        return PartitionKeyRange(
+            self._get_partition_start_time(start_index).strftime(self.fmt),
+            self._get_partition_start_time(max(start_index, end_index)).strftime(self.fmt),
+        )
+
+    def _get_first_partition_start_time(self) -> PendulumDateTime:
+        return _get_first_partition_start_time(self.start, self.timezone, self.schedule_type)
+
+    def _get_partition_start_time(self, index: int) -> PendulumDateTime:
+        """The start time of the partition at the given index, counting from the first partition.
+        Indexes past either end of the partitions that currently exist are allowed.
+        """
+        return _add_periods(self._get_first_partition_start_time(), self.schedule_type, index)
+
+    def _get_partition_index_for_time(self, dt: datetime) -> int:
+        """The index of the partition whose time window contains the given time. Times before the
+        first partition have negative indexes.
+        """
+        dt = pendulum.instance(dt, tz=self.timezone).in_tz(self.timezone)
+        first_start_dt = self._get_first_partition_start_time()
+
+        # Estimate the index from the calendar, then correct it for the time of day and for any
+        # daylight savings transitions
+        if self.schedule_type == ScheduleType.HOURLY:
+            index = int((dt.timestamp() - first_start_dt.timestamp()) // 3600)
+        elif self.schedule_type == ScheduleType.DAILY:
+            index = (dt.date() - first_start_dt.date()).days
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            index = (dt.date() - first_start_dt.date()).days // 7
+        else:
+            index = (dt.year - first_start_dt.year) * 12 + dt.month - first_start_dt.month
+
+        while _add_periods(first_start_dt, self.schedule_type, index) > dt:
+            index -= 1
+        while _add_periods(first_start_dt, self.schedule_type, index + 1) <= dt:
+            index += 1
+
+        return index
+
     def get_default_partition_mapping(self):
         from dagster.core.asset_defs.time_window_partition_mapping import TimeWindowPartitionMapping
 
         return TimeWindowPartitionMapping()
 
 
+# partitions definitions are usually module-level constants, so only a few distinct starts are
+# computed in a process
+@lru_cache(maxsize=128)
+def _get_first_partition_start_time(
+    start: datetime, timezone: str, schedule_type: ScheduleType
+) -> PendulumDateTime:
+    start_dt = pendulum.instance(start, tz=timezone).in_tz(timezone)
+    if schedule_type == ScheduleType.HOURLY:
+        first_start_dt = start_dt.start_of("hour")
+    elif schedule_type == ScheduleType.DAILY:
+        first_start_dt = start_dt.start_of("day")
+    elif schedule_type == ScheduleType.WEEKLY:
+        # weekly partitions start on Sundays, matching the cron schedule
+        first_start_dt = start_dt.start_of("day").subtract(days=(start_dt.weekday() + 1) % 7)
+    else:
+        first_start_dt = start_dt.start_of("month")
+
+    if first_start_dt < start_dt:
+        first_start_dt = _add_periods(first_start_dt, schedule_type, 1)
+
+    return first_start_dt
+
+
+def _add_periods(
+    dt: PendulumDateTime, schedule_type: ScheduleType, num_periods: int
+) -> PendulumDateTime:
+    # Hours are added in absolute time, and longer periods in local time, which matches how
+    # schedule_execution_time_iterator advances
+    if schedule_type == ScheduleType.HOURLY:
+        return dt.add(hours=num_periods)
+    elif schedule_type == ScheduleType.DAILY:
+        return dt.add(days=num_periods)
+    elif schedule_type == ScheduleType.WEEKLY:
+        return dt.add(weeks=num_periods)
+    elif schedule_type == ScheduleType.MONTHLY:
+        return dt.add(months=num_periods)
+    else:
+        check.failed(f"Unexpected ScheduleType {schedule_type}")
+
+
+class TimeWindowPartitionKeys(Sequence[str]):
+    """The partition keys of a TimeWindowPartitionsDefinition at a point in time.
+
+    Keys are computed from their index when they are accessed, so that the length, indexing,
+    slicing and membership checks don't require building every partition.
+    """
+
+    def __init__(self, partitions_def: TimeWindowPartitionsDefinition, num_partitions: int):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", TimeWindowPartitionsDefinition
+        )
+        self._num_partitions = check.int_param(num_partitions, "num_partitions")
+
+    def __len__(self) -> int:
+        return self._num_partitions
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._key_at(i) for i in range(*index.indices(self._num_partitions))]
+
+        check.int_param(index, "index")
+        if index < 0:
+            index += self._num_partitions
+        if index < 0 or index >= self._num_partitions:
+            raise IndexError("partition index out of range")
+
+        return self._key_at(index)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._num_partitions):
+            yield self._key_at(i)
+
+    def __contains__(self, partition_key: object) -> bool:
+        return isinstance(partition_key, str) and self._index_of(partition_key) is not None
+
+    def index(self, partition_key: str, start: int = 0, stop: Optional[int] = None) -> int:
+        index = self._index_of(partition_key)
+        stop = self._num_partitions if stop is None else stop
+        if index is None or index < start or index >= stop:
+            raise ValueError(f"{partition_key} is not a partition key")
+
+        return index
+
+    def time_window_at(self, index: int) -> TimeWindow:
+        """Returns the time window of the partition at the given index."""
+        return self._partitions_def.time_window_for_partition_key(self[index])
+
+    def get_partition_keys_in_range(self, partition_key_range: PartitionKeyRange) -> List[str]:
+        """Returns the keys between the start and end keys of the given range, inclusive."""
+        return self[self.index(partition_key_range.start) : self.index(partition_key_range.end) + 1]
+
+    def _key_at(self, index: int) -> str:
+        # pylint: disable=protected-access
+        return self._partitions_def._get_partition_start_time(index).strftime(
+            self._partitions_def.fmt
+        )
+
+    def _index_of(self, partition_key: str) -> Optional[int]:
+        try:
+            start_time = self._partitions_def.start_time_for_partition_key(partition_key)
+        except ValueError:
+            return None
+
+        # pylint: disable=protected-access
+        index = self._partitions_def._get_partition_index_for_time(start_time)
+        if index < 0 or index >= self._num_partitions or self._key_at(index) != partition_key:
+            return None
+
+        return index
+
+
 class DailyPartitionsDefinition(TimeWindowPartitionsDefinition):
     def __new__(
         cls,
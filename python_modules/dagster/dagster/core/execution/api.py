@@ -1,6 +1,6 @@
 import sys
 from contextlib import contextmanager
-from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 
 from dagster import check
 from dagster.core.definitions import IPipeline, JobDefinition, PipelineDefinition
@@ -14,7 +14,6 @@
 from dagster.core.execution.plan.plan import ExecutionPlan
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.retries import RetryMode
-from dagster.core.instance import DagsterInstance, InstanceRef
 from dagster.core.selector import parse_step_selection
 from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.system_config.objects import ResolvedRunConfig
@@ -33,6 +32,9 @@
 )
 from .results import PipelineExecutionResult
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance, InstanceRef
+
 ## Brief guide to the execution APIs
 # | function name               | operates over      | sync  | supports    | creates new PipelineRun |
 # |                             |                    |       | reexecution | in instance             |
@@ -56,9 +58,11 @@
 def execute_run_iterator(
     pipeline: IPipeline,
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     resume_from_failure: bool = False,
 ) -> Iterator[DagsterEvent]:
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(pipeline, "pipeline", IPipeline)
     check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
     check.inst_param(instance, "instance", DagsterInstance)
@@ -146,7 +150,7 @@ def gen_ignore_duplicate_run_worker():
 def execute_run(
     pipeline: IPipeline,
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     raise_on_error: bool = False,
 ) -> PipelineExecutionResult:
     """Executes an existing pipeline run synchronously.
@@ -163,6 +167,8 @@ def execute_run(
     Returns:
         PipelineExecutionResult: The result of the execution.
     """
+    from dagster.core.instance import DagsterInstance
+
     if isinstance(pipeline, PipelineDefinition):
         if isinstance(pipeline, JobDefinition):
             error = "execute_run requires a reconstructable job but received job definition directly instead."
@@ -257,7 +263,7 @@ def execute_pipeline_iterator(
     preset: Optional[str] = None,
     tags: Optional[Dict[str, Any]] = None,
     solid_selection: Optional[List[str]] = None,
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
 ) -> Iterator[DagsterEvent]:
     """Execute a pipeline iteratively.
 
@@ -325,8 +331,10 @@ def execute_pipeline_iterator(
 
 @contextmanager
 def ephemeral_instance_if_missing(
-    instance: Optional[DagsterInstance],
-) -> Iterator[DagsterInstance]:
+    instance: "Optional[DagsterInstance]",
+) -> "Iterator[DagsterInstance]":
+    from dagster.core.instance import DagsterInstance
+
     if instance:
         yield instance
     else:
@@ -341,7 +349,7 @@ def execute_pipeline(
     preset: Optional[str] = None,
     tags: Optional[Dict[str, Any]] = None,
     solid_selection: Optional[List[str]] = None,
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
     raise_on_error: bool = True,
 ) -> PipelineExecutionResult:
     """Execute a pipeline synchronously.
@@ -395,7 +403,7 @@ def execute_pipeline(
 @telemetry_wrapper
 def _logged_execute_pipeline(
     pipeline: Union[IPipeline, PipelineDefinition],
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     run_config: Optional[dict] = None,
     mode: Optional[str] = None,
     preset: Optional[str] = None,
@@ -403,6 +411,8 @@ def _logged_execute_pipeline(
     solid_selection: Optional[List[str]] = None,
     raise_on_error: bool = True,
 ) -> PipelineExecutionResult:
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(instance, "instance", DagsterInstance)
     (
         pipeline,
@@ -447,7 +457,7 @@ def reexecute_pipeline(
     mode: Optional[str] = None,
     preset: Optional[str] = None,
     tags: Optional[Dict[str, Any]] = None,
-    instance: DagsterInstance = None,
+    instance: "DagsterInstance" = None,
     raise_on_error: bool = True,
 ) -> PipelineExecutionResult:
     """Reexecute an existing pipeline run.
@@ -549,7 +559,7 @@ def reexecute_pipeline_iterator(
     mode: Optional[str] = None,
     preset: Optional[str] = None,
     tags: Optional[Dict[str, Any]] = None,
-    instance: DagsterInstance = None,
+    instance: "DagsterInstance" = None,
 ) -> Iterator[DagsterEvent]:
     """Reexecute a pipeline iteratively.
 
@@ -641,10 +651,12 @@ def execute_plan_iterator(
     execution_plan: ExecutionPlan,
     pipeline: IPipeline,
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     retry_mode: Optional[RetryMode] = None,
     run_config: Optional[dict] = None,
 ) -> Iterator[DagsterEvent]:
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(pipeline, "pipeline", IPipeline)
     check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
@@ -671,7 +683,7 @@ def execute_plan_iterator(
 def execute_plan(
     execution_plan: ExecutionPlan,
     pipeline: IPipeline,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     pipeline_run: PipelineRun,
     run_config: Optional[Dict] = None,
     retry_mode: Optional[RetryMode] = None,
@@ -679,6 +691,8 @@ def execute_plan(
     """This is the entry point of dagster-graphql executions. For the dagster CLI entry point, see
     execute_pipeline() above.
     """
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(pipeline, "pipeline", IPipeline)
     check.inst_param(instance, "instance", DagsterInstance)
@@ -708,7 +722,7 @@ def _check_pipeline(pipeline: Union[PipelineDefinition, IPipeline]) -> IPipeline
 
 
 def _get_execution_plan_from_run(
-    pipeline: IPipeline, pipeline_run: PipelineRun, instance: DagsterInstance
+    pipeline: IPipeline, pipeline_run: PipelineRun, instance: "DagsterInstance"
 ) -> ExecutionPlan:
     if (
         # need to rebuild execution plan so it matches the subsetted graph
@@ -738,9 +752,11 @@ def create_execution_plan(
     mode: Optional[str] = None,
     step_keys_to_execute: Optional[List[str]] = None,
     known_state: KnownExecutionState = None,
-    instance_ref: Optional[InstanceRef] = None,
+    instance_ref: "Optional[InstanceRef]" = None,
     tags: Optional[Dict[str, str]] = None,
 ) -> ExecutionPlan:
+    from dagster.core.instance import InstanceRef
+
     pipeline = _check_pipeline(pipeline)
     pipeline_def = pipeline.get_definition()
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
@@ -998,7 +1014,7 @@ def _check_execute_pipeline_args(
 
 
 def _resolve_reexecute_step_selection(
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     pipeline: IPipeline,
     mode: Optional[str],
     run_config: Optional[dict],
@@ -15,7 +15,12 @@
 )
 from dagster.core.host_representation.origin import ExternalPartitionSetOrigin
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.pipeline_run import (
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunsFilter,
+    RunPartitionData,
+)
 from dagster.core.storage.tags import (
     PARENT_RUN_ID_TAG,
     PARTITION_NAME_TAG,
@@ -157,26 +162,87 @@ def submit_backfill_runs(instance, workspace, repo_location, backfill_job, parti
     external_pipeline = external_repo.get_full_external_pipeline(
         external_partition_set.pipeline_name
     )
+
+    # look up the latest run of every partition in the chunk at once, rather than one at a time
+    run_partition_data_by_name = (
+        {
+            run_partition_data.partition: run_partition_data
+            for run_partition_data in instance.get_run_partition_data(
+                partition_set_name,
+                job_name=external_partition_set.pipeline_name,
+                partition_names=[partition_data.name for partition_data in result.partition_data],
+            )
+        }
+        if backfill_job.from_failure or backfill_job.reexecution_steps
+        else None
+    )
+
+    # runs that an earlier attempt at this chunk created but didn't get to submit, e.g. because
+    # the daemon was interrupted, are submitted rather than being created again
+    unsubmitted_runs_by_partition = {
+        run.tags[PARTITION_NAME_TAG]: run
+        for run in instance.get_backfill_unsubmitted_runs(
+            backfill_job.backfill_id,
+            partition_names=[partition_data.name for partition_data in result.partition_data],
+        )
+    }
+
+    run_kwargs_list = []
     for partition_data in result.partition_data:
-        pipeline_run = create_backfill_run(
+        if partition_data.name in unsubmitted_runs_by_partition:
+            yield None
+            continue
+
+        run_kwargs = _get_backfill_run_kwargs(
             instance,
             repo_location,
             external_pipeline,
             external_partition_set,
             backfill_job,
             partition_data,
+            run_partition_data_by_name,
         )
-        if pipeline_run:
+        if run_kwargs:
             # we skip runs in certain cases, e.g. we are running a `from_failure` backfill job
             # and the partition has had a successful run since the time the backfill was
             # scheduled
-            instance.submit_run(pipeline_run.run_id, workspace)
-            yield pipeline_run.run_id
+            run_kwargs_list.append(run_kwargs)
         yield None
 
+    # create the runs for the whole chunk of partitions in one write, and then submit them. A
+    # partition only counts as done once its run has been submitted, so if submitting is
+    # interrupted, the runs that are left NOT_STARTED are picked up by the next attempt.
+    pipeline_runs = list(unsubmitted_runs_by_partition.values()) + instance.create_runs(
+        run_kwargs_list
+    )
+    for pipeline_run in instance.submit_runs(
+        [pipeline_run.run_id for pipeline_run in pipeline_runs], workspace
+    ):
+        yield pipeline_run.run_id
+
 
 def create_backfill_run(
     instance, repo_location, external_pipeline, external_partition_set, backfill_job, partition_data
+):
+    run_kwargs = _get_backfill_run_kwargs(
+        instance,
+        repo_location,
+        external_pipeline,
+        external_partition_set,
+        backfill_job,
+        partition_data,
+    )
+    return instance.create_run(**run_kwargs) if run_kwargs else None
+
+
+def _get_backfill_run_kwargs(
+    instance,
+    repo_location,
+    external_pipeline,
+    external_partition_set,
+    backfill_job,
+    partition_data,
+    run_partition_data_by_name=None,
 ):
     from dagster.daemon.daemon import get_telemetry_daemon_session_id
 
@@ -186,6 +252,12 @@ def create_backfill_run(
     check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
     check.inst_param(backfill_job, "backfill_job", PartitionBackfill)
     check.inst_param(partition_data, "partition_data", ExternalPartitionExecutionParamData)
+    check.opt_dict_param(
+        run_partition_data_by_name,
+        "run_partition_data_by_name",
+        key_type=str,
+        value_type=RunPartitionData,
+    )
 
     tags = merge_dicts(
         external_pipeline.tags,
@@ -206,7 +278,15 @@ def create_backfill_run(
             solid_selection = external_partition_set.solid_selection
 
     elif backfill_job.from_failure:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        if run_partition_data_by_name is not None:
+            # skip loading the last run unless it failed
+            run_partition_data = run_partition_data_by_name.get(partition_data.name)
+            if not run_partition_data or run_partition_data.status != PipelineRunStatus.FAILURE:
+                return None
+
+        last_run = _fetch_last_run(
+            instance, external_partition_set, partition_data.name, run_partition_data_by_name
+        )
         if not last_run or last_run.status != PipelineRunStatus.FAILURE:
             return None
 
@@ -226,7 +306,9 @@ def create_backfill_run(
         step_keys_to_execute, known_state = get_retry_steps_from_parent_run(instance, parent_run_id)
 
     elif backfill_job.reexecution_steps:
-        last_run = _fetch_last_run(instance, external_partition_set, partition_data.name)
+        last_run = _fetch_last_run(
+            instance, external_partition_set, partition_data.name, run_partition_data_by_name
+        )
         parent_run_id = last_run.run_id if last_run else None
         root_run_id = (last_run.root_run_id or last_run.run_id) if last_run else None
         if parent_run_id and root_run_id:
@@ -263,7 +345,7 @@ def create_backfill_run(
         pipeline_name_hash=hash_name(external_pipeline.name),
     )
 
-    return instance.create_run(
+    return dict(
         pipeline_snapshot=external_pipeline.pipeline_snapshot,
         execution_plan_snapshot=external_execution_plan.execution_plan_snapshot,
         parent_pipeline_snapshot=external_pipeline.parent_pipeline_snapshot,
@@ -283,10 +365,17 @@ def create_backfill_run(
     )
 
 
-def _fetch_last_run(instance, external_partition_set, partition_name):
+def _fetch_last_run(
+    instance, external_partition_set, partition_name, run_partition_data_by_name=None
+):
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(external_partition_set, "external_partition_set", ExternalPartitionSet)
     check.str_param(partition_name, "partition_name")
+    check.opt_dict_param(run_partition_data_by_name, "run_partition_data_by_name")
+
+    if run_partition_data_by_name is not None:
+        run_partition_data = run_partition_data_by_name.get(partition_name)
+        return instance.get_run_by_id(run_partition_data.run_id) if run_partition_data else None
 
     runs = instance.get_runs(
         PipelineRunsFilter(
@@ -1,5 +1,5 @@
 from contextlib import contextmanager
-from typing import Any, Dict, Generator, Optional, cast
+from typing import TYPE_CHECKING, Any, Dict, Generator, Optional, cast
 
 from dagster import check
 from dagster.config.validate import process_config
@@ -11,7 +11,6 @@
 from dagster.core.definitions.run_config import define_resource_dictionary_cls
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.core.execution.resources_init import resource_initialization_manager
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.io_manager import IOManager, IOManagerDefinition
 from dagster.core.storage.pipeline_run import PipelineRun
@@ -20,6 +19,9 @@
 from .api import ephemeral_instance_if_missing
 from .context_creation_pipeline import initialize_console_manager
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 def _get_mapped_resource_config(
     resource_defs: Dict[str, ResourceDefinition], resource_config: Dict[str, Any]
@@ -41,7 +43,7 @@ def _get_mapped_resource_config(
 @contextmanager
 def build_resources(
     resources: Dict[str, Any],
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
     resource_config: Optional[Dict[str, Any]] = None,
     pipeline_run: Optional[PipelineRun] = None,
     log_manager: Optional[DagsterLogManager] = None,
@@ -69,6 +71,8 @@ def build_resources(
             initialization. Defaults to system log manager.
     """
 
+    from dagster.core.instance import DagsterInstance
+
     resources = check.dict_param(resources, "resource_defs", key_type=str)
     instance = check.opt_inst_param(instance, "instance", DagsterInstance)
     resource_config = check.opt_dict_param(resource_config, "resource_config", key_type=str)
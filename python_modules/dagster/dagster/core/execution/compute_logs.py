@@ -3,6 +3,7 @@
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
@@ -15,6 +16,15 @@
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
+# The most bytes that the reader thread of `pipe_stream_to_file` reads from the pipe at a time.
+# Writers block once the pipe's kernel buffer is full, so this bounds the buffered output.
+PIPE_READ_SIZE = 65536
+
+# How long to wait for the reader thread of `pipe_stream_to_file` to drain the pipe once capture
+# ends. Subprocesses that inherited the pipe and outlive the capture keep it open, in which case
+# the reader thread is left to finish in the background.
+PIPE_READER_JOIN_TIMEOUT = 5
+
 
 @contextmanager
 def redirect_to_file(stream, filepath):
@@ -31,6 +41,74 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+@contextmanager
+def pipe_stream_to_file(stream, filepath):
+    """Mirrors everything written to the file descriptor of the stream to the given file, while
+    still writing it to the stream.
+
+    Unlike :py:func:`mirror_stream_to_file`, this doesn't start any helper processes: the file
+    descriptor is redirected to a pipe, which a thread in the current process copies to both the
+    file and the original destination of the stream.
+    """
+    ensure_file(filepath)
+    from_fd = _fileno(stream)
+
+    if not from_fd or should_disable_io_stream_redirect():
+        yield
+        return
+
+    read_fd, write_fd = os.pipe()
+    stream.flush()
+    copied_fd = os.dup(from_fd)
+    reader_thread = threading.Thread(
+        target=_copy_pipe_to_file,
+        args=(read_fd, filepath, os.dup(copied_fd)),
+        name="compute-log-pipe-reader",
+        daemon=True,
+    )
+    reader_thread.start()
+
+    os.dup2(write_fd, from_fd)
+    os.close(write_fd)
+    try:
+        yield
+    finally:
+        stream.flush()
+        # closes the last write end of the pipe held by this process, so the reader thread sees
+        # the end of the pipe once it has copied everything written to it
+        os.dup2(copied_fd, from_fd)
+        os.close(copied_fd)
+        reader_thread.join(PIPE_READER_JOIN_TIMEOUT)
+
+
+def _copy_pipe_to_file(read_fd, filepath, stream_fd):
+    try:
+        with open(filepath, "ab", buffering=0) as file_stream:
+            while True:
+                data = os.read(read_fd, PIPE_READ_SIZE)
+                if not data:
+                    return
+
+                file_stream.write(data)
+                if stream_fd is not None:
+                    try:
+                        _write_all(stream_fd, data)
+                    except OSError:
+                        # keep capturing to the file if the original stream goes away
+                        os.close(stream_fd)
+                        stream_fd = None
+    finally:
+        os.close(read_fd)
+        if stream_fd is not None:
+            os.close(stream_fd)
+
+
+def _write_all(fd, data):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
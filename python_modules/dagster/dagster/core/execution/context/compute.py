@@ -1,20 +1,24 @@
 from abc import ABC, abstractmethod, abstractproperty
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from dagster import check
 from dagster.core.definitions.dependency import Node, NodeHandle
 from dagster.core.definitions.mode import ModeDefinition
+from dagster.core.definitions.partition_key_range import PartitionKeyRange
 from dagster.core.definitions.pipeline_definition import PipelineDefinition
 from dagster.core.definitions.solid_definition import SolidDefinition
 from dagster.core.definitions.step_launcher import StepLauncher
+from dagster.core.definitions.time_window_partitions import TimeWindow
 from dagster.core.errors import DagsterInvalidPropertyError
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.utils.forked_pdb import ForkedPdb
 
 from .system import StepExecutionContext
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 class AbstractComputeExecutionContext(ABC):  # pylint: disable=no-init
     """Base class for solid context implemented by SolidExecutionContext and DagstermillExecutionContext"""
@@ -101,7 +105,7 @@ def pipeline_run(self) -> PipelineRun:
         return self._step_execution_context.pipeline_run
 
     @property
-    def instance(self) -> DagsterInstance:
+    def instance(self) -> "DagsterInstance":
         """DagsterInstance: The current Dagster instance"""
         return self._step_execution_context.instance
 
@@ -215,6 +219,23 @@ def output_asset_partition_key(self, output_name: str = "result") -> str:
         """
         return self._step_execution_context.asset_partition_key_for_output(output_name)
 
+    def output_asset_partition_key_range(self, output_name: str = "result") -> PartitionKeyRange:
+        """Returns the range of asset partition keys for the given output. Defaults to "result",
+        which is the name of the default output.
+
+        A run can cover a range of partitions of assets that are partitioned by time windows.
+        """
+        return self._step_execution_context.asset_partition_key_range_for_output(output_name)
+
+    def output_asset_partitions_time_window(self, output_name: str = "result") -> TimeWindow:
+        """Returns the time window covered by the asset partitions of the given output. Defaults
+        to "result", which is the name of the default output.
+
+        Raises an error if the output asset is not partitioned with a
+        TimeWindowPartitionsDefinition.
+        """
+        return self._step_execution_context.asset_partitions_time_window_for_output(output_name)
+
     def has_tag(self, key: str) -> bool:
         """Check if a logging tag is set.
 
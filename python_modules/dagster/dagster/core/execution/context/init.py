@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
 
 from dagster import check
 from dagster.core.definitions.pipeline_definition import PipelineDefinition
@@ -8,10 +8,12 @@
     Resources,
 )
 from dagster.core.errors import DagsterInvariantViolationError
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 class InitResourceContext:
     """Resource-specific initialization context.
@@ -39,7 +41,7 @@ def __init__(
         resource_config: Any,
         resources: Resources,
         resource_def: Optional[ResourceDefinition] = None,
-        instance: Optional[DagsterInstance] = None,
+        instance: "Optional[DagsterInstance]" = None,
         dagster_run: Optional[PipelineRun] = None,
         pipeline_run: Optional[PipelineRun] = None,
         log_manager: Optional[DagsterLogManager] = None,
@@ -73,7 +75,7 @@ def resources(self) -> Resources:
         return self._resources
 
     @property
-    def instance(self) -> Optional[DagsterInstance]:
+    def instance(self) -> "Optional[DagsterInstance]":
         return self._instance
 
     @property
@@ -126,11 +128,12 @@ def __init__(
         self,
         resource_config: Any,
         resources: Optional[Union[Resources, Dict[str, Any]]],
-        instance: Optional[DagsterInstance],
+        instance: "Optional[DagsterInstance]",
     ):
         from dagster.core.execution.build_resources import build_resources
         from dagster.core.execution.api import ephemeral_instance_if_missing
         from dagster.core.execution.context_creation_pipeline import initialize_console_manager
+        from dagster.core.instance import DagsterInstance
 
         self._instance_provided = (
             check.opt_inst_param(instance, "instance", DagsterInstance) is not None
@@ -199,7 +202,7 @@ def resources(self) -> Resources:
         return self._resources
 
     @property
-    def instance(self) -> Optional[DagsterInstance]:
+    def instance(self) -> "Optional[DagsterInstance]":
         return self._instance
 
     @property
@@ -227,7 +230,7 @@ def run_id(self) -> Optional[str]:
 def build_init_resource_context(
     config: Optional[Dict[str, Any]] = None,
     resources: Optional[Dict[str, Any]] = None,
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
 ) -> InitResourceContext:
     """Builds resource initialization context from provided parameters.
 
@@ -255,6 +258,8 @@ def build_init_resource_context(
                 resource_to_init(context)
 
     """
+    from dagster.core.instance import DagsterInstance
+
     return UnboundInitResourceContext(
         resource_config=check.opt_dict_param(config, "config", key_type=str),
         instance=check.opt_inst_param(instance, "instance", DagsterInstance),
@@ -1,5 +1,5 @@
 # pylint: disable=super-init-not-called
-from typing import AbstractSet, Any, Dict, NamedTuple, Optional, Union, cast
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, NamedTuple, Optional, Union, cast
 
 from dagster import check
 from dagster.config import Shape
@@ -23,7 +23,6 @@
     DagsterInvariantViolationError,
 )
 from dagster.core.execution.build_resources import build_resources
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.types.dagster_type import DagsterType
@@ -33,6 +32,9 @@
 from .compute import OpExecutionContext
 from .system import StepExecutionContext, TypeCheckContext
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 def _property_msg(prop_name: str, method_name: str) -> str:
     return (
@@ -50,11 +52,12 @@ def __init__(
         solid_config: Any,
         resources_dict: Optional[Dict[str, Any]],
         resources_config: Dict[str, Any],
-        instance: Optional[DagsterInstance],
+        instance: "Optional[DagsterInstance]",
         partition_key: Optional[str],
     ):  # pylint: disable=super-init-not-called
         from dagster.core.execution.context_creation_pipeline import initialize_console_manager
         from dagster.core.execution.api import ephemeral_instance_if_missing
+        from dagster.core.instance import DagsterInstance
 
         self._solid_config = solid_config
 
@@ -117,7 +120,7 @@ def pipeline_run(self) -> PipelineRun:
         raise DagsterInvalidPropertyError(_property_msg("pipeline_run", "property"))
 
     @property
-    def instance(self) -> DagsterInstance:
+    def instance(self) -> "DagsterInstance":
         return self._instance
 
     @property
@@ -289,7 +292,7 @@ def __init__(
         solid_config: Any,
         resources: "Resources",
         resources_config: Dict[str, Any],
-        instance: DagsterInstance,
+        instance: "DagsterInstance",
         log_manager: DagsterLogManager,
         pdb: Optional[ForkedPdb],
         tags: Optional[Dict[str, str]],
@@ -320,7 +323,7 @@ def pipeline_run(self) -> PipelineRun:
         raise DagsterInvalidPropertyError(_property_msg("pipeline_run", "property"))
 
     @property
-    def instance(self) -> DagsterInstance:
+    def instance(self) -> "DagsterInstance":
         return self._instance
 
     @property
@@ -420,7 +423,7 @@ def build_op_context(
     resources: Optional[Dict[str, Any]] = None,
     op_config: Any = None,
     resources_config: Optional[Dict[str, Any]] = None,
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
     config: Any = None,
     partition_key: Optional[str] = None,
 ) -> OpExecutionContext:
@@ -469,7 +472,7 @@ def build_solid_context(
     resources: Optional[Dict[str, Any]] = None,
     solid_config: Any = None,
     resources_config: Optional[Dict[str, Any]] = None,
-    instance: Optional[DagsterInstance] = None,
+    instance: "Optional[DagsterInstance]" = None,
     config: Any = None,
     partition_key: Optional[str] = None,
 ) -> UnboundSolidExecutionContext:
@@ -501,6 +504,8 @@ def build_solid_context(
                 solid_to_invoke(context)
     """
 
+    from dagster.core.instance import DagsterInstance
+
     if solid_config and config:
         raise DagsterInvalidInvocationError(
             "Attempted to invoke ``build_solid_context`` with both ``solid_config``, and its "
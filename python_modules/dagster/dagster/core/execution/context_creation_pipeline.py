@@ -35,7 +35,6 @@
 )
 from dagster.core.execution.retries import RetryMode
 from dagster.core.executor.init import InitExecutorContext
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.system_config.objects import ResolvedRunConfig
@@ -53,8 +52,9 @@
 )
 
 if TYPE_CHECKING:
-    from dagster.core.executor.base import Executor
     from dagster.core.execution.plan.outputs import StepOutputHandle
+    from dagster.core.executor.base import Executor
+    from dagster.core.instance import DagsterInstance
 
 
 def initialize_console_manager(pipeline_run: Optional[PipelineRun]) -> DagsterLogManager:
@@ -105,7 +105,7 @@ class ContextCreationData(NamedTuple):
     pipeline_run: PipelineRun
     mode_def: ModeDefinition
     executor_def: ExecutorDefinition
-    instance: DagsterInstance
+    instance: "DagsterInstance"
     resource_keys_to_init: AbstractSet[str]
     execution_plan: ExecutionPlan
 
@@ -119,7 +119,7 @@ def create_context_creation_data(
     execution_plan: ExecutionPlan,
     run_config: Dict[str, Any],
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
 ) -> "ContextCreationData":
     pipeline_def = pipeline.get_definition()
     resolved_run_config = ResolvedRunConfig.build(pipeline_def, run_config, mode=pipeline_run.mode)
@@ -203,7 +203,7 @@ def execution_context_event_generator(
     execution_plan: ExecutionPlan,
     run_config: Dict[str, Any],
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     retry_mode: RetryMode,
     scoped_resources_builder_cm: Optional[
         Callable[..., EventGenerationManager[ScopedResourcesBuilder]]
@@ -211,6 +211,8 @@ def execution_context_event_generator(
     raise_on_error: Optional[bool] = False,
     output_capture: Optional[Dict["StepOutputHandle", Any]] = None,
 ) -> Generator[Union[DagsterEvent, PlanExecutionContext], None, None]:
+    from dagster.core.instance import DagsterInstance
+
     scoped_resources_builder_cm = cast(
         Callable[..., EventGenerationManager[ScopedResourcesBuilder]],
         check.opt_callable_param(
@@ -279,7 +281,7 @@ def __init__(
         execution_plan: ExecutionPlan,
         run_config: Dict[str, Any],
         pipeline_run: PipelineRun,
-        instance: DagsterInstance,
+        instance: "DagsterInstance",
         raise_on_error: Optional[bool] = False,
         output_capture: Optional[Dict["StepOutputHandle", Any]] = None,
         executor_defs: Optional[List[ExecutorDefinition]] = None,
@@ -308,7 +310,7 @@ def orchestration_context_event_generator(
     execution_plan: ExecutionPlan,
     run_config: Dict[str, Any],
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     raise_on_error: bool,
     executor_defs: Optional[List[ExecutorDefinition]],
     output_capture: Optional[Dict["StepOutputHandle", Any]],
@@ -374,7 +376,7 @@ def __init__(
         execution_plan: ExecutionPlan,
         run_config: Dict[str, Any],
         pipeline_run: PipelineRun,
-        instance: DagsterInstance,
+        instance: "DagsterInstance",
         retry_mode: RetryMode,
         scoped_resources_builder_cm: Optional[
             Callable[..., EventGenerationManager[ScopedResourcesBuilder]]
@@ -426,7 +428,7 @@ def scoped_pipeline_context(
     pipeline: IPipeline,
     run_config: Dict[str, Any],
     pipeline_run: PipelineRun,
-    instance: DagsterInstance,
+    instance: "DagsterInstance",
     scoped_resources_builder_cm: Optional[
         Callable[..., EventGenerationManager[ScopedResourcesBuilder]]
     ] = resource_initialization_manager,
@@ -439,6 +441,8 @@ def scoped_pipeline_context(
     Should only be used where we need to reconstruct the pipeline context, ignoring any yielded
     events (e.g. PipelineExecutionResult, dagstermill, unit tests, etc)
     """
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(pipeline, "pipeline", IPipeline)
     check.dict_param(run_config, "run_config", key_type=str)
@@ -516,7 +520,7 @@ def create_log_manager(
 
 
 def _create_context_free_log_manager(
-    instance: DagsterInstance, pipeline_run: PipelineRun, pipeline_def: PipelineDefinition
+    instance: "DagsterInstance", pipeline_run: PipelineRun, pipeline_def: PipelineDefinition
 ) -> DagsterLogManager:
     """In the event of pipeline initialization failure, we want to be able to log the failure
     without a dependency on the PlanExecutionContext to initialize DagsterLogManager.
@@ -524,6 +528,8 @@ def _create_context_free_log_manager(
         pipeline_run (dagster.core.storage.pipeline_run.PipelineRun)
         pipeline_def (dagster.definitions.PipelineDefinition)
     """
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(instance, "instance", DagsterInstance)
     check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
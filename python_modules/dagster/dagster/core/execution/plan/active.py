@@ -1,5 +1,7 @@
+import heapq
 import time
-from typing import Callable, Dict, Iterator, List, Optional, Set, cast
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, cast
 
 from dagster import check
 from dagster.core.errors import (
@@ -58,7 +60,18 @@ def __init__(
         self._step_outputs: Set[StepOutputHandle] = set()
 
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = self._plan.get_executable_step_deps()
+        self._pending: Dict[str, Set[str]] = {}
+
+        # The dependencies of every step that has been pending, along with the reverse mapping and
+        # the number of dependencies that haven't finished, so that _update only needs to check
+        # the pending steps that a dependency failed for or that all dependencies have finished
+        # for since the last update. The order in which each step became pending keeps the order
+        # in which steps become executable stable.
+        self._step_deps: Dict[str, Set[str]] = {}
+        self._dependent_step_keys: Dict[str, Set[str]] = defaultdict(set)
+        self._num_unfinished_deps: Dict[str, int] = {}
+        self._pending_order: Dict[str, int] = {}
+        self._step_keys_to_check: Set[str] = set()
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -69,8 +82,10 @@ def __init__(
         )
         self._new_dynamic_mappings: bool = False
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: List[str] = []
+        # steps move in to these buckets as a result of _update calls. Executable steps are kept in
+        # a heap ordered by sort key, then by the order in which they became executable.
+        self._executable: List[Tuple[float, int, str]] = []
+        self._executable_count: int = 0
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
@@ -91,6 +106,7 @@ def __init__(
         self._interrupted: bool = False
 
         # Start the show by loading _executable with the set of _pending steps that have no deps
+        self._add_pending(self._plan.get_executable_step_deps())
         self._update()
 
     def __enter__(self):
@@ -106,7 +122,10 @@ def __exit__(self, exc_type, exc_value, traceback):
 
         if not self.is_complete:
             pending_action = (
-                self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+                [step_key for _, _, step_key in sorted(self._executable)]
+                + self._pending_abandon
+                + self._pending_retry
+                + self._pending_skip
             )
             state_str = "{pending_str}{in_flight_str}{action_str}{retry_str}".format(
                 in_flight_str="\nSteps still in flight: {}".format(self._in_flight)
@@ -155,23 +174,31 @@ def _update(self) -> None:
         new_steps_to_skip = []
         new_steps_to_abandon = []
 
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
-            new_step_deps = self._plan.resolve(self._successful_dynamic_outputs)
-            for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
-
+            self._add_pending(self._plan.resolve(self._successful_dynamic_outputs))
             self._new_dynamic_mappings = False
 
-        for step_key, requirements in self._pending.items():
+        step_keys_to_check = sorted(
+            [step_key for step_key in self._step_keys_to_check if step_key in self._pending],
+            key=self._pending_order.__getitem__,
+        )
+        self._step_keys_to_check = set()
+
+        for step_key in step_keys_to_check:
+            requirements = self._pending[step_key]
+
             # If any upstream deps failed - this is not executable
-            if requirements.intersection(failed_or_abandoned_steps):
+            if any(
+                requirement in self._failed or requirement in self._abandoned
+                for requirement in requirements
+            ):
                 new_steps_to_abandon.append(step_key)
 
             # If all the upstream steps of a step are complete or skipped
-            elif requirements.issubset(successful_or_skipped_steps):
+            elif all(
+                requirement in self._success or requirement in self._skipped
+                for requirement in requirements
+            ):
                 step = self.get_step_by_key(step_key)
 
                 # The base case is downstream step won't skip
@@ -199,7 +226,7 @@ def _update(self) -> None:
                     new_steps_to_execute.append(step_key)
 
         for key in new_steps_to_execute:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._pending[key]
 
         for key in new_steps_to_skip:
@@ -217,9 +244,50 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._push_executable(key)
             del self._waiting_to_retry[key]
 
+    def _add_pending(self, step_deps: Dict[str, Set[str]]) -> None:
+        for step_key, deps in step_deps.items():
+            self._pending[step_key] = deps
+            self._step_deps[step_key] = deps
+            self._pending_order[step_key] = len(self._pending_order)
+            self._num_unfinished_deps[step_key] = 0
+            for dep in deps:
+                self._dependent_step_keys[dep].add(step_key)
+                if not self._is_finished(dep):
+                    self._num_unfinished_deps[step_key] += 1
+
+        self._step_keys_to_check.update(step_deps.keys())
+
+    def _is_finished(self, step_key: str) -> bool:
+        return (
+            step_key in self._success
+            or step_key in self._skipped
+            or step_key in self._failed
+            or step_key in self._abandoned
+        )
+
+    def _check_dependent_steps(self, step_key: str, failed: bool = False) -> None:
+        for dependent_step_key in self._dependent_step_keys.get(step_key, ()):
+            self._num_unfinished_deps[dependent_step_key] -= 1
+            if failed or self._num_unfinished_deps[dependent_step_key] <= 0:
+                self._step_keys_to_check.add(dependent_step_key)
+
+    def _push_executable(self, step_key: str) -> None:
+        heapq.heappush(
+            self._executable,
+            (self._sort_key_fn(self.get_step_by_key(step_key)), self._executable_count, step_key),
+        )
+        self._executable_count += 1
+
+    def _pop_executable(self, limit: Optional[int]) -> Iterator[str]:
+        while self._executable and (limit is None or limit > 0):
+            _, _, step_key = heapq.heappop(self._executable)
+            yield step_key
+            if limit is not None:
+                limit -= 1
+
     def sleep_til_ready(self) -> None:
         now = time.time()
         sleep_amt = min([ready_at - now for ready_at in self._waiting_to_retry.values()])
@@ -253,17 +321,10 @@ def get_steps_to_execute(self, limit: int = None) -> List[ExecutionStep]:
         check.opt_int_param(limit, "limit")
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
-        if limit:
-            steps = steps[:limit]
+        steps = [self.get_step_by_key(key) for key in self._pop_executable(limit or None)]
 
         for step in steps:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return steps
@@ -272,12 +333,12 @@ def get_steps_to_skip(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
             self._prep_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -286,11 +347,11 @@ def get_steps_to_abandon(self) -> List[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -346,20 +407,24 @@ def plan_events_iterator(self, pipeline_context) -> Iterator[DagsterEvent]:
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._check_dependent_steps(step_key, failed=True)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._check_dependent_steps(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._check_dependent_steps(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._check_dependent_steps(step_key, failed=True)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -379,11 +444,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending({step_key: self._step_deps[step_key]})
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._check_dependent_steps(step_key, failed=True)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -35,7 +35,7 @@
 from dagster.core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster.core.execution.resolve_versions import resolve_step_output_versions
 from dagster.core.storage.io_manager import IOManager
-from dagster.core.storage.tags import MEMOIZED_RUN_TAG
+from dagster.core.storage.tags import CODE_VERSION_TAG, MEMOIZED_RUN_TAG
 from dagster.core.types.dagster_type import DagsterType, DagsterTypeKind
 from dagster.utils import ensure_gen, iterate_with_context
 from dagster.utils.backcompat import experimental_functionality_warning
@@ -442,9 +442,11 @@ def _get_output_asset_materializations(
     output: Union[Output, DynamicOutput],
     output_def: OutputDefinition,
     io_manager_metadata_entries: List[Union[EventMetadataEntry, PartitionMetadataEntry]],
+    code_version: Optional[str] = None,
 ) -> Iterator[AssetMaterialization]:
 
     all_metadata = output.metadata_entries + io_manager_metadata_entries
+    tags = {CODE_VERSION_TAG: code_version} if code_version else None
 
     if asset_partitions:
         metadata_mapping: Dict[str, List["EventMetadataEntry"]] = {
@@ -469,6 +471,7 @@ def _get_output_asset_materializations(
                 asset_key=asset_key,
                 partition=partition,
                 metadata_entries=metadata_mapping[partition],
+                tags=tags,
             )
     else:
         for entry in all_metadata:
@@ -478,7 +481,9 @@ def _get_output_asset_materializations(
                     "is not associated with any specific partitions."
                 )
         yield AssetMaterialization(
-            asset_key=asset_key, metadata_entries=cast(List["EventMetadataEntry"], all_metadata)
+            asset_key=asset_key,
+            metadata_entries=cast(List["EventMetadataEntry"], all_metadata),
+            tags=tags,
         )
 
 
@@ -553,6 +558,7 @@ def _gen_fn():
             output,
             output_def,
             manager_metadata_entries,
+            code_version=step_context.solid_def.version,
         ):
             yield DagsterEvent.asset_materialization(step_context, materialization, input_lineage)
 
@@ -39,7 +39,6 @@
     UnresolvedStepHandle,
 )
 from dagster.core.execution.retries import RetryMode, RetryState
-from dagster.core.instance import DagsterInstance, InstanceRef
 from dagster.core.storage.mem_io_manager import mem_io_manager
 from dagster.core.system_config.objects import ResolvedRunConfig
 from dagster.core.types.dagster_type import DagsterTypeKind
@@ -74,6 +73,8 @@
 )
 
 if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance, InstanceRef
+
     from .active import ActiveExecution
 
 StepHandleTypes = (StepHandle, UnresolvedStepHandle, ResolvedFromDynamicStepHandle)
@@ -100,7 +101,7 @@ def __init__(
         resolved_run_config: ResolvedRunConfig,
         step_keys_to_execute: Optional[List[str]],
         known_state,
-        instance_ref: Optional[InstanceRef],
+        instance_ref: "Optional[InstanceRef]",
         tags: Dict[str, str],
     ):
         self.pipeline = check.inst_param(pipeline, "pipeline", IPipeline)
@@ -159,6 +160,8 @@ def set_output_handle(
     def build(self) -> "ExecutionPlan":
         """Builds the execution plan"""
 
+        from dagster.core.instance import DagsterInstance
+
         _check_persistent_storage_requirement(
             self.pipeline,
             self.mode_definition,
@@ -735,11 +738,15 @@ def resolve(
         self,
         mappings: Dict[str, Dict[str, List[str]]],
     ) -> Dict[str, Set[str]]:
-        """Resolve any dynamic map or collect steps with the resolved dynamic mappings"""
+        """Resolve any dynamic map or collect steps with the resolved dynamic mappings.
 
-        previous = self.get_executable_step_deps()
+        Returns:
+            Dict[str, Set[str]]: The dependencies of the steps that became executable, i.e. the
+                resolved steps and the steps downstream of them that were waiting on them to
+                resolve.
+        """
 
-        _update_from_resolved_dynamic_outputs(
+        resolved_steps = _update_from_resolved_dynamic_outputs(
             self.step_dict,
             self.step_dict_by_key,
             self.executable_map,
@@ -747,10 +754,25 @@ def resolve(
             self.step_handles_to_execute,
             mappings,
         )
-
-        after = self.get_executable_step_deps()
-
-        return {key: deps for key, deps in after.items() if key not in previous}
+        if not resolved_steps:
+            return {}
+
+        step_keys_to_execute = set(self.step_keys_to_execute)
+        new_step_keys = {step.key for step in resolved_steps}
+        new_step_deps = {}
+
+        # A step that was already executable was held back before this resolution if it depended
+        # on a step in the plan that wasn't executable yet. Such a step is now either one of the
+        # resolved steps or a step that was held back in turn, and steps come after their
+        # dependencies in the executable step deps.
+        for key, deps in self.get_executable_step_deps().items():
+            if key in new_step_keys or any(
+                dep in new_step_keys and dep in step_keys_to_execute for dep in deps
+            ):
+                new_step_keys.add(key)
+                new_step_deps[key] = deps
+
+        return new_step_deps
 
     def build_subset_plan(
         self,
@@ -825,7 +847,7 @@ def build_memoized_plan(
         self,
         pipeline_def: PipelineDefinition,
         resolved_run_config: ResolvedRunConfig,
-        instance: DagsterInstance,
+        instance: "DagsterInstance",
     ) -> "ExecutionPlan":
         """
         Returns:
@@ -1101,9 +1123,10 @@ def _update_from_resolved_dynamic_outputs(
     resolvable_map: Dict[FrozenSet[str], List[UnresolvedStepHandle]],
     step_handles_to_execute: List[StepHandleUnion],
     dynamic_mappings: Dict[str, Dict[str, List[str]]],
-) -> None:
-    resolved_steps = []
+) -> List[ExecutionStep]:
+    resolved_steps: List[ExecutionStep] = []
     key_sets_to_clear = []
+    step_handles_to_execute_set = set(step_handles_to_execute)
 
     # find entries in the resolvable map whose requirements are now all ready
     for required_keys, unresolved_step_handles in resolvable_map.items():
@@ -1114,7 +1137,7 @@ def _update_from_resolved_dynamic_outputs(
 
         for unresolved_step_handle in unresolved_step_handles:
             # don't resolve steps we are not executing
-            if unresolved_step_handle not in step_handles_to_execute:
+            if unresolved_step_handle not in step_handles_to_execute_set:
                 continue
 
             resolvable_step = step_dict[unresolved_step_handle]
@@ -1133,6 +1156,8 @@ def _update_from_resolved_dynamic_outputs(
     for key_set in key_sets_to_clear:
         del resolvable_map[key_set]
 
+    return resolved_steps
+
 
 def can_isolate_steps(pipeline_def: PipelineDefinition, mode_def: ModeDefinition):
     """Returns true if every output definition in the pipeline uses an IO manager that's not
@@ -1189,7 +1214,9 @@ def _check_persistent_storage_requirement(
         )
 
 
-def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, run_id: str) -> bool:
+def should_skip_step(
+    execution_plan: ExecutionPlan, instance: "DagsterInstance", run_id: str
+) -> bool:
     """[INTERNAL] Check if it should skip executing the plan. Primarily used by execution without
     run-level plan process, e.g. Airflow step execution. Note: this only checks one step at a time.
 
@@ -1198,6 +1225,8 @@ def should_skip_step(execution_plan: ExecutionPlan, instance: DagsterInstance, r
     - if there is at least one input, where none of the upstream steps have yielded an
       output, we should skip the step.
     """
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.inst_param(instance, "instance", DagsterInstance)
     check.str_param(run_id, "run_id")
@@ -1322,7 +1351,7 @@ def _get_executable_step_deps(
     # for things transitively downstream of unresolved collect steps
     unresolved_set = set()
 
-    step_keys_to_execute = [handle.to_key() for handle in step_handles_to_execute]
+    step_keys_to_execute = {handle.to_key() for handle in step_handles_to_execute}
 
     for key, handle in executable_map.items():
         step = cast(ExecutionStep, step_dict[handle])
@@ -1377,7 +1406,7 @@ def _compute_step_maps(step_dict, step_dict_by_key, step_handles_to_execute, kno
             step_keys=missing_steps,
         )
 
-    step_keys_to_execute = [step_handle.to_key() for step_handle in step_handles_to_execute]
+    step_keys_to_execute = {step_handle.to_key() for step_handle in step_handles_to_execute}
 
     executable_map = {}
     resolvable_map: Dict[str, List[UnresolvedStepHandle]] = defaultdict(list)
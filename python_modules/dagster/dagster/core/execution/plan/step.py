@@ -302,15 +302,19 @@ def resolve(self, mappings: Dict[str, Dict[str, List[str]]]) -> List[ExecutionSt
         )
         execution_steps = []
 
+        # the resolved steps share the inputs that don't depend on the mapping key, along with the
+        # outputs and tags, so fanning out to many mapping keys stays cheap
+        step_inputs = self.step_inputs
+        step_outputs = self.step_outputs
         for mapped_key in mappings[self.resolved_by_step_key][self.resolved_by_output_name]:
-            resolved_inputs = [_resolved_input(inp, mapped_key) for inp in self.step_inputs]
+            resolved_inputs = [_resolved_input(inp, mapped_key) for inp in step_inputs]
 
             execution_steps.append(
                 ExecutionStep(
                     handle=ResolvedFromDynamicStepHandle(self.handle.solid_handle, mapped_key),
                     pipeline_name=self.pipeline_name,
                     step_inputs=resolved_inputs,
-                    step_outputs=self.step_outputs,
+                    step_outputs=step_outputs,
                     tags=self.tags,
                 )
             )
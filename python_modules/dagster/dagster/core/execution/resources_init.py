@@ -1,7 +1,7 @@
 import inspect
 from collections import deque
 from contextlib import ContextDecorator
-from typing import AbstractSet, Any, Callable, Deque, Dict, Optional, cast
+from typing import TYPE_CHECKING, AbstractSet, Any, Callable, Deque, Dict, Optional, cast
 
 from dagster import check
 from dagster.core.decorator_utils import get_function_params
@@ -25,7 +25,6 @@
 )
 from dagster.core.execution.plan.plan import ExecutionPlan, StepHandleUnion
 from dagster.core.execution.plan.step import ExecutionStep
-from dagster.core.instance import DagsterInstance
 from dagster.core.log_manager import DagsterLogManager
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.system_config.objects import ResourceConfig
@@ -36,6 +35,9 @@
 
 from .context.init import InitResourceContext
 
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
 
 def resource_initialization_manager(
     resource_defs: Dict[str, ResourceDefinition],
@@ -44,7 +46,7 @@ def resource_initialization_manager(
     execution_plan: Optional[ExecutionPlan],
     pipeline_run: Optional[PipelineRun],
     resource_keys_to_init: Optional[AbstractSet[str]],
-    instance: Optional[DagsterInstance],
+    instance: "Optional[DagsterInstance]",
     emit_persistent_events: Optional[bool],
     pipeline_def_for_backwards_compat: Optional[PipelineDefinition],
 ):
@@ -105,7 +107,7 @@ def _core_resource_initialization_event_generator(
     execution_plan: Optional[ExecutionPlan],
     pipeline_run: Optional[PipelineRun],
     resource_keys_to_init: Optional[AbstractSet[str]],
-    instance: Optional[DagsterInstance],
+    instance: "Optional[DagsterInstance]",
     emit_persistent_events: Optional[bool],
     pipeline_def_for_backwards_compat: Optional[PipelineDefinition],
 ):
@@ -197,10 +199,12 @@ def resource_initialization_event_generator(
     execution_plan: Optional[ExecutionPlan],
     pipeline_run: Optional[PipelineRun],
     resource_keys_to_init: Optional[AbstractSet[str]],
-    instance: Optional[DagsterInstance],
+    instance: "Optional[DagsterInstance]",
     emit_persistent_events: Optional[bool],
     pipeline_def_for_backwards_compat: Optional[PipelineDefinition],
 ):
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(log_manager, "log_manager", DagsterLogManager)
     resource_keys_to_init = check.opt_set_param(
         resource_keys_to_init, "resource_keys_to_init", of_type=str
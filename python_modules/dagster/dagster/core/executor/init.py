@@ -2,7 +2,6 @@
 
 from dagster import check
 from dagster.core.definitions import ExecutorDefinition, IPipeline
-from dagster.core.instance import DagsterInstance
 
 
 class InitExecutorContext(
@@ -28,6 +27,8 @@ def __new__(
         executor_config,
         instance,
     ):
+        from dagster.core.instance import DagsterInstance
+
         return super(InitExecutorContext, cls).__new__(
             cls,
             job=check.inst_param(job, "job", IPipeline),
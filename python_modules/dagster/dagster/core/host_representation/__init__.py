@@ -6,6 +6,10 @@
 It also contains classes that represent historical representations
 that have been persisted. e.g. HistoricalPipeline
 """
+from typing import TYPE_CHECKING
+
+from dagster.utils.deferred_imports import deferred_imports
+
 from .external import (
     ExternalExecutionPlan,
     ExternalPartitionSet,
@@ -47,11 +51,6 @@
     RepositoryLocationOrigin,
 )
 from .pipeline_index import PipelineIndex
-from .repository_location import (
-    GrpcServerRepositoryLocation,
-    InProcessRepositoryLocation,
-    RepositoryLocation,
-)
 from .represented import RepresentedPipeline
 from .selector import (
     GraphSelector,
@@ -61,3 +60,20 @@
     ScheduleSelector,
     SensorSelector,
 )
+
+# The repository locations import the gRPC api modules, which in turn import this package, so they
+# are only imported when first accessed, letting those modules be imported on their own.
+_DEFERRED_IMPORTS = {
+    "GrpcServerRepositoryLocation": "dagster.core.host_representation.repository_location",
+    "InProcessRepositoryLocation": "dagster.core.host_representation.repository_location",
+    "RepositoryLocation": "dagster.core.host_representation.repository_location",
+}
+
+if TYPE_CHECKING:
+    from .repository_location import (
+        GrpcServerRepositoryLocation,
+        InProcessRepositoryLocation,
+        RepositoryLocation,
+    )
+
+__getattr__, __dir__ = deferred_imports(__name__, _DEFERRED_IMPORTS)
@@ -0,0 +1,98 @@
+from typing import List, Optional, Sequence
+
+from dagster import check
+from dagster.core.definitions.events import AssetKey
+
+from .external_data import (
+    ExternalAssetGraphIndex,
+    ExternalAssetNode,
+    external_asset_graph_index_from_nodes,
+)
+
+
+class AssetGraphIndex:
+    """Index over the asset graph of a repository, for looking up asset nodes by key and for
+    querying the assets upstream and downstream of an asset.
+
+    Transitive queries only visit the assets that they return, so they stay fast on large graphs.
+    Results are returned in topological order.
+    """
+
+    def __init__(
+        self,
+        asset_nodes: Sequence[ExternalAssetNode],
+        external_asset_graph_index: Optional[ExternalAssetGraphIndex] = None,
+    ):
+        check.list_param(asset_nodes, "asset_nodes", of_type=ExternalAssetNode)
+        check.opt_inst_param(
+            external_asset_graph_index, "external_asset_graph_index", ExternalAssetGraphIndex
+        )
+
+        # repository data from older versions of dagster doesn't include the index
+        if external_asset_graph_index is None:
+            external_asset_graph_index = external_asset_graph_index_from_nodes(asset_nodes)
+
+        self._asset_nodes_by_key = {asset_node.asset_key: asset_node for asset_node in asset_nodes}
+        self._asset_keys = external_asset_graph_index.toposorted_asset_keys
+        self._position_by_key = {
+            asset_key: position for position, asset_key in enumerate(self._asset_keys)
+        }
+        self._upstream_positions = external_asset_graph_index.upstream_indices
+        self._downstream_positions: List[List[int]] = [[] for _ in self._asset_keys]
+        for position, upstream_positions in enumerate(self._upstream_positions):
+            for upstream_position in upstream_positions:
+                self._downstream_positions[upstream_position].append(position)
+
+    @property
+    def toposorted_asset_keys(self) -> List[AssetKey]:
+        return self._asset_keys
+
+    def has_asset_node(self, asset_key: AssetKey) -> bool:
+        return asset_key in self._asset_nodes_by_key
+
+    def get_asset_node(self, asset_key: AssetKey) -> Optional[ExternalAssetNode]:
+        return self._asset_nodes_by_key.get(asset_key)
+
+    def get_upstream_asset_keys(self, asset_key: AssetKey) -> List[AssetKey]:
+        return self._keys_at(self._upstream_positions[self._position(asset_key)])
+
+    def get_downstream_asset_keys(self, asset_key: AssetKey) -> List[AssetKey]:
+        return self._keys_at(sorted(self._downstream_positions[self._position(asset_key)]))
+
+    def get_all_upstream_asset_keys(self, asset_key: AssetKey) -> List[AssetKey]:
+        """Returns the keys of every asset that the given asset depends on, directly or
+        transitively.
+        """
+        return self._keys_at(self._reachable_positions(asset_key, self._upstream_positions))
+
+    def get_all_downstream_asset_keys(self, asset_key: AssetKey) -> List[AssetKey]:
+        """Returns the keys of every asset that depends on the given asset, directly or
+        transitively.
+        """
+        return self._keys_at(self._reachable_positions(asset_key, self._downstream_positions))
+
+    def _position(self, asset_key: AssetKey) -> int:
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.invariant(
+            asset_key in self._position_by_key,
+            f"Asset {asset_key.to_string()} is not in the asset graph",
+        )
+        return self._position_by_key[asset_key]
+
+    def _keys_at(self, positions: Sequence[int]) -> List[AssetKey]:
+        return [self._asset_keys[position] for position in positions]
+
+    def _reachable_positions(
+        self, asset_key: AssetKey, adjacent_positions: List[List[int]]
+    ) -> List[int]:
+        start_position = self._position(asset_key)
+        visited = {start_position}
+        to_visit = [start_position]
+        while to_visit:
+            for adjacent_position in adjacent_positions[to_visit.pop()]:
+                if adjacent_position not in visited:
+                    visited.add(adjacent_position)
+                    to_visit.append(adjacent_position)
+
+        visited.remove(start_position)
+        return sorted(visited)
@@ -12,6 +12,7 @@
 from dagster.core.utils import toposort
 from dagster.utils.schedules import schedule_execution_time_iterator
 
+from .asset_graph_index import AssetGraphIndex
 from .external_data import (
     ExternalAssetNode,
     ExternalPartitionSetData,
@@ -70,6 +71,9 @@ def __init__(self, external_repository_data, repository_handle):
                 else:
                     self._asset_jobs[job_name].append(asset_node)
 
+        # built on first use, since repositories without assets don't need it
+        self._asset_graph_index = None
+
     @property
     def name(self):
         return self.external_repository_data.name
@@ -183,12 +187,16 @@ def get_external_asset_nodes(self, job_name=None) -> Sequence[ExternalAssetNode]
         )
 
     def get_external_asset_node(self, asset_key: AssetKey) -> ExternalAssetNode:
-        matching = [
-            asset_node
-            for asset_node in self.external_repository_data.external_asset_graph_data
-            if asset_node.asset_key == asset_key
-        ]
-        return matching[0] if matching else None
+        return self.asset_graph_index.get_asset_node(asset_key)
+
+    @property
+    def asset_graph_index(self) -> AssetGraphIndex:
+        if self._asset_graph_index is None:
+            self._asset_graph_index = AssetGraphIndex(
+                self.external_repository_data.external_asset_graph_data,
+                self.external_repository_data.external_asset_graph_index,
+            )
+        return self._asset_graph_index
 
     def get_display_metadata(self):
         return self.handle.display_metadata
@@ -4,6 +4,7 @@
 business logic or clever indexing. Use the classes in external.py
 for that.
 """
+import heapq
 from abc import ABC, abstractmethod
 from collections import defaultdict, namedtuple
 from datetime import datetime
@@ -36,7 +37,7 @@
 class ExternalRepositoryData(
     namedtuple(
         "_ExternalRepositoryData",
-        "name external_pipeline_datas external_schedule_datas external_partition_set_datas external_sensor_datas external_asset_graph_data",
+        "name external_pipeline_datas external_schedule_datas external_partition_set_datas external_sensor_datas external_asset_graph_data external_asset_graph_index",
     )
 ):
     def __new__(
@@ -47,6 +48,7 @@ def __new__(
         external_partition_set_datas,
         external_sensor_datas=None,
         external_asset_graph_data=None,
+        external_asset_graph_index=None,
     ):
         return super(ExternalRepositoryData, cls).__new__(
             cls,
@@ -72,6 +74,9 @@ def __new__(
                 "external_asset_graph_dats",
                 of_type=ExternalAssetNode,
             ),
+            external_asset_graph_index=check.opt_inst_param(
+                external_asset_graph_index, "external_asset_graph_index", ExternalAssetGraphIndex
+            ),
         )
 
     def get_pipeline_snapshot(self, name):
@@ -526,10 +531,41 @@ def __new__(
         )
 
 
+@whitelist_for_serdes
+class ExternalAssetGraphIndex(
+    namedtuple("_ExternalAssetGraphIndex", "toposorted_asset_keys upstream_indices")
+):
+    """The structure of the asset graph, computed once when the repository data is built.
+
+    The asset keys are in topological order, unless the graph has a cycle. The upstream assets of
+    each asset are referenced by their position in the list of asset keys.
+    """
+
+    def __new__(
+        cls,
+        toposorted_asset_keys: List[AssetKey],
+        upstream_indices: List[List[int]],
+    ):
+        check.list_param(toposorted_asset_keys, "toposorted_asset_keys", of_type=AssetKey)
+        check.list_param(upstream_indices, "upstream_indices", of_type=list)
+        check.invariant(
+            len(toposorted_asset_keys) == len(upstream_indices),
+            "Expected an entry in upstream_indices for every asset key",
+        )
+        return super(ExternalAssetGraphIndex, cls).__new__(
+            cls,
+            toposorted_asset_keys=toposorted_asset_keys,
+            upstream_indices=upstream_indices,
+        )
+
+
 def external_repository_data_from_def(repository_def):
     check.inst_param(repository_def, "repository_def", RepositoryDefinition)
 
     pipelines = repository_def.get_all_pipelines()
+    external_asset_nodes = external_asset_graph_from_defs(
+        pipelines, foreign_assets_by_key=repository_def.foreign_assets_by_key
+    )
     return ExternalRepositoryData(
         name=repository_def.name,
         external_pipeline_datas=sorted(
@@ -548,9 +584,8 @@ def external_repository_data_from_def(repository_def):
             list(map(external_sensor_data_from_def, repository_def.sensor_defs)),
             key=lambda sd: sd.name,
         ),
-        external_asset_graph_data=external_asset_graph_from_defs(
-            pipelines, foreign_assets_by_key=repository_def.foreign_assets_by_key
-        ),
+        external_asset_graph_data=external_asset_nodes,
+        external_asset_graph_index=external_asset_graph_index_from_nodes(external_asset_nodes),
     )
 
 
@@ -565,9 +600,19 @@ def external_asset_graph_from_defs(
     dep_by: Dict[AssetKey, List[ExternalAssetDependedBy]] = defaultdict(list)
     all_upstream_asset_keys = set()
 
+    # node defs that are shared by several pipelines only have their inputs and outputs walked
+    # the first time that they are seen
+    asset_keys_by_node_def_id: Dict[int, Set[AssetKey]] = {}
+
     for pipeline in pipelines:
         for node_def in pipeline.all_node_defs:
+            if id(node_def) in asset_keys_by_node_def_id:
+                for asset_key in asset_keys_by_node_def_id[id(node_def)]:
+                    node_defs_by_asset_key[asset_key].append((node_def, pipeline))
+                continue
+
             node_asset_keys: Set[AssetKey] = set()
+            asset_keys_by_node_def_id[id(node_def)] = node_asset_keys
             for output_def in node_def.output_defs:
                 asset_key = output_def.hardcoded_asset_key
 
@@ -662,6 +707,58 @@ def external_asset_graph_from_defs(
     return asset_nodes
 
 
+def external_asset_graph_index_from_nodes(
+    asset_nodes: Sequence[ExternalAssetNode],
+) -> ExternalAssetGraphIndex:
+    index_by_asset_key = {asset_node.asset_key: i for i, asset_node in enumerate(asset_nodes)}
+    upstream_indices_by_index = [
+        {
+            index_by_asset_key[dep.upstream_asset_key]
+            for dep in asset_node.dependencies
+            if dep.upstream_asset_key in index_by_asset_key
+        }
+        for asset_node in asset_nodes
+    ]
+    downstream_indices_by_index: List[List[int]] = [[] for _ in asset_nodes]
+    for index, upstream_indices in enumerate(upstream_indices_by_index):
+        for upstream_index in upstream_indices:
+            downstream_indices_by_index[upstream_index].append(index)
+
+    # Kahn's algorithm, which is linear in the size of the graph even when it's deep. Assets that
+    # are ready at the same time are ordered by their position in asset_nodes.
+    num_unsorted_upstream = [
+        len(upstream_indices) for upstream_indices in upstream_indices_by_index
+    ]
+    ready = [index for index, num in enumerate(num_unsorted_upstream) if num == 0]
+    toposorted_indices = []
+    while ready:
+        index = heapq.heappop(ready)
+        toposorted_indices.append(index)
+        for downstream_index in downstream_indices_by_index[index]:
+            num_unsorted_upstream[downstream_index] -= 1
+            if num_unsorted_upstream[downstream_index] == 0:
+                heapq.heappush(ready, downstream_index)
+
+    # assets in or downstream of a cycle are never ready, so add them in their original order
+    if len(toposorted_indices) < len(asset_nodes):
+        sorted_indices = set(toposorted_indices)
+        toposorted_indices.extend(
+            index for index in range(len(asset_nodes)) if index not in sorted_indices
+        )
+
+    position_by_index = {index: position for position, index in enumerate(toposorted_indices)}
+    return ExternalAssetGraphIndex(
+        toposorted_asset_keys=[asset_nodes[index].asset_key for index in toposorted_indices],
+        upstream_indices=[
+            sorted(
+                position_by_index[upstream_index]
+                for upstream_index in upstream_indices_by_index[index]
+            )
+            for index in toposorted_indices
+        ],
+    )
+
+
 def external_pipeline_data_from_def(pipeline_def):
     check.inst_param(pipeline_def, "pipeline_def", PipelineDefinition)
     return ExternalPipelineData(
@@ -3,7 +3,7 @@
 import uuid
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import Generic, NamedTuple, Optional, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Generic, NamedTuple, Optional, TypeVar, Union, cast
 
 import pendulum
 from dagster import check
@@ -13,10 +13,14 @@
     RepositoryLocationOrigin,
 )
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster.grpc.client import DagsterGrpcClient
-from dagster.grpc.server import GrpcServerProcess
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
+if TYPE_CHECKING:
+    # dagster.grpc.client and dagster.grpc.server import dagster.core.host_representation, so they
+    # are imported where they're used instead
+    from dagster.grpc.client import DagsterGrpcClient
+    from dagster.grpc.server import GrpcServerProcess
+
 
 class GrpcServerEndpoint(
     NamedTuple(
@@ -38,7 +42,9 @@ def __new__(cls, server_id, host, port, socket):
             check.opt_str_param(socket, "socket"),
         )
 
-    def create_client(self) -> DagsterGrpcClient:
+    def create_client(self) -> "DagsterGrpcClient":
+        from dagster.grpc.client import DagsterGrpcClient
+
         return DagsterGrpcClient(port=self.port, socket=self.socket, host=self.host)
 
 
@@ -69,7 +75,7 @@ class ProcessRegistryEntry(
     NamedTuple(
         "_ProcessRegistryEntry",
         [
-            ("process_or_error", Union[GrpcServerProcess, SerializableErrorInfo]),
+            ("process_or_error", Union["GrpcServerProcess", SerializableErrorInfo]),
             ("loadable_target_origin", LoadableTargetOrigin),
             ("creation_timestamp", float),
             ("server_id", Optional[str]),
@@ -77,6 +83,8 @@ class ProcessRegistryEntry(
     )
 ):
     def __new__(cls, process_or_error, loadable_target_origin, creation_timestamp, server_id):
+        from dagster.grpc.server import GrpcServerProcess
+
         return super(ProcessRegistryEntry, cls).__new__(
             cls,
             check.inst_param(
@@ -120,8 +128,12 @@ def __init__(
         self._heartbeat_ttl = check.int_param(heartbeat_ttl, "heartbeat_ttl")
         self._startup_timeout = check.int_param(startup_timeout, "startup_timeout")
 
+        # Guards _active_entries, _all_processes, and _origin_locks
         self._lock = threading.Lock()
 
+        # Held while the server for a given origin is being created, keyed by origin ID
+        self._origin_locks = {}
+
         self._all_processes = []
 
         self._cleanup_thread_shutdown_event = None
@@ -151,12 +163,13 @@ def reload_grpc_endpoint(
         check.inst_param(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
-        with self._lock:
-            origin_id = repository_location_origin.get_id()
-            if origin_id in self._active_entries:
-                # Free the map entry for this origin so that _get_grpc_endpoint will create
-                # a new process
-                del self._active_entries[origin_id]
+        origin_id = repository_location_origin.get_id()
+        with self._get_origin_lock(origin_id):
+            with self._lock:
+                if origin_id in self._active_entries:
+                    # Free the map entry for this origin so that _get_grpc_endpoint will create
+                    # a new process
+                    del self._active_entries[origin_id]
 
             return self._get_grpc_endpoint(repository_location_origin)
 
@@ -167,9 +180,17 @@ def get_grpc_endpoint(
             repository_location_origin, "repository_location_origin", RepositoryLocationOrigin
         )
 
-        with self._lock:
+        with self._get_origin_lock(repository_location_origin.get_id()):
             return self._get_grpc_endpoint(repository_location_origin)
 
+    def _get_origin_lock(self, origin_id: str) -> threading.Lock:
+        # Servers for different origins can be started concurrently, but only one thread at a
+        # time may create or refresh the server for any given origin
+        with self._lock:
+            if origin_id not in self._origin_locks:
+                self._origin_locks[origin_id] = threading.Lock()
+            return self._origin_locks[origin_id]
+
     def _get_loadable_target_origin(
         self, repository_location_origin: ManagedGrpcPythonEnvRepositoryLocationOrigin
     ):
@@ -190,12 +211,16 @@ def _get_grpc_endpoint(
                 f"No Python file/module information available for location {repository_location_origin.location_name}"
             )
 
-        if not origin_id in self._active_entries:
+        with self._lock:
+            active_entry = self._active_entries.get(origin_id)
+
+        if not active_entry:
             refresh_server = True
         else:
-            active_entry = self._active_entries[origin_id]
             refresh_server = loadable_target_origin != active_entry.loadable_target_origin
 
+        from dagster.grpc.server import GrpcServerProcess
+
         server_process: Union[GrpcServerProcess, SerializableErrorInfo]
         new_server_id: Optional[str]
         if refresh_server:
@@ -208,19 +233,20 @@ def _get_grpc_endpoint(
                     fixed_server_id=new_server_id,
                     startup_timeout=self._startup_timeout,
                 )
-                self._all_processes.append(server_process)
+                with self._lock:
+                    self._all_processes.append(server_process)
             except Exception:
                 server_process = serializable_error_info_from_exc_info(sys.exc_info())
                 new_server_id = None
 
-            self._active_entries[origin_id] = ProcessRegistryEntry(
+            active_entry = ProcessRegistryEntry(
                 process_or_error=server_process,
                 loadable_target_origin=loadable_target_origin,
                 creation_timestamp=pendulum.now("UTC").timestamp(),
                 server_id=new_server_id,
             )
-
-        active_entry = self._active_entries[origin_id]
+            with self._lock:
+                self._active_entries[origin_id] = active_entry
 
         if isinstance(active_entry.process_or_error, SerializableErrorInfo):
             raise DagsterUserCodeProcessError(
@@ -0,0 +1,260 @@
+import hashlib
+import importlib.util
+import os
+import sys
+import threading
+import warnings
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional
+
+from dagster import check
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc.types import ListRepositoriesResponse
+from dagster.serdes import deserialize_json_to_dagster_namedtuple, serialize_dagster_namedtuple
+from dagster.serdes.serdes import whitelist_for_serdes
+from dagster.utils import mkdir_p
+from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.version import __version__
+
+from .external_data import ExternalRepositoryData
+from .origin import ManagedGrpcPythonEnvRepositoryLocationOrigin, RepositoryLocationOrigin
+
+if TYPE_CHECKING:
+    from dagster.core.instance import DagsterInstance
+
+# Locations with more Python files than this under their code directories are keyed by the ID of
+# their server instead, since checking every file on each load would defeat the purpose of the cache
+MAX_CODE_VERSION_FILES = 10000
+
+# Directories that hold environments or build artifacts rather than the code of a location
+IGNORED_CODE_DIR_NAMES = {
+    "__pycache__",
+    "build",
+    "dist",
+    "env",
+    "node_modules",
+    "site-packages",
+    "venv",
+}
+
+
+@whitelist_for_serdes
+class RepositoryDataCacheEntry(
+    NamedTuple(
+        "_RepositoryDataCacheEntry",
+        [
+            ("code_version_key", str),
+            ("dagster_version", str),
+            ("list_repositories_response", ListRepositoriesResponse),
+            ("container_image", Optional[str]),
+            ("external_repository_datas", Dict[str, ExternalRepositoryData]),
+        ],
+    )
+):
+    def __new__(
+        cls,
+        code_version_key,
+        dagster_version,
+        list_repositories_response,
+        container_image,
+        external_repository_datas,
+    ):
+        return super(RepositoryDataCacheEntry, cls).__new__(
+            cls,
+            check.str_param(code_version_key, "code_version_key"),
+            check.str_param(dagster_version, "dagster_version"),
+            check.inst_param(
+                list_repositories_response, "list_repositories_response", ListRepositoriesResponse
+            ),
+            check.opt_str_param(container_image, "container_image"),
+            check.dict_param(
+                external_repository_datas,
+                "external_repository_datas",
+                key_type=str,
+                value_type=ExternalRepositoryData,
+            ),
+        )
+
+
+class RepositoryDataCache:
+    """Persists the data that a gRPC repository location loads from its server on local disk, so
+    that a host process can skip listing, streaming and deserializing the repository data of code
+    that hasn't changed since it was cached.
+
+    Entries are keyed by the location origin and are only valid for the code version key they were
+    written with. For locations whose server is managed by Dagster, the key is a hash of the code
+    pointer and of the paths, sizes and modification times of the Python files that it loads, which
+    is known before the server is contacted. For other locations, the key is the ID of the server. Servers started with a
+    fixed server ID (e.g. ``dagster api grpc --fixed-server-id <image tag>``) keep the same ID
+    across restarts, so their cached data stays valid until the code they serve changes.
+    """
+
+    def __init__(self, base_dir: str):
+        self._base_dir = check.str_param(base_dir, "base_dir")
+        mkdir_p(self._base_dir)
+
+    @staticmethod
+    def from_instance(instance: "DagsterInstance") -> Optional["RepositoryDataCache"]:
+        if not instance.repository_data_cache_enabled:
+            return None
+        return RepositoryDataCache(instance.repository_data_cache_dir)
+
+    @property
+    def base_dir(self) -> str:
+        return self._base_dir
+
+    def _path_for_origin(self, origin: RepositoryLocationOrigin) -> str:
+        return os.path.join(self._base_dir, f"{origin.get_id()}.json")
+
+    def get(
+        self, origin: RepositoryLocationOrigin, code_version_key: str
+    ) -> Optional[RepositoryDataCacheEntry]:
+        check.inst_param(origin, "origin", RepositoryLocationOrigin)
+        check.str_param(code_version_key, "code_version_key")
+
+        path = self._path_for_origin(origin)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r") as f:
+                entry = deserialize_json_to_dagster_namedtuple(f.read())
+        except Exception:
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            warnings.warn(
+                f"Ignoring unreadable repository data cache entry for location "
+                f"{origin.location_name}: {error.to_string()}"
+            )
+            return None
+
+        if (
+            not isinstance(entry, RepositoryDataCacheEntry)
+            or entry.code_version_key != code_version_key
+            or entry.dagster_version != __version__
+        ):
+            return None
+
+        return entry
+
+    def set(
+        self,
+        origin: RepositoryLocationOrigin,
+        code_version_key: str,
+        list_repositories_response: ListRepositoriesResponse,
+        container_image: Optional[str],
+        external_repository_datas: Dict[str, ExternalRepositoryData],
+    ) -> None:
+        check.inst_param(origin, "origin", RepositoryLocationOrigin)
+
+        path = self._path_for_origin(origin)
+        serialized = serialize_dagster_namedtuple(
+            RepositoryDataCacheEntry(
+                code_version_key=code_version_key,
+                dagster_version=__version__,
+                list_repositories_response=list_repositories_response,
+                container_image=container_image,
+                external_repository_datas=external_repository_datas,
+            )
+        )
+
+        # Write to a temporary file and move it into place so that concurrent readers never see
+        # a partially written entry
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as f:
+            f.write(serialized)
+        os.replace(temp_path, path)
+
+    def clear(self, origin: RepositoryLocationOrigin) -> None:
+        check.inst_param(origin, "origin", RepositoryLocationOrigin)
+        path = self._path_for_origin(origin)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def get_local_code_version_key(origin: RepositoryLocationOrigin) -> Optional[str]:
+    """Returns a key for the code that a location loads, computed without contacting its server:
+    a hash of its code pointer and of the paths, sizes and modification times of the Python files
+    under the directories that the code is loaded from. Returns None if the code can't be found on
+    local disk, or if there are too many files under those directories to check on every load.
+    """
+    check.inst_param(origin, "origin", RepositoryLocationOrigin)
+
+    if not isinstance(origin, ManagedGrpcPythonEnvRepositoryLocationOrigin):
+        return None
+
+    loadable_target_origin = origin.loadable_target_origin
+    code_dirs = _get_code_dirs(loadable_target_origin)
+    if not code_dirs:
+        return None
+
+    python_files = []
+    for code_dir in code_dirs:
+        python_files.extend(_get_python_files(code_dir, MAX_CODE_VERSION_FILES - len(python_files)))
+        if len(python_files) > MAX_CODE_VERSION_FILES:
+            return None
+
+    hasher = hashlib.sha256(serialize_dagster_namedtuple(loadable_target_origin).encode("utf-8"))
+    for python_file in python_files:
+        try:
+            stat = os.stat(python_file)
+        except OSError:
+            continue
+        hasher.update(f"{python_file}:{stat.st_size}:{stat.st_mtime_ns}".encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def _get_code_dirs(loadable_target_origin: LoadableTargetOrigin) -> List[str]:
+    code_dirs = []
+    if loadable_target_origin.working_directory:
+        code_dirs.append(loadable_target_origin.working_directory)
+
+    if loadable_target_origin.python_file:
+        code_dirs.append(os.path.dirname(os.path.abspath(loadable_target_origin.python_file)))
+    elif not loadable_target_origin.working_directory:
+        # modules and packages can only be found from this process if they are installed in the
+        # same environment as the server
+        if (
+            loadable_target_origin.executable_path
+            and loadable_target_origin.executable_path != sys.executable
+        ):
+            return []
+
+        module_name = loadable_target_origin.module_name or loadable_target_origin.package_name
+        try:
+            spec = importlib.util.find_spec(module_name.split(".")[0])
+        except (ImportError, ValueError):
+            return []
+
+        if not spec:
+            return []
+        elif spec.submodule_search_locations:
+            code_dirs.extend(spec.submodule_search_locations)
+        elif spec.origin and os.path.isfile(spec.origin):
+            code_dirs.append(os.path.dirname(spec.origin))
+
+    return sorted({os.path.abspath(code_dir) for code_dir in code_dirs if os.path.isdir(code_dir)})
+
+
+def _get_python_files(code_dir: str, max_files: int) -> List[str]:
+    # Returns at most max_files + 1 files, so that callers can tell when the limit was exceeded
+    python_files: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(code_dir):
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames if _is_code_dir(os.path.join(dirpath, dirname))
+        )
+        python_files.extend(
+            os.path.join(dirpath, filename)
+            for filename in sorted(filenames)
+            if filename.endswith(".py")
+        )
+        if len(python_files) > max_files:
+            return python_files[: max_files + 1]
+    return python_files
+
+
+def _is_code_dir(path: str) -> bool:
+    dirname = os.path.basename(path)
+    if dirname.startswith(".") or dirname in IGNORED_CODE_DIR_NAMES:
+        return False
+    # virtualenvs can have any name, but always contain a pyvenv.cfg file
+    return not os.path.exists(os.path.join(path, "pyvenv.cfg"))
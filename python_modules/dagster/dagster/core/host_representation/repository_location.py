@@ -1,9 +1,22 @@
 import datetime
 import sys
 import threading
+import warnings
 from abc import abstractmethod
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 
 from dagster import check
 from dagster.api.get_server_id import sync_get_server_id
@@ -19,13 +32,16 @@
 from dagster.api.snapshot_pipeline import sync_get_external_pipeline_subset_grpc
 from dagster.api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
 from dagster.api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
-from dagster.api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
+from dagster.api.snapshot_sensor import (
+    sync_get_external_sensor_execution_data_batches_grpc,
+    sync_get_external_sensor_execution_data_grpc,
+)
 from dagster.core.code_pointer import CodePointer
 from dagster.core.definitions.reconstructable import (
     ReconstructablePipeline,
     ReconstructableRepository,
 )
-from dagster.core.errors import DagsterInvariantViolationError
+from dagster.core.errors import DagsterInvariantViolationError, DagsterUserCodeUnreachableError
 from dagster.core.execution.api import create_execution_plan
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.host_representation import ExternalPipelineSubsetResult
@@ -34,29 +50,39 @@
     ExternalPipeline,
     ExternalRepository,
 )
-from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
+from dagster.core.host_representation.external_data import ExternalRepositoryData
+from dagster.core.host_representation.grpc_server_registry import (
+    GrpcServerEndpoint,
+    GrpcServerRegistry,
+)
 from dagster.core.host_representation.handle import PipelineHandle, RepositoryHandle
 from dagster.core.host_representation.origin import (
     GrpcServerRepositoryLocationOrigin,
     InProcessRepositoryLocationOrigin,
     RepositoryLocationOrigin,
 )
+from dagster.core.host_representation.repository_data_cache import (
+    RepositoryDataCache,
+    get_local_code_version_key,
+)
 from dagster.core.instance import DagsterInstance
 from dagster.core.origin import RepositoryPythonOrigin
 from dagster.core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster.grpc.impl import (
     get_external_schedule_execution,
     get_external_sensor_execution,
+    get_external_sensor_execution_batches,
     get_notebook_data,
     get_partition_config,
     get_partition_names,
     get_partition_set_execution_param_data,
     get_partition_tags,
 )
-from dagster.grpc.types import GetCurrentImageResult
+from dagster.grpc.types import GetCurrentImageResult, ListRepositoriesResponse
 from dagster.serdes import deserialize_as
 from dagster.seven.compat.pendulum import PendulumDateTime
 from dagster.utils import merge_dicts
+from dagster.utils.error import serializable_error_info_from_exc_info
 from dagster.utils.hosted_user_process import external_repo_from_def
 
 from .selector import PipelineSelector
@@ -75,6 +101,7 @@
     from dagster.core.host_representation.external_data import (
         ExternalSensorExecutionErrorData,
     )
+    from dagster.grpc.client import DagsterGrpcClient
 
 
 class RepositoryLocation(AbstractContextManager):
@@ -201,6 +228,25 @@ def get_external_sensor_execution_data(
     ) -> Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]:
         pass
 
+    def get_external_sensor_execution_data_batches(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        run_request_batch_size: int,
+    ) -> Iterator[Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]]:
+        """Evaluates a sensor, yielding its run requests in batches of ``run_request_batch_size``
+        as they are produced, each with the cursor of the sensor at that point. By default, the
+        whole evaluation is returned as a single batch.
+        """
+        check.int_param(run_request_batch_size, "run_request_batch_size")
+        yield self.get_external_sensor_execution_data(
+            instance, repository_handle, name, last_completion_time, last_run_key, cursor
+        )
+
     @abstractmethod
     def get_external_notebook_data(self, notebook_path: str) -> bytes:
         pass
@@ -449,6 +495,26 @@ def get_external_sensor_execution_data(
             self._recon_repo, instance.get_ref(), name, last_completion_time, last_run_key, cursor
         )
 
+    def get_external_sensor_execution_data_batches(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        run_request_batch_size: int,
+    ) -> Iterator[Union["SensorExecutionData", "ExternalSensorExecutionErrorData"]]:
+        return get_external_sensor_execution_batches(
+            self._recon_repo,
+            instance.get_ref(),
+            name,
+            last_completion_time,
+            last_run_key,
+            cursor,
+            run_request_batch_size,
+        )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
@@ -481,20 +547,32 @@ def __init__(
         heartbeat: Optional[bool] = False,
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
+        repository_data_cache: Optional[RepositoryDataCache] = None,
+        get_endpoint: Optional[Callable[[], GrpcServerEndpoint]] = None,
     ):
-        from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
-
         self._origin = check.inst_param(origin, "origin", RepositoryLocationOrigin)
 
         self.grpc_server_registry = check.opt_inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
         )
+        self._repository_data_cache = check.opt_inst_param(
+            repository_data_cache, "repository_data_cache", RepositoryDataCache
+        )
+
+        # Locations whose server is started by a registry are given a function that returns the
+        # endpoint of the server, so that their cached data can be served before the server is up
+        self._get_endpoint = check.opt_callable_param(get_endpoint, "get_endpoint")
 
         if isinstance(self.origin, GrpcServerRepositoryLocationOrigin):
             self._port = self.origin.port
             self._socket = self.origin.socket
             self._host = self.origin.host
             self._use_ssl = bool(self.origin.use_ssl)
+        elif self._get_endpoint:
+            self._port = None
+            self._socket = None
+            self._host = None
+            self._use_ssl = False
         else:
             self._port = check.opt_int_param(port, "port")
             self._socket = check.opt_str_param(socket, "socket")
@@ -510,8 +588,19 @@ def __init__(
         self._heartbeat = check.bool_param(heartbeat, "heartbeat")
         self._watch_server = check.bool_param(watch_server, "watch_server")
 
-        self.server_id = None
-        self._external_repositories_data = None
+        self._client = None
+        self._server_id = None
+        self._endpoint_resolved = threading.Event()
+        self._endpoint_error = None
+        self._revalidation_thread = None
+        self._cleanup_lock = threading.Lock()
+        self._is_cleaned_up = False
+
+        # the repository data of a location that was loaded from the cache is swapped by its
+        # revalidation thread, so it's only read and written while holding this lock
+        self._repository_data_lock = threading.RLock()
+        self._repository_names: AbstractSet[str] = set()
+        self._external_repositories: Dict[str, ExternalRepository] = {}
 
         self._executable_path = None
         self._container_image = None
@@ -519,91 +608,255 @@ def __init__(
         self._entry_point = None
 
         try:
-            self.client = DagsterGrpcClient(
+            code_version_key = None
+            cache_entry = None
+            if self._get_endpoint and self._repository_data_cache:
+                # the key of a managed location only depends on its code on local disk, so its
+                # cached data can be served without starting its server first
+                code_version_key = get_local_code_version_key(self.origin)
+                if code_version_key:
+                    cache_entry = self._repository_data_cache.get(self.origin, code_version_key)
+
+            if cache_entry:
+                self._set_repository_data(
+                    cache_entry.list_repositories_response,
+                    cache_entry.container_image,
+                    cache_entry.external_repository_datas,
+                )
+                # start the server and check the cached data against it in the background
+                self._revalidation_thread = threading.Thread(
+                    target=self._revalidate_cache_entry,
+                    args=(cast(str, code_version_key), cache_entry),
+                    name="grpc-repository-data-cache-revalidation",
+                )
+                self._revalidation_thread.daemon = True
+                self._revalidation_thread.start()
+                return
+
+            if self._get_endpoint:
+                endpoint = self._get_endpoint()
+                self._set_endpoint(endpoint)
+                server_id = endpoint.server_id
+
+            self._connect(server_id)
+
+            # the cached data of the location is served without listing the repositories or
+            # streaming their data from the server if the code hasn't changed since it was cached
+            if self._repository_data_cache:
+                code_version_key = (
+                    code_version_key
+                    or get_local_code_version_key(self.origin)
+                    or cast(str, self._server_id)
+                )
+                cache_entry = self._repository_data_cache.get(self.origin, code_version_key)
+
+            if cache_entry:
+                self._set_repository_data(
+                    cache_entry.list_repositories_response,
+                    cache_entry.container_image,
+                    cache_entry.external_repository_datas,
+                )
+            else:
+                self._set_repository_data(*self._fetch_repository_data(code_version_key))
+        except:
+            self.cleanup()
+            raise
+
+    def _set_endpoint(self, endpoint: GrpcServerEndpoint) -> None:
+        self._port = endpoint.port
+        self._socket = endpoint.socket
+        self._host = endpoint.host
+
+    def _connect(self, server_id: Optional[str]) -> None:
+        from dagster.grpc.client import DagsterGrpcClient, client_heartbeat_thread
+
+        try:
+            self._client = DagsterGrpcClient(
                 port=self._port,
                 socket=self._socket,
                 host=self._host,
                 use_ssl=self._use_ssl,
             )
-            list_repositories_response = sync_list_repositories_grpc(self.client)
-
-            self.server_id = server_id if server_id else sync_get_server_id(self.client)
-            self.repository_names = set(
+            self._server_id = server_id if server_id else sync_get_server_id(self._client)
+        finally:
+            self._endpoint_resolved.set()
+
+        if self._heartbeat:
+            self._heartbeat_shutdown_event = threading.Event()
+
+            self._heartbeat_thread = threading.Thread(
+                target=client_heartbeat_thread,
+                args=(
+                    self._client,
+                    self._heartbeat_shutdown_event,
+                ),
+                name="grpc-client-heartbeat",
+            )
+            self._heartbeat_thread.daemon = True
+            self._heartbeat_thread.start()
+
+    def _fetch_repository_data(
+        self, code_version_key: Optional[str]
+    ) -> Tuple[ListRepositoriesResponse, str, Dict[str, ExternalRepositoryData]]:
+        list_repositories_response = sync_list_repositories_grpc(self.client)
+        container_image = self._reload_current_image()
+        external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
+            self.client,
+            self,
+            repository_names=set(
                 symbol.repository_name for symbol in list_repositories_response.repository_symbols
+            ),
+        )
+        if self._repository_data_cache and code_version_key:
+            self._repository_data_cache.set(
+                self.origin,
+                code_version_key,
+                list_repositories_response,
+                container_image,
+                external_repositories_data,
             )
+        return list_repositories_response, container_image, external_repositories_data
 
-            if self._heartbeat:
-                self._heartbeat_shutdown_event = threading.Event()
-
-                self._heartbeat_thread = threading.Thread(
-                    target=client_heartbeat_thread,
-                    args=(
-                        self.client,
-                        self._heartbeat_shutdown_event,
-                    ),
-                    name="grpc-client-heartbeat",
+    def _set_repository_data(
+        self,
+        list_repositories_response: ListRepositoriesResponse,
+        container_image: Optional[str],
+        external_repositories_data: Dict[str, ExternalRepositoryData],
+    ) -> None:
+        with self._cleanup_lock:
+            if self._is_cleaned_up:
+                return
+
+            with self._repository_data_lock:
+                self._repository_names = set(
+                    symbol.repository_name
+                    for symbol in list_repositories_response.repository_symbols
                 )
-                self._heartbeat_thread.daemon = True
-                self._heartbeat_thread.start()
+                self._executable_path = list_repositories_response.executable_path
+                self._repository_code_pointer_dict = (
+                    list_repositories_response.repository_code_pointer_dict
+                )
+                self._entry_point = list_repositories_response.entry_point
+                self._container_image = container_image
+                # the repository handles are built from the data above
+                self._external_repositories = {
+                    repo_name: ExternalRepository(
+                        repo_data,
+                        RepositoryHandle(
+                            repository_name=repo_name,
+                            repository_location=self,
+                        ),
+                    )
+                    for repo_name, repo_data in external_repositories_data.items()
+                }
+
+    def _revalidate_cache_entry(self, code_version_key: str, cache_entry) -> None:
+        try:
+            endpoint = check.not_none(self._get_endpoint)()
+            with self._cleanup_lock:
+                if self._is_cleaned_up:
+                    return
+                self._set_endpoint(endpoint)
+                self._connect(endpoint.server_id)
+        except Exception:
+            self._endpoint_error = serializable_error_info_from_exc_info(sys.exc_info())
+            return
+        finally:
+            self._endpoint_resolved.set()
 
-            self._executable_path = list_repositories_response.executable_path
-            self._repository_code_pointer_dict = (
-                list_repositories_response.repository_code_pointer_dict
+        try:
+            (
+                list_repositories_response,
+                container_image,
+                external_repositories_data,
+            ) = self._fetch_repository_data(code_version_key)
+        except Exception:
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            warnings.warn(
+                f"Error refreshing the cached data of repository location {self.name}: "
+                f"{error.to_string()}"
+            )
+            return
+
+        if (
+            list_repositories_response != cache_entry.list_repositories_response
+            or container_image != cache_entry.container_image
+            or external_repositories_data != cache_entry.external_repository_datas
+        ):
+            self._set_repository_data(
+                list_repositories_response, container_image, external_repositories_data
             )
-            self._entry_point = list_repositories_response.entry_point
-
-            self._container_image = self._reload_current_image()
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+    def _wait_for_endpoint(self) -> None:
+        # Locations that were loaded from the cache start their server in the background
+        self._endpoint_resolved.wait()
+        if self._endpoint_error:
+            raise DagsterUserCodeUnreachableError(
+                f"Could not start the server for repository location {self.name}: "
+                f"{self._endpoint_error.to_string()}"
             )
 
-            self.external_repositories = {
-                repo_name: ExternalRepository(
-                    repo_data,
-                    RepositoryHandle(
-                        repository_name=repo_name,
-                        repository_location=self,
-                    ),
-                )
-                for repo_name, repo_data in self._external_repositories_data.items()
-            }
-        except:
-            self.cleanup()
-            raise
+    @property
+    def client(self) -> "DagsterGrpcClient":
+        self._wait_for_endpoint()
+        return cast("DagsterGrpcClient", self._client)
+
+    @property
+    def server_id(self) -> Optional[str]:
+        # None while the server of a location that was loaded from the cache is starting
+        return self._server_id
 
     @property
     def origin(self) -> RepositoryLocationOrigin:
         return self._origin
 
+    @property
+    def repository_names(self) -> AbstractSet[str]:
+        with self._repository_data_lock:
+            return self._repository_names
+
+    @property
+    def external_repositories(self) -> Dict[str, ExternalRepository]:
+        with self._repository_data_lock:
+            return self._external_repositories
+
     @property
     def container_image(self) -> str:
-        return cast(str, self._container_image)
+        with self._repository_data_lock:
+            return cast(str, self._container_image)
 
     @property
     def repository_code_pointer_dict(self) -> Dict[str, CodePointer]:
-        return cast(Dict[str, CodePointer], self._repository_code_pointer_dict)
+        with self._repository_data_lock:
+            return cast(Dict[str, CodePointer], self._repository_code_pointer_dict)
 
     @property
     def executable_path(self) -> Optional[str]:
-        return self._executable_path
+        with self._repository_data_lock:
+            return self._executable_path
 
     @property
     def entry_point(self) -> Optional[List[str]]:
-        return self._entry_point
+        with self._repository_data_lock:
+            return self._entry_point
 
     @property
     def port(self) -> Optional[int]:
+        if self._get_endpoint:
+            self._wait_for_endpoint()
         return self._port
 
     @property
     def socket(self) -> Optional[str]:
+        if self._get_endpoint:
+            self._wait_for_endpoint()
         return self._socket
 
     @property
     def host(self) -> str:
-        return self._host
+        if self._get_endpoint:
+            self._wait_for_endpoint()
+        return cast(str, self._host)
 
     @property
     def use_ssl(self) -> bool:
@@ -616,6 +869,13 @@ def _reload_current_image(self) -> str:
         ).current_image
 
     def cleanup(self) -> None:
+        with self._cleanup_lock:
+            self._is_cleaned_up = True
+
+        if self._revalidation_thread:
+            self._revalidation_thread.join()
+            self._revalidation_thread = None
+
         if self._heartbeat_shutdown_event:
             self._heartbeat_shutdown_event.set()
             self._heartbeat_shutdown_event = None
@@ -764,6 +1024,27 @@ def get_external_sensor_execution_data(
             cursor,
         )
 
+    def get_external_sensor_execution_data_batches(
+        self,
+        instance: DagsterInstance,
+        repository_handle: RepositoryHandle,
+        name: str,
+        last_completion_time: Optional[float],
+        last_run_key: Optional[str],
+        cursor: Optional[str],
+        run_request_batch_size: int,
+    ) -> Iterator["SensorExecutionData"]:
+        return sync_get_external_sensor_execution_data_batches_grpc(
+            self.client,
+            instance,
+            repository_handle,
+            name,
+            last_completion_time,
+            last_run_key,
+            cursor,
+            run_request_batch_size,
+        )
+
     def get_external_partition_set_execution_param_data(
         self,
         repository_handle: RepositoryHandle,
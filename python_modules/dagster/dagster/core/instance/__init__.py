@@ -58,7 +58,7 @@
 from dagster.seven import get_current_datetime_in_utc
 from dagster.utils import traced
 from dagster.utils.backcompat import experimental_functionality_warning
-from dagster.utils.error import serializable_error_info_from_exc_info
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 from .config import DAGSTER_CONFIG_YAML_FILENAME, is_dagster_home_set
 from .ref import InstanceRef
@@ -636,6 +636,21 @@ def cancellation_thread_poll_interval_seconds(self) -> int:
             "cancellation_thread_poll_interval_seconds", 10
         )
 
+    # repository data cache
+
+    @property
+    def repository_data_cache_enabled(self) -> bool:
+        if self.is_ephemeral:
+            return False
+
+        return self.get_settings("repository_data_cache").get("enabled", False)
+
+    @property
+    def repository_data_cache_dir(self) -> str:
+        return self.get_settings("repository_data_cache").get(
+            "base_dir", os.path.join(self.root_directory, "repository_data_cache")
+        )
+
     # python logs
 
     @property
@@ -724,6 +739,12 @@ def has_historical_pipeline(self, snapshot_id: str) -> bool:
     def get_execution_plan_snapshot(self, snapshot_id: str) -> "ExecutionPlanSnapshot":
         return self._run_storage.get_execution_plan_snapshot(snapshot_id)
 
+    @traced
+    def get_execution_plan_snapshots(
+        self, snapshot_ids: List[str]
+    ) -> Dict[str, "ExecutionPlanSnapshot"]:
+        return self._run_storage.get_execution_plan_snapshots(snapshot_ids)
+
     @traced
     def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
         return self._event_storage.get_stats_for_run(run_id)
@@ -732,6 +753,16 @@ def get_run_stats(self, run_id: str) -> PipelineRunStatsSnapshot:
     def get_run_step_stats(self, run_id, step_keys=None) -> List["RunStepKeyStatsSnapshot"]:
         return self._event_storage.get_step_stats_for_run(run_id, step_keys)
 
+    @traced
+    def get_run_stats_by_run_id(self, run_ids: List[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        return self._event_storage.get_stats_for_runs(run_ids)
+
+    @traced
+    def get_run_step_stats_by_run_id(
+        self, run_ids: List[str], step_keys=None
+    ) -> Mapping[str, List["RunStepKeyStatsSnapshot"]]:
+        return self._event_storage.get_step_stats_for_runs(run_ids, step_keys)
+
     @traced
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         return self._run_storage.get_run_tags()
@@ -842,6 +873,7 @@ def _construct_run_with_snapshots(
         solid_selection=None,
         external_pipeline_origin=None,
         pipeline_code_origin=None,
+        snapshot_id_cache=None,
     ):
 
         # https://github.com/dagster-io/dagster/issues/2403
@@ -857,14 +889,19 @@ def _construct_run_with_snapshots(
         )
 
         pipeline_snapshot_id = (
-            self._ensure_persisted_pipeline_snapshot(pipeline_snapshot, parent_pipeline_snapshot)
+            self._ensure_persisted_pipeline_snapshot(
+                pipeline_snapshot, parent_pipeline_snapshot, snapshot_id_cache
+            )
             if pipeline_snapshot
             else None
         )
 
         execution_plan_snapshot_id = (
             self._ensure_persisted_execution_plan_snapshot(
-                execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+                execution_plan_snapshot,
+                pipeline_snapshot_id,
+                step_keys_to_execute,
+                snapshot_id_cache,
             )
             if execution_plan_snapshot and pipeline_snapshot_id
             else None
@@ -888,11 +925,19 @@ def _construct_run_with_snapshots(
             pipeline_code_origin=pipeline_code_origin,
         )
 
-    def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline_snapshot):
+    def _ensure_persisted_pipeline_snapshot(
+        self, pipeline_snapshot, parent_pipeline_snapshot, snapshot_id_cache=None
+    ):
         from dagster.core.snap import create_pipeline_snapshot_id, PipelineSnapshot
 
         check.inst_param(pipeline_snapshot, "pipeline_snapshot", PipelineSnapshot)
         check.opt_inst_param(parent_pipeline_snapshot, "parent_pipeline_snapshot", PipelineSnapshot)
+        check.opt_dict_param(snapshot_id_cache, "snapshot_id_cache", key_type=int, value_type=str)
+
+        # snapshots that were already persisted while creating the same batch of runs are keyed by
+        # object identity, so that they are neither hashed nor checked in storage again
+        if snapshot_id_cache is not None and id(pipeline_snapshot) in snapshot_id_cache:
+            return snapshot_id_cache[id(pipeline_snapshot)]
 
         if pipeline_snapshot.lineage_snapshot:
             if not self._run_storage.has_pipeline_snapshot(
@@ -919,10 +964,17 @@ def _ensure_persisted_pipeline_snapshot(self, pipeline_snapshot, parent_pipeline
             )
             check.invariant(pipeline_snapshot_id == returned_pipeline_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache[id(pipeline_snapshot)] = pipeline_snapshot_id
+
         return pipeline_snapshot_id
 
     def _ensure_persisted_execution_plan_snapshot(
-        self, execution_plan_snapshot, pipeline_snapshot_id, step_keys_to_execute
+        self,
+        execution_plan_snapshot,
+        pipeline_snapshot_id,
+        step_keys_to_execute,
+        snapshot_id_cache=None,
     ):
         from dagster.core.snap.execution_plan_snapshot import (
             ExecutionPlanSnapshot,
@@ -932,6 +984,7 @@ def _ensure_persisted_execution_plan_snapshot(
         check.inst_param(execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot)
         check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
         check.opt_nullable_list_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+        check.opt_dict_param(snapshot_id_cache, "snapshot_id_cache", key_type=int, value_type=str)
 
         check.invariant(
             execution_plan_snapshot.pipeline_snapshot_id == pipeline_snapshot_id,
@@ -945,6 +998,9 @@ def _ensure_persisted_execution_plan_snapshot(
             ),
         )
 
+        if snapshot_id_cache is not None and id(execution_plan_snapshot) in snapshot_id_cache:
+            return snapshot_id_cache[id(execution_plan_snapshot)]
+
         execution_plan_snapshot_id = create_execution_plan_snapshot_id(execution_plan_snapshot)
 
         if not self._run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id):
@@ -954,6 +1010,9 @@ def _ensure_persisted_execution_plan_snapshot(
 
             check.invariant(execution_plan_snapshot_id == returned_execution_plan_snapshot_id)
 
+        if snapshot_id_cache is not None:
+            snapshot_id_cache[id(execution_plan_snapshot)] = execution_plan_snapshot_id
+
         return execution_plan_snapshot_id
 
     def create_run(
@@ -996,6 +1055,27 @@ def create_run(
         )
         return self._run_storage.add_run(pipeline_run)
 
+    def create_runs(self, run_kwargs_list: List[Dict[str, Any]]) -> List[PipelineRun]:
+        """Create a batch of runs in a single write to run storage.
+
+        Args:
+            run_kwargs_list (List[Dict[str, Any]]): The keyword arguments to ``create_run`` for
+                each run, in the order that the runs should be created.
+
+        Returns:
+            List[PipelineRun]: The created runs.
+        """
+        check.list_param(run_kwargs_list, "run_kwargs_list", of_type=dict)
+
+        # Runs in a batch usually share their snapshots, so each distinct snapshot is only
+        # checked for and persisted once
+        snapshot_id_cache: Dict[int, str] = {}
+        pipeline_runs = [
+            self._construct_run_with_snapshots(**run_kwargs, snapshot_id_cache=snapshot_id_cache)
+            for run_kwargs in run_kwargs_list
+        ]
+        return self._run_storage.add_runs(pipeline_runs)
+
     def register_managed_run(
         self,
         pipeline_name,
@@ -1174,6 +1254,9 @@ def all_asset_keys(self):
     def get_asset_keys(self, prefix=None, limit=None, cursor=None):
         return self._event_storage.get_asset_keys(prefix=prefix, limit=limit, cursor=cursor)
 
+    def iterate_asset_keys(self, prefix=None):
+        return self._event_storage.iterate_asset_keys(prefix=prefix)
+
     @traced
     def has_asset_key(self, asset_key: AssetKey) -> bool:
         return self._event_storage.has_asset_key(asset_key)
@@ -1266,6 +1349,18 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         return self._event_storage.get_materialization_count_by_partition(asset_keys)
 
+    @traced
+    def get_latest_storage_id_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], int]]:
+        return self._event_storage.get_latest_storage_id_by_partition(asset_keys)
+
+    @traced
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], "EventLogEntry"]]:
+        return self._event_storage.get_latest_materialization_events_by_partition(asset_keys)
+
     # event subscriptions
 
     def _get_yaml_python_handlers(self):
@@ -1511,16 +1606,44 @@ def submit_run(self, run_id, workspace: "IWorkspace") -> PipelineRun:
             run_id (str): The id of the run.
         """
 
-        from dagster.core.host_representation import ExternalPipelineOrigin
-        from dagster.core.origin import PipelinePythonOrigin
-        from dagster.core.run_coordinator import SubmitRunContext
-
         run = self.get_run_by_id(run_id)
         if run is None:
             raise DagsterInvariantViolationError(
                 f"Could not load run {run_id} that was passed to submit_run"
             )
 
+        return self._submit_run(run, workspace)
+
+    def submit_runs(self, run_ids: List[str], workspace: "IWorkspace") -> List[PipelineRun]:
+        """Submit a batch of pipeline runs to the coordinator, in order.
+
+        Works like calling ``submit_run`` for each run, but loads all of the runs from run storage
+        in a single query. If submitting one of the runs fails, the error is raised, and the runs
+        after it in the batch are left unsubmitted in the ``NOT_STARTED`` state, so that they can
+        be submitted again later.
+
+        Args:
+            run_ids (List[str]): The ids of the runs.
+        """
+        check.list_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return []
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(PipelineRunsFilter(run_ids=run_ids))}
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in runs_by_id]
+        if missing_run_ids:
+            raise DagsterInvariantViolationError(
+                f"Could not load runs {', '.join(missing_run_ids)} that were passed to submit_runs"
+            )
+
+        runs = [runs_by_id[run_id] for run_id in run_ids]
+        return [self._submit_run(run, workspace) for run in runs]
+
+    def _submit_run(self, run: PipelineRun, workspace: "IWorkspace") -> PipelineRun:
+        from dagster.core.host_representation import ExternalPipelineOrigin
+        from dagster.core.origin import PipelinePythonOrigin
+        from dagster.core.run_coordinator import SubmitRunContext
+
         check.inst(
             run.external_pipeline_origin,
             ExternalPipelineOrigin,
@@ -1566,8 +1689,7 @@ def launch_run(self, run_id: str, workspace: "IWorkspace"):
             run_id (str): The id of the run the launch.
         """
         from dagster.core.launcher import LaunchRunContext
-        from dagster.core.events import EngineEventData, DagsterEvent, DagsterEventType
-        from dagster.core.events.log import EventLogEntry
+        from dagster.core.events import EngineEventData
 
         run = self.get_run_by_id(run_id)
         if run is None:
@@ -1575,23 +1697,7 @@ def launch_run(self, run_id: str, workspace: "IWorkspace"):
                 f"Could not load run {run_id} that was passed to launch_run"
             )
 
-        launch_started_event = DagsterEvent(
-            event_type_value=DagsterEventType.PIPELINE_STARTING.value,
-            pipeline_name=run.pipeline_name,
-        )
-
-        event_record = EventLogEntry(
-            message="",
-            user_message="",
-            level=logging.INFO,
-            pipeline_name=run.pipeline_name,
-            run_id=run.run_id,
-            error_info=None,
-            timestamp=time.time(),
-            dagster_event=launch_started_event,
-        )
-
-        self.handle_new_event(event_record)
+        self._report_run_starting(run)
 
         run = self.get_run_by_id(run_id)
         if run is None:
@@ -1611,6 +1717,98 @@ def launch_run(self, run_id: str, workspace: "IWorkspace"):
 
         return run
 
+    def launch_runs(
+        self, run_ids: List[str], workspace: "IWorkspace"
+    ) -> Dict[str, SerializableErrorInfo]:
+        """Launch a batch of pipeline runs.
+
+        Works like calling ``launch_run`` for each run, but loads the runs from run storage in
+        bulk and hands all of them to ``RunLauncher.launch_runs()`` at once, so that run launchers
+        can start them concurrently. Runs that fail to launch are marked as failed, without
+        affecting the other runs in the batch.
+
+        Errors raised before the runs are handed to the run launcher are raised. If the run
+        launcher itself raises, some of the runs may already have been launched, so none of them
+        are marked as failed. The error is reported to each run and returned for each of them
+        instead, and runs that never start are left to run monitoring.
+
+        Args:
+            run_ids (List[str]): The ids of the runs to launch.
+
+        Returns:
+            Dict[str, SerializableErrorInfo]: The errors of the runs that failed to launch, keyed
+            by run id.
+        """
+        from dagster.core.launcher import LaunchRunContext
+        from dagster.core.events import EngineEventData
+
+        check.list_param(run_ids, "run_ids", of_type=str)
+        if not run_ids:
+            return {}
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(PipelineRunsFilter(run_ids=run_ids))}
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in runs_by_id]
+        if missing_run_ids:
+            raise DagsterInvariantViolationError(
+                f"Could not load runs {', '.join(missing_run_ids)} that were passed to launch_runs"
+            )
+
+        for run_id in run_ids:
+            self._report_run_starting(runs_by_id[run_id])
+
+        runs_by_id = {run.run_id: run for run in self.get_runs(PipelineRunsFilter(run_ids=run_ids))}
+
+        try:
+            errors = self._run_launcher.launch_runs(
+                [
+                    LaunchRunContext(pipeline_run=runs_by_id[run_id], workspace=workspace)
+                    for run_id in run_ids
+                ]
+            )
+        except Exception:
+            error = serializable_error_info_from_exc_info(sys.exc_info())
+            for run_id in run_ids:
+                self.report_engine_event(
+                    "Run launcher raised an error while launching a batch of runs, which may not "
+                    f"have launched this run: {error.message}",
+                    runs_by_id[run_id],
+                    EngineEventData.engine_error(error),
+                )
+            return {run_id: error for run_id in run_ids}
+
+        for run_id, error in errors.items():
+            run = runs_by_id[run_id]
+            self.report_engine_event(
+                error.message,
+                run,
+                EngineEventData.engine_error(error),
+            )
+            self.report_run_failed(run)
+
+        return errors
+
+    def _report_run_starting(self, run: PipelineRun):
+        from dagster.core.events import DagsterEvent, DagsterEventType
+        from dagster.core.events.log import EventLogEntry
+
+        launch_started_event = DagsterEvent(
+            event_type_value=DagsterEventType.PIPELINE_STARTING.value,
+            pipeline_name=run.pipeline_name,
+        )
+
+        event_record = EventLogEntry(
+            message="",
+            user_message="",
+            level=logging.INFO,
+            pipeline_name=run.pipeline_name,
+            run_id=run.run_id,
+            error_info=None,
+            timestamp=time.time(),
+            dagster_event=launch_started_event,
+        )
+
+        self.handle_new_event(event_record)
+
     def resume_run(self, run_id: str, workspace: "IWorkspace", attempt_number: int):
         """Resume a pipeline run.
 
@@ -1896,6 +2094,23 @@ def add_backfill(self, partition_backfill):
     def update_backfill(self, partition_backfill):
         return self._run_storage.update_backfill(partition_backfill)
 
+    def get_backfill_run_partition_names(self, backfill_id, partition_names=None):
+        return self._run_storage.get_backfill_run_partition_names(backfill_id, partition_names)
+
+    def get_backfill_unsubmitted_runs(self, backfill_id, partition_names=None):
+        return self._run_storage.get_backfill_unsubmitted_runs(backfill_id, partition_names)
+
+    def get_run_partition_data(
+        self, partition_set_name, job_name=None, partition_names=None, partition_keys=None
+    ):
+        return self._run_storage.get_run_partition_data(
+            partition_set_name, job_name, partition_names, partition_keys
+        )
+
+    @traced
+    def get_latest_runs_by_run_key(self, run_keys, tags=None):
+        return self._run_storage.get_latest_runs_by_run_key(run_keys, tags)
+
     @property
     def should_start_background_run_thread(self) -> bool:
         """
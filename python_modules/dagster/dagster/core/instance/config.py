@@ -3,6 +3,7 @@
 
 from dagster import Array, Bool, check
 from dagster.config import Field, Permissive
+from dagster.config.source import StringSource
 from dagster.config.validate import validate_config
 from dagster.core.errors import DagsterInvalidConfigError
 from dagster.serdes import class_from_code_pointer
@@ -127,4 +128,10 @@ def dagster_instance_config_schema():
                 "cancellation_thread_poll_interval_seconds": Field(int, is_required=False),
             },
         ),
+        "repository_data_cache": Field(
+            {
+                "enabled": Field(Bool, is_required=False, default_value=False),
+                "base_dir": Field(StringSource, is_required=False),
+            },
+        ),
     }
@@ -1,11 +1,13 @@
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional
 
 from dagster.core.instance import MayHaveInstanceWeakref
 from dagster.core.origin import PipelinePythonOrigin
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.workspace.workspace import IWorkspace
+from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
 
 class LaunchRunContext(NamedTuple):
@@ -72,6 +74,30 @@ def launch_run(self, context: LaunchRunContext) -> None:
             IWorkspace from which the run was launched.
         """
 
+    def launch_runs(self, contexts: List[LaunchRunContext]) -> Dict[str, SerializableErrorInfo]:
+        """Launch a batch of runs.
+
+        Typically invoked through ``DagsterInstance.launch_runs()``, e.g. by the queued run
+        coordinator daemon. The default implementation calls ``launch_run`` for each of the runs in
+        turn; run launchers that can start runs concurrently should override it.
+
+        Args:
+            contexts (List[LaunchRunContext]): information about the launch of each run.
+
+        Returns:
+            Dict[str, SerializableErrorInfo]: The errors of the runs that failed to launch, keyed
+            by run id. A run failing to launch doesn't stop the other runs from being launched.
+        """
+        errors = {}
+        for context in contexts:
+            try:
+                self.launch_run(context)
+            except Exception:
+                errors[context.pipeline_run.run_id] = serializable_error_info_from_exc_info(
+                    sys.exc_info()
+                )
+        return errors
+
     @abstractmethod
     def can_terminate(self, run_id):
         """
@@ -14,6 +14,7 @@
 from dagster.core.execution.plan.state import KnownExecutionState
 from dagster.core.execution.plan.step import (
     ExecutionStep,
+    ResolvedFromDynamicStepHandle,
     StepKind,
     UnresolvedCollectExecutionStep,
     UnresolvedMappedExecutionStep,
@@ -255,10 +256,20 @@ def snapshot_from_execution_plan(execution_plan, pipeline_snapshot_id):
     check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
     check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
 
+    # Steps that were resolved from the dynamic mappings in the known state are rebuilt from their
+    # unresolved step and the mapping keys when the plan is rebuilt from the snapshot, so only the
+    # ones that were selected for execution directly are stored. This keeps the snapshot of a
+    # re-execution from growing with the number of mapping keys.
+    step_handles_to_execute = set(execution_plan.step_handles_to_execute)
+    steps = [
+        step
+        for step in execution_plan.steps
+        if not isinstance(step.handle, ResolvedFromDynamicStepHandle)
+        or step.handle in step_handles_to_execute
+    ]
+
     return ExecutionPlanSnapshot(
-        steps=sorted(
-            list(map(_snapshot_from_execution_step, execution_plan.steps)), key=lambda es: es.key
-        ),
+        steps=sorted(list(map(_snapshot_from_execution_step, steps)), key=lambda es: es.key),
         artifacts_persisted=execution_plan.artifacts_persisted,
         pipeline_snapshot_id=pipeline_snapshot_id,
         step_keys_to_execute=execution_plan.step_keys_to_execute,
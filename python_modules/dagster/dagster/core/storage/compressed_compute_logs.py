@@ -0,0 +1,158 @@
+"""Compressed storage format for the compute logs of finished steps.
+
+A log file is split into segments of ``SEGMENT_SIZE`` uncompressed bytes, each of which is
+compressed on its own and appended to a single compressed file. Since gzip members and zstd frames
+can be concatenated, the compressed file can also be decompressed as a whole with the usual tools.
+
+An index file next to it records, for each segment, the offset of its first byte in the
+uncompressed log and its offset and length in the compressed file, so that a window of the log can
+be read by decompressing only the segments that overlap it.
+"""
+
+import bisect
+import gzip
+import json
+import os
+from typing import List, NamedTuple, Optional
+
+from dagster import check
+from dagster.core.errors import DagsterInvariantViolationError
+
+SEGMENT_SIZE = 1024 * 1024
+
+INDEX_VERSION = 1
+
+COMPRESSION_EXTENSION = {"gzip": "gz", "zstd": "zst"}
+
+
+class CompressedLogSegment(NamedTuple):
+    offset: int
+    compressed_offset: int
+    compressed_size: int
+
+
+class CompressedLogIndex(NamedTuple):
+    compression: str
+    size: int
+    segments: List[CompressedLogSegment]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": INDEX_VERSION,
+                "compression": self.compression,
+                "size": self.size,
+                "segments": [list(segment) for segment in self.segments],
+            }
+        )
+
+    @staticmethod
+    def from_json(json_str: str) -> "CompressedLogIndex":
+        index = json.loads(json_str)
+        check.invariant(
+            index.get("version") == INDEX_VERSION,
+            f"Unsupported compute log index version {index.get('version')}",
+        )
+        return CompressedLogIndex(
+            compression=index["compression"],
+            size=index["size"],
+            segments=[CompressedLogSegment(*segment) for segment in index["segments"]],
+        )
+
+
+def check_compression_available(compression: str):
+    check.invariant(
+        compression in COMPRESSION_EXTENSION,
+        f"compression must be one of {list(COMPRESSION_EXTENSION.keys())}, got {compression}",
+    )
+    if compression == "zstd":
+        try:
+            import zstandard  # pylint: disable=unused-import
+        except ImportError:
+            raise DagsterInvariantViolationError(
+                "zstd compression of compute logs requires the zstandard package. Install it with "
+                "`pip install dagster[zstd]`."
+            )
+
+
+def _compress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdCompressor().compress(data)
+
+    return gzip.compress(data)
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    if compression == "zstd":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(data)
+
+    return gzip.decompress(data)
+
+
+def compress_log_file(path: str, compressed_path: str, index_path: str, compression: str):
+    """Writes the compressed segments and the index for the log file at the given path.
+
+    The index is written last, so once it exists the compressed file is complete.
+    """
+    check_compression_available(compression)
+
+    segments = []
+    size = 0
+    compressed_offset = 0
+    tmp_compressed_path = f"{compressed_path}.tmp"
+    with open(path, "rb") as log_file, open(tmp_compressed_path, "wb") as compressed_file:
+        while True:
+            data = log_file.read(SEGMENT_SIZE)
+            if not data:
+                break
+
+            compressed = _compress(compression, data)
+            compressed_file.write(compressed)
+            segments.append(CompressedLogSegment(size, compressed_offset, len(compressed)))
+            size += len(data)
+            compressed_offset += len(compressed)
+
+    os.replace(tmp_compressed_path, compressed_path)
+
+    tmp_index_path = f"{index_path}.tmp"
+    with open(tmp_index_path, "w") as index_file:
+        index_file.write(CompressedLogIndex(compression, size, segments).to_json())
+    os.replace(tmp_index_path, index_path)
+
+
+def read_log_index(index_path: str) -> Optional[CompressedLogIndex]:
+    try:
+        with open(index_path, "r") as index_file:
+            return CompressedLogIndex.from_json(index_file.read())
+    except FileNotFoundError:
+        return None
+
+
+def read_compressed_log_range(
+    compressed_path: str, index: CompressedLogIndex, start: int, end: int
+) -> bytes:
+    """Reads bytes [start, end) of the uncompressed log, decompressing only the segments that
+    overlap them.
+    """
+    chunks = []
+    with open(compressed_path, "rb") as compressed_file:
+        for segment in _overlapping_segments(index, start, end):
+            compressed_file.seek(segment.compressed_offset)
+            data = _decompress(index.compression, compressed_file.read(segment.compressed_size))
+            chunks.append(data[max(start - segment.offset, 0) : max(end - segment.offset, 0)])
+
+    return b"".join(chunks)
+
+
+def _overlapping_segments(index: CompressedLogIndex, start: int, end: int):
+    # segments are sorted by offset, so the first one that overlaps is the last one that starts at
+    # or before the first byte
+    first = bisect.bisect_right([segment.offset for segment in index.segments], start)
+    for segment in index.segments[max(first - 1, 0) :]:
+        if segment.offset >= end:
+            break
+        yield segment
@@ -1,7 +1,19 @@
 import warnings
 from abc import ABC, abstractmethod, abstractproperty
 from datetime import datetime
-from typing import Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from dagster import check
 from dagster.core.definitions.events import AssetKey
@@ -16,6 +28,9 @@
 from dagster.core.storage.pipeline_run import PipelineRunStatsSnapshot
 from dagster.serdes import whitelist_for_serdes
 
+# Number of asset keys fetched per query when iterating over all asset keys
+ASSET_KEY_BATCH_SIZE = 1000
+
 
 class RunShardedEventsCursor(NamedTuple):
     """Pairs an id-based event log cursor with a timestamp-based run cursor, for improved
@@ -146,6 +161,17 @@ def get_step_stats_for_run(self, run_id: str, step_keys=None) -> List[RunStepKey
 
         return build_run_step_stats_from_events(run_id, logs)
 
+    def get_stats_for_runs(self, run_ids: Sequence[str]) -> Mapping[str, PipelineRunStatsSnapshot]:
+        """Get a summary of the events that have occurred in each of the given runs, keyed by run
+        id."""
+        return {run_id: self.get_stats_for_run(run_id) for run_id in run_ids}
+
+    def get_step_stats_for_runs(
+        self, run_ids: Sequence[str], step_keys=None
+    ) -> Mapping[str, List[RunStepKeyStatsSnapshot]]:
+        """Get per-step stats for each of the given runs, keyed by run id."""
+        return {run_id: self.get_step_stats_for_run(run_id, step_keys) for run_id in run_ids}
+
     @abstractmethod
     def store_event(self, event: EventLogEntry):
         """Store an event corresponding to a pipeline run.
@@ -233,6 +259,27 @@ def get_asset_keys(
             asset_keys = asset_keys[:limit]
         return asset_keys
 
+    def iterate_asset_keys(
+        self,
+        prefix: Optional[List[str]] = None,
+        batch_size: int = ASSET_KEY_BATCH_SIZE,
+    ) -> Iterator[AssetKey]:
+        """Yields the keys of all assets, optionally filtered by a prefix, in the same order as
+        `get_asset_keys`. Keys are fetched a batch at a time, so that iterating over a large number
+        of assets doesn't require holding all of their keys in memory.
+        """
+        check.opt_list_param(prefix, "prefix", of_type=str)
+        check.int_param(batch_size, "batch_size")
+        check.invariant(batch_size > 0, "batch_size must be greater than 0")
+
+        cursor = None
+        while True:
+            asset_keys = list(self.get_asset_keys(prefix=prefix, limit=batch_size, cursor=cursor))
+            yield from asset_keys
+            if len(asset_keys) < batch_size:
+                return
+            cursor = asset_keys[-1].to_string()
+
     @abstractmethod
     def get_latest_materialization_events(
         self, asset_keys: Sequence[AssetKey]
@@ -268,6 +315,60 @@ def get_materialization_count_by_partition(
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         pass
 
+    def get_latest_storage_id_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], int]]:
+        """Returns the storage id of the latest materialization of each partition of the given
+        assets since they were last wiped. Materializations without a partition are keyed by None.
+        """
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        latest_storage_id_by_partition: Dict[AssetKey, Dict[Optional[str], int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key in asset_keys:
+            records = self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                ),
+                ascending=True,
+            )
+            for record in records:
+                materialization = (
+                    record.event_log_entry.dagster_event.step_materialization_data.materialization
+                )
+                latest_storage_id_by_partition[asset_key][
+                    materialization.partition
+                ] = record.storage_id
+
+        return latest_storage_id_by_partition
+
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], EventLogEntry]]:
+        """Returns the latest materialization event of each partition of the given assets since
+        they were last wiped. Materializations without a partition are keyed by None.
+        """
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        events_by_partition: Dict[AssetKey, Dict[Optional[str], EventLogEntry]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key in asset_keys:
+            records = self.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION, asset_key=asset_key
+                ),
+                ascending=True,
+            )
+            for record in records:
+                materialization = (
+                    record.event_log_entry.dagster_event.step_materialization_data.materialization
+                )
+                events_by_partition[asset_key][materialization.partition] = record.event_log_entry
+
+        return events_by_partition
+
 
 def extract_asset_events_cursor(cursor, before_cursor, after_cursor, ascending):
     if cursor:
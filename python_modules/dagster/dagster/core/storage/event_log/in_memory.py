@@ -344,3 +344,28 @@ def get_materialization_count_by_partition(
                 materialization_count_by_key_partition[asset_key] = {}
 
         return materialization_count_by_key_partition
+
+    def get_latest_storage_id_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], int]]:
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        # the storage ids returned by get_event_records are only positions among the filtered
+        # events, so number the events across the whole log to make them comparable between assets
+        all_records = [record for records in self._logs.values() for record in records]
+        latest_storage_id_by_partition: Dict[AssetKey, Dict[Optional[str], int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for storage_id, record in enumerate(sorted(all_records, key=lambda x: x.timestamp)):
+            if (
+                record.is_dagster_event
+                and record.dagster_event.event_type_value
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+                and record.dagster_event.asset_key in latest_storage_id_by_partition
+                and self._wiped_asset_keys[record.dagster_event.asset_key] < record.timestamp
+            ):
+                latest_storage_id_by_partition[record.dagster_event.asset_key][
+                    record.dagster_event.partition
+                ] = storage_id
+
+        return latest_storage_id_by_partition
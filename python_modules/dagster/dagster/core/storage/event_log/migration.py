@@ -1,5 +1,8 @@
+from datetime import datetime
+
 import sqlalchemy as db
 from dagster import AssetKey, seven
+from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 from dagster.utils import utc_datetime_from_timestamp
@@ -7,11 +10,19 @@
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+ASSET_PARTITIONS = "asset_partitions"  # builds the asset partitions table from the event log
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITIONS: lambda: migrate_asset_partitions,
+}
+
+# number of asset partitions fetched or written per statement when rebuilding the asset partitions
+# table, to stay under the bound parameter limits of the database
+ASSET_PARTITIONS_BATCH_SIZE = 500
 
 
 def migrate_event_log_data(instance=None):
@@ -164,6 +175,107 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partitions(event_log_storage, print_fn=None):
+    """
+    Utility method to build the per-partition materialization summary of each asset from the
+    materialization events in the event log.
+    """
+    from dagster.core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from .schema import AssetPartitionsTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        conn.execute(AssetPartitionsTable.delete())  # pylint: disable=no-value-for-parameter
+        rebuild_asset_partitions(conn, print_fn=print_fn)
+
+
+def rebuild_asset_partitions(conn, asset_keys=None, print_fn=None):
+    """
+    Recomputes the rows of the asset partitions table for the given asset keys (or all asset keys
+    in the asset key table) from the materialization events that are visible through the given
+    connection, skipping materializations that happened before an asset was last wiped.
+    """
+    from .schema import AssetKeyTable, AssetPartitionsTable, SqlEventLogStorageTable
+
+    asset_key_query = db.select([AssetKeyTable.c.asset_key, AssetKeyTable.c.asset_details])
+    if asset_keys is not None:
+        asset_key_query = asset_key_query.where(
+            AssetKeyTable.c.asset_key.in_([asset_key.to_string() for asset_key in asset_keys])
+        )
+    asset_rows = conn.execute(asset_key_query).fetchall()
+
+    if print_fn:
+        print_fn(f"Found {len(asset_rows)} assets to reindex.")
+        asset_rows = tqdm(asset_rows)
+
+    for asset_key_str, asset_details_str in asset_rows:
+        asset_key = AssetKey.from_db_string(asset_key_str)
+        asset_details = (
+            deserialize_json_to_dagster_namedtuple(asset_details_str) if asset_details_str else None
+        )
+        wipe_timestamp = asset_details.last_wipe_timestamp if asset_details else None
+
+        conn.execute(
+            AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                AssetPartitionsTable.c.asset_key == asset_key.to_string()
+            )
+        )
+
+        count_query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.count(SqlEventLogStorageTable.c.id),
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.or_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+                )
+            )
+            .where(SqlEventLogStorageTable.c.partition != None)
+            .where(
+                SqlEventLogStorageTable.c.dagster_event_type
+                == DagsterEventType.ASSET_MATERIALIZATION.value
+            )
+            .group_by(SqlEventLogStorageTable.c.partition)
+        )
+        if wipe_timestamp:
+            count_query = count_query.where(
+                SqlEventLogStorageTable.c.timestamp > datetime.utcfromtimestamp(wipe_timestamp)
+            )
+        partition_rows = conn.execute(count_query).fetchall()
+
+        for start in range(0, len(partition_rows), ASSET_PARTITIONS_BATCH_SIZE):
+            batch = partition_rows[start : start + ASSET_PARTITIONS_BATCH_SIZE]
+            run_id_by_storage_id = dict(
+                conn.execute(
+                    db.select(
+                        [SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.run_id]
+                    ).where(SqlEventLogStorageTable.c.id.in_([row[2] for row in batch]))
+                ).fetchall()
+            )
+            conn.execute(
+                AssetPartitionsTable.insert(),  # pylint: disable=no-value-for-parameter
+                [
+                    dict(
+                        asset_key=asset_key.to_string(),
+                        partition=partition,
+                        materialization_count=count,
+                        last_storage_id=last_storage_id,
+                        last_run_id=run_id_by_storage_id.get(last_storage_id),
+                    )
+                    for partition, count, last_storage_id in batch
+                ],
+            )
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
@@ -42,6 +42,20 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Per-partition materialization summary of each asset, maintained on write. Rows for an asset are
+# cleared when it is wiped, so the counts only include materializations since the last wipe.
+AssetPartitionsTable = db.Table(
+    "asset_partitions",
+    SqlEventLogStorageMetadata,
+    db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+    db.Column("asset_key", MySQLCompatabilityTypes.UniqueText, nullable=False),
+    db.Column("partition", MySQLCompatabilityTypes.UniqueText, nullable=False),
+    db.Column("last_storage_id", db.Integer),
+    db.Column("materialization_count", db.Integer, nullable=False),
+    db.Column("last_run_id", db.String(255)),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 db.Index("idx_run_id", SqlEventLogStorageTable.c.run_id)
 db.Index(
     "idx_step_key",
@@ -65,3 +79,21 @@
     SqlEventLogStorageTable.c.id,
     mysql_length={"dagster_event_type": 64},
 )
+db.Index(
+    "idx_asset_partitions_asset_key_partition",
+    AssetPartitionsTable.c.asset_key,
+    AssetPartitionsTable.c.partition,
+    unique=True,
+    mysql_length={"asset_key": 255, "partition": 255},
+)
+
+# Postgres can only use a btree index for asset key prefix searches (`LIKE 'prefix%'`) if the index
+# uses the text_pattern_ops operator class, unless the database has the C collation. The other
+# databases use the unique index on asset_key.
+db.event.listen(
+    AssetKeyTable,
+    "after_create",
+    db.DDL(
+        "CREATE INDEX idx_asset_keys_asset_key_prefix ON asset_keys (asset_key text_pattern_ops)"
+    ).execute_if(dialect="postgresql"),
+)
@@ -25,11 +25,25 @@
     RunShardedEventsCursor,
     extract_asset_events_cursor,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
-from .schema import AssetKeyTable, SecondaryIndexMigrationTable, SqlEventLogStorageTable
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITIONS,
+    EVENT_LOG_DATA_MIGRATIONS,
+    rebuild_asset_partitions,
+)
+from .schema import (
+    AssetKeyTable,
+    AssetPartitionsTable,
+    SecondaryIndexMigrationTable,
+    SqlEventLogStorageTable,
+)
 
 MIN_ASSET_ROWS = 25
 
+# Number of runs whose events are fetched per query when fetching stats for many runs
+RUN_ID_BATCH_SIZE = 500
+
 
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
@@ -102,8 +116,9 @@ def has_asset_key_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(AssetKeyTable.name)]
             return "last_materialization_timestamp" in column_names
 
-    def store_asset(self, event):
+    def store_asset(self, event, storage_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(storage_id, "storage_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -166,6 +181,47 @@ def store_asset(self, event):
             except db.exc.IntegrityError:
                 conn.execute(update_statement)
 
+        if event.dagster_event.partition and self.has_secondary_index(ASSET_PARTITIONS):
+            self.store_asset_partition(event, storage_id)
+
+    def store_asset_partition(self, event, storage_id):
+        """Increments the materialization count of the partition of the given materialization event
+        in the asset partitions table, and records it as the latest materialization.
+
+        Args:
+            event (EventLogEntry): The materialization event.
+            storage_id (Optional[int]): The id of the event in the event log.
+        """
+        asset_key_str = event.dagster_event.asset_key.to_string()
+        partition = event.dagster_event.partition
+
+        with self.index_connection() as conn:
+            try:
+                conn.execute(
+                    AssetPartitionsTable.insert().values(  # pylint: disable=no-value-for-parameter
+                        asset_key=asset_key_str,
+                        partition=partition,
+                        materialization_count=1,
+                        last_storage_id=storage_id,
+                        last_run_id=event.run_id,
+                    )
+                )
+            except db.exc.IntegrityError:
+                conn.execute(
+                    AssetPartitionsTable.update()  # pylint: disable=no-value-for-parameter
+                    .where(
+                        db.and_(
+                            AssetPartitionsTable.c.asset_key == asset_key_str,
+                            AssetPartitionsTable.c.partition == partition,
+                        )
+                    )
+                    .values(
+                        materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                        last_storage_id=storage_id,
+                        last_run_id=event.run_id,
+                    )
+                )
+
     def store_event(self, event):
         """Store an event corresponding to a pipeline run.
 
@@ -177,14 +233,15 @@ def store_event(self, event):
         run_id = event.run_id
 
         with self.run_connection(run_id) as conn:
-            conn.execute(insert_event_statement)
+            result = conn.execute(insert_event_statement)
+            storage_id = result.inserted_primary_key[0]
 
         if (
             event.is_dagster_event
             and event.dagster_event.is_step_materialization
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, storage_id)
 
     def get_logs_for_run_by_log_id(
         self,
@@ -279,6 +336,42 @@ def get_stats_for_run(self, run_id):
         with self.run_connection(run_id) as conn:
             results = conn.execute(query).fetchall()
 
+        return self._build_stats_for_run(run_id, results)
+
+    def get_stats_for_runs(self, run_ids):
+        check.list_param(run_ids, "run_ids", of_type=str)
+
+        results_by_run_id = {run_id: [] for run_id in run_ids}
+        for i in range(0, len(run_ids), RUN_ID_BATCH_SIZE):
+            query = (
+                db.select(
+                    [
+                        SqlEventLogStorageTable.c.run_id,
+                        SqlEventLogStorageTable.c.dagster_event_type,
+                        db.func.count().label("n_events_of_type"),
+                        db.func.max(SqlEventLogStorageTable.c.timestamp).label(
+                            "last_event_timestamp"
+                        ),
+                    ]
+                )
+                .where(SqlEventLogStorageTable.c.run_id.in_(run_ids[i : i + RUN_ID_BATCH_SIZE]))
+                .group_by("run_id", "dagster_event_type")
+            )
+
+            with self.run_connection(run_id=None) as conn:
+                results = conn.execute(query).fetchall()
+
+            for (run_id, dagster_event_type, n_events_of_type, last_event_timestamp) in results:
+                results_by_run_id[run_id].append(
+                    (dagster_event_type, n_events_of_type, last_event_timestamp)
+                )
+
+        return {
+            run_id: self._build_stats_for_run(run_id, results)
+            for run_id, results in results_by_run_id.items()
+        }
+
+    def _build_stats_for_run(self, run_id, results):
         try:
             counts = {}
             times = {}
@@ -329,9 +422,39 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
         # being able to share code with the in-memory event log storage implementation.  We may
         # choose to revisit this in the future, especially if we are able to do JSON-column queries
         # in SQL as a way of bypassing the serdes layer in all cases.
-        raw_event_query = (
-            db.select([SqlEventLogStorageTable.c.event])
-            .where(SqlEventLogStorageTable.c.run_id == run_id)
+        raw_event_query = self._step_stats_events_query(step_keys).where(
+            SqlEventLogStorageTable.c.run_id == run_id
+        )
+
+        with self.run_connection(run_id) as conn:
+            results = conn.execute(raw_event_query).fetchall()
+
+        return self._build_step_stats_for_run(run_id, [json_str for (json_str,) in results])
+
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        check.list_param(run_ids, "run_ids", of_type=str)
+        check.opt_list_param(step_keys, "step_keys", of_type=str)
+
+        events_by_run_id = {run_id: [] for run_id in run_ids}
+        for i in range(0, len(run_ids), RUN_ID_BATCH_SIZE):
+            raw_event_query = self._step_stats_events_query(
+                step_keys, [SqlEventLogStorageTable.c.run_id]
+            ).where(SqlEventLogStorageTable.c.run_id.in_(run_ids[i : i + RUN_ID_BATCH_SIZE]))
+
+            with self.run_connection(run_id=None) as conn:
+                results = conn.execute(raw_event_query).fetchall()
+
+            for (json_str, run_id) in results:
+                events_by_run_id[run_id].append(json_str)
+
+        return {
+            run_id: self._build_step_stats_for_run(run_id, json_strs)
+            for run_id, json_strs in events_by_run_id.items()
+        }
+
+    def _step_stats_events_query(self, step_keys, extra_columns=None):
+        query = (
+            db.select([SqlEventLogStorageTable.c.event] + (extra_columns or []))
             .where(SqlEventLogStorageTable.c.step_key != None)
             .where(
                 SqlEventLogStorageTable.c.dagster_event_type.in_(
@@ -352,19 +475,16 @@ def get_step_stats_for_run(self, run_id, step_keys=None):
             .order_by(SqlEventLogStorageTable.c.id.asc())
         )
         if step_keys:
-            raw_event_query = raw_event_query.where(
-                SqlEventLogStorageTable.c.step_key.in_(step_keys)
-            )
-
-        with self.run_connection(run_id) as conn:
-            results = conn.execute(raw_event_query).fetchall()
+            query = query.where(SqlEventLogStorageTable.c.step_key.in_(step_keys))
+        return query
 
+    def _build_step_stats_for_run(self, run_id, json_strs):
         try:
             records = [
                 check.inst_param(
                     deserialize_json_to_dagster_namedtuple(json_str), "event", EventLogEntry
                 )
-                for (json_str,) in results
+                for json_str in json_strs
             ]
             return build_run_step_stats_from_events(run_id, records)
         except (seven.JSONDecodeError, DeserializationError) as err:
@@ -398,14 +518,24 @@ def wipe(self):
         # Should be overridden by SqliteEventLogStorage and other storages that shard based on
         # run_id
 
+        has_asset_partitions = self.has_secondary_index(ASSET_PARTITIONS)
+
         # https://stackoverflow.com/a/54386260/324449
         with self.run_connection(run_id=None) as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if has_asset_partitions:
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
         with self.index_connection() as conn:
             conn.execute(SqlEventLogStorageTable.delete())  # pylint: disable=no-value-for-parameter
             conn.execute(AssetKeyTable.delete())  # pylint: disable=no-value-for-parameter
+            if has_asset_partitions:
+                conn.execute(
+                    AssetPartitionsTable.delete()  # pylint: disable=no-value-for-parameter
+                )
 
     def delete_events(self, run_id):
         with self.run_connection(run_id) as conn:
@@ -454,6 +584,17 @@ def delete_events_for_run(self, conn, run_id):
                     )
                 )
 
+            # Checked on this connection rather than with has_secondary_index, since the run's
+            # connection may be held open already. The counts of the remaining assets are
+            # recomputed without the deleted events.
+            if conn.execute(self._secondary_index_query(ASSET_PARTITIONS)).fetchall():
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionsTable.c.asset_key.in_(keys_to_check)
+                    )
+                )
+                rebuild_asset_partitions(conn, list(set(removed_asset_keys) - to_remove))
+
     @property
     def is_persistent(self):
         return True
@@ -500,16 +641,18 @@ def has_secondary_index(self, name):
         """This method uses a checkpoint migration table to see if summary data has been constructed
         in a secondary index table.  Can be used to checkpoint event_log data migrations.
         """
-        query = (
+        with self.index_connection() as conn:
+            results = conn.execute(self._secondary_index_query(name)).fetchall()
+
+        return len(results) > 0
+
+    def _secondary_index_query(self, name):
+        return (
             db.select([1])
             .where(SecondaryIndexMigrationTable.c.name == name)
             .where(SecondaryIndexMigrationTable.c.migration_completed != None)
             .limit(1)
         )
-        with self.index_connection() as conn:
-            results = conn.execute(query).fetchall()
-
-        return len(results) > 0
 
     def enable_secondary_index(self, name):
         """This method marks an event_log data migration as complete, to indicate that a summary
@@ -617,10 +760,16 @@ def get_event_records(
         check.bool_param(ascending, "ascending")
 
         query = db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+        asset_details = None
         if event_records_filter and event_records_filter.asset_key:
-            asset_details = next(iter(self._get_assets_details([event_records_filter.asset_key])))
-        else:
-            asset_details = None
+            if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+                query = self._add_joined_assets_wipe_filter_to_query(
+                    query, [event_records_filter.asset_key]
+                )
+            else:
+                asset_details = next(
+                    iter(self._get_assets_details([event_records_filter.asset_key]))
+                )
 
         query = self._apply_filter_to_query(
             query=query,
@@ -668,9 +817,7 @@ def has_asset_key(self, asset_key: AssetKey) -> bool:
         return bool(rows)
 
     def all_asset_keys(self):
-        rows = self._fetch_asset_rows()
-        asset_keys = [AssetKey.from_db_string(row[0]) for row in sorted(rows, key=lambda x: x[0])]
-        return [asset_key for asset_key in asset_keys if asset_key]
+        return self._fetch_asset_keys()
 
     def get_asset_keys(
         self,
@@ -678,8 +825,34 @@ def get_asset_keys(
         limit: Optional[int] = None,
         cursor: Optional[str] = None,
     ) -> Iterable[AssetKey]:
-        rows = self._fetch_asset_rows(prefix=prefix, limit=limit, cursor=cursor)
-        asset_keys = [AssetKey.from_db_string(row[0]) for row in sorted(rows, key=lambda x: x[0])]
+        return self._fetch_asset_keys(prefix=prefix, limit=limit, cursor=cursor)
+
+    def _fetch_asset_keys(self, prefix=None, limit=None, cursor=None) -> List[AssetKey]:
+        if not self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            rows = self._fetch_asset_rows(prefix=prefix, limit=limit, cursor=cursor)
+            asset_keys = [
+                AssetKey.from_db_string(row[0]) for row in sorted(rows, key=lambda x: x[0])
+            ]
+            return [asset_key for asset_key in asset_keys if asset_key]
+
+        # once the wipe timestamps have been migrated, wiped assets can be filtered out in SQL, so
+        # only the keys need to be fetched, a page at a time
+        query = (
+            db.select([AssetKeyTable.c.asset_key])
+            .where(
+                db.or_(
+                    AssetKeyTable.c.wipe_timestamp == None,
+                    AssetKeyTable.c.last_materialization_timestamp > AssetKeyTable.c.wipe_timestamp,
+                )
+            )
+            .order_by(AssetKeyTable.c.asset_key.asc())
+        )
+        query = self._apply_asset_filter_to_query(query, prefix=prefix, limit=limit, cursor=cursor)
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        asset_keys = [AssetKey.from_db_string(row[0]) for row in rows]
         return [asset_key for asset_key in asset_keys if asset_key]
 
     def get_latest_materialization_events(
@@ -905,8 +1078,10 @@ def _apply_asset_filter_to_query(
             )
 
         if prefix:
+            # asset key strings are JSON lists, so a key path prefix is a string prefix of the
+            # key. Escape the LIKE wildcards, since `_` is common in asset key names.
             prefix_str = seven.dumps(prefix)[:-1]
-            query = query.where(AssetKeyTable.c.asset_key.startswith(prefix_str))
+            query = query.where(AssetKeyTable.c.asset_key.startswith(prefix_str, autoescape=True))
 
         if cursor:
             query = query.where(AssetKeyTable.c.asset_key > cursor)
@@ -937,6 +1112,36 @@ def _get_assets_details(self, asset_keys: Sequence[AssetKey]):
                 asset_key_to_details.get(asset_key.to_string(), None) for asset_key in asset_keys
             ]
 
+    def _add_joined_assets_wipe_filter_to_query(self, query, asset_keys: Sequence[AssetKey]):
+        # Filters out events that happened before their asset was last wiped, by joining the wipe
+        # timestamps from the asset keys table instead of fetching them in a separate query. Only
+        # valid once the wipe timestamps have been migrated into their own column.
+        check.list_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        # events stored with the legacy dotted form of an asset key are matched to the asset key
+        # row of each of the queried assets
+        legacy_asset_key_matches = [
+            db.and_(
+                AssetKeyTable.c.asset_key == asset_key.to_string(),
+                SqlEventLogStorageTable.c.asset_key == asset_key.to_string(legacy=True),
+            )
+            for asset_key in asset_keys
+        ]
+        return query.select_from(
+            SqlEventLogStorageTable.outerjoin(
+                AssetKeyTable,
+                db.or_(
+                    AssetKeyTable.c.asset_key == SqlEventLogStorageTable.c.asset_key,
+                    *legacy_asset_key_matches,
+                ),
+            )
+        ).where(
+            db.or_(
+                AssetKeyTable.c.wipe_timestamp == None,
+                SqlEventLogStorageTable.c.timestamp > AssetKeyTable.c.wipe_timestamp,
+            )
+        )
+
     def _add_assets_wipe_filter_to_query(
         self, query, assets_details: Sequence[str], asset_keys: Sequence[AssetKey]
     ):
@@ -1018,9 +1223,12 @@ def get_asset_run_ids(self, asset_key):
             .order_by(db.func.max(SqlEventLogStorageTable.c.timestamp).desc())
         )
 
-        asset_keys = [asset_key]
-        asset_details = self._get_assets_details(asset_keys)
-        query = self._add_assets_wipe_filter_to_query(query, asset_details, asset_keys)
+        if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            query = self._add_joined_assets_wipe_filter_to_query(query, [asset_key])
+        else:
+            asset_keys = [asset_key]
+            asset_details = self._get_assets_details(asset_keys)
+            query = self._add_assets_wipe_filter_to_query(query, asset_details, asset_keys)
 
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
@@ -1096,11 +1304,22 @@ def wipe_asset(self, asset_key):
                     )
                 )
 
+        if self.has_secondary_index(ASSET_PARTITIONS):
+            with self.index_connection() as conn:
+                conn.execute(
+                    AssetPartitionsTable.delete().where(  # pylint: disable=no-value-for-parameter
+                        AssetPartitionsTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialization_count_by_partition(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, Mapping[str, int]]:
         check.list_param(asset_keys, "asset_keys", AssetKey)
 
+        if self.has_secondary_index(ASSET_PARTITIONS):
+            return self._get_materialization_count_by_partition_from_index(asset_keys)
+
         query = (
             db.select(
                 [
@@ -1120,13 +1339,18 @@ def get_materialization_count_by_partition(
                         ),
                     ),
                     SqlEventLogStorageTable.c.partition != None,
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
                 )
             )
             .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
         )
 
-        assets_details = self._get_assets_details(asset_keys)
-        query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+        if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            query = self._add_joined_assets_wipe_filter_to_query(query, asset_keys)
+        else:
+            assets_details = self._get_assets_details(asset_keys)
+            query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
 
         with self.index_connection() as conn:
             results = conn.execute(query).fetchall()
@@ -1140,3 +1364,121 @@ def get_materialization_count_by_partition(
                 materialization_count_by_partition[asset_key][row[1]] = row[2]
 
         return materialization_count_by_partition
+
+    def get_latest_storage_id_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], int]]:
+        check.list_param(asset_keys, "asset_keys", AssetKey)
+
+        query = self._get_latest_storage_id_by_partition_query(asset_keys)
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        latest_storage_id_by_partition: Dict[AssetKey, Dict[Optional[str], int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key_str, partition, storage_id in results:
+            asset_key = AssetKey.from_db_string(asset_key_str)
+            if not asset_key:
+                continue
+            # an asset may have events stored under both its current and its legacy key string
+            storage_ids_by_partition = latest_storage_id_by_partition[asset_key]
+            storage_ids_by_partition[partition] = max(
+                storage_id, storage_ids_by_partition.get(partition, storage_id)
+            )
+
+        return latest_storage_id_by_partition
+
+    def get_latest_materialization_events_by_partition(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[Optional[str], EventLogEntry]]:
+        check.list_param(asset_keys, "asset_keys", AssetKey)
+
+        latest_storage_ids_query = self._get_latest_storage_id_by_partition_query(
+            asset_keys
+        ).with_only_columns([db.func.max(SqlEventLogStorageTable.c.id)])
+        query = (
+            db.select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.id.in_(latest_storage_ids_query))
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        events_by_partition: Dict[AssetKey, Dict[Optional[str], EventLogEntry]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for _storage_id, json_str in results:
+            event = deserialize_json_to_dagster_namedtuple(json_str)
+            if not isinstance(event, EventLogEntry) or not event.dagster_event:
+                continue
+            materialization = event.dagster_event.step_materialization_data.materialization
+            if materialization.asset_key not in events_by_partition:
+                continue
+            # ordered by storage id, so that the latest event wins when an asset has events stored
+            # under both its current and its legacy key string
+            events_by_partition[materialization.asset_key][materialization.partition] = event
+
+        return events_by_partition
+
+    def _get_latest_storage_id_by_partition_query(self, asset_keys: Sequence[AssetKey]):
+        query = (
+            db.select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    db.or_(
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string() for asset_key in asset_keys]
+                        ),
+                        SqlEventLogStorageTable.c.asset_key.in_(
+                            [asset_key.to_string(legacy=True) for asset_key in asset_keys]
+                        ),
+                    ),
+                    SqlEventLogStorageTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+
+        if self.has_secondary_index(ASSET_KEY_INDEX_COLS):
+            query = self._add_joined_assets_wipe_filter_to_query(query, asset_keys)
+        else:
+            assets_details = self._get_assets_details(asset_keys)
+            query = self._add_assets_wipe_filter_to_query(query, assets_details, asset_keys)
+
+        return query
+
+    def _get_materialization_count_by_partition_from_index(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        query = db.select(
+            [
+                AssetPartitionsTable.c.asset_key,
+                AssetPartitionsTable.c.partition,
+                AssetPartitionsTable.c.materialization_count,
+            ]
+        ).where(
+            AssetPartitionsTable.c.asset_key.in_(
+                [asset_key.to_string() for asset_key in asset_keys]
+            )
+        )
+
+        with self.index_connection() as conn:
+            results = conn.execute(query).fetchall()
+
+        materialization_count_by_partition: Dict[AssetKey, Dict[str, int]] = {
+            asset_key: {} for asset_key in asset_keys
+        }
+        for asset_key_str, partition, count in results:
+            materialization_count_by_partition[AssetKey.from_db_string(asset_key_str)][
+                partition
+            ] = count
+
+        return materialization_count_by_partition
@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: a1f7c0e6d3b2
+Revises: 05844c702676
+Create Date: 2022-02-16 14:03:27.518442
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "a1f7c0e6d3b2"
+down_revision = "05844c702676"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
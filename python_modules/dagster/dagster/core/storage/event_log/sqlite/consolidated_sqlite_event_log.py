@@ -121,10 +121,12 @@ def upgrade(self):
             run_alembic_upgrade(alembic_config, conn)
 
     def has_secondary_index(self, name):
+        # only built indexes are cached, since an index can be built by another process (e.g. by
+        # `dagster instance reindex`) while this storage is in use
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                ConsolidatedSqliteEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(ConsolidatedSqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
@@ -14,7 +14,7 @@
 from dagster.config.source import StringSource
 from dagster.core.events import DagsterEventType
 from dagster.core.events.log import EventLogEntry
-from dagster.core.storage.event_log.base import EventLogRecord, EventRecordsFilter
+from dagster.core.storage.event_log.base import EventLogRecord, EventLogStorage, EventRecordsFilter
 from dagster.core.storage.pipeline_run import PipelineRunStatus, PipelineRunsFilter
 from dagster.core.storage.sql import (
     check_alembic_revision,
@@ -82,6 +82,8 @@ def __init__(self, base_dir, inst_data=None):
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
+        self._secondary_index_cache = {}
+
         # Ensure that multiple threads (like the event log watcher) interact safely with each other
         self._db_lock = threading.Lock()
 
@@ -119,6 +121,20 @@ def inst_data(self):
     def config_type(cls):
         return {"base_dir": StringSource}
 
+    def has_secondary_index(self, name):
+        # only built indexes are cached, since an index can be built by another process (e.g. by
+        # `dagster instance reindex`) while this storage is in use
+        if name not in self._secondary_index_cache:
+            if not super(SqliteEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
+        return self._secondary_index_cache[name]
+
+    def enable_secondary_index(self, name):
+        super(SqliteEventLogStorage, self).enable_secondary_index(name)
+        if name in self._secondary_index_cache:
+            del self._secondary_index_cache[name]
+
     @staticmethod
     def from_config_value(inst_data, config_value):
         return SqliteEventLogStorage(inst_data=inst_data, **config_value)
@@ -237,9 +253,17 @@ def store_event(self, event):
         ):
             # mirror the event in the cross-run index database
             with self.index_connection() as conn:
-                conn.execute(insert_event_statement)
+                result = conn.execute(insert_event_statement)
+                storage_id = result.inserted_primary_key[0]
+
+            self.store_asset(event, storage_id)
+
+    def get_stats_for_runs(self, run_ids):
+        # each run is stored in its own shard, so the stats of each run are fetched separately
+        return EventLogStorage.get_stats_for_runs(self, run_ids)
 
-            self.store_asset(event)
+    def get_step_stats_for_runs(self, run_ids, step_keys=None):
+        return EventLogStorage.get_step_stats_for_runs(self, run_ids, step_keys)
 
     def get_event_records(
         self,
@@ -361,6 +385,7 @@ def wipe(self):
             os.unlink(filename)
 
         self._initialized_dbs = set()
+        self._secondary_index_cache = {}
 
     def _delete_mirrored_events_for_asset_key(self, asset_key):
         with self.index_connection() as conn:
@@ -10,7 +10,6 @@
 from dagster.config import Field
 from dagster.config.source import StringSource
 from dagster.core.definitions.resource_definition import resource
-from dagster.core.instance import DagsterInstance
 from dagster.core.types.decorator import usable_as_dagster_type
 from dagster.utils import mkdir_p
 
@@ -238,6 +237,8 @@ def __init__(self, base_dir):
 
     @staticmethod
     def for_instance(instance, run_id):
+        from dagster.core.instance import DagsterInstance
+
         check.inst_param(instance, "instance", DagsterInstance)
         return LocalFileManager(instance.file_manager_directory(run_id))
 
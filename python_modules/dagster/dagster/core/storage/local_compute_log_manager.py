@@ -1,17 +1,26 @@
 import hashlib
 import os
+import shutil
 import sys
+import time
 from collections import defaultdict
 from contextlib import contextmanager
 
-from dagster import Field, Float, StringSource, check
-from dagster.core.execution.compute_logs import mirror_stream_to_file
+from dagster import Enum, EnumValue, Field, Float, StringSource, check
+from dagster.core.execution.compute_logs import mirror_stream_to_file, pipe_stream_to_file
 from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
 from dagster.utils import ensure_dir, touch_file
 from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers.polling import PollingObserver
 
+from .compressed_compute_logs import (
+    COMPRESSION_EXTENSION,
+    check_compression_available,
+    compress_log_file,
+    read_compressed_log_range,
+    read_log_index,
+)
 from .compute_log_manager import (
     MAX_BYTES_FILE_READ,
     ComputeIOType,
@@ -26,15 +35,56 @@
 
 MAX_FILENAME_LENGTH = 255
 
+# "tail" mirrors stdout & stderr to the log files with a `tail` subprocess per stream, "pipe" with
+# a pipe and a reader thread in the step process
+CAPTURE_MODES = ["tail", "pipe"]
 
-class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
-    """Stores copies of stdout & stderr for each compute step locally on disk."""
+# How often the compute logs are checked for ones that are past their retention period. The time of
+# the last check is stored as the modification time of a marker file in the base directory, since
+# each step process has its own compute log manager.
+PRUNE_INTERVAL_SECONDS = 3600
+
+PRUNE_MARKER_FILENAME = ".compute_logs_pruned"
 
-    def __init__(self, base_dir, polling_timeout=None, inst_data=None):
+
+class LocalComputeLogManager(ComputeLogManager, ConfigurableClass):
+    """Stores copies of stdout & stderr for each compute step locally on disk.
+
+    The ``capture_mode`` config sets how the output is copied to disk. The default, ``tail``,
+    starts a ``tail`` subprocess for each captured stream. ``pipe`` copies the output through a
+    pipe from a thread in the step process instead, which avoids starting helper processes for
+    every step, but loses the output that hasn't been copied yet if the process is killed.
+
+    If ``compression`` is set to ``gzip`` or ``zstd``, the logs of each step are compressed once
+    the step finishes, in segments that are indexed so that ``read_logs_file`` only decompresses
+    the ones overlapping the requested window. Logs are written uncompressed while the step runs.
+
+    If ``retention_days`` is set, the compute logs of runs that haven't been written to in that many
+    days are deleted, checking at most once an hour when a step finishes.
+    """
+
+    def __init__(
+        self,
+        base_dir,
+        polling_timeout=None,
+        inst_data=None,
+        capture_mode="tail",
+        compression=None,
+        retention_days=None,
+    ):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._capture_mode = check.str_param(capture_mode, "capture_mode")
+        check.invariant(
+            self._capture_mode in CAPTURE_MODES,
+            f"capture_mode must be one of {CAPTURE_MODES}, got {capture_mode}",
+        )
+        self._compression = check.opt_str_param(compression, "compression")
+        if self._compression:
+            check_compression_available(self._compression)
+        self._retention_days = check.opt_int_param(retention_days, "retention_days")
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -46,8 +96,9 @@ def _watch_logs(self, pipeline_run, step_key=None):
         key = self.get_key(pipeline_run, step_key)
         outpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDOUT)
         errpath = self.get_local_path(pipeline_run.run_id, key, ComputeIOType.STDERR)
-        with mirror_stream_to_file(sys.stdout, outpath):
-            with mirror_stream_to_file(sys.stderr, errpath):
+        mirror = pipe_stream_to_file if self._capture_mode == "pipe" else mirror_stream_to_file
+        with mirror(sys.stdout, outpath):
+            with mirror(sys.stderr, errpath):
                 yield
 
     @property
@@ -63,6 +114,19 @@ def config_type(cls):
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "capture_mode": Field(
+                Enum("ComputeLogCaptureMode", [EnumValue(mode) for mode in CAPTURE_MODES]),
+                is_required=False,
+                default_value="tail",
+            ),
+            "compression": Field(
+                Enum(
+                    "ComputeLogCompression",
+                    [EnumValue(compression) for compression in COMPRESSION_EXTENSION],
+                ),
+                is_required=False,
+            ),
+            "retention_days": Field(int, is_required=False),
         }
 
     @staticmethod
@@ -79,6 +143,26 @@ def get_local_path(self, run_id, key, io_type):
     def complete_artifact_path(self, run_id, key):
         return self._get_local_path(run_id, key, "complete")
 
+    def get_compressed_path(self, run_id, key, io_type):
+        """Returns the path of the compressed log file for a given execution step, or None if the
+        logs of the step haven't been compressed.
+        """
+        check.inst_param(io_type, "io_type", ComputeIOType)
+        index = read_log_index(self._index_path(run_id, key, io_type))
+        if not index:
+            return None
+        return self._compressed_path(run_id, key, io_type, index.compression)
+
+    def _index_path(self, run_id, key, io_type):
+        return self._get_local_path(run_id, key, "{}.idx".format(IO_TYPE_EXTENSION[io_type]))
+
+    def _compressed_path(self, run_id, key, io_type, compression):
+        return self._get_local_path(
+            run_id,
+            key,
+            "{}.{}".format(IO_TYPE_EXTENSION[io_type], COMPRESSION_EXTENSION[compression]),
+        )
+
     def _get_local_path(self, run_id, key, extension):
         filename = "{}.{}".format(key, extension)
         if len(filename) > MAX_FILENAME_LENGTH:
@@ -88,15 +172,23 @@ def _get_local_path(self, run_id, key, extension):
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
         path = self.get_local_path(run_id, key, io_type)
 
+        index = read_log_index(self._index_path(run_id, key, io_type))
+        if index:
+            return self._read_compressed_logs_file(run_id, key, io_type, index, cursor, max_bytes)
+
         if not os.path.exists(path) or not os.path.isfile(path):
             return ComputeLogFileData(path=path, data=None, cursor=0, size=0, download_url=None)
 
         # See: https://docs.python.org/2/library/stdtypes.html#file.tell for Windows behavior
-        with open(path, "rb") as f:
-            f.seek(cursor, os.SEEK_SET)
-            data = f.read(max_bytes)
-            cursor = f.tell()
-            stats = os.fstat(f.fileno())
+        try:
+            with open(path, "rb") as f:
+                f.seek(cursor, os.SEEK_SET)
+                data = f.read(max_bytes)
+                cursor = f.tell()
+                stats = os.fstat(f.fileno())
+        except FileNotFoundError:
+            # the logs were compressed after checking for the index
+            return self.read_logs_file(run_id, key, io_type, cursor, max_bytes)
 
         # local download path
         download_url = self.download_url(run_id, key, io_type)
@@ -108,6 +200,28 @@ def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FIL
             download_url=download_url,
         )
 
+    def _read_compressed_logs_file(self, run_id, key, io_type, index, cursor, max_bytes):
+        cursor = min(cursor, index.size)
+        end = min(cursor + max_bytes, index.size)
+        data = read_compressed_log_range(
+            self._compressed_path(run_id, key, io_type, index.compression),
+            index,
+            cursor,
+            end,
+        )
+        if end < index.size:
+            # leave a character that is cut off by max_bytes to the next read, unless the window
+            # is too small to hold it
+            data = _trim_partial_utf8_char(data) or data
+
+        return ComputeLogFileData(
+            path=self.get_local_path(run_id, key, io_type),
+            data=data.decode("utf-8", errors="replace"),
+            cursor=cursor + len(data),
+            size=index.size,
+            download_url=self.download_url(run_id, key, io_type),
+        )
+
     def is_watch_completed(self, run_id, key):
         return os.path.exists(self.complete_artifact_path(run_id, key))
 
@@ -123,9 +237,73 @@ def on_watch_finish(self, pipeline_run, step_key=None):
         check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
         check.opt_str_param(step_key, "step_key")
         key = self.get_key(pipeline_run, step_key)
+        if self._compression:
+            for io_type in ComputeIOType:
+                self._compress_logs_file(pipeline_run.run_id, key, io_type)
+
         touchpath = self.complete_artifact_path(pipeline_run.run_id, key)
         touch_file(touchpath)
 
+        if self._retention_days is not None:
+            self._maybe_prune_logs()
+
+    def _compress_logs_file(self, run_id, key, io_type):
+        path = self.get_local_path(run_id, key, io_type)
+        if not os.path.exists(path):
+            return
+
+        compress_log_file(
+            path,
+            self._compressed_path(run_id, key, io_type, self._compression),
+            self._index_path(run_id, key, io_type),
+            self._compression,
+        )
+        os.remove(path)
+
+    def _maybe_prune_logs(self):
+        marker_path = os.path.join(self._base_dir, PRUNE_MARKER_FILENAME)
+        now = time.time()
+        if os.path.exists(marker_path) and now - os.path.getmtime(marker_path) < (
+            PRUNE_INTERVAL_SECONDS
+        ):
+            return
+
+        touch_file(marker_path)
+        self.prune_logs(now - self._retention_days * 24 * 60 * 60)
+
+    def prune_logs(self, before):
+        """Deletes the compute logs of every run whose logs were last written to before the given
+        timestamp.
+
+        Args:
+            before (float): The timestamp before which compute logs are deleted.
+        """
+        check.float_param(before, "before")
+        if not os.path.isdir(self._base_dir):
+            return
+
+        for run_id in os.listdir(self._base_dir):
+            run_directory = self._run_directory(run_id)
+            if not os.path.isdir(run_directory):
+                continue
+
+            paths = [run_directory] + [
+                os.path.join(run_directory, filename) for filename in os.listdir(run_directory)
+            ]
+            try:
+                last_modified = max(os.path.getmtime(path) for path in paths)
+            except FileNotFoundError:
+                # the logs are being written to or compressed right now
+                continue
+
+            if last_modified < before:
+                shutil.rmtree(run_directory, ignore_errors=True)
+                try:
+                    # the run directory may hold other artifacts of the run
+                    os.rmdir(os.path.dirname(run_directory))
+                except OSError:
+                    pass
+
     def download_url(self, run_id, key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
         return "/download/{}/{}/{}".format(run_id, key, io_type.value)
@@ -234,3 +412,24 @@ def on_created(self, event):
     def on_modified(self, event):
         if event.src_path in self.update_paths:
             self.manager.notify_subscriptions(self.run_id, self.key)
+
+
+def _trim_partial_utf8_char(data):
+    """Drops the bytes of a multi-byte UTF-8 character that is cut off at the end of the data."""
+    for i in range(1, min(len(data), 4) + 1):
+        byte = data[-i]
+        if byte & 0xC0 == 0x80:
+            # a continuation byte, keep looking for the first byte of the character
+            continue
+
+        if byte >= 0xF0:
+            char_size = 4
+        elif byte >= 0xE0:
+            char_size = 3
+        elif byte >= 0xC0:
+            char_size = 2
+        else:
+            char_size = 1
+        return data[:-i] if char_size > i else data
+
+    return data
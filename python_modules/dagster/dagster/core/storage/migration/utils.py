@@ -204,3 +204,60 @@ def create_event_log_event_idx():
         ["dagster_event_type", "id"],
         mysql_length={"dagster_event_type": 64},
     )
+
+
+def create_asset_key_prefix_index():
+    if not has_table("asset_keys"):
+        return
+
+    # pylint: disable=no-member
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    if "idx_asset_keys_asset_key_prefix" in [
+        index["name"] for index in get_inspector().get_indexes("asset_keys")
+    ]:
+        return
+
+    op.create_index(
+        "idx_asset_keys_asset_key_prefix",
+        "asset_keys",
+        ["asset_key"],
+        postgresql_ops={"asset_key": "text_pattern_ops"},
+    )
+
+
+def create_run_update_timestamp_index():
+    if not has_table("runs"):
+        return
+
+    if "idx_run_update_timestamp" in [
+        index["name"] for index in get_inspector().get_indexes("runs")
+    ]:
+        return
+
+    op.create_index("idx_run_update_timestamp", "runs", ["update_timestamp"], unique=False)
+
+
+def create_asset_partitions_table():
+    if not has_table("event_logs"):
+        return
+
+    if not has_table("asset_partitions"):
+        op.create_table(
+            "asset_partitions",
+            db.Column("id", db.Integer, primary_key=True, autoincrement=True),
+            db.Column("asset_key", db.String(512), nullable=False),
+            db.Column("partition", db.String(512), nullable=False),
+            db.Column("last_storage_id", db.Integer),
+            db.Column("materialization_count", db.Integer, nullable=False),
+            db.Column("last_run_id", db.String(255)),
+            db.Column("create_timestamp", db.DateTime, server_default=db.text("CURRENT_TIMESTAMP")),
+        )
+        op.create_index(
+            "idx_asset_partitions_asset_key_partition",
+            "asset_partitions",
+            ["asset_key", "partition"],
+            unique=True,
+            mysql_length={"asset_key": 255, "partition": 255},
+        )
@@ -435,7 +435,8 @@ class DagsterRun(PipelineRun):
 class PipelineRunsFilter(
     namedtuple(
         "_PipelineRunsFilter",
-        "run_ids pipeline_name statuses tags snapshot_id updated_after mode created_before",
+        "run_ids pipeline_name statuses tags snapshot_id updated_after mode created_before "
+        "pipeline_names",
     )
 ):
     def __new__(
@@ -448,6 +449,7 @@ def __new__(
         updated_after=None,
         mode=None,
         created_before=None,
+        pipeline_names=None,
     ):
         return super(PipelineRunsFilter, cls).__new__(
             cls,
@@ -459,6 +461,7 @@ def __new__(
             updated_after=check.opt_inst_param(updated_after, "updated_after", datetime),
             mode=check.opt_str_param(mode, "mode"),
             created_before=check.opt_inst_param(created_before, "created_before", datetime),
+            pipeline_names=check.opt_list_param(pipeline_names, "pipeline_names", of_type=str),
         )
 
     @staticmethod
@@ -527,6 +530,27 @@ def __new__(
         )
 
 
+class RunPartitionData(
+    NamedTuple(
+        "_RunPartitionData",
+        [
+            ("run_id", str),
+            ("partition", str),
+            ("status", DagsterRunStatus),
+        ],
+    )
+):
+    """The latest run of a partition in a partition set."""
+
+    def __new__(cls, run_id, partition, status):
+        return super(RunPartitionData, cls).__new__(
+            cls,
+            run_id=check.str_param(run_id, "run_id"),
+            partition=check.str_param(partition, "partition"),
+            status=check.inst_param(status, "status", DagsterRunStatus),
+        )
+
+
 ###################################################################################################
 # GRAVEYARD
 #
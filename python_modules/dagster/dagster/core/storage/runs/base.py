@@ -8,11 +8,21 @@
 from dagster.core.storage.pipeline_run import (
     JobBucket,
     PipelineRun,
+    PipelineRunStatus,
     PipelineRunsFilter,
+    RunPartitionData,
     RunRecord,
     TagBucket,
 )
+from dagster.core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    RUN_KEY_TAG,
+)
 from dagster.daemon.types import DaemonHeartbeat
+from dagster.utils import merge_dicts
 
 
 class RunStorage(ABC, MayHaveInstanceWeakref):
@@ -38,6 +48,17 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             pipeline_run (PipelineRun): The run to add.
         """
 
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        """Add a batch of runs to storage, in order.
+
+        Storages that can insert many runs at once should override this method. Raises the same
+        errors as add_run.
+
+        Args:
+            pipeline_runs (List[PipelineRun]): The runs to add.
+        """
+        return [self.add_run(pipeline_run) for pipeline_run in pipeline_runs]
+
     @abstractmethod
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         """Update run storage in accordance to a pipeline run related DagsterEvent
@@ -167,6 +188,132 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_backfill_run_partition_names(
+        self, backfill_id: str, partition_names: Optional[List[str]] = None
+    ) -> Set[str]:
+        """Get the names of the partitions that runs have already been submitted for in a backfill.
+
+        Runs that were created but never submitted, and are still ``NOT_STARTED``, don't count.
+
+        Args:
+            backfill_id (str): The id of the backfill.
+            partition_names (Optional[List[str]]): If set, only these partitions are checked.
+
+        Returns:
+            Set[str]
+        """
+        runs = self.get_runs(
+            filters=PipelineRunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_id))
+        )
+        run_partition_names = {
+            run.tags[PARTITION_NAME_TAG]
+            for run in runs
+            if PARTITION_NAME_TAG in run.tags and run.status != PipelineRunStatus.NOT_STARTED
+        }
+        if partition_names is None:
+            return run_partition_names
+        return run_partition_names.intersection(partition_names)
+
+    def get_backfill_unsubmitted_runs(
+        self, backfill_id: str, partition_names: Optional[List[str]] = None
+    ) -> List[PipelineRun]:
+        """Get the runs that were created for a backfill but never submitted, and are still
+        ``NOT_STARTED``.
+
+        Args:
+            backfill_id (str): The id of the backfill.
+            partition_names (Optional[List[str]]): If set, only runs for these partitions are
+                returned.
+
+        Returns:
+            List[PipelineRun]
+        """
+        runs = self.get_runs(
+            filters=PipelineRunsFilter(
+                statuses=[PipelineRunStatus.NOT_STARTED],
+                tags=PipelineRun.tags_for_backfill_id(backfill_id),
+            )
+        )
+        if partition_names is None:
+            return runs
+        partition_name_set = set(partition_names)
+        return [run for run in runs if run.tags.get(PARTITION_NAME_TAG) in partition_name_set]
+
+    def get_run_partition_data(
+        self,
+        partition_set_name: str,
+        job_name: Optional[str] = None,
+        partition_names: Optional[List[str]] = None,
+        partition_keys: Optional[List[str]] = None,
+    ) -> List[RunPartitionData]:
+        """Get the latest run of each partition in a partition set that has been run.
+
+        Args:
+            partition_set_name (str): The name of the partition set.
+            job_name (Optional[str]): If set, only runs of this job are considered.
+            partition_names (Optional[List[str]]): If set, only these partitions are returned.
+            partition_keys (Optional[List[str]]): All of the partition keys of the partition set,
+                in order. If set, runs over a range of partitions are considered for each partition
+                in their range.
+
+        Returns:
+            List[RunPartitionData]
+        """
+        runs = self.get_runs(
+            filters=PipelineRunsFilter(
+                pipeline_name=job_name, tags={PARTITION_SET_TAG: partition_set_name}
+            )
+        )
+        partition_name_set = set(partition_names) if partition_names is not None else None
+
+        run_partition_data_by_partition = {}
+        for run in runs:
+            partition = run.tags.get(PARTITION_NAME_TAG)
+            if partition:
+                run_partitions = [partition]
+            elif partition_keys is not None:
+                run_partitions = get_partition_keys_in_run_range(run.tags, partition_keys)
+            else:
+                continue
+
+            for partition in run_partitions:
+                if partition in run_partition_data_by_partition:
+                    # runs are in descending order by creation time, so the first run that we see
+                    # for a partition is its latest run
+                    continue
+                if partition_name_set is not None and partition not in partition_name_set:
+                    continue
+                run_partition_data_by_partition[partition] = RunPartitionData(
+                    run_id=run.run_id, partition=partition, status=run.status
+                )
+
+        return list(run_partition_data_by_partition.values())
+
+    def get_latest_runs_by_run_key(
+        self, run_keys: List[str], tags: Optional[Dict[str, str]] = None
+    ) -> Dict[str, PipelineRun]:
+        """Get the latest run with each of the given run keys.
+
+        Args:
+            run_keys (List[str]): The run keys to look up.
+            tags (Optional[Dict[str, str]]): If set, only runs with all of these tags are
+                considered.
+
+        Returns:
+            Dict[str, PipelineRun]: The latest run for each run key that has a run, keyed by run
+                key.
+        """
+        runs_by_run_key = {}
+        for run_key in run_keys:
+            runs = self.get_runs(
+                filters=PipelineRunsFilter(tags=merge_dicts(tags or {}, {RUN_KEY_TAG: run_key})),
+                limit=1,
+            )
+            if runs:
+                runs_by_run_key[run_key] = runs[0]
+
+        return runs_by_run_key
+
     @abstractmethod
     def get_run_tags(self) -> List[Tuple[str, Set[str]]]:
         """Get a list of tag keys and the values that have been associated with them.
@@ -307,6 +454,26 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
             ExecutionPlanSnapshot
         """
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: List[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        """Fetch the snapshots with the given IDs.
+
+        Args:
+            execution_plan_snapshot_ids (List[str])
+
+        Returns:
+            Dict[str, ExecutionPlanSnapshot]: The snapshots that exist, keyed by ID.
+        """
+        snapshots = {}
+        for execution_plan_snapshot_id in execution_plan_snapshot_ids:
+            if self.has_execution_plan_snapshot(execution_plan_snapshot_id):
+                snapshots[execution_plan_snapshot_id] = self.get_execution_plan_snapshot(
+                    execution_plan_snapshot_id
+                )
+
+        return snapshots
+
     @abstractmethod
     def wipe(self):
         """Clears the run storage."""
@@ -364,3 +531,17 @@ def add_backfill(self, partition_backfill: PartitionBackfill):
     @abstractmethod
     def update_backfill(self, partition_backfill: PartitionBackfill):
         """Update a partition backfill in run storage"""
+
+
+def get_partition_keys_in_run_range(tags: Dict[str, str], partition_keys: List[str]) -> List[str]:
+    """Returns the partitions that a run over a range of partitions covers, given the tags of the
+    run and all of the partition keys of its partition set in order.
+    """
+    start = tags.get(ASSET_PARTITION_RANGE_START_TAG)
+    end = tags.get(ASSET_PARTITION_RANGE_END_TAG)
+    if start not in partition_keys or end not in partition_keys:
+        # not a range run, or the range is no longer in the partition set
+        return []
+
+    # the keys are positioned by the order of the partition set rather than compared as strings
+    return partition_keys[partition_keys.index(start) : partition_keys.index(end) + 1]
@@ -36,6 +36,9 @@ def _filter(run: PipelineRun) -> bool:
         if filters.pipeline_name and filters.pipeline_name != run.pipeline_name:
             return False
 
+        if filters.pipeline_names and run.pipeline_name not in filters.pipeline_names:
+            return False
+
         if filters.mode and filters.mode != run.mode:
             return False
 
@@ -6,14 +6,16 @@
 from ..pipeline_run import PipelineRunStatus
 from ..runs.base import RunStorage
 from ..runs.schema import RunsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
+from ..tags import BACKFILL_ID_TAG, PARTITION_NAME_TAG, PARTITION_SET_TAG
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = "run_start_end"
+RUN_BACKFILL_ID = "run_backfill_id"
 
 # for `dagster instance migrate`, paired with schema changes
 REQUIRED_DATA_MIGRATIONS = {
     RUN_PARTITIONS: lambda: migrate_run_partition,
+    RUN_BACKFILL_ID: lambda: migrate_run_backfill_id,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS = {
@@ -86,6 +88,30 @@ def migrate_run_partition(storage, print_fn=None):
         storage.add_run_tags(run.run_id, run.tags)
 
 
+def migrate_run_backfill_id(storage, print_fn=None):
+    """
+    Utility method to populate the backfill id column from the backfill tags of existing runs.
+    """
+    from dagster.core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    for run in chunked_run_iterator(storage, print_fn):
+        if BACKFILL_ID_TAG not in run.tags:
+            continue
+
+        with storage.connect() as conn:
+            conn.execute(
+                RunsTable.update()  # pylint: disable=no-value-for-parameter
+                .where(RunsTable.c.run_id == run.run_id)
+                .values(backfill_id=run.tags[BACKFILL_ID_TAG])
+            )
+
+
 def migrate_run_start_end(storage, print_fn=None):
     """
     Utility method that updates the start and end times of historical runs using the completed event log.
@@ -27,6 +27,7 @@
     # December 2021 - Added by PR 6038
     db.Column("start_time", db.Float),
     db.Column("end_time", db.Float),
+    db.Column("backfill_id", db.String(255)),
 )
 
 # Secondary Index migration table, used to track data migrations, both for event_logs and runs.
@@ -88,3 +89,5 @@
 db.Index("idx_bulk_actions", BulkActionsTable.c.key, mysql_length=32)
 db.Index("idx_bulk_actions_status", BulkActionsTable.c.status, mysql_length=32)
 db.Index("idx_run_status", RunsTable.c.status, mysql_length=32)
+db.Index("idx_run_backfill_id", RunsTable.c.backfill_id)
+db.Index("idx_run_update_timestamp", RunsTable.c.update_timestamp)
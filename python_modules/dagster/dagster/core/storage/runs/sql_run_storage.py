@@ -24,7 +24,15 @@
     create_execution_plan_snapshot_id,
     create_pipeline_snapshot_id,
 )
-from dagster.core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    BACKFILL_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+)
 from dagster.daemon.types import DaemonHeartbeat
 from dagster.serdes import (
     deserialize_as,
@@ -34,9 +42,22 @@
 from dagster.seven import JSONDecodeError
 from dagster.utils import datetime_as_float, merge_dicts, utc_datetime_from_timestamp
 
-from ..pipeline_run import JobBucket, PipelineRun, PipelineRunsFilter, RunRecord, TagBucket
-from .base import RunStorage
-from .migration import OPTIONAL_DATA_MIGRATIONS, REQUIRED_DATA_MIGRATIONS, RUN_PARTITIONS
+from ..pipeline_run import (
+    JobBucket,
+    PipelineRun,
+    PipelineRunStatus,
+    PipelineRunsFilter,
+    RunPartitionData,
+    RunRecord,
+    TagBucket,
+)
+from .base import RunStorage, get_partition_keys_in_run_range
+from .migration import (
+    OPTIONAL_DATA_MIGRATIONS,
+    REQUIRED_DATA_MIGRATIONS,
+    RUN_BACKFILL_ID,
+    RUN_PARTITIONS,
+)
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
@@ -47,6 +68,13 @@
     SnapshotsTable,
 )
 
+# Number of run keys that are looked up per query, which keeps the number of bound parameters
+# under sqlite's limit
+RUN_KEY_BATCH_SIZE = 500
+
+# Number of snapshots fetched per query when fetching snapshots in bulk
+SNAPSHOT_BATCH_SIZE = 500
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -56,6 +84,9 @@ class SnapshotType(Enum):
 class SqlRunStorage(RunStorage):  # pylint: disable=no-init
     """Base class for SQL based run storages"""
 
+    # set once the backfill id column has been found on the runs table
+    _has_backfill_id_column = False
+
     @abstractmethod
     def connect(self):
         """Context manager yielding a sqlalchemy.engine.Connection."""
@@ -82,23 +113,22 @@ def fetchone(self, query):
 
         return row
 
-    def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
-        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
-
-        if pipeline_run.pipeline_snapshot_id and not self.has_pipeline_snapshot(
-            pipeline_run.pipeline_snapshot_id
-        ):
-            raise DagsterSnapshotDoesNotExist(
-                "Snapshot {ss_id} does not exist in run storage".format(
-                    ss_id=pipeline_run.pipeline_snapshot_id
+    def _check_snapshots_exist(self, pipeline_runs: List[PipelineRun]):
+        snapshot_ids = {
+            run.pipeline_snapshot_id for run in pipeline_runs if run.pipeline_snapshot_id
+        }
+        for snapshot_id in snapshot_ids:
+            if not self.has_pipeline_snapshot(snapshot_id):
+                raise DagsterSnapshotDoesNotExist(
+                    "Snapshot {ss_id} does not exist in run storage".format(ss_id=snapshot_id)
                 )
-            )
 
+    def _run_insert_values(self, pipeline_run: PipelineRun, include_backfill_id: bool) -> Dict:
         has_tags = pipeline_run.tags and len(pipeline_run.tags) > 0
         partition = pipeline_run.tags.get(PARTITION_NAME_TAG) if has_tags else None
         partition_set = pipeline_run.tags.get(PARTITION_SET_TAG) if has_tags else None
 
-        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+        values = dict(
             run_id=pipeline_run.run_id,
             pipeline_name=pipeline_run.pipeline_name,
             status=pipeline_run.status.value,
@@ -107,6 +137,25 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
             partition=partition,
             partition_set=partition_set,
         )
+        if include_backfill_id:
+            values["backfill_id"] = pipeline_run.tags.get(BACKFILL_ID_TAG) if has_tags else None
+        return values
+
+    def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
+        check.inst_param(pipeline_run, "pipeline_run", PipelineRun)
+
+        self._check_snapshots_exist([pipeline_run])
+
+        # only runs launched by a backfill need the backfill id column, so skip inspecting the
+        # schema for all other runs
+        include_backfill_id = bool(
+            pipeline_run.tags
+            and BACKFILL_ID_TAG in pipeline_run.tags
+            and self.has_backfill_id_column()
+        )
+        runs_insert = RunsTable.insert().values(  # pylint: disable=no-value-for-parameter
+            **self._run_insert_values(pipeline_run, include_backfill_id)
+        )
         with self.connect() as conn:
             try:
                 conn.execute(runs_insert)
@@ -124,6 +173,39 @@ def add_run(self, pipeline_run: PipelineRun) -> PipelineRun:
 
         return pipeline_run
 
+    def add_runs(self, pipeline_runs: List[PipelineRun]) -> List[PipelineRun]:
+        check.list_param(pipeline_runs, "pipeline_runs", of_type=PipelineRun)
+        if not pipeline_runs:
+            return []
+
+        self._check_snapshots_exist(pipeline_runs)
+
+        include_backfill_id = self.has_backfill_id_column()
+        run_values = [
+            self._run_insert_values(pipeline_run, include_backfill_id)
+            for pipeline_run in pipeline_runs
+        ]
+        tag_values = [
+            dict(run_id=pipeline_run.run_id, key=k, value=v)
+            for pipeline_run in pipeline_runs
+            for k, v in (pipeline_run.tags or {}).items()
+        ]
+
+        with self.connect() as conn:
+            try:
+                conn.execute(
+                    RunsTable.insert(), run_values  # pylint: disable=no-value-for-parameter
+                )
+            except db.exc.IntegrityError as exc:
+                raise DagsterRunAlreadyExists from exc
+
+            if tag_values:
+                conn.execute(
+                    RunTagsTable.insert(), tag_values  # pylint: disable=no-value-for-parameter
+                )
+
+        return pipeline_runs
+
     def handle_run_event(self, run_id: str, event: DagsterEvent):
         check.str_param(run_id, "run_id")
         check.inst_param(event, "event", DagsterEvent)
@@ -202,6 +284,9 @@ def _add_filters_to_query(self, query, filters: PipelineRunsFilter):
         if filters.pipeline_name:
             query = query.where(RunsTable.c.pipeline_name == filters.pipeline_name)
 
+        if filters.pipeline_names:
+            query = query.where(RunsTable.c.pipeline_name.in_(filters.pipeline_names))
+
         if filters.mode:
             query = query.where(RunsTable.c.mode == filters.mode)
 
@@ -703,6 +788,24 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)
 
+    def get_execution_plan_snapshots(
+        self, execution_plan_snapshot_ids: List[str]
+    ) -> Dict[str, ExecutionPlanSnapshot]:
+        check.list_param(execution_plan_snapshot_ids, "execution_plan_snapshot_ids", of_type=str)
+
+        snapshot_ids = list(set(execution_plan_snapshot_ids))
+        snapshots = {}
+        for i in range(0, len(snapshot_ids), SNAPSHOT_BATCH_SIZE):
+            query = db.select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+                SnapshotsTable.c.snapshot_id.in_(snapshot_ids[i : i + SNAPSHOT_BATCH_SIZE])
+            )
+            for snapshot_id, snapshot_body in self.fetchall(query):
+                snapshot = defensively_unpack_pipeline_snapshot_query(logging, [snapshot_body])
+                if snapshot:
+                    snapshots[snapshot_id] = snapshot
+
+        return snapshots
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
@@ -773,6 +876,190 @@ def _get_partition_runs(
             rows = self.fetchall(query)
             return self._rows_to_runs(rows)
 
+    def get_backfill_run_partition_names(
+        self, backfill_id: str, partition_names: Optional[List[str]] = None
+    ) -> Set[str]:
+        check.str_param(backfill_id, "backfill_id")
+        check.opt_list_param(partition_names, "partition_names", of_type=str)
+
+        if partition_names is not None and not partition_names:
+            return set()
+
+        if not self.has_built_index(RUN_BACKFILL_ID):
+            return super().get_backfill_run_partition_names(backfill_id, partition_names)
+
+        query = (
+            db.select([RunsTable.c.partition])
+            .where(RunsTable.c.backfill_id == backfill_id)
+            .where(RunsTable.c.partition != None)
+            .where(RunsTable.c.status != PipelineRunStatus.NOT_STARTED.value)
+        )
+        if partition_names is not None:
+            query = query.where(RunsTable.c.partition.in_(partition_names))
+
+        return {row[0] for row in self.fetchall(query)}
+
+    def get_backfill_unsubmitted_runs(
+        self, backfill_id: str, partition_names: Optional[List[str]] = None
+    ) -> List[PipelineRun]:
+        check.str_param(backfill_id, "backfill_id")
+        check.opt_list_param(partition_names, "partition_names", of_type=str)
+
+        if partition_names is not None and not partition_names:
+            return []
+
+        if not self.has_built_index(RUN_BACKFILL_ID):
+            return super().get_backfill_unsubmitted_runs(backfill_id, partition_names)
+
+        query = (
+            self._runs_query()
+            .where(RunsTable.c.backfill_id == backfill_id)
+            .where(RunsTable.c.status == PipelineRunStatus.NOT_STARTED.value)
+        )
+        if partition_names is not None:
+            query = query.where(RunsTable.c.partition.in_(partition_names))
+
+        return self._rows_to_runs(self.fetchall(query))
+
+    def get_run_partition_data(
+        self,
+        partition_set_name: str,
+        job_name: Optional[str] = None,
+        partition_names: Optional[List[str]] = None,
+        partition_keys: Optional[List[str]] = None,
+    ) -> List[RunPartitionData]:
+        check.str_param(partition_set_name, "partition_set_name")
+        check.opt_str_param(job_name, "job_name")
+        check.opt_list_param(partition_names, "partition_names", of_type=str)
+        check.opt_list_param(partition_keys, "partition_keys", of_type=str)
+
+        if partition_names is not None and not partition_names:
+            return []
+
+        if not self.has_built_index(RUN_PARTITIONS):
+            return super().get_run_partition_data(
+                partition_set_name, job_name, partition_names, partition_keys
+            )
+
+        # the latest run of each partition is the one with the highest id
+        latest_runs_query = (
+            db.select([db.func.max(RunsTable.c.id).label("id")])
+            .where(RunsTable.c.partition_set == partition_set_name)
+            .where(RunsTable.c.partition != None)
+        )
+        if job_name:
+            latest_runs_query = latest_runs_query.where(RunsTable.c.pipeline_name == job_name)
+        if partition_names is not None:
+            latest_runs_query = latest_runs_query.where(RunsTable.c.partition.in_(partition_names))
+        latest_runs_query = latest_runs_query.group_by(RunsTable.c.partition).alias("latest_runs")
+
+        query = db.select(
+            [RunsTable.c.id, RunsTable.c.run_id, RunsTable.c.partition, RunsTable.c.status]
+        ).select_from(RunsTable.join(latest_runs_query, RunsTable.c.id == latest_runs_query.c.id))
+
+        latest_run_by_partition = {
+            partition: (storage_id, run_id, status)
+            for storage_id, run_id, partition, status in self.fetchall(query)
+        }
+
+        if partition_keys is not None:
+            partition_name_set = set(partition_names) if partition_names is not None else None
+            for storage_id, run_id, status, start, end in self._get_partition_range_runs(
+                partition_set_name, job_name
+            ):
+                for partition in get_partition_keys_in_run_range(
+                    {ASSET_PARTITION_RANGE_START_TAG: start, ASSET_PARTITION_RANGE_END_TAG: end},
+                    partition_keys,
+                ):
+                    if partition_name_set is not None and partition not in partition_name_set:
+                        continue
+                    # a range run is the latest run of a partition if it was added after the
+                    # latest run of that partition alone
+                    if (
+                        partition not in latest_run_by_partition
+                        or latest_run_by_partition[partition][0] < storage_id
+                    ):
+                        latest_run_by_partition[partition] = (storage_id, run_id, status)
+
+        return [
+            RunPartitionData(run_id=run_id, partition=partition, status=PipelineRunStatus(status))
+            for partition, (_storage_id, run_id, status) in latest_run_by_partition.items()
+        ]
+
+    def _get_partition_range_runs(
+        self, partition_set_name: str, job_name: Optional[str]
+    ) -> List[Tuple[int, str, str, str, str]]:
+        # runs over a range of partitions are in the partition set without a single partition, and
+        # are identified by the tags of the start and end of their range
+        start_tags = RunTagsTable.alias("range_start_tags")
+        end_tags = RunTagsTable.alias("range_end_tags")
+        query = (
+            db.select(
+                [
+                    RunsTable.c.id,
+                    RunsTable.c.run_id,
+                    RunsTable.c.status,
+                    start_tags.c.value,
+                    end_tags.c.value,
+                ]
+            )
+            .select_from(
+                RunsTable.join(
+                    start_tags,
+                    db.and_(
+                        start_tags.c.run_id == RunsTable.c.run_id,
+                        start_tags.c.key == ASSET_PARTITION_RANGE_START_TAG,
+                    ),
+                ).join(
+                    end_tags,
+                    db.and_(
+                        end_tags.c.run_id == RunsTable.c.run_id,
+                        end_tags.c.key == ASSET_PARTITION_RANGE_END_TAG,
+                    ),
+                )
+            )
+            .where(RunsTable.c.partition_set == partition_set_name)
+            .where(RunsTable.c.partition == None)
+        )
+        if job_name:
+            query = query.where(RunsTable.c.pipeline_name == job_name)
+
+        return self.fetchall(query)
+
+    def get_latest_runs_by_run_key(
+        self, run_keys: List[str], tags: Optional[Dict[str, str]] = None
+    ) -> Dict[str, PipelineRun]:
+        check.list_param(run_keys, "run_keys", of_type=str)
+        check.opt_dict_param(tags, "tags", key_type=str, value_type=str)
+
+        runs_by_run_key: Dict[str, PipelineRun] = {}
+        for i in range(0, len(run_keys), RUN_KEY_BATCH_SIZE):
+            run_key_tags = RunTagsTable.alias("run_key_tags")
+            query = (
+                db.select([RunsTable.c.run_body])
+                .select_from(
+                    RunsTable.join(run_key_tags, RunsTable.c.run_id == run_key_tags.c.run_id)
+                )
+                .where(run_key_tags.c.key == RUN_KEY_TAG)
+                .where(run_key_tags.c.value.in_(run_keys[i : i + RUN_KEY_BATCH_SIZE]))
+            )
+            for key, value in (tags or {}).items():
+                other_tags = RunTagsTable.alias()
+                query = query.where(
+                    db.exists()
+                    .where(other_tags.c.run_id == RunsTable.c.run_id)
+                    .where(other_tags.c.key == key)
+                    .where(other_tags.c.value == value)
+                )
+            query = query.order_by(RunsTable.c.id.desc())
+
+            for run in self._rows_to_runs(self.fetchall(query)):
+                # runs are in descending order by id, so the first run that we see for a run key
+                # is its latest run
+                runs_by_run_key.setdefault(run.tags[RUN_KEY_TAG], run)
+
+        return runs_by_run_key
+
     # Tracking data migrations over secondary indexes
 
     def _execute_data_migrations(
@@ -831,6 +1118,17 @@ def has_run_stats_index_cols(self):
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
             return "start_time" in column_names and "end_time" in column_names
 
+    def has_backfill_id_column(self):
+        # the column is added by a schema migration, so once it exists the schema doesn't need to
+        # be inspected again when adding runs
+        if self._has_backfill_id_column:
+            return True
+
+        with self.connect() as conn:
+            column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
+        self._has_backfill_id_column = "backfill_id" in column_names
+        return self._has_backfill_id_column
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat):
@@ -0,0 +1,22 @@
+"""add run update timestamp index
+
+Revision ID: 4b1f7c2d9e53
+Revises: 8f3c2a1e9b7d
+Create Date: 2022-02-21 09:27:14.603118
+
+"""
+from dagster.core.storage.migration.utils import create_run_update_timestamp_index
+
+# revision identifiers, used by Alembic.
+revision = "4b1f7c2d9e53"
+down_revision = "8f3c2a1e9b7d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_update_timestamp_index()
+
+
+def downgrade():
+    pass
@@ -116,6 +116,8 @@ def _alembic_downgrade(self, rev="head"):
         alembic_config = get_alembic_config(__file__)
         with self.connect() as conn:
             run_alembic_downgrade(alembic_config, conn, rev=rev)
+        # a downgrade may drop the backfill id column
+        self._has_backfill_id_column = False
 
     def upgrade(self):
         self._check_for_version_066_migration_and_perform()
@@ -39,6 +39,16 @@
 
 DOCKER_IMAGE_TAG = "{prefix}image".format(prefix=SYSTEM_TAG_PREFIX)
 
+# Set on the asset materializations of ops that have a version, to detect assets that need to be
+# recomputed because their code changed
+CODE_VERSION_TAG = "{prefix}code_version".format(prefix=SYSTEM_TAG_PREFIX)
+
+ASSET_PARTITION_RANGE_START_TAG = "{prefix}asset_partition_range_start".format(
+    prefix=SYSTEM_TAG_PREFIX
+)
+
+ASSET_PARTITION_RANGE_END_TAG = "{prefix}asset_partition_range_end".format(prefix=SYSTEM_TAG_PREFIX)
+
 USER_EDITABLE_SYSTEM_TAGS = [PRIORITY_TAG]
 
 
@@ -32,7 +32,6 @@
     get_ephemeral_repository_name,
 )
 from dagster.core.errors import DagsterInvariantViolationError
-from dagster.core.instance import DagsterInstance
 from dagster.utils import merge_dicts
 from dagster.version import __version__ as dagster_module_version
 
@@ -262,6 +261,8 @@ def get_log_queue_dir():
 
 
 def _check_telemetry_instance_param(args, kwargs, instance_index):
+    from dagster.core.instance import DagsterInstance
+
     if "instance" in kwargs:
         return check.inst_param(
             kwargs["instance"],
@@ -314,6 +315,7 @@ def write_telemetry_log_line(log_line):
 
 
 def _get_instance_telemetry_info(instance):
+    from dagster.core.instance import DagsterInstance
     from dagster.core.storage.runs import SqlRunStorage
 
     check.inst_param(instance, "instance", DagsterInstance)
@@ -379,6 +381,7 @@ def log_external_repo_stats(instance, source, external_repo, external_pipeline=N
         ExternalPipeline,
         ExternalRepository,
     )
+    from dagster.core.instance import DagsterInstance
 
     check.inst_param(instance, "instance", DagsterInstance)
     check.str_param(source, "source")
@@ -407,6 +410,8 @@ def log_external_repo_stats(instance, source, external_repo, external_pipeline=N
 
 
 def log_repo_stats(instance, source, pipeline=None, repo=None):
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(instance, "instance", DagsterInstance)
     check.str_param(source, "source")
     check.opt_inst_param(pipeline, "pipeline", IPipeline)
@@ -445,6 +450,7 @@ def log_repo_stats(instance, source, pipeline=None, repo=None):
 
 
 def log_workspace_stats(instance, workspace_process_context):
+    from dagster.core.instance import DagsterInstance
     from dagster.core.workspace import IWorkspaceProcessContext
 
     check.inst_param(instance, "instance", DagsterInstance)
@@ -468,6 +474,8 @@ def log_action(
     pipeline_name_hash=None,
     repo_hash=None,
 ):
+    from dagster.core.instance import DagsterInstance
+
     check.inst_param(instance, "instance", DagsterInstance)
     if client_time is None:
         client_time = datetime.datetime.now()
@@ -4,8 +4,10 @@
 import warnings
 from abc import ABC, abstractmethod, abstractproperty
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import ExitStack
-from typing import TYPE_CHECKING, Dict, List, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union, cast
 
 from dagster import check
 from dagster.core.errors import DagsterInvariantViolationError, DagsterRepositoryLocationLoadError
@@ -29,6 +31,7 @@
     LocationStateSubscriber,
 )
 from dagster.core.host_representation.origin import GrpcServerRepositoryLocationOrigin
+from dagster.core.host_representation.repository_data_cache import RepositoryDataCache
 from dagster.core.instance import DagsterInstance
 from dagster.grpc.server_watcher import create_grpc_watch_thread
 from dagster.utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
@@ -51,6 +54,11 @@
 DAGIT_GRPC_SERVER_HEARTBEAT_TTL = 45
 DAGIT_GRPC_SERVER_STARTUP_TIMEOUT = 30
 
+# Maximum number of repository locations that are loaded at the same time
+DEFAULT_MAX_CONCURRENT_LOCATION_LOADS = 8
+# How long a single repository location may take to load before it is reported as an error
+DEFAULT_LOCATION_LOAD_TIMEOUT = 180
+
 
 class BaseWorkspaceRequestContext(IWorkspace):
     """
@@ -100,6 +108,14 @@ def has_permission(self, permission: str) -> bool:
     def show_instance_config(self) -> bool:
         return True
 
+    @property
+    def loaders(self) -> Dict[str, Any]:
+        """Request-scoped storage for data loaders, which batch the queries made while resolving a
+        single request and are discarded along with the request context."""
+        if not hasattr(self, "_loaders"):
+            self._loaders: Dict[str, Any] = {}
+        return self._loaders
+
     def get_location(self, origin):
         location_name = origin.location_name
         location_entry = self.get_location_entry(location_name)
@@ -377,11 +393,24 @@ def __init__(
         version: str = "",
         read_only: bool = False,
         grpc_server_registry=None,
+        max_concurrent_location_loads: int = DEFAULT_MAX_CONCURRENT_LOCATION_LOADS,
+        location_load_timeout: Optional[float] = DEFAULT_LOCATION_LOAD_TIMEOUT,
     ):
         self._stack = ExitStack()
 
         check.opt_str_param(version, "version")
         check.bool_param(read_only, "read_only")
+        self._max_concurrent_location_loads = check.int_param(
+            max_concurrent_location_loads, "max_concurrent_location_loads"
+        )
+        check.param_invariant(
+            self._max_concurrent_location_loads > 0,
+            "max_concurrent_location_loads",
+            "Must load at least one location at a time",
+        )
+        self._location_load_timeout = check.opt_numeric_param(
+            location_load_timeout, "location_load_timeout"
+        )
 
         # lazy import for perf
         from rx.subjects import Subject
@@ -423,6 +452,8 @@ def __init__(
                 )
             )
 
+        self._repository_data_cache = RepositoryDataCache.from_instance(instance)
+
         self._location_entry_dict: Dict[str, WorkspaceLocationEntry] = OrderedDict()
 
         with self._lock:
@@ -445,39 +476,125 @@ def _load_workspace(self):
 
         self._location_entry_dict = OrderedDict()
 
+        location_names = set()
         for origin in repository_location_origins:
             check.invariant(
-                self._location_entry_dict.get(origin.location_name) is None,
+                origin.location_name not in location_names,
                 'Cannot have multiple locations with the same name, got multiple "{name}"'.format(
                     name=origin.location_name,
                 ),
             )
+            location_names.add(origin.location_name)
 
+        for origin in repository_location_origins:
             if origin.supports_server_watch:
                 self._start_watch_thread(origin)
-            self._location_entry_dict[origin.location_name] = self._load_location(origin)
+
+        for origin, entry in zip(
+            repository_location_origins, self._load_locations(repository_location_origins)
+        ):
+            self._location_entry_dict[origin.location_name] = entry
+
+    def _load_locations(
+        self, origins: List[RepositoryLocationOrigin]
+    ) -> List[WorkspaceLocationEntry]:
+        # Each location may spin up a gRPC server and fetch its repository data, so load them on
+        # a bounded thread pool. A failure or timeout in one location is recorded on its entry
+        # and does not affect the others.
+        assert self._lock.locked()
+        if not origins:
+            return []
+
+        start_times: Dict[str, float] = {}
+
+        def _load(origin):
+            start_times[origin.location_name] = time.time()
+            return self._load_location(origin)
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(len(origins), self._max_concurrent_location_loads),
+            thread_name_prefix="workspace_location_load",
+        )
+        try:
+            futures = [executor.submit(_load, origin) for origin in origins]
+            return [
+                self._wait_for_location_entry(origin, future, start_times)
+                for origin, future in zip(origins, futures)
+            ]
+        finally:
+            # Don't block on locations that timed out, their threads finish in the background
+            executor.shutdown(wait=False)
+
+    def _wait_for_location_entry(self, origin, future, start_times) -> WorkspaceLocationEntry:
+        location_name = origin.location_name
+        timeout = self._location_load_timeout
+
+        while True:
+            if timeout is None:
+                return future.result()
+
+            # The timeout applies from when the location starts loading, not from when it was
+            # queued behind other locations
+            start_time = start_times.get(location_name)
+            remaining = timeout if start_time is None else start_time + timeout - time.time()
+            try:
+                return future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                if location_name in start_times and (
+                    time.time() - start_times[location_name] >= timeout
+                ):
+                    break
+
+        # Clean up the location if it eventually finishes loading, since nothing will reference it
+        future.add_done_callback(_cleanup_abandoned_location_entry)
+
+        error = SerializableErrorInfo(
+            message=f"Timed out after {timeout} seconds while loading repository location "
+            f"{location_name}.",
+            stack=[],
+            cls_name="DagsterUserCodeUnreachableError",
+        )
+        warnings.warn(
+            "Error loading repository location {location_name}:{error_string}".format(
+                location_name=location_name, error_string=error.to_string()
+            )
+        )
+        return WorkspaceLocationEntry(
+            origin=origin,
+            repository_location=None,
+            load_error=error,
+            load_status=WorkspaceLocationLoadStatus.LOADED,
+            display_metadata=origin.get_display_metadata(),
+            update_timestamp=time.time(),
+        )
 
     def _create_location_from_origin(
         self, origin: RepositoryLocationOrigin
     ) -> Optional[RepositoryLocation]:
         if not self._grpc_server_registry.supports_origin(origin):
+            if self._repository_data_cache and isinstance(
+                origin, GrpcServerRepositoryLocationOrigin
+            ):
+                return GrpcServerRepositoryLocation(
+                    origin, repository_data_cache=self._repository_data_cache
+                )
             return origin.create_location()
         else:
-            endpoint = (
-                self._grpc_server_registry.reload_grpc_endpoint(origin)
+            get_endpoint = (
+                self._grpc_server_registry.reload_grpc_endpoint
                 if self._grpc_server_registry.supports_reload
-                else self._grpc_server_registry.get_grpc_endpoint(origin)
+                else self._grpc_server_registry.get_grpc_endpoint
             )
 
+            # The location only blocks on the server starting up if it can't be loaded from the
+            # repository data cache
             return GrpcServerRepositoryLocation(
                 origin=origin,
-                server_id=endpoint.server_id,
-                port=endpoint.port,
-                socket=endpoint.socket,
-                host=endpoint.host,
                 heartbeat=True,
                 watch_server=False,
                 grpc_server_registry=self._grpc_server_registry,
+                repository_data_cache=self._repository_data_cache,
+                get_endpoint=lambda: get_endpoint(origin),
             )
 
     @property
@@ -534,6 +651,7 @@ def _load_location(self, origin):
         location_name = origin.location_name
         location = None
         error = None
+        start_time = time.time()
         try:
             location = self._create_location_from_origin(origin)
         except Exception:
@@ -553,6 +671,7 @@ def _load_location(self, origin):
             if location
             else origin.get_display_metadata(),
             update_timestamp=time.time(),
+            load_duration=time.time() - start_time,
         )
 
     def create_snapshot(self):
@@ -569,6 +688,13 @@ def repository_location_names(self):
         with self._lock:
             return list(self._location_entry_dict)
 
+    @property
+    def location_load_durations(self) -> Dict[str, Optional[float]]:
+        """Seconds spent loading each repository location, keyed by location name. Locations
+        that timed out while loading have a duration of None."""
+        with self._lock:
+            return {name: entry.load_duration for name, entry in self._location_entry_dict.items()}
+
     def has_repository_location(self, location_name):
         check.str_param(location_name, "location_name")
 
@@ -655,3 +781,12 @@ def __exit__(self, exception_type, exception_value, traceback):
         with self._lock:
             self._cleanup_locations()
         self._stack.close()
+
+
+def _cleanup_abandoned_location_entry(future):
+    if future.exception():
+        return
+
+    entry = future.result()
+    if entry.repository_location:
+        entry.repository_location.cleanup()
@@ -1,5 +1,9 @@
 from dagster import check
-from dagster.core.host_representation.origin import RepositoryLocationOrigin
+from dagster.core.host_representation.origin import (
+    GrpcServerRepositoryLocationOrigin,
+    RepositoryLocationOrigin,
+)
+from dagster.core.host_representation.repository_data_cache import RepositoryDataCache
 from dagster.core.host_representation.repository_location import GrpcServerRepositoryLocation
 from dagster.core.workspace import IWorkspace
 
@@ -11,7 +15,7 @@ class DynamicWorkspace(IWorkspace):
     Probably move to the workspace module
     """
 
-    def __init__(self, grpc_server_registry):
+    def __init__(self, grpc_server_registry, repository_data_cache=None):
         from dagster.core.host_representation.grpc_server_registry import GrpcServerRegistry
 
         self._locations = {}
@@ -19,6 +23,9 @@ def __init__(self, grpc_server_registry):
         self._grpc_server_registry = check.inst_param(
             grpc_server_registry, "grpc_server_registry", GrpcServerRegistry
         )
+        self._repository_data_cache = check.opt_inst_param(
+            repository_data_cache, "repository_data_cache", RepositoryDataCache
+        )
 
     def __enter__(self):
         return self
@@ -33,7 +40,16 @@ def get_location(self, origin):
         existing_location = self._locations.get(origin_id)
 
         if not self._grpc_server_registry.supports_origin(origin):
-            location = existing_location if existing_location else origin.create_location()
+            if existing_location:
+                location = existing_location
+            elif self._repository_data_cache and isinstance(
+                origin, GrpcServerRepositoryLocationOrigin
+            ):
+                location = GrpcServerRepositoryLocation(
+                    origin, repository_data_cache=self._repository_data_cache
+                )
+            else:
+                location = origin.create_location()
         else:
             endpoint = self._grpc_server_registry.get_grpc_endpoint(origin)
 
@@ -55,6 +71,7 @@ def get_location(self, origin):
                     heartbeat=True,
                     watch_server=False,
                     grpc_server_registry=self._grpc_server_registry,
+                    repository_data_cache=self._repository_data_cache,
                 )
             )
 
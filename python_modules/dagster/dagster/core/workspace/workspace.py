@@ -35,3 +35,5 @@ class WorkspaceLocationEntry(NamedTuple):
     load_status: WorkspaceLocationLoadStatus
     display_metadata: Dict[str, str]
     update_timestamp: float
+    # Seconds spent creating the location, or None if the load did not finish
+    load_duration: Optional[float] = None
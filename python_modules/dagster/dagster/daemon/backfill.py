@@ -10,8 +10,6 @@
     submit_backfill_runs,
 )
 from dagster.core.instance import DagsterInstance
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunsFilter
-from dagster.core.storage.tags import PARTITION_NAME_TAG
 from dagster.core.workspace import IWorkspace
 from dagster.utils.error import serializable_error_info_from_exc_info
 
@@ -126,11 +124,6 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
         index = partition_names.index(backfill_job.last_submitted_partition_name)
         partition_names = partition_names[index + 1 :]
 
-    # for idempotence, fetch all runs with the current backfill id
-    backfill_runs = instance.get_runs(
-        PipelineRunsFilter(tags=PipelineRun.tags_for_backfill_id(backfill_job.backfill_id))
-    )
-    completed_partitions = set([run.tags.get(PARTITION_NAME_TAG) for run in backfill_runs])
     initial_checkpoint = (
         partition_names.index(checkpoint) + 1 if checkpoint and checkpoint in partition_names else 0
     )
@@ -139,6 +132,13 @@ def _get_partitions_chunk(instance, logger, backfill_job, chunk_size):
     partitions_chunk = partition_names[:chunk_size]
     next_checkpoint = partitions_chunk[-1]
 
+    # for idempotence, look up which partitions in the chunk already have runs for the current
+    # backfill id. Partitions before the checkpoint were all submitted by earlier iterations, so
+    # only the current chunk needs to be checked.
+    completed_partitions = instance.get_backfill_run_partition_names(
+        backfill_job.backfill_id, partitions_chunk
+    )
+
     to_skip = set(partitions_chunk).intersection(completed_partitions)
     if to_skip:
         logger.info(
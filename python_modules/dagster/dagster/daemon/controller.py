@@ -8,6 +8,7 @@
 import pendulum
 from dagster import check
 from dagster.core.host_representation.grpc_server_registry import ProcessGrpcServerRegistry
+from dagster.core.host_representation.repository_data_cache import RepositoryDataCache
 from dagster.core.instance import DagsterInstance
 from dagster.core.workspace.dynamic_workspace import DynamicWorkspace
 from dagster.daemon.daemon import (
@@ -83,7 +84,10 @@ def daemon_controller_from_instance(
             # Create this in each daemon to generate a workspace per-daemon
             @contextmanager
             def gen_workspace(_instance):
-                with DynamicWorkspace(grpc_server_registry) as workspace:
+                with DynamicWorkspace(
+                    grpc_server_registry,
+                    repository_data_cache=RepositoryDataCache.from_instance(instance),
+                ) as workspace:
                     yield workspace
 
             with DagsterDaemonController(
@@ -132,46 +132,104 @@ def run_iteration(self, instance, workspace):
         # place in order
         sorted_runs = self._priority_sort(queued_runs)
 
-        # launch until blocked by limit rules
-        num_dequeued_runs = 0
-        tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
-            tag_concurrency_limits, in_progress_runs
+        runs_to_dequeue = self._choose_runs_to_dequeue(
+            instance, sorted_runs, in_progress_runs, tag_concurrency_limits, max_runs_to_launch
         )
 
-        for run in sorted_runs:
-            if num_dequeued_runs >= max_runs_to_launch:
-                break
-
-            if tag_concurrency_limits_counter.is_run_blocked(run):
-                continue
-
-            error_info = None
-
-            try:
-                self._dequeue_run(instance, run, workspace)
-            except Exception:
-                error_info = serializable_error_info_from_exc_info(sys.exc_info())
+        # the chosen runs are launched as a single batch, so that the run launcher can start them
+        # concurrently
+        try:
+            self._dequeue_runs(instance, runs_to_dequeue)
+
+            # launch_runs only raises before it hands the runs to the run launcher. After that,
+            # it returns the error of each run that failed to launch, and marks the run as failed
+            # itself.
+            errors = instance.launch_runs([run.run_id for run in runs_to_dequeue], workspace)
+        except Exception:
+            # none of the runs have been launched, so all of them are failed
+            error_info = serializable_error_info_from_exc_info(sys.exc_info())
+            for run in runs_to_dequeue:
+                yield self._report_dequeue_error(instance, run, error_info)
+            return
 
-                message = (
-                    f"Caught an error for run {run.run_id} while removing it from the queue."
-                    " Marking the run as failed and dropping it from the queue"
-                )
-                message_with_full_error = f"{message}: {error_info.to_string()}"
+        num_dequeued_runs = 0
+        for run in runs_to_dequeue:
+            error_info = errors.get(run.run_id)
 
-                self._logger.error(message_with_full_error)
-                instance.report_run_failed(run, message_with_full_error)
+            if error_info:
+                message = f"Caught an error for run {run.run_id} while launching it"
+                self._logger.error(f"{message}: {error_info.to_string()}")
 
                 # modify the original error, so that the extra message appears in heartbeats
                 error_info = error_info._replace(message=f"{message}: {error_info.message}")
 
             else:
-                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
                 num_dequeued_runs += 1
 
             yield error_info
 
         self._logger.info("Launched {} runs.".format(num_dequeued_runs))
 
+    def _choose_runs_to_dequeue(
+        self, instance, sorted_runs, in_progress_runs, tag_concurrency_limits, max_runs_to_launch
+    ):
+        """Chooses the runs to launch, in order, until blocked by limit rules.
+
+        The chosen runs are checked to still be queued in a single query. If any of them aren't,
+        the rest of the runs are chosen again without counting them against the limits.
+        """
+        runs_to_dequeue = []
+        candidate_runs = sorted_runs
+
+        while candidate_runs and len(runs_to_dequeue) < max_runs_to_launch:
+            tag_concurrency_limits_counter = _TagConcurrencyLimitsCounter(
+                tag_concurrency_limits, in_progress_runs + runs_to_dequeue
+            )
+
+            chosen_runs = []
+            for run in candidate_runs:
+                if len(runs_to_dequeue) + len(chosen_runs) >= max_runs_to_launch:
+                    break
+
+                if tag_concurrency_limits_counter.is_run_blocked(run):
+                    continue
+
+                tag_concurrency_limits_counter.update_counters_with_launched_run(run)
+                chosen_runs.append(run)
+
+            if not chosen_runs:
+                break
+
+            # double check that the runs are still queued before dequeing
+            reloaded_runs_by_id = {
+                run.run_id: run
+                for run in instance.get_runs(
+                    filters=PipelineRunsFilter(run_ids=[run.run_id for run in chosen_runs])
+                )
+            }
+            has_skipped_runs = False
+            for run in chosen_runs:
+                reloaded_run = reloaded_runs_by_id.get(run.run_id)
+                if reloaded_run and reloaded_run.status == PipelineRunStatus.QUEUED:
+                    runs_to_dequeue.append(reloaded_run)
+                    continue
+
+                self._logger.info(
+                    "Run {run_id} is now {status} instead of QUEUED, skipping".format(
+                        run_id=run.run_id,
+                        status=reloaded_run.status if reloaded_run else "deleted",
+                    )
+                )
+                has_skipped_runs = True
+
+            if not has_skipped_runs:
+                break
+
+            chosen_run_ids = {run.run_id for run in chosen_runs}
+            candidate_runs = [run for run in candidate_runs if run.run_id not in chosen_run_ids]
+
+        return runs_to_dequeue
+
     def _get_queued_runs(self, instance):
         queued_runs_filter = PipelineRunsFilter(statuses=[PipelineRunStatus.QUEUED])
 
@@ -195,32 +253,33 @@ def get_priority(run):
         # sorted is stable, so fifo is maintained
         return sorted(runs, key=get_priority, reverse=True)
 
-    def _dequeue_run(self, instance, run, workspace):
-        # double check that the run is still queued before dequeing
-        reloaded_run = instance.get_run_by_id(run.run_id)
+    def _report_dequeue_error(self, instance, run, error_info):
+        message = (
+            f"Caught an error for run {run.run_id} while removing it from the queue."
+            " Marking the run as failed and dropping it from the queue"
+        )
+        message_with_full_error = f"{message}: {error_info.to_string()}"
 
-        if reloaded_run.status != PipelineRunStatus.QUEUED:
-            self._logger.info(
-                "Run {run_id} is now {status} instead of QUEUED, skipping".format(
-                    run_id=reloaded_run.run_id, status=reloaded_run.status
-                )
-            )
-            return
+        self._logger.error(message_with_full_error)
+        instance.report_run_failed(run, message_with_full_error)
 
-        dequeued_event = DagsterEvent(
-            event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
-            pipeline_name=run.pipeline_name,
-        )
-        event_record = EventLogEntry(
-            message="",
-            user_message="",
-            level=logging.INFO,
-            pipeline_name=run.pipeline_name,
-            run_id=run.run_id,
-            error_info=None,
-            timestamp=time.time(),
-            dagster_event=dequeued_event,
-        )
-        instance.handle_new_event(event_record)
+        # modify the original error, so that the extra message appears in heartbeats
+        return error_info._replace(message=f"{message}: {error_info.message}")
 
-        instance.launch_run(run.run_id, workspace)
+    def _dequeue_runs(self, instance, runs):
+        for run in runs:
+            dequeued_event = DagsterEvent(
+                event_type_value=DagsterEventType.PIPELINE_DEQUEUED.value,
+                pipeline_name=run.pipeline_name,
+            )
+            event_record = EventLogEntry(
+                message="",
+                user_message="",
+                level=logging.INFO,
+                pipeline_name=run.pipeline_name,
+                run_id=run.run_id,
+                error_info=None,
+                timestamp=time.time(),
+                dagster_event=dequeued_event,
+            )
+            instance.handle_new_event(event_record)
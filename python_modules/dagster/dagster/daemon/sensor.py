@@ -16,7 +16,7 @@
     TickData,
     TickStatus,
 )
-from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus, PipelineRunsFilter
+from dagster.core.storage.pipeline_run import PipelineRun, PipelineRunStatus
 from dagster.core.storage.tags import RUN_KEY_TAG, check_tags
 from dagster.core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster.core.workspace import IWorkspace
@@ -28,6 +28,11 @@
 
 MIN_INTERVAL_LOOP_TIME = 5
 
+# The number of run requests in each batch that a sensor evaluation is split into. The runs for
+# each batch are deduped, created and launched together, and the cursor of the sensor is
+# checkpointed after each batch that the code server marks as safe to checkpoint.
+SENSOR_RUN_REQUEST_BATCH_SIZE = 1000
+
 
 class DagsterSensorDaemonError(DagsterError):
     """Error when running the SensorDaemon"""
@@ -87,26 +92,41 @@ def update_state(self, status, **kwargs):
     def add_run(self, run_id, run_key=None):
         self._tick = self._tick.with_run(run_id, run_key)
 
+    def checkpoint(self, cursor):
+        """Persists the runs launched so far and the given cursor, without completing the tick."""
+        self.update_state(None, cursor=cursor)
+        self._instance.update_job_tick(self._tick)
+
+        # keep the timestamp of the last completed tick, so that the min interval of the sensor is
+        # still measured from it
+        self._write_job_state(
+            self._job_state.job_specific_data.last_tick_timestamp
+            if self._job_state.job_specific_data
+            else None
+        )
+
     def _write(self):
         self._instance.update_job_tick(self._tick)
         if self._tick.status in FULFILLED_TICK_STATES:
-            last_run_key = (
-                self._job_state.job_specific_data.last_run_key
-                if self._job_state.job_specific_data
-                else None
-            )
-            if self._tick.run_keys:
-                last_run_key = self._tick.run_keys[-1]
-            self._instance.update_job_state(
-                self._job_state.with_data(
-                    SensorInstigatorData(
-                        last_tick_timestamp=self._tick.timestamp,
-                        last_run_key=last_run_key,
-                        min_interval=self._external_sensor.min_interval_seconds,
-                        cursor=self._tick.cursor,
-                    )
-                )
+            self._write_job_state(self._tick.timestamp)
+
+    def _write_job_state(self, last_tick_timestamp):
+        last_run_key = (
+            self._job_state.job_specific_data.last_run_key
+            if self._job_state.job_specific_data
+            else None
+        )
+        if self._tick.run_keys:
+            last_run_key = self._tick.run_keys[-1]
+        self._job_state = self._job_state.with_data(
+            SensorInstigatorData(
+                last_tick_timestamp=last_tick_timestamp,
+                last_run_key=last_run_key,
+                min_interval=self._external_sensor.min_interval_seconds,
+                cursor=self._tick.cursor,
             )
+        )
+        self._instance.update_job_state(self._job_state)
 
     def __enter__(self):
         return self
@@ -266,86 +286,149 @@ def _evaluate_sensor(
     sensor_debug_crash_flags=None,
 ):
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
-    sensor_runtime_data = repo_location.get_external_sensor_execution_data(
+    sensor_runtime_data_batches = repo_location.get_external_sensor_execution_data_batches(
         instance,
         external_repo.handle,
         external_sensor.name,
         job_state.job_specific_data.last_tick_timestamp if job_state.job_specific_data else None,
         job_state.job_specific_data.last_run_key if job_state.job_specific_data else None,
         job_state.job_specific_data.cursor if job_state.job_specific_data else None,
+        SENSOR_RUN_REQUEST_BATCH_SIZE,
     )
 
-    yield
-
-    assert isinstance(sensor_runtime_data, SensorExecutionData)
-    if not sensor_runtime_data.run_requests:
-        if sensor_runtime_data.pipeline_run_reactions:
-            for pipeline_run_reaction in sensor_runtime_data.pipeline_run_reactions:
-                origin_run_id = pipeline_run_reaction.pipeline_run.run_id
-                if pipeline_run_reaction.error:
-                    context.logger.error(
-                        f"Got a reaction request for run {origin_run_id} but execution errorred: {pipeline_run_reaction.error}"
-                    )
-                    context.update_state(
-                        TickStatus.FAILURE,
-                        cursor=sensor_runtime_data.cursor,
-                        error=pipeline_run_reaction.error,
-                    )
-                else:
-                    # log to the original pipeline run
-                    message = (
-                        f'Sensor "{external_sensor.name}" acted on run status '
-                        f"{pipeline_run_reaction.pipeline_run.status.value} of run {origin_run_id}."
-                    )
-                    instance.report_engine_event(
-                        message=message, pipeline_run=pipeline_run_reaction.pipeline_run
-                    )
-                    context.logger.info(
-                        f"Completed a reaction request for run {origin_run_id}: {message}"
-                    )
-                    context.update_state(
-                        TickStatus.SUCCESS,
-                        cursor=sensor_runtime_data.cursor,
-                        origin_run_id=origin_run_id,
-                    )
-        elif sensor_runtime_data.skip_message:
-            context.logger.info(
-                f"Sensor {external_sensor.name} skipped: {sensor_runtime_data.skip_message}"
-            )
-            context.update_state(
-                TickStatus.SKIPPED,
-                skip_reason=sensor_runtime_data.skip_message,
-                cursor=sensor_runtime_data.cursor,
-            )
-        else:
-            context.logger.info(f"No run requests returned for {external_sensor.name}, skipping")
-            context.update_state(TickStatus.SKIPPED, cursor=sensor_runtime_data.cursor)
-
-        yield
-        return
-
     skipped_runs = []
-    for run_request in sensor_runtime_data.run_requests:
+    external_pipelines_by_job_name = {}
+    execution_plan_snapshots = {}
+    cursor = None
+    for sensor_runtime_data in sensor_runtime_data_batches:
+        yield
 
-        target_data = external_sensor.get_target_data(run_request.job_name)
+        assert isinstance(sensor_runtime_data, SensorExecutionData)
+        cursor = sensor_runtime_data.cursor
+        if not sensor_runtime_data.run_requests:
+            _handle_sensor_without_run_requests(
+                context, instance, external_sensor, sensor_runtime_data
+            )
+            yield
+            return
 
-        pipeline_selector = PipelineSelector(
-            location_name=repo_location.name,
-            repository_name=external_repo.name,
-            pipeline_name=target_data.pipeline_name,
-            solid_selection=target_data.solid_selection,
-        )
-        external_pipeline = repo_location.get_external_pipeline(pipeline_selector)
-        run = _get_or_create_sensor_run(
+        yield from _launch_sensor_runs(
             context,
             instance,
+            workspace,
             repo_location,
+            external_repo,
             external_sensor,
-            external_pipeline,
-            run_request,
-            target_data,
+            sensor_runtime_data.run_requests,
+            external_pipelines_by_job_name,
+            execution_plan_snapshots,
+            skipped_runs,
+            sensor_debug_crash_flags,
+        )
+
+        # persist the progress of the sensor, so that a later tick resumes after this batch if
+        # the daemon is interrupted before the sensor finishes. The cursor of a batch that isn't
+        # safe to checkpoint may already account for the run requests of later batches.
+        if sensor_runtime_data.safe_to_checkpoint:
+            context.checkpoint(cursor)
+
+    if skipped_runs:
+        run_keys = [skipped.run_key for skipped in skipped_runs]
+        skipped_count = len(skipped_runs)
+        context.logger.info(
+            f"Skipping {skipped_count} {'run' if skipped_count == 1 else 'runs'} for sensor "
+            f"{external_sensor.name} already completed with run keys: {seven.json.dumps(run_keys)}"
         )
 
+    if context.run_count:
+        context.update_state(TickStatus.SUCCESS, cursor=cursor)
+    else:
+        context.update_state(TickStatus.SKIPPED, cursor=cursor)
+
+    yield
+
+
+def _handle_sensor_without_run_requests(context, instance, external_sensor, sensor_runtime_data):
+    if sensor_runtime_data.pipeline_run_reactions:
+        for pipeline_run_reaction in sensor_runtime_data.pipeline_run_reactions:
+            origin_run_id = pipeline_run_reaction.pipeline_run.run_id
+            if pipeline_run_reaction.error:
+                context.logger.error(
+                    f"Got a reaction request for run {origin_run_id} but execution errorred: {pipeline_run_reaction.error}"
+                )
+                context.update_state(
+                    TickStatus.FAILURE,
+                    cursor=sensor_runtime_data.cursor,
+                    error=pipeline_run_reaction.error,
+                )
+            else:
+                # log to the original pipeline run
+                message = (
+                    f'Sensor "{external_sensor.name}" acted on run status '
+                    f"{pipeline_run_reaction.pipeline_run.status.value} of run {origin_run_id}."
+                )
+                instance.report_engine_event(
+                    message=message, pipeline_run=pipeline_run_reaction.pipeline_run
+                )
+                context.logger.info(
+                    f"Completed a reaction request for run {origin_run_id}: {message}"
+                )
+                context.update_state(
+                    TickStatus.SUCCESS,
+                    cursor=sensor_runtime_data.cursor,
+                    origin_run_id=origin_run_id,
+                )
+    elif sensor_runtime_data.skip_message:
+        context.logger.info(
+            f"Sensor {external_sensor.name} skipped: {sensor_runtime_data.skip_message}"
+        )
+        context.update_state(
+            TickStatus.SKIPPED,
+            skip_reason=sensor_runtime_data.skip_message,
+            cursor=sensor_runtime_data.cursor,
+        )
+    else:
+        context.logger.info(f"No run requests returned for {external_sensor.name}, skipping")
+        context.update_state(TickStatus.SKIPPED, cursor=sensor_runtime_data.cursor)
+
+
+def _launch_sensor_runs(
+    context,
+    instance,
+    workspace,
+    repo_location,
+    external_repo,
+    external_sensor,
+    run_requests,
+    external_pipelines_by_job_name,
+    execution_plan_snapshots,
+    skipped_runs,
+    sensor_debug_crash_flags,
+):
+    for run_request in run_requests:
+        if run_request.job_name not in external_pipelines_by_job_name:
+            target_data = external_sensor.get_target_data(run_request.job_name)
+            pipeline_selector = PipelineSelector(
+                location_name=repo_location.name,
+                repository_name=external_repo.name,
+                pipeline_name=target_data.pipeline_name,
+                solid_selection=target_data.solid_selection,
+            )
+            external_pipelines_by_job_name[
+                run_request.job_name
+            ] = repo_location.get_external_pipeline(pipeline_selector)
+
+    runs = _get_or_create_sensor_runs(
+        context,
+        instance,
+        repo_location,
+        external_sensor,
+        external_pipelines_by_job_name,
+        execution_plan_snapshots,
+        run_requests,
+    )
+
+    for run_request, run in zip(run_requests, runs):
         if isinstance(run, SkippedSensorRun):
             skipped_runs.append(run)
             yield
@@ -377,21 +460,6 @@ def _evaluate_sensor(
 
         context.add_run(run_id=run.run_id, run_key=run_request.run_key)
 
-    if skipped_runs:
-        run_keys = [skipped.run_key for skipped in skipped_runs]
-        skipped_count = len(skipped_runs)
-        context.logger.info(
-            f"Skipping {skipped_count} {'run' if skipped_count == 1 else 'runs'} for sensor "
-            f"{external_sensor.name} already completed with run keys: {seven.json.dumps(run_keys)}"
-        )
-
-    if context.run_count:
-        context.update_state(TickStatus.SUCCESS, cursor=sensor_runtime_data.cursor)
-    else:
-        context.update_state(TickStatus.SKIPPED, cursor=sensor_runtime_data.cursor)
-
-    yield
-
 
 def _is_under_min_interval(job_state, now):
     if not job_state.job_specific_data:
@@ -407,60 +475,100 @@ def _is_under_min_interval(job_state, now):
     return elapsed < job_state.job_specific_data.min_interval
 
 
-def _get_or_create_sensor_run(
-    context, instance, repo_location, external_sensor, external_pipeline, run_request, target_data
+def _get_or_create_sensor_runs(
+    context,
+    instance,
+    repo_location,
+    external_sensor,
+    external_pipelines_by_job_name,
+    execution_plan_snapshots,
+    run_requests,
 ):
+    # Returns a run or a SkippedSensorRun for each of the run requests, deduping the run keys
+    # against the existing runs of the sensor in a single query and creating the new runs in a
+    # single write
+    existing_runs_by_run_key = instance.get_latest_runs_by_run_key(
+        list({run_request.run_key for run_request in run_requests if run_request.run_key}),
+        tags=PipelineRun.tags_for_sensor(external_sensor),
+    )
 
-    if not run_request.run_key:
-        return _create_sensor_run(
-            instance, repo_location, external_sensor, external_pipeline, run_request, target_data
-        )
-
-    existing_runs = instance.get_runs(
-        PipelineRunsFilter(
-            tags=merge_dicts(
-                PipelineRun.tags_for_sensor(external_sensor),
-                {RUN_KEY_TAG: run_request.run_key},
+    runs = []
+    new_run_kwargs_list = []
+    new_run_indices = []
+    requested_run_keys = set()
+    for run_request in run_requests:
+        if run_request.run_key and run_request.run_key in requested_run_keys:
+            context.logger.info(
+                f"Skipping run for {run_request.run_key}, it was already requested by this tick."
             )
-        )
-    )
+            runs.append(SkippedSensorRun(run_key=run_request.run_key, existing_run=None))
+            continue
 
-    if len(existing_runs):
-        run = existing_runs[0]
-        if run.status != PipelineRunStatus.NOT_STARTED:
+        if run_request.run_key:
+            requested_run_keys.add(run_request.run_key)
+
+        existing_run = existing_runs_by_run_key.get(run_request.run_key)
+        if existing_run and existing_run.status != PipelineRunStatus.NOT_STARTED:
             # A run already exists and was launched for this time period,
             # but the scheduler must have crashed before the tick could be put
             # into a SUCCESS state
-            context.logger.info(f"Skipping run for {run_request.run_key}, found {run.run_id}.")
-            return SkippedSensorRun(run_key=run_request.run_key, existing_run=run)
-        else:
             context.logger.info(
-                f"Run {run.run_id} already created with the run key "
+                f"Skipping run for {run_request.run_key}, found {existing_run.run_id}."
+            )
+            runs.append(SkippedSensorRun(run_key=run_request.run_key, existing_run=existing_run))
+        elif existing_run:
+            context.logger.info(
+                f"Run {existing_run.run_id} already created with the run key "
                 f"`{run_request.run_key}` for {external_sensor.name}"
             )
-            return run
+            runs.append(existing_run)
+        else:
+            context.logger.info(f"Creating new run for {external_sensor.name}")
+            new_run_indices.append(len(runs))
+            new_run_kwargs_list.append(
+                _get_sensor_run_kwargs(
+                    instance,
+                    repo_location,
+                    external_sensor,
+                    external_pipelines_by_job_name[run_request.job_name],
+                    execution_plan_snapshots,
+                    run_request,
+                )
+            )
+            runs.append(None)
 
-    context.logger.info(f"Creating new run for {external_sensor.name}")
+    if new_run_kwargs_list:
+        for index, run in zip(new_run_indices, instance.create_runs(new_run_kwargs_list)):
+            runs[index] = run
 
-    return _create_sensor_run(
-        instance, repo_location, external_sensor, external_pipeline, run_request, target_data
-    )
+    return runs
 
 
-def _create_sensor_run(
-    instance, repo_location, external_sensor, external_pipeline, run_request, target_data
+def _get_sensor_run_kwargs(
+    instance,
+    repo_location,
+    external_sensor,
+    external_pipeline,
+    execution_plan_snapshots,
+    run_request,
 ):
     from dagster.daemon.daemon import get_telemetry_daemon_session_id
 
-    external_execution_plan = repo_location.get_external_execution_plan(
-        external_pipeline,
-        run_request.run_config,
-        target_data.mode,
-        step_keys_to_execute=None,
-        known_state=None,
-        instance=instance,
-    )
-    execution_plan_snapshot = external_execution_plan.execution_plan_snapshot
+    target_data = external_sensor.get_target_data(run_request.job_name)
+
+    # sensors often request many runs with the same config, whose execution plans are the same, so
+    # each plan is only fetched from the repository location once per tick
+    plan_key = (run_request.job_name, seven.json.dumps(run_request.run_config, sort_keys=True))
+    if plan_key not in execution_plan_snapshots:
+        execution_plan_snapshots[plan_key] = repo_location.get_external_execution_plan(
+            external_pipeline,
+            run_request.run_config,
+            target_data.mode,
+            step_keys_to_execute=None,
+            known_state=None,
+            instance=instance,
+        ).execution_plan_snapshot
+    execution_plan_snapshot = execution_plan_snapshots[plan_key]
 
     pipeline_tags = external_pipeline.tags or {}
     check_tags(pipeline_tags, "pipeline_tags")
@@ -482,7 +590,7 @@ def _create_sensor_run(
         },
     )
 
-    return instance.create_run(
+    return dict(
         pipeline_name=target_data.pipeline_name,
         run_id=None,
         run_config=run_request.run_config,
@@ -127,6 +127,11 @@ def __init__(self, channel):
             request_serializer=api__pb2.Empty.SerializeToString,
             response_deserializer=api__pb2.GetCurrentImageReply.FromString,
         )
+        self.GetServerMetrics = channel.unary_unary(
+            "/api.DagsterApi/GetServerMetrics",
+            request_serializer=api__pb2.Empty.SerializeToString,
+            response_deserializer=api__pb2.GetServerMetricsReply.FromString,
+        )
 
 
 class DagsterApiServicer(object):
@@ -258,6 +263,12 @@ def GetCurrentImage(self, request, context):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def GetServerMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_DagsterApiServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -366,6 +377,11 @@ def add_DagsterApiServicer_to_server(servicer, server):
             request_deserializer=api__pb2.Empty.FromString,
             response_serializer=api__pb2.GetCurrentImageReply.SerializeToString,
         ),
+        "GetServerMetrics": grpc.unary_unary_rpc_method_handler(
+            servicer.GetServerMetrics,
+            request_deserializer=api__pb2.Empty.FromString,
+            response_serializer=api__pb2.GetServerMetricsReply.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("api.DagsterApi", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -983,3 +999,32 @@ def GetCurrentImage(
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def GetServerMetrics(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/api.DagsterApi/GetServerMetrics",
+            api__pb2.Empty.SerializeToString,
+            api__pb2.GetServerMetricsReply.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
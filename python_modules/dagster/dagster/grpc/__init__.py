@@ -8,5 +8,20 @@
 drive web frontends like dagit.
 """
 
-from .client import DagsterGrpcClient, ephemeral_grpc_api_client
-from .server import DagsterGrpcServer
+from typing import TYPE_CHECKING
+
+from dagster.utils.deferred_imports import deferred_imports
+
+# The client and server import grpc and the generated protobuf code, so they are only imported
+# when first accessed, letting processes that only need e.g. dagster.grpc.types skip that cost.
+_DEFERRED_IMPORTS = {
+    "DagsterGrpcClient": "dagster.grpc.client",
+    "ephemeral_grpc_api_client": "dagster.grpc.client",
+    "DagsterGrpcServer": "dagster.grpc.server",
+}
+
+if TYPE_CHECKING:
+    from .client import DagsterGrpcClient, ephemeral_grpc_api_client
+    from .server import DagsterGrpcServer
+
+__getattr__, __dir__ = deferred_imports(__name__, _DEFERRED_IMPORTS)
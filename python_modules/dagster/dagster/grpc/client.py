@@ -302,6 +302,41 @@ def external_sensor_execution(self, sensor_execution_args, timeout=DEFAULT_GRPC_
 
         return "".join([chunk.serialized_chunk for chunk in chunks])
 
+    def external_sensor_execution_batches(
+        self, sensor_execution_args, timeout=DEFAULT_GRPC_TIMEOUT
+    ):
+        """Yields the serialized batches of a sensor evaluation, as requested by the
+        ``run_request_batch_size`` of the args, as each batch is received.
+
+        The stream stays open until the last batch is consumed, so callers that do slow work
+        between batches should read all of the batches first. Servers that don't support batches
+        send a single serialized result, which is yielded as the only batch.
+        """
+        check.inst_param(
+            sensor_execution_args,
+            "sensor_execution_args",
+            SensorExecutionArgs,
+        )
+
+        serialized_chunks = []
+        for chunk in self._streaming_query(
+            "ExternalSensorExecution",
+            api_pb2.ExternalSensorExecutionRequest,
+            timeout=timeout,
+            serialized_external_sensor_execution_args=serialize_dagster_namedtuple(
+                sensor_execution_args
+            ),
+        ):
+            # the chunks of each batch are numbered from 0, so a new batch starts once the previous
+            # one is complete
+            if chunk.sequence_number == 0 and serialized_chunks:
+                yield "".join(serialized_chunks)
+                serialized_chunks = []
+            serialized_chunks.append(chunk.serialized_chunk)
+
+        if serialized_chunks:
+            yield "".join(serialized_chunks)
+
     def external_notebook_data(self, notebook_path):
         check.str_param(notebook_path, "notebook_path")
         res = self._query(
@@ -377,6 +412,10 @@ def get_current_image(self):
         res = self._query("GetCurrentImage", api_pb2.Empty)
         return res.serialized_current_image
 
+    def get_server_metrics(self):
+        res = self._query("GetServerMetrics", api_pb2.Empty)
+        return res.serialized_server_metrics
+
     def health_check_query(self):
         try:
             with self._channel() as channel:
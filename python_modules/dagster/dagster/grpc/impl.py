@@ -280,6 +280,53 @@ def get_external_sensor_execution(
             )
 
 
+def get_external_sensor_execution_batches(
+    recon_repo,
+    instance_ref,
+    sensor_name,
+    last_completion_timestamp,
+    last_run_key,
+    cursor,
+    run_request_batch_size,
+):
+    check.inst_param(
+        recon_repo,
+        "recon_repo",
+        ReconstructableRepository,
+    )
+    check.int_param(run_request_batch_size, "run_request_batch_size")
+
+    definition = recon_repo.get_definition()
+    sensor_def = definition.get_sensor_def(sensor_name)
+
+    with SensorEvaluationContext(
+        instance_ref,
+        last_completion_time=last_completion_timestamp,
+        last_run_key=last_run_key,
+        cursor=cursor,
+        repository_name=recon_repo.get_definition().name,
+    ) as sensor_context:
+        batches = sensor_def.evaluate_tick_in_batches(sensor_context, run_request_batch_size)
+        while True:
+            try:
+                with user_code_error_boundary(
+                    SensorExecutionError,
+                    lambda: "Error occurred during the execution of evaluation_fn for sensor "
+                    "{sensor_name}".format(sensor_name=sensor_def.name),
+                ):
+                    batch = next(batches, None)
+            except SensorExecutionError:
+                yield ExternalSensorExecutionErrorData(
+                    serializable_error_info_from_exc_info(sys.exc_info())
+                )
+                return
+
+            if batch is None:
+                return
+
+            yield batch
+
+
 def get_partition_config(recon_repo, partition_set_name, partition_name):
     definition = recon_repo.get_definition()
     partition_set_def = definition.get_partition_set_def(partition_set_name)
@@ -0,0 +1,102 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, List, Sequence
+
+from dagster import check
+
+from .types import RpcLatencyHistogram
+
+# Upper bounds (in seconds) of the latency buckets that RPC calls are sorted into
+DEFAULT_RPC_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+class _MethodLatencies:
+    def __init__(self, num_buckets: int):
+        self.bucket_counts: List[int] = [0] * num_buckets
+        self.count = 0
+        self.error_count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+
+class RpcMetricsRecorder:
+    """Thread-safe recorder of per-method latency histograms and in-flight counts for the RPCs
+    served by a DagsterApiServer."""
+
+    def __init__(self, bucket_upper_bounds: Sequence[float] = DEFAULT_RPC_LATENCY_BUCKETS):
+        self._bucket_upper_bounds = [float(bound) for bound in bucket_upper_bounds]
+        check.invariant(
+            len(self._bucket_upper_bounds) > 0
+            and self._bucket_upper_bounds == sorted(self._bucket_upper_bounds),
+            "bucket_upper_bounds must be a non-empty sorted sequence",
+        )
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, _MethodLatencies] = {}
+        self._in_flight: Dict[str, int] = defaultdict(int)
+
+    @contextmanager
+    def record(self, method_name: str):
+        with self._lock:
+            self._in_flight[method_name] += 1
+
+        start_time = time.time()
+        failed = False
+        try:
+            yield
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._add_sample(method_name, time.time() - start_time, failed)
+
+    def _add_sample(self, method_name: str, elapsed_seconds: float, failed: bool):
+        bucket_index = bisect.bisect_left(self._bucket_upper_bounds, elapsed_seconds)
+        with self._lock:
+            self._in_flight[method_name] -= 1
+
+            latencies = self._latencies.get(method_name)
+            if not latencies:
+                latencies = _MethodLatencies(len(self._bucket_upper_bounds) + 1)
+                self._latencies[method_name] = latencies
+
+            latencies.bucket_counts[bucket_index] += 1
+            latencies.count += 1
+            latencies.total_seconds += elapsed_seconds
+            latencies.max_seconds = max(latencies.max_seconds, elapsed_seconds)
+            if failed:
+                latencies.error_count += 1
+
+    def get_latency_histograms(self) -> Dict[str, RpcLatencyHistogram]:
+        with self._lock:
+            return {
+                method_name: RpcLatencyHistogram(
+                    bucket_upper_bounds=list(self._bucket_upper_bounds),
+                    bucket_counts=list(latencies.bucket_counts),
+                    count=latencies.count,
+                    error_count=latencies.error_count,
+                    total_seconds=latencies.total_seconds,
+                    max_seconds=latencies.max_seconds,
+                )
+                for method_name, latencies in self._latencies.items()
+            }
+
+    def get_in_flight_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {method_name: count for method_name, count in self._in_flight.items() if count}
@@ -1,3 +1,4 @@
+import inspect
 import math
 import os
 import queue
@@ -43,6 +44,7 @@
     get_external_pipeline_subset_result,
     get_external_schedule_execution,
     get_external_sensor_execution,
+    get_external_sensor_execution_batches,
     get_notebook_data,
     get_partition_config,
     get_partition_names,
@@ -50,6 +52,7 @@
     get_partition_tags,
     start_run_in_subprocess,
 )
+from .metrics import RpcMetricsRecorder
 from .types import (
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
@@ -59,6 +62,7 @@
     ExecutionPlanSnapshotArgs,
     ExternalScheduleExecutionArgs,
     GetCurrentImageResult,
+    GrpcServerMetrics,
     ListRepositoriesResponse,
     LoadableRepositorySymbol,
     PartitionArgs,
@@ -70,6 +74,7 @@
     StartRunResult,
 )
 from .utils import get_loadable_targets, max_rx_bytes, max_send_bytes
+from .worker_pool import USER_CODE_RPC_METHODS, UserCodeWorkerPool
 
 EVENT_QUEUE_POLL_INTERVAL = 0.1
 
@@ -77,6 +82,28 @@
 
 STREAMING_CHUNK_SIZE = 4000000
 
+DAGSTER_API_RPC_METHODS = frozenset(
+    method.name for method in api_pb2.DESCRIPTOR.services_by_name["DagsterApi"].methods
+)
+
+# RPCs that clients use to check on the server itself rather than to run user code. They are
+# served from their own thread pool, so that slow sensors or partition functions occupying the
+# main pool can't delay heartbeats and cause the server to shut down.
+CONTROL_RPC_METHODS = frozenset(
+    [
+        "Ping",
+        "Heartbeat",
+        "GetServerId",
+        "GetCurrentImage",
+        "GetServerMetrics",
+        "ShutdownServer",
+        "CancelExecution",
+        "CanCancelExecution",
+    ]
+)
+
+DEFAULT_CONTROL_RPC_MAX_WORKERS = 4
+
 
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
@@ -238,6 +265,20 @@ def __init__(
 
         self.__cleanup_thread.start()
 
+        self._rpc_metrics = RpcMetricsRecorder()
+
+    @property
+    def rpc_metrics(self) -> RpcMetricsRecorder:
+        return self._rpc_metrics
+
+    @property
+    def entry_point(self):
+        return self._entry_point
+
+    @property
+    def serializable_load_error(self):
+        return self._serializable_load_error
+
     def cleanup(self):
         if self.__heartbeat_thread:
             self.__heartbeat_thread.join()
@@ -556,6 +597,25 @@ def ExternalSensorExecution(self, request, _context):
         check.inst_param(args, "args", SensorExecutionArgs)
 
         recon_repo = self._recon_repository_from_origin(args.repository_origin)
+
+        if args.run_request_batch_size is not None:
+            # each batch is streamed as its own serialized document, whose chunk sequence numbers
+            # start over at 0, so that the client can process a batch before the next one is
+            # evaluated
+            for sensor_data in get_external_sensor_execution_batches(
+                recon_repo,
+                args.instance_ref,
+                args.sensor_name,
+                args.last_completion_time,
+                args.last_run_key,
+                args.cursor,
+                args.run_request_batch_size,
+            ):
+                yield from self._split_serialized_data_into_chunk_events(
+                    serialize_dagster_namedtuple(sensor_data)
+                )
+            return
+
         serialized_sensor_data = serialize_dagster_namedtuple(
             get_external_sensor_execution(
                 recon_repo,
@@ -753,6 +813,74 @@ def GetCurrentImage(self, request, _context):
             )
         )
 
+    def GetServerMetrics(self, request, _context):
+        return api_pb2.GetServerMetricsReply(
+            serialized_server_metrics=serialize_dagster_namedtuple(
+                GrpcServerMetrics(
+                    server_id=self._server_id,
+                    rpc_latencies=self._rpc_metrics.get_latency_histograms(),
+                    rpcs_in_flight=self._rpc_metrics.get_in_flight_counts(),
+                )
+            )
+        )
+
+
+def _dispatch_rpc_methods_to_worker_pool(servicer, worker_pool):
+    for method_name in USER_CODE_RPC_METHODS:
+        setattr(
+            servicer,
+            method_name,
+            _worker_pool_rpc_method(
+                method_name,
+                worker_pool,
+                inspect.isgeneratorfunction(getattr(servicer, method_name)),
+            ),
+        )
+
+
+def _worker_pool_rpc_method(method_name, worker_pool, streaming):
+    if streaming:
+
+        def _streaming_rpc(request, _context):
+            yield from worker_pool.call(method_name, request)
+
+        return _streaming_rpc
+
+    def _unary_rpc(request, _context):
+        (reply,) = worker_pool.call(method_name, request)
+        return reply
+
+    return _unary_rpc
+
+
+def _instrument_rpc_methods(servicer, rpc_metrics, thread_pools_by_method):
+    # Replaces each RPC method on the servicer instance with a wrapper that records its latency.
+    # grpc serves a method from the thread pool set as `experimental_thread_pool` on its handler
+    # instead of the server's main pool, on grpcio versions that support it.
+    for method_name in DAGSTER_API_RPC_METHODS:
+        wrapped_method = _instrumented_rpc_method(
+            method_name, getattr(servicer, method_name), rpc_metrics
+        )
+        if method_name in thread_pools_by_method:
+            wrapped_method.experimental_thread_pool = thread_pools_by_method[method_name]
+        setattr(servicer, method_name, wrapped_method)
+
+
+def _instrumented_rpc_method(method_name, method, rpc_metrics):
+    if inspect.isgeneratorfunction(method):
+
+        def _streaming_rpc(request, context):
+            with rpc_metrics.record(method_name):
+                yield from method(request, context)
+
+        return _streaming_rpc
+
+    def _unary_rpc(request, context):
+        with rpc_metrics.record(method_name):
+            return method(request, context)
+
+    return _unary_rpc
+
 
 @whitelist_for_serdes
 class GrpcServerStartedEvent(namedtuple("GrpcServerStartedEvent", "")):
@@ -793,12 +921,32 @@ def __init__(
         ipc_output_file=None,
         fixed_server_id=None,
         entry_point=None,
+        control_max_workers=DEFAULT_CONTROL_RPC_MAX_WORKERS,
+        rpc_max_workers=None,
+        num_worker_processes=None,
     ):
         check.opt_str_param(host, "host")
         check.opt_int_param(port, "port")
         check.opt_str_param(socket, "socket")
         check.opt_int_param(max_workers, "max_workers")
+        check.int_param(control_max_workers, "control_max_workers")
+        check.invariant(control_max_workers > 0, "control_max_workers must be greater than 0")
+        rpc_max_workers = check.opt_dict_param(
+            rpc_max_workers, "rpc_max_workers", key_type=str, value_type=int
+        )
+        for method_name, method_max_workers in rpc_max_workers.items():
+            check.invariant(
+                method_name in DAGSTER_API_RPC_METHODS, f"Unknown RPC method {method_name}"
+            )
+            check.invariant(
+                method_max_workers > 0, f"Max workers for RPC method {method_name} must be positive"
+            )
         check.opt_inst_param(loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin)
+        check.opt_int_param(num_worker_processes, "num_worker_processes")
+        check.invariant(
+            num_worker_processes is None or num_worker_processes > 0,
+            "num_worker_processes must be greater than 0",
+        )
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
             "You must pass a valid `port` on Windows: `socket` not supported.",
@@ -833,6 +981,19 @@ def __init__(
         )
         self._server_termination_event = threading.Event()
 
+        # Control RPCs share one pool, and RPC methods with their own concurrency limit each get a
+        # dedicated pool. Every other RPC is served from the server's main pool.
+        control_thread_pool = ThreadPoolExecutor(
+            max_workers=control_max_workers, thread_name_prefix="grpc-server-control-rpc"
+        )
+        self._rpc_thread_pools = {
+            method_name: control_thread_pool for method_name in CONTROL_RPC_METHODS
+        }
+        for method_name, method_max_workers in rpc_max_workers.items():
+            self._rpc_thread_pools[method_name] = ThreadPoolExecutor(
+                max_workers=method_max_workers, thread_name_prefix=f"grpc-server-{method_name}"
+            )
+
         try:
             self._api_servicer = DagsterApiServer(
                 server_termination_event=self._server_termination_event,
@@ -843,6 +1004,21 @@ def __init__(
                 fixed_server_id=fixed_server_id,
                 entry_point=entry_point,
             )
+
+            # User code RPCs are handed off to worker processes that each have the repositories
+            # loaded, so that CPU-bound user code isn't serialized by this process's GIL. If the
+            # user code failed to load, every RPC reports the load error from this process instead.
+            self._worker_pool = (
+                UserCodeWorkerPool(
+                    loadable_target_origin=loadable_target_origin,
+                    entry_point=self._api_servicer.entry_point,
+                    num_workers=num_worker_processes,
+                )
+                if num_worker_processes
+                and loadable_target_origin
+                and not self._api_servicer.serializable_load_error
+                else None
+            )
         except Exception:
             if self._ipc_output_file:
                 with ipc_write_stream(self._ipc_output_file) as ipc_stream:
@@ -857,6 +1033,11 @@ def __init__(
         self._health_servicer = health.HealthServicer()
         health_pb2_grpc.add_HealthServicer_to_server(self._health_servicer, self.server)
 
+        if self._worker_pool:
+            _dispatch_rpc_methods_to_worker_pool(self._api_servicer, self._worker_pool)
+        _instrument_rpc_methods(
+            self._api_servicer, self._api_servicer.rpc_metrics, self._rpc_thread_pools
+        )
         add_DagsterApiServicer_to_server(self._api_servicer, self.server)
 
         if port:
@@ -929,6 +1110,12 @@ def serve(self):
 
         self._api_servicer.cleanup()
 
+        for thread_pool in set(self._rpc_thread_pools.values()):
+            thread_pool.shutdown(wait=False)
+
+        if self._worker_pool:
+            self._worker_pool.shutdown()
+
 
 class CouldNotStartServerProcess(Exception):
     def __init__(self, port=None, socket=None):
@@ -976,10 +1163,12 @@ def open_server_process(
     heartbeat_timeout=30,
     fixed_server_id=None,
     startup_timeout=20,
+    num_worker_processes=None,
 ):
     check.invariant((port or socket) and not (port and socket), "Set only port or socket")
     check.opt_inst_param(loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin)
     check.opt_int_param(max_workers, "max_workers")
+    check.opt_int_param(num_worker_processes, "num_worker_processes")
 
     from dagster.core.test_utils import get_mocked_system_timezone
 
@@ -998,6 +1187,7 @@ def open_server_process(
         + (["--port", str(port)] if port else [])
         + (["--socket", socket] if socket else [])
         + (["-n", str(max_workers)] if max_workers else [])
+        + (["--num-worker-processes", str(num_worker_processes)] if num_worker_processes else [])
         + (["--heartbeat"] if heartbeat else [])
         + (["--heartbeat-timeout", str(heartbeat_timeout)] if heartbeat_timeout else [])
         + (["--fixed-server-id", fixed_server_id] if fixed_server_id else [])
@@ -1037,6 +1227,7 @@ def open_server_process_on_dynamic_port(
     heartbeat_timeout=30,
     fixed_server_id=None,
     startup_timeout=20,
+    num_worker_processes=None,
 ):
     server_process = None
     retries = 0
@@ -1052,6 +1243,7 @@ def open_server_process_on_dynamic_port(
                 heartbeat_timeout=heartbeat_timeout,
                 fixed_server_id=fixed_server_id,
                 startup_timeout=startup_timeout,
+                num_worker_processes=num_worker_processes,
             )
         except CouldNotBindGrpcServerToAddress:
             pass
@@ -1072,6 +1264,7 @@ def __init__(
         heartbeat_timeout=30,
         fixed_server_id=None,
         startup_timeout=20,
+        num_worker_processes=None,
     ):
         self.port = None
         self.socket = None
@@ -1088,6 +1281,7 @@ def __init__(
         check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
         check.opt_str_param(fixed_server_id, "fixed_server_id")
         check.int_param(startup_timeout, "startup_timeout")
+        check.opt_int_param(num_worker_processes, "num_worker_processes")
         check.invariant(
             max_workers is None or max_workers > 1 if heartbeat else True,
             "max_workers must be greater than 1 or set to None if heartbeat is True. "
@@ -1103,6 +1297,7 @@ def __init__(
                 heartbeat_timeout=heartbeat_timeout,
                 fixed_server_id=fixed_server_id,
                 startup_timeout=startup_timeout,
+                num_worker_processes=num_worker_processes,
             )
         else:
             self.socket = safe_tempfile_path_unmanaged()
@@ -1116,6 +1311,7 @@ def __init__(
                 heartbeat_timeout=heartbeat_timeout,
                 fixed_server_id=fixed_server_id,
                 startup_timeout=startup_timeout,
+                num_worker_processes=num_worker_processes,
             )
 
         if self.server_process is None:
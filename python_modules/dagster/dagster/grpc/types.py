@@ -344,7 +344,8 @@ def __new__(
 class SensorExecutionArgs(
     namedtuple(
         "_SensorExecutionArgs",
-        "repository_origin instance_ref sensor_name last_completion_time last_run_key cursor",
+        "repository_origin instance_ref sensor_name last_completion_time last_run_key cursor "
+        "run_request_batch_size",
     )
 ):
     def __new__(
@@ -355,6 +356,7 @@ def __new__(
         last_completion_time,
         last_run_key,
         cursor,
+        run_request_batch_size=None,
     ):
         return super(SensorExecutionArgs, cls).__new__(
             cls,
@@ -368,6 +370,9 @@ def __new__(
             ),
             last_run_key=check.opt_str_param(last_run_key, "last_run_key"),
             cursor=check.opt_str_param(cursor, "cursor"),
+            run_request_batch_size=check.opt_int_param(
+                run_request_batch_size, "run_request_batch_size"
+            ),
         )
 
 
@@ -468,3 +473,83 @@ def __new__(cls, current_image, serializable_error_info):
                 serializable_error_info, "serializable_error_info", SerializableErrorInfo
             ),
         )
+
+
+@whitelist_for_serdes
+class RpcLatencyHistogram(
+    NamedTuple(
+        "_RpcLatencyHistogram",
+        [
+            ("bucket_upper_bounds", List[float]),
+            ("bucket_counts", List[int]),
+            ("count", int),
+            ("error_count", int),
+            ("total_seconds", float),
+            ("max_seconds", float),
+        ],
+    )
+):
+    """Latencies of a single RPC method. bucket_counts has one more entry than
+    bucket_upper_bounds, counting the calls that were slower than the largest bound."""
+
+    def __new__(
+        cls, bucket_upper_bounds, bucket_counts, count, error_count, total_seconds, max_seconds
+    ):
+        check.list_param(bucket_upper_bounds, "bucket_upper_bounds", of_type=float)
+        check.list_param(bucket_counts, "bucket_counts", of_type=int)
+        check.invariant(
+            len(bucket_counts) == len(bucket_upper_bounds) + 1,
+            "bucket_counts must have one more entry than bucket_upper_bounds",
+        )
+        return super(RpcLatencyHistogram, cls).__new__(
+            cls,
+            bucket_upper_bounds=bucket_upper_bounds,
+            bucket_counts=bucket_counts,
+            count=check.int_param(count, "count"),
+            error_count=check.int_param(error_count, "error_count"),
+            total_seconds=check.float_param(total_seconds, "total_seconds"),
+            max_seconds=check.float_param(max_seconds, "max_seconds"),
+        )
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def percentile_upper_bound(self, percentile: float) -> Optional[float]:
+        """The upper bound of the bucket containing the given percentile (between 0 and 100), or
+        None if it falls in the overflow bucket."""
+        check.invariant(0 <= percentile <= 100, "percentile must be between 0 and 100")
+        if not self.count:
+            return None
+
+        threshold = self.count * percentile / 100.0
+        running_count = 0
+        for upper_bound, bucket_count in zip(self.bucket_upper_bounds, self.bucket_counts):
+            running_count += bucket_count
+            if running_count >= threshold:
+                return upper_bound
+        return None
+
+
+@whitelist_for_serdes
+class GrpcServerMetrics(
+    NamedTuple(
+        "_GrpcServerMetrics",
+        [
+            ("server_id", str),
+            ("rpc_latencies", Dict[str, RpcLatencyHistogram]),
+            ("rpcs_in_flight", Dict[str, int]),
+        ],
+    )
+):
+    def __new__(cls, server_id, rpc_latencies, rpcs_in_flight):
+        return super(GrpcServerMetrics, cls).__new__(
+            cls,
+            server_id=check.str_param(server_id, "server_id"),
+            rpc_latencies=check.dict_param(
+                rpc_latencies, "rpc_latencies", key_type=str, value_type=RpcLatencyHistogram
+            ),
+            rpcs_in_flight=check.dict_param(
+                rpcs_in_flight, "rpcs_in_flight", key_type=str, value_type=int
+            ),
+        )
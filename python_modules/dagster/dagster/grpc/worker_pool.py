@@ -0,0 +1,250 @@
+import inspect
+import os
+import queue
+import sys
+import threading
+
+from dagster import check
+from dagster.core.errors import DagsterUserCodeProcessError
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.seven import multiprocessing
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .__generated__ import api_pb2
+
+# RPCs that evaluate user code without reading or writing any state held by the server, so they
+# can be served by any process that has the repositories loaded
+USER_CODE_RPC_METHODS = frozenset(
+    [
+        "ExecutionPlanSnapshot",
+        "ExternalPartitionNames",
+        "ExternalPartitionConfig",
+        "ExternalPartitionTags",
+        "ExternalPartitionSetExecutionParams",
+        "ExternalPipelineSubsetSnapshot",
+        "ExternalRepository",
+        "StreamingExternalRepository",
+        "ExternalScheduleExecution",
+        "ExternalSensorExecution",
+    ]
+)
+
+_API_METHOD_DESCRIPTORS = api_pb2.DESCRIPTOR.services_by_name["DagsterApi"].methods_by_name
+
+# Messages sent from a worker process to the server process
+_READY = "READY"
+_REPLY = "REPLY"
+_DONE = "DONE"
+_ERROR = "ERROR"
+
+
+class UserCodeWorkerProcessDiedError(Exception):
+    """Raised when a worker process exits while it is starting up or serving an RPC."""
+
+
+def _worker_process_main(conn, loadable_target_origin, entry_point):
+    # Imported here since the server module imports this one
+    from .server import DagsterApiServer
+
+    try:
+        api_servicer = DagsterApiServer(
+            server_termination_event=threading.Event(),
+            loadable_target_origin=loadable_target_origin,
+            entry_point=entry_point,
+        )
+    except Exception:
+        conn.send((_ERROR, serializable_error_info_from_exc_info(sys.exc_info())))
+        return
+
+    conn.send((_READY, os.getpid()))
+
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+
+        # The server process sends None when the pool is shut down
+        if message is None:
+            return
+
+        method_name, serialized_request = message
+        request_type = getattr(api_pb2, _API_METHOD_DESCRIPTORS[method_name].input_type.name)
+        try:
+            result = getattr(api_servicer, method_name)(
+                request_type.FromString(serialized_request), None
+            )
+            # Send each reply of a streaming RPC as soon as it is produced, so that neither process
+            # has to hold the whole stream in memory
+            for reply in result if inspect.isgenerator(result) else [result]:
+                conn.send((_REPLY, reply.SerializeToString()))
+        except Exception:
+            conn.send((_ERROR, serializable_error_info_from_exc_info(sys.exc_info())))
+        else:
+            conn.send((_DONE, None))
+
+
+class _UserCodeWorkerProcess:
+    def __init__(self, loadable_target_origin, entry_point):
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_worker_process_main,
+            args=(child_conn, loadable_target_origin, entry_point),
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        self._ready = False
+        self._died = False
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    def is_alive(self):
+        return not self._died and self._process.is_alive()
+
+    def _died_error(self):
+        self._died = True
+        return UserCodeWorkerProcessDiedError(
+            f"User code worker process {self.pid} exited unexpectedly"
+        )
+
+    def _recv(self):
+        try:
+            return self._conn.recv()
+        except (EOFError, OSError):
+            raise self._died_error()
+
+    def wait_until_ready(self):
+        if self._ready:
+            return
+
+        message_type, payload = self._recv()
+        if message_type == _ERROR:
+            self._died = True
+            raise DagsterUserCodeProcessError.from_error_info(payload)
+
+        check.invariant(message_type == _READY, f"Unexpected message {message_type}")
+        self._ready = True
+
+    def call(self, method_name, serialized_request):
+        self.wait_until_ready()
+        try:
+            self._conn.send((method_name, serialized_request))
+        except OSError:
+            raise self._died_error()
+
+        done = False
+        try:
+            while True:
+                message_type, payload = self._recv()
+                if message_type == _REPLY:
+                    yield payload
+                    continue
+
+                done = True
+                if message_type == _ERROR:
+                    raise DagsterUserCodeProcessError.from_error_info(payload)
+                return
+        finally:
+            # If the caller stopped reading the stream early, discard the rest of it so that the
+            # next call only reads its own replies
+            if not done:
+                self._drain()
+
+    def _drain(self):
+        try:
+            while self._recv()[0] == _REPLY:
+                pass
+        except UserCodeWorkerProcessDiedError:
+            pass
+
+    def shutdown(self):
+        try:
+            self._conn.send(None)
+        except OSError:
+            pass
+        self._process.join()
+        self._conn.close()
+
+
+class UserCodeWorkerPool:
+    """Pool of worker processes that each load the server's repositories once at startup, so that
+    CPU-bound RPCs like sensor evaluations and execution plan snapshots can run in parallel instead
+    of contending for the server process's GIL.
+
+    Each call is served by an idle worker. Requests and replies are passed over a pipe as
+    serialized protobuf messages, and the replies of streaming RPCs are passed on to the caller one
+    at a time as the worker produces them. If a worker process dies during a call, the call fails
+    and the worker is replaced with a fresh one.
+    """
+
+    def __init__(self, loadable_target_origin, entry_point, num_workers):
+        self._loadable_target_origin = check.inst_param(
+            loadable_target_origin, "loadable_target_origin", LoadableTargetOrigin
+        )
+        self._entry_point = list(check.list_param(entry_point, "entry_point", of_type=str))
+        self._num_workers = check.int_param(num_workers, "num_workers")
+        check.invariant(num_workers > 0, "num_workers must be greater than 0")
+
+        self._lock = threading.Lock()
+        self._workers = [self._start_worker() for _ in range(num_workers)]
+
+        # Wait for every worker to load the user code up front, so that loading it doesn't add
+        # latency to the first RPCs that the pool serves
+        try:
+            for worker in self._workers:
+                worker.wait_until_ready()
+        except Exception:
+            self.shutdown()
+            raise
+
+        self._idle_workers = queue.Queue()
+        for worker in self._workers:
+            self._idle_workers.put(worker)
+
+    @property
+    def num_workers(self):
+        return self._num_workers
+
+    def _start_worker(self):
+        return _UserCodeWorkerProcess(self._loadable_target_origin, self._entry_point)
+
+    def call(self, method_name, request):
+        """Yields the replies to an RPC as the worker that serves it produces them."""
+        check.invariant(
+            method_name in USER_CODE_RPC_METHODS,
+            f"RPC method {method_name} can't be served by a worker process",
+        )
+        reply_type = getattr(api_pb2, _API_METHOD_DESCRIPTORS[method_name].output_type.name)
+
+        worker = self._idle_workers.get()
+        serialized_replies = worker.call(method_name, request.SerializeToString())
+        try:
+            for serialized_reply in serialized_replies:
+                yield reply_type.FromString(serialized_reply)
+        finally:
+            serialized_replies.close()
+            self._release_worker(worker)
+
+    def _release_worker(self, worker):
+        if worker.is_alive():
+            self._idle_workers.put(worker)
+            return
+
+        # The replacement loads the user code in the background, and the next call that it serves
+        # waits for it to be ready
+        replacement = self._start_worker()
+        with self._lock:
+            self._workers.remove(worker)
+            self._workers.append(replacement)
+        self._idle_workers.put(replacement)
+        worker.shutdown()
+
+    def shutdown(self):
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            worker.shutdown()
@@ -422,6 +422,16 @@ def unpack_value(val: Any) -> Any:
     )
 
 
+def _import_deferred_dagster_modules() -> None:
+    # `import dagster` defers importing some modules until they are first used (see
+    # `_DEFERRED_IMPORTS` in dagster/__init__.py), so the classes they whitelist may not be
+    # registered yet. Import them before deciding that a class isn't in the whitelist.
+    import dagster
+
+    for name in dagster._DEFERRED_IMPORTS:  # pylint: disable=protected-access
+        getattr(dagster, name)
+
+
 def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str) -> Any:
     if isinstance(val, list):
         return [
@@ -430,6 +440,8 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         ]
     if isinstance(val, dict) and val.get("__class__"):
         klass_name = val.pop("__class__")
+        if not whitelist_map.has_tuple_entry(klass_name) and whitelist_map is _WHITELIST_MAP:
+            _import_deferred_dagster_modules()
         if not whitelist_map.has_tuple_entry(klass_name):
             raise DeserializationError(
                 f'Attempted to deserialize class "{klass_name}" which is not in the whitelist. '
@@ -448,6 +460,8 @@ def unpack_inner_value(val: Any, whitelist_map: WhitelistMap, descent_path: str)
         )
     if isinstance(val, dict) and val.get("__enum__"):
         name, member = val["__enum__"].split(".")
+        if not whitelist_map.has_enum_entry(name) and whitelist_map is _WHITELIST_MAP:
+            _import_deferred_dagster_modules()
         if not whitelist_map.has_enum_entry(name):
             raise DeserializationError(
                 f"Attempted to deserialize enum {name} which was not in the whitelist.\n"
@@ -0,0 +1,46 @@
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def deferred_imports(
+    module_name: str, imports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Builds the module-level ``__getattr__`` and ``__dir__`` (PEP 562) of a package whose names
+    are imported from their modules on first access, rather than when the package is imported.
+
+    Usage in a package's ``__init__.py``:
+
+    .. code-block:: python
+
+        _DEFERRED_IMPORTS = {"DagsterGrpcClient": "dagster.grpc.client"}
+
+        __getattr__, __dir__ = deferred_imports(__name__, _DEFERRED_IMPORTS)
+
+    Args:
+        module_name (str): The name of the package, i.e. its ``__name__``.
+        imports (Mapping[str, str]): The module that each deferred name is imported from, keyed
+            by name.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: The ``__getattr__`` and ``__dir__``
+            functions of the package.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        if name in imports:
+            value = getattr(importlib.import_module(imports[name]), name)
+            setattr(module, name, value)
+            return value
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(list(vars(module)) + list(imports))
+
+    if sys.version_info < (3, 7):
+        # Module-level __getattr__ is only supported from python 3.7, so import the names now
+        for name in imports:
+            __getattr__(name)
+
+    return __getattr__, __dir__
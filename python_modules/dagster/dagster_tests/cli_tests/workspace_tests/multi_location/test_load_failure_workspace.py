@@ -1,6 +1,9 @@
+import threading
+
 from dagster import DagsterInstance
 from dagster.core.workspace.context import WorkspaceProcessContext
 from dagster.core.workspace.load import load_workspace_process_context_from_yaml_paths
+from dagster.core.workspace.load_target import WorkspaceFileTarget
 from dagster.utils import file_relative_path
 
 
@@ -48,3 +51,50 @@ def test_workspace_with_only_error():
             "No module named"
             in request_context.get_repository_location_error("broken_location").message
         )
+
+
+def test_multi_location_load_durations():
+    with load_workspace_process_context_from_yaml_paths(
+        DagsterInstance.ephemeral(),
+        [file_relative_path(__file__, "multi_location_with_error.yaml")],
+    ) as cli_workspace:
+        durations = cli_workspace.location_load_durations
+        assert set(durations.keys()) == {"working_location", "broken_location"}
+        assert all(duration is not None and duration >= 0 for duration in durations.values())
+
+
+def test_location_load_timeout(monkeypatch):
+    release_event = threading.Event()
+    original_create_location = WorkspaceProcessContext._create_location_from_origin
+
+    def _create_location_from_origin(self, origin):
+        if origin.location_name == "broken_location":
+            release_event.wait(30)
+            raise Exception("Should have timed out")
+        return original_create_location(self, origin)
+
+    monkeypatch.setattr(
+        WorkspaceProcessContext, "_create_location_from_origin", _create_location_from_origin
+    )
+
+    try:
+        with WorkspaceProcessContext(
+            DagsterInstance.ephemeral(),
+            WorkspaceFileTarget(
+                paths=[file_relative_path(__file__, "multi_location_with_error.yaml")]
+            ),
+            max_concurrent_location_loads=2,
+            location_load_timeout=1,
+        ) as cli_workspace:
+            assert cli_workspace.repository_locations_count == 2
+            assert cli_workspace.has_repository_location("working_location")
+            assert not cli_workspace.has_repository_location("broken_location")
+
+            request_context = cli_workspace.create_request_context()
+            assert (
+                "Timed out after 1 seconds"
+                in request_context.get_repository_location_error("broken_location").message
+            )
+            assert cli_workspace.location_load_durations["broken_location"] is None
+    finally:
+        release_event.set()
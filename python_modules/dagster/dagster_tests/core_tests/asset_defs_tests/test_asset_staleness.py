@@ -0,0 +1,217 @@
+import warnings
+
+from dagster import DagsterInstance, DailyPartitionsDefinition, StaticPartitionsDefinition
+from dagster.core.asset_defs import (
+    StaleAsset,
+    asset,
+    build_assets_job,
+    get_stale_assets,
+    select_stale_assets,
+)
+from dagster.core.asset_defs.asset_staleness import _PartitionIndex
+from dagster.core.definitions.events import AssetKey
+from dagster.core.definitions.partition_key_range import PartitionKeyRange
+from dagster.core.storage.tags import CODE_VERSION_TAG
+from dagster.utils.backcompat import ExperimentalWarning
+
+
+def test_get_stale_assets():
+    @asset(version="1")
+    def upstream():
+        return 1
+
+    @asset
+    def downstream(upstream):
+        return upstream + 1
+
+    @asset
+    def other():
+        return 2
+
+    assets = [upstream, downstream, other]
+    all_stale = {
+        AssetKey("upstream"): StaleAsset(AssetKey("upstream")),
+        AssetKey("downstream"): StaleAsset(AssetKey("downstream")),
+        AssetKey("other"): StaleAsset(AssetKey("other")),
+    }
+
+    with DagsterInstance.ephemeral() as instance:
+        assert get_stale_assets(instance, assets) == all_stale
+
+        build_assets_job("all_assets", assets=assets).execute_in_process(instance=instance)
+        assert get_stale_assets(instance, assets) == {}
+
+        # materializing an upstream asset makes everything downstream of it stale
+        build_assets_job("upstream_only", assets=[upstream]).execute_in_process(instance=instance)
+        assert get_stale_assets(instance, assets) == {
+            AssetKey("downstream"): StaleAsset(AssetKey("downstream"))
+        }
+
+        stale_assets_defs, up_to_date_assets_defs = select_stale_assets(instance, assets)
+        assert stale_assets_defs == [downstream]
+        assert up_to_date_assets_defs == [upstream, other]
+
+        build_assets_job("all_assets", assets=assets).execute_in_process(instance=instance)
+        assert get_stale_assets(instance, assets) == {}
+
+        # changing the code version of an asset makes it and everything downstream of it stale
+        @asset(name="upstream", version="2")
+        def new_upstream():
+            return 1
+
+        assert get_stale_assets(instance, [new_upstream, downstream, other]) == {
+            AssetKey("upstream"): StaleAsset(AssetKey("upstream")),
+            AssetKey("downstream"): StaleAsset(AssetKey("downstream")),
+        }
+
+        # wiping an asset makes it stale
+        instance.wipe_assets([AssetKey("other")])
+        assert get_stale_assets(instance, assets) == {
+            AssetKey("other"): StaleAsset(AssetKey("other"))
+        }
+
+
+def test_get_stale_partitioned_assets():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream():
+        return 1
+
+    @asset(partitions_def=partitions_def)
+    def downstream(upstream):
+        return upstream
+
+    @asset
+    def unpartitioned(downstream):
+        return downstream
+
+    assets = [upstream, downstream, unpartitioned]
+    job = build_assets_job("partitioned_assets", assets=assets)
+
+    with DagsterInstance.ephemeral() as instance:
+        for partition_key in ["a", "b", "c"]:
+            job.execute_in_process(partition_key=partition_key, instance=instance)
+        assert get_stale_assets(instance, assets) == {}
+
+        build_assets_job("upstream_only", assets=[upstream]).execute_in_process(
+            partition_key="b", instance=instance
+        )
+        assert get_stale_assets(instance, assets) == {
+            AssetKey("downstream"): StaleAsset(AssetKey("downstream"), {"b"}),
+            AssetKey("unpartitioned"): StaleAsset(AssetKey("unpartitioned")),
+        }
+
+        job.execute_in_process(partition_key="b", instance=instance)
+        assert get_stale_assets(instance, assets) == {}
+
+
+def test_get_stale_partitioned_assets_code_version():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def, version="1")
+    def versioned():
+        return 1
+
+    @asset(name="versioned", partitions_def=partitions_def, version="2")
+    def new_versioned():
+        return 2
+
+    with DagsterInstance.ephemeral() as instance:
+        job = build_assets_job("versioned", assets=[versioned])
+        for partition_key in ["a", "b", "c"]:
+            job.execute_in_process(partition_key=partition_key, instance=instance)
+        assert get_stale_assets(instance, [versioned]) == {}
+        assert get_stale_assets(instance, [new_versioned]) == {
+            AssetKey("versioned"): StaleAsset(AssetKey("versioned"), {"a", "b", "c"})
+        }
+
+        # rematerializing one partition with the new version leaves the others stale
+        build_assets_job("new_versioned", assets=[new_versioned]).execute_in_process(
+            partition_key="b", instance=instance
+        )
+        assert get_stale_assets(instance, [new_versioned]) == {
+            AssetKey("versioned"): StaleAsset(AssetKey("versioned"), {"a", "c"})
+        }
+        assert get_stale_assets(instance, [versioned]) == {
+            AssetKey("versioned"): StaleAsset(AssetKey("versioned"), {"b"})
+        }
+
+
+def test_get_stale_assets_with_source_asset():
+    @asset
+    def source():
+        return 1
+
+    @asset
+    def downstream(source):
+        return source
+
+    with DagsterInstance.ephemeral() as instance:
+        build_assets_job("all_assets", assets=[source, downstream]).execute_in_process(
+            instance=instance
+        )
+        assert get_stale_assets(instance, [downstream]) == {}
+
+        build_assets_job("source", assets=[source]).execute_in_process(instance=instance)
+        assert get_stale_assets(instance, [downstream]) == {
+            AssetKey("downstream"): StaleAsset(AssetKey("downstream"))
+        }
+
+
+def test_code_version_tag_does_not_warn():
+    @asset(version="1")
+    def versioned():
+        return 1
+
+    with DagsterInstance.ephemeral() as instance:
+        with warnings.catch_warnings(record=True) as record:
+            warnings.simplefilter("always")
+            result = build_assets_job("versioned", assets=[versioned]).execute_in_process(
+                instance=instance
+            )
+
+        materialization = result.asset_materializations_for_node("versioned")[0]
+        assert materialization.tags == {CODE_VERSION_TAG: "1"}
+        assert not [
+            warning
+            for warning in record
+            if issubclass(warning.category, ExperimentalWarning)
+            and '"tags"' in str(warning.message)
+        ]
+
+
+def test_partition_index_range_partly_outside_partitions():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-01-01")
+    partition_index = _PartitionIndex()
+    partition_keys = partitions_def.get_partition_keys()
+
+    def _keys_in_range(start, end):
+        return partition_index.get_partition_keys_in_range(
+            partitions_def, PartitionKeyRange(start, end)
+        )
+
+    assert _keys_in_range("2021-01-02", "2021-01-03") == ["2021-01-02", "2021-01-03"]
+    # the endpoints are placed by their time windows rather than compared as strings
+    assert _keys_in_range("2020-12-30", "2021-01-02") == ["2021-01-01", "2021-01-02"]
+    assert _keys_in_range(partition_keys[-2], "2999-01-01") == partition_keys[-2:]
+    assert _keys_in_range("2020-12-30", "2999-01-01") == partition_keys
+    assert _keys_in_range("2020-12-01", "2020-12-02") == []
+    assert _keys_in_range("2999-01-01", "2999-01-02") == []
+    assert _keys_in_range("not a date", "2021-01-02") == []
+
+
+def test_partition_index_static_partitions():
+    partitions_def = StaticPartitionsDefinition(["c", "a", "b"])
+    partition_index = _PartitionIndex()
+
+    def _keys_in_range(start, end):
+        return partition_index.get_partition_keys_in_range(
+            partitions_def, PartitionKeyRange(start, end)
+        )
+
+    # the keys are in the order of the partitions definition
+    assert _keys_in_range("c", "a") == ["c", "a"]
+    assert _keys_in_range("a", "b") == ["a", "b"]
+    # keys that aren't partitions can't be placed in the order
+    assert _keys_in_range("0", "z") == []
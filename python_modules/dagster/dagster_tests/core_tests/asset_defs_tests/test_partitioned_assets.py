@@ -2,7 +2,9 @@
 import pytest
 from dagster import (
     AssetMaterialization,
+    DagsterInstance,
     DagsterInvalidDefinitionError,
+    DagsterInvariantViolationError,
     DailyPartitionsDefinition,
     IOManager,
     IOManagerDefinition,
@@ -330,6 +332,73 @@ def downstream_asset(upstream_asset):
     my_job.execute_in_process(partition_key="2021-06-06")
 
 
+def test_partition_key_range_run():
+    partitions_def = DailyPartitionsDefinition(start_date="2021-05-05")
+    expected_time_window = TimeWindow(pendulum.parse("2021-06-06"), pendulum.parse("2021-06-09"))
+
+    class MyIOManager(IOManager):
+        def handle_output(self, context, _obj):
+            assert context.asset_partition_key_range == PartitionKeyRange(
+                "2021-06-06", "2021-06-08"
+            )
+            assert context.asset_partitions_time_window == expected_time_window
+
+        def load_input(self, context):
+            assert context.asset_partitions_time_window == expected_time_window
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context):
+        assert context.output_asset_partitions_time_window() == expected_time_window
+
+    @asset(partitions_def=partitions_def)
+    def downstream_asset(upstream_asset):
+        assert upstream_asset is None
+
+    my_job = build_assets_job(
+        "my_job",
+        assets=[downstream_asset, upstream_asset],
+        resource_defs={"io_manager": IOManagerDefinition.hardcoded_io_manager(MyIOManager())},
+    )
+    with DagsterInstance.ephemeral() as instance:
+        result = my_job.execute_in_process(
+            partition_key_range=PartitionKeyRange("2021-06-06", "2021-06-08"), instance=instance
+        )
+        assert instance.get_run_by_id(result.run_id).tags == {
+            "dagster/asset_partition_range_start": "2021-06-06",
+            "dagster/asset_partition_range_end": "2021-06-08",
+            "dagster/partition_set": "my_job_partition_set",
+        }
+
+        # the range run is the latest run of each partition in its range
+        partition_keys = partitions_def.get_partition_keys()
+        assert sorted(
+            run_partition_data.partition
+            for run_partition_data in instance.get_run_partition_data(
+                "my_job_partition_set", partition_keys=partition_keys
+            )
+        ) == ["2021-06-06", "2021-06-07", "2021-06-08"]
+
+    assert sorted(
+        materialization.partition
+        for materialization in result.asset_materializations_for_node("downstream_asset")
+    ) == ["2021-06-06", "2021-06-07", "2021-06-08"]
+
+
+def test_partition_key_range_run_static_partitions():
+    @asset(partitions_def=StaticPartitionsDefinition(["a", "b", "c"]))
+    def my_asset():
+        pass
+
+    my_job = build_assets_job("my_job", assets=[my_asset])
+    with pytest.raises(DagsterInvariantViolationError):
+        my_job.execute_in_process(partition_key_range=PartitionKeyRange("a", "b"))
+
+    result = my_job.execute_in_process(partition_key_range=PartitionKeyRange("b", "b"))
+    assert result.asset_materializations_for_node("my_asset") == [
+        AssetMaterialization(asset_key=AssetKey(["my_asset"]), partition="b")
+    ]
+
+
 def test_asset_partitions_time_window_non_identity_partition_mapping():
     upstream_partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
     downstream_partitions_def = DailyPartitionsDefinition(start_date="2020-01-01")
@@ -1,16 +1,11 @@
-import pendulum
-import pytest
 from dagster import (
     DailyPartitionsDefinition,
     HourlyPartitionsDefinition,
     MonthlyPartitionsDefinition,
+    WeeklyPartitionsDefinition,
 )
 from dagster.core.asset_defs.asset_partitions import PartitionKeyRange
-from dagster.core.asset_defs.time_window_partition_mapping import (
-    TimeWindowPartitionMapping,
-    round_datetime_to_period,
-)
-from dagster.core.definitions.partition import ScheduleType
+from dagster.core.asset_defs.time_window_partition_mapping import TimeWindowPartitionMapping
 
 
 def test_get_upstream_partitions_for_partition_range_same_partitioning():
@@ -94,21 +89,13 @@ def test_get_upstream_partitions_for_partition_range_monthly_downstream_daily_up
     assert result == PartitionKeyRange("2021-05-01", "2021-07-31")
 
 
-@pytest.mark.parametrize(
-    "dt_str, period, expected_str",
-    [
-        ("2020-01-01", ScheduleType.DAILY, "2020-01-01"),
-        ("2020-01-01 01:00:00", ScheduleType.DAILY, "2020-01-01"),
-        ("2020-01-01 01:00:00", ScheduleType.HOURLY, "2020-01-01 01:00:00"),
-        ("2020-01-01", ScheduleType.MONTHLY, "2020-01-01"),
-        ("2020-01-02", ScheduleType.MONTHLY, "2020-01-01"),
-        ("2020-01-02 01:00:00", ScheduleType.MONTHLY, "2020-01-01"),
-        ("2021-12-03", ScheduleType.WEEKLY, "2021-11-29"),
-        ("2021-12-03 01:00:00", ScheduleType.WEEKLY, "2021-11-29"),
-        ("2021-11-29", ScheduleType.WEEKLY, "2021-11-29"),
-    ],
-)
-def test_round_datetime_to_period(dt_str, period, expected_str):
-    dt = pendulum.parse(dt_str)
-    expected_dt = pendulum.parse(expected_str)
-    assert round_datetime_to_period(dt, period) == expected_dt
+def test_get_downstream_partitions_for_partition_range_daily_upstream_weekly_downstream():
+    downstream_partitions_def = WeeklyPartitionsDefinition(start_date="2021-05-02")
+    upstream_partitions_def = DailyPartitionsDefinition(start_date="2021-05-01")
+    # weekly partitions start on Sundays
+    result = TimeWindowPartitionMapping().get_downstream_partitions_for_partition_range(
+        PartitionKeyRange("2021-05-05", "2021-05-10"),
+        downstream_partitions_def,
+        upstream_partitions_def,
+    )
+    assert result == PartitionKeyRange("2021-05-02", "2021-05-09")
@@ -1,16 +1,21 @@
 from datetime import datetime
 
 import pendulum
+import pytest
 from dagster import (
     DailyPartitionsDefinition,
     HourlyPartitionsDefinition,
     MonthlyPartitionsDefinition,
+    WeeklyPartitionsDefinition,
     daily_partitioned_config,
     hourly_partitioned_config,
     monthly_partitioned_config,
 )
+from dagster.core.definitions.partition import ScheduleType, get_cron_schedule
+from dagster.core.definitions.partition_key_range import PartitionKeyRange
 from dagster.core.definitions.time_window_partitions import TimeWindow
 from dagster.utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
+from dagster.utils.schedules import schedule_execution_time_iterator
 
 DATE_FORMAT = "%Y-%m-%d"
 
@@ -140,3 +145,88 @@ def my_partitioned_config(_start, _end):
     assert partitions_def.time_window_for_partition_key("2021-05-05-01:00") == time_window(
         "2021-05-05T01:00:00", "2021-05-05T02:00:00"
     )
+
+
+def test_partition_key_sequence():
+    partitions_def = HourlyPartitionsDefinition(start_date="2015-01-01-00:00")
+    partition_keys = partitions_def.get_partition_key_sequence(
+        datetime.strptime("2021-01-01-00:00", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE)
+    )
+
+    assert len(partition_keys) == 52608
+    assert partition_keys[0] == "2015-01-01-00:00"
+    assert partition_keys[-1] == "2020-12-31-23:00"
+    assert partition_keys[24:27] == ["2015-01-02-00:00", "2015-01-02-01:00", "2015-01-02-02:00"]
+    assert partition_keys.index("2015-01-02-00:00") == 24
+    assert "2020-12-31-23:00" in partition_keys
+    assert "2021-01-01-00:00" not in partition_keys
+    assert "2014-12-31-23:00" not in partition_keys
+    assert "2015-01-01-00:30" not in partition_keys
+    assert "not a date" not in partition_keys
+    assert partition_keys.get_partition_keys_in_range(
+        PartitionKeyRange("2020-12-31-21:00", "2020-12-31-23:00")
+    ) == ["2020-12-31-21:00", "2020-12-31-22:00", "2020-12-31-23:00"]
+    assert partition_keys.time_window_at(1) == time_window(
+        "2015-01-01T01:00:00", "2015-01-01T02:00:00"
+    )
+
+    with pytest.raises(IndexError):
+        partition_keys[52608]  # pylint: disable=pointless-statement
+
+    with pytest.raises(ValueError):
+        partition_keys.index("2021-01-01-00:00")
+
+
+def test_weekly_partitions():
+    # weekly partitions start on the first Sunday on or after the start date
+    partitions_def = WeeklyPartitionsDefinition(start_date="2021-05-05")
+    partitions = partitions_def.get_partitions(datetime.strptime("2021-05-24", DATE_FORMAT))
+
+    assert [partition.value for partition in partitions] == [
+        time_window("2021-05-09", "2021-05-16"),
+        time_window("2021-05-16", "2021-05-23"),
+    ]
+    assert [partition.name for partition in partitions] == ["2021-05-09", "2021-05-16"]
+
+
+@pytest.mark.parametrize(
+    "partitions_def",
+    [
+        HourlyPartitionsDefinition(start_date="2021-01-01-00:00", timezone="US/Central"),
+        DailyPartitionsDefinition(start_date="2021-01-01", timezone="US/Central"),
+        WeeklyPartitionsDefinition(start_date="2021-01-01", timezone="US/Central"),
+        MonthlyPartitionsDefinition(start_date="2020-01-01", timezone="US/Central"),
+        DailyPartitionsDefinition(start_date="2021-01-01", end_offset=-3),
+    ],
+)
+def test_partitions_match_schedule_iterator(partitions_def):
+    # the partitions are computed arithmetically, so check them against the cron schedule across
+    # the daylight savings transitions of 2021
+    current_time = pendulum.datetime(2022, 1, 1, tz="US/Central")
+    partitions = partitions_def.get_partitions(current_time)
+    start_timestamp = pendulum.instance(
+        partitions_def.start, tz=partitions_def.timezone
+    ).timestamp()
+    start_times = (
+        start_time
+        for start_time in schedule_execution_time_iterator(
+            start_timestamp=start_timestamp,
+            cron_schedule=get_cron_schedule(schedule_type=partitions_def.schedule_type),
+            execution_timezone=partitions_def.timezone,
+        )
+        if start_time.timestamp() >= start_timestamp
+    )
+    prev_time = next(start_times)
+
+    for partition in partitions:
+        next_time = next(start_times)
+        assert partition.value == TimeWindow(prev_time, next_time)
+        assert partition.name == prev_time.strftime(partitions_def.fmt)
+        # hourly keys are ambiguous during the hour that repeats when daylight savings ends
+        if partitions_def.schedule_type != ScheduleType.HOURLY:
+            assert partitions_def.time_window_for_partition_key(partition.name) == partition.value
+        prev_time = next_time
+
+    assert next_time.timestamp() <= current_time.timestamp()
+    if partitions_def.end_offset == 0:
+        assert next(start_times).timestamp() > current_time.timestamp()
@@ -1,5 +1,8 @@
+import os
+import time
+
 import pytest
-from dagster import job, op
+from dagster import DynamicOut, job, op
 from dagster.core.errors import DagsterInvariantViolationError
 from dagster.core.events import DagsterEvent, DagsterEventType
 from dagster.core.execution.api import create_execution_plan
@@ -147,3 +150,122 @@ def test_recover_in_between_steps():
                 step_key="bar_op",
             )
         )
+
+
+# Generous enough to not be flaky on slow machines, but catches regressions that make resolving
+# or scheduling mapped steps quadratic in the number of mapping keys again
+FAN_OUT_TIME_BUDGET_SECONDS = 60.0
+
+
+def define_fan_out_job():
+    @op(out=DynamicOut())
+    def emit_op():
+        pass
+
+    @op
+    def map_op(_data):
+        pass
+
+    @op
+    def collect_op(_data):
+        pass
+
+    @job
+    def fan_out_job():
+        collect_op(emit_op().map(map_op).collect())
+
+    return fan_out_job
+
+
+def _success_event(job_name, step_key):
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        pipeline_name=job_name,
+        event_specific_data=StepSuccessData(duration_ms=10.0),
+        step_key=step_key,
+    )
+
+
+def _output_event(job_name, step_key, mapping_key=None):
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        pipeline_name=job_name,
+        event_specific_data=StepOutputData(
+            StepOutputHandle(step_key=step_key, output_name="result", mapping_key=mapping_key)
+        ),
+        step_key=step_key,
+    )
+
+
+def test_fan_out_collects_after_all_mapped_steps():
+    num_mapping_keys = 100
+    fan_out_job = define_fan_out_job()
+    job_name = fan_out_job.name
+
+    with create_execution_plan(fan_out_job).start(RetryMode.DISABLED) as active_execution:
+        [emit_step] = active_execution.get_steps_to_execute()
+        assert emit_step.key == "emit_op"
+
+        for i in range(num_mapping_keys):
+            active_execution.handle_event(_output_event(job_name, "emit_op", str(i)))
+        active_execution.handle_event(_success_event(job_name, "emit_op"))
+
+        # vend the mapped steps one at a time, like the in process executor does. The collect step
+        # isn't executable until every mapped step has finished.
+        mapped_step_keys = []
+        for _ in range(num_mapping_keys):
+            [step] = active_execution.get_steps_to_execute(limit=1)
+            assert step.key.startswith("map_op[")
+
+            mapped_step_keys.append(step.key)
+            active_execution.handle_event(_output_event(job_name, step.key))
+            active_execution.handle_event(_success_event(job_name, step.key))
+
+        steps = active_execution.get_steps_to_execute()
+        assert [step.key for step in steps] == ["collect_op"]
+
+        assert sorted(mapped_step_keys) == sorted(f"map_op[{i}]" for i in range(num_mapping_keys))
+        assert len(steps[0].step_input_named("_data").get_step_output_handle_dependencies()) == (
+            num_mapping_keys
+        )
+        active_execution.handle_event(_success_event(job_name, "collect_op"))
+
+
+@pytest.mark.skipif(
+    not os.getenv("DAGSTER_RUN_BENCHMARKS"),
+    reason="timing benchmark, set DAGSTER_RUN_BENCHMARKS to run it",
+)
+def test_large_fan_out_benchmark():
+    num_mapping_keys = 100000
+    fan_out_job = define_fan_out_job()
+    job_name = fan_out_job.name
+
+    start_time = time.time()
+    with create_execution_plan(fan_out_job).start(RetryMode.DISABLED) as active_execution:
+        [emit_step] = active_execution.get_steps_to_execute()
+        assert emit_step.key == "emit_op"
+
+        for i in range(num_mapping_keys):
+            active_execution.handle_event(_output_event(job_name, "emit_op", str(i)))
+        active_execution.handle_event(_success_event(job_name, "emit_op"))
+
+        # vend the mapped steps one at a time, like the in process executor does
+        num_mapped_steps = 0
+        while True:
+            steps = active_execution.get_steps_to_execute(limit=1)
+            if not steps or steps[0].key == "collect_op":
+                break
+
+            num_mapped_steps += 1
+            active_execution.handle_event(_output_event(job_name, steps[0].key))
+            active_execution.handle_event(_success_event(job_name, steps[0].key))
+
+        assert num_mapped_steps == num_mapping_keys
+        assert steps[0].key == "collect_op"
+        active_execution.handle_event(_success_event(job_name, "collect_op"))
+
+    elapsed = time.time() - start_time
+    assert elapsed < FAN_OUT_TIME_BUDGET_SECONDS, (
+        f"Fanning out to {num_mapping_keys} mapped steps took {elapsed:.2f}s, "
+        f"over the budget of {FAN_OUT_TIME_BUDGET_SECONDS}s"
+    )
@@ -0,0 +1,97 @@
+import pytest
+from dagster import AssetKey, check
+from dagster.core.host_representation.asset_graph_index import AssetGraphIndex
+from dagster.core.host_representation.external_data import (
+    ExternalAssetDependedBy,
+    ExternalAssetDependency,
+    ExternalAssetNode,
+    external_asset_graph_index_from_nodes,
+)
+
+
+def _asset_nodes(deps_by_name):
+    depended_by = {name: [] for name in deps_by_name}
+    for name, dep_names in deps_by_name.items():
+        for dep_name in dep_names:
+            depended_by[dep_name].append(name)
+
+    return [
+        ExternalAssetNode(
+            asset_key=AssetKey(name),
+            dependencies=[
+                ExternalAssetDependency(upstream_asset_key=AssetKey(dep_name), input_name=dep_name)
+                for dep_name in dep_names
+            ],
+            depended_by=[
+                ExternalAssetDependedBy(
+                    downstream_asset_key=AssetKey(downstream_name), input_name=name
+                )
+                for downstream_name in depended_by[name]
+            ],
+        )
+        for name, dep_names in deps_by_name.items()
+    ]
+
+
+def _keys(*names):
+    return [AssetKey(name) for name in names]
+
+
+def test_asset_graph_index():
+    #     a
+    #    / \
+    #   b   c   e
+    #    \ /
+    #     d
+    asset_nodes = _asset_nodes({"d": ["b", "c"], "c": ["a"], "b": ["a"], "a": [], "e": []})
+
+    for graph_index in [
+        AssetGraphIndex(asset_nodes),
+        AssetGraphIndex(asset_nodes, external_asset_graph_index_from_nodes(asset_nodes)),
+    ]:
+        assert graph_index.get_asset_node(AssetKey("b")) == asset_nodes[2]
+        assert graph_index.get_asset_node(AssetKey("f")) is None
+        assert graph_index.has_asset_node(AssetKey("e"))
+
+        toposorted_keys = graph_index.toposorted_asset_keys
+        assert toposorted_keys.index(AssetKey("a")) < toposorted_keys.index(AssetKey("b"))
+        assert toposorted_keys.index(AssetKey("c")) < toposorted_keys.index(AssetKey("d"))
+
+        assert set(graph_index.get_upstream_asset_keys(AssetKey("d"))) == set(_keys("b", "c"))
+        assert set(graph_index.get_downstream_asset_keys(AssetKey("a"))) == set(_keys("b", "c"))
+        assert graph_index.get_all_upstream_asset_keys(AssetKey("a")) == []
+        assert graph_index.get_all_downstream_asset_keys(AssetKey("e")) == []
+
+        # transitive queries return keys in topological order
+        all_upstream = graph_index.get_all_upstream_asset_keys(AssetKey("d"))
+        assert all_upstream[0] == AssetKey("a")
+        assert set(all_upstream) == set(_keys("a", "b", "c"))
+
+        all_downstream = graph_index.get_all_downstream_asset_keys(AssetKey("a"))
+        assert all_downstream[-1] == AssetKey("d")
+        assert set(all_downstream) == set(_keys("b", "c", "d"))
+
+        with pytest.raises(check.CheckError):
+            graph_index.get_all_upstream_asset_keys(AssetKey("f"))
+
+
+def test_large_asset_graph_index():
+    num_assets = 10000
+    asset_nodes = _asset_nodes(
+        {f"asset_{i}": [f"asset_{i - 1}"] if i else [] for i in range(num_assets)}
+    )
+    graph_index = AssetGraphIndex(asset_nodes)
+
+    all_upstream = graph_index.get_all_upstream_asset_keys(AssetKey(f"asset_{num_assets - 1}"))
+    assert all_upstream == _keys(*[f"asset_{i}" for i in range(num_assets - 1)])
+
+    all_downstream = graph_index.get_all_downstream_asset_keys(AssetKey("asset_5000"))
+    assert all_downstream == _keys(*[f"asset_{i}" for i in range(5001, num_assets)])
+
+
+def test_asset_graph_index_with_cycle():
+    asset_nodes = _asset_nodes({"a": ["b"], "b": ["a"], "c": ["a"]})
+    graph_index = AssetGraphIndex(asset_nodes)
+
+    assert set(graph_index.get_all_upstream_asset_keys(AssetKey("c"))) == set(_keys("a", "b"))
+    assert graph_index.get_all_upstream_asset_keys(AssetKey("a")) == _keys("b")
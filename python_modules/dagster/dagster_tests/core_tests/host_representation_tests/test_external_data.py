@@ -8,10 +8,12 @@
 from dagster.core.host_representation.external_data import (
     ExternalAssetDependedBy,
     ExternalAssetDependency,
+    ExternalAssetGraphIndex,
     ExternalAssetNode,
     ExternalSensorData,
     ExternalTargetData,
     external_asset_graph_from_defs,
+    external_asset_graph_index_from_nodes,
 )
 from dagster.serdes import deserialize_json_to_dagster_namedtuple
 
@@ -233,6 +235,83 @@ def graph2():
     ]
 
 
+def test_same_asset_dependency_in_multiple_pipelines():
+    @asset
+    def asset1():
+        return 1
+
+    @asset
+    def asset2(asset1):
+        assert asset1 == 1
+
+    @pipeline
+    def graph1():
+        asset2(asset1())
+
+    @pipeline
+    def graph2():
+        asset2(asset1())
+
+    external_asset_nodes = external_asset_graph_from_defs(
+        [graph1, graph2], foreign_assets_by_key={}
+    )
+
+    assert external_asset_nodes == [
+        ExternalAssetNode(
+            asset_key=AssetKey("asset1"),
+            dependencies=[],
+            depended_by=[
+                ExternalAssetDependedBy(
+                    downstream_asset_key=AssetKey("asset2"), input_name="asset1"
+                )
+            ],
+            op_name="asset1",
+            op_description=None,
+            job_names=["graph1", "graph2"],
+        ),
+        ExternalAssetNode(
+            asset_key=AssetKey("asset2"),
+            dependencies=[
+                ExternalAssetDependency(upstream_asset_key=AssetKey("asset1"), input_name="asset1")
+            ],
+            depended_by=[],
+            op_name="asset2",
+            op_description=None,
+            job_names=["graph1", "graph2"],
+        ),
+    ]
+
+
+def test_external_asset_graph_index():
+    @asset
+    def asset1():
+        return 1
+
+    @asset
+    def asset2(asset1):
+        assert asset1 == 1
+
+    @asset
+    def asset3(asset1, asset2):
+        assert asset1 == 1
+        assert asset2
+
+    @pipeline
+    def my_graph():
+        r = asset1()
+        asset3(r, asset2(r))
+
+    external_asset_nodes = external_asset_graph_from_defs([my_graph], foreign_assets_by_key={})
+
+    # the index is independent of the order of the asset nodes
+    assert external_asset_graph_index_from_nodes(
+        list(reversed(external_asset_nodes))
+    ) == ExternalAssetGraphIndex(
+        toposorted_asset_keys=[AssetKey("asset1"), AssetKey("asset2"), AssetKey("asset3")],
+        upstream_indices=[[], [0], [0, 1]],
+    )
+
+
 def test_unused_foreign_asset():
     foo = ForeignAsset(key=AssetKey("foo"), description="abc")
     bar = ForeignAsset(key=AssetKey("bar"), description="def")
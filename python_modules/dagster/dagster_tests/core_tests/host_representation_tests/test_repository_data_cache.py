@@ -0,0 +1,325 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import pytest
+from dagster import file_relative_path, pipeline, repository, solid
+from dagster.core.host_representation import (
+    GrpcServerRepositoryLocationOrigin,
+    ManagedGrpcPythonEnvRepositoryLocationOrigin,
+    external_repository_data_from_def,
+)
+from dagster.core.host_representation.grpc_server_registry import ProcessGrpcServerRegistry
+from dagster.core.host_representation.repository_data_cache import (
+    RepositoryDataCache,
+    get_local_code_version_key,
+)
+from dagster.core.host_representation.repository_location import GrpcServerRepositoryLocation
+from dagster.core.test_utils import instance_for_test
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.core.workspace import WorkspaceProcessContext
+from dagster.core.workspace.dynamic_workspace import DynamicWorkspace
+from dagster.core.workspace.load_target import GrpcServerTarget
+from dagster.grpc.server import GrpcServerProcess
+from dagster.grpc.types import ListRepositoriesResponse
+
+
+@solid
+def do_something():
+    return 1
+
+
+@pipeline
+def foo_pipeline():
+    do_something()
+
+
+@repository
+def cached_repo():
+    return [foo_pipeline]
+
+
+def _origin():
+    return GrpcServerRepositoryLocationOrigin(host="localhost", port=1234, location_name="test")
+
+
+def test_repository_data_cache_roundtrip():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RepositoryDataCache(temp_dir)
+        origin = _origin()
+        repository_datas = {"cached_repo": external_repository_data_from_def(cached_repo)}
+        list_repositories_response = ListRepositoriesResponse([])
+
+        assert cache.get(origin, "server_one") is None
+
+        cache.set(origin, "server_one", list_repositories_response, None, repository_datas)
+        entry = cache.get(origin, "server_one")
+        assert entry.list_repositories_response == list_repositories_response
+        assert entry.external_repository_datas == repository_datas
+
+        # Entries are only valid for the code version key they were written with
+        assert cache.get(origin, "server_two") is None
+
+        cache.clear(origin)
+        assert cache.get(origin, "server_one") is None
+
+
+def test_repository_data_cache_corrupt_entry():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RepositoryDataCache(temp_dir)
+        origin = _origin()
+        with open(os.path.join(temp_dir, f"{origin.get_id()}.json"), "w") as f:
+            f.write("not json")
+
+        with pytest.warns(UserWarning, match="unreadable repository data cache entry"):
+            assert cache.get(origin, "server_one") is None
+
+
+def test_local_code_version_key():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        python_file = os.path.join(temp_dir, "repo.py")
+        shutil.copy(__file__, python_file)
+        origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(executable_path=sys.executable, python_file=python_file)
+        )
+
+        code_version_key = get_local_code_version_key(origin)
+        assert code_version_key
+        assert get_local_code_version_key(origin) == code_version_key
+
+        # Changing any of the python files that the code is loaded from changes the key
+        with open(os.path.join(temp_dir, "other.py"), "w") as f:
+            f.write("x = 1")
+        assert get_local_code_version_key(origin) != code_version_key
+
+    # The code of other servers isn't available locally
+    assert get_local_code_version_key(_origin()) is None
+
+
+def test_local_code_version_key_skips_environments(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        python_file = os.path.join(temp_dir, "repo.py")
+        shutil.copy(__file__, python_file)
+        origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(executable_path=sys.executable, python_file=python_file)
+        )
+        code_version_key = get_local_code_version_key(origin)
+
+        # Files in environments don't affect the key, whatever the environment is called
+        os.makedirs(os.path.join(temp_dir, "venv", "lib"))
+        with open(os.path.join(temp_dir, "venv", "lib", "installed.py"), "w") as f:
+            f.write("x = 1")
+        os.makedirs(os.path.join(temp_dir, "my_env", "lib"))
+        with open(os.path.join(temp_dir, "my_env", "pyvenv.cfg"), "w") as f:
+            f.write("")
+        with open(os.path.join(temp_dir, "my_env", "lib", "installed.py"), "w") as f:
+            f.write("x = 1")
+        assert get_local_code_version_key(origin) == code_version_key
+
+        # Locations with too many files to check on every load have no local key
+        monkeypatch.setattr(
+            "dagster.core.host_representation.repository_data_cache.MAX_CODE_VERSION_FILES", 1
+        )
+        with open(os.path.join(temp_dir, "other.py"), "w") as f:
+            f.write("x = 1")
+        assert get_local_code_version_key(origin) is None
+
+
+def test_repository_data_cache_disabled_by_default():
+    with instance_for_test() as instance:
+        assert not instance.repository_data_cache_enabled
+        assert RepositoryDataCache.from_instance(instance) is None
+
+
+def test_workspace_uses_repository_data_cache(monkeypatch):
+    with instance_for_test(overrides={"repository_data_cache": {"enabled": True}}) as instance:
+        assert instance.repository_data_cache_enabled
+
+        loadable_target_origin = LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "test_repository_data_cache.py"),
+        )
+        server_process = GrpcServerProcess(
+            loadable_target_origin=loadable_target_origin, fixed_server_id="fixed_id"
+        )
+        try:
+            with server_process.create_ephemeral_client():
+                target = GrpcServerTarget(
+                    host="localhost",
+                    socket=server_process.socket,
+                    port=server_process.port,
+                    location_name="test",
+                )
+                with WorkspaceProcessContext(instance, target) as workspace_process_context:
+                    location = (
+                        workspace_process_context.create_request_context().get_repository_location(
+                            "test"
+                        )
+                    )
+                    assert location.has_repository("cached_repo")
+
+                assert os.listdir(instance.repository_data_cache_dir)
+
+                # A second process context reads the repository data from the cache instead of
+                # streaming it from the server
+                def _fail(*_args, **_kwargs):
+                    raise Exception("Should have loaded repository data from the cache")
+
+                monkeypatch.setattr(
+                    "dagster.core.host_representation.repository_location."
+                    "sync_get_streaming_external_repositories_data_grpc",
+                    _fail,
+                )
+
+                with WorkspaceProcessContext(instance, target) as workspace_process_context:
+                    location = (
+                        workspace_process_context.create_request_context().get_repository_location(
+                            "test"
+                        )
+                    )
+                    assert location.get_repository("cached_repo").has_pipeline("foo_pipeline")
+        finally:
+            server_process.wait()
+
+
+def test_managed_location_uses_repository_data_cache(monkeypatch):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RepositoryDataCache(temp_dir)
+        origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(
+                executable_path=sys.executable,
+                python_file=file_relative_path(__file__, "test_repository_data_cache.py"),
+            ),
+            location_name="test",
+        )
+
+        with ProcessGrpcServerRegistry(
+            reload_interval=0, heartbeat_ttl=30, startup_timeout=30
+        ) as grpc_server_registry:
+            with DynamicWorkspace(grpc_server_registry, repository_data_cache=cache) as workspace:
+                assert workspace.get_location(origin).has_repository("cached_repo")
+
+        # A location for a new server, with a new server ID, is loaded from the cache without
+        # listing or streaming the repositories of the server
+        def _fail(*_args, **_kwargs):
+            raise Exception("Should have loaded the location from the cache")
+
+        monkeypatch.setattr(
+            "dagster.core.host_representation.repository_location.sync_list_repositories_grpc",
+            _fail,
+        )
+        monkeypatch.setattr(
+            "dagster.core.host_representation.repository_location."
+            "sync_get_streaming_external_repositories_data_grpc",
+            _fail,
+        )
+
+        with ProcessGrpcServerRegistry(
+            reload_interval=0, heartbeat_ttl=30, startup_timeout=30
+        ) as grpc_server_registry:
+            with DynamicWorkspace(grpc_server_registry, repository_data_cache=cache) as workspace:
+                location = workspace.get_location(origin)
+                assert location.get_repository("cached_repo").has_pipeline("foo_pipeline")
+
+
+def test_cached_location_loads_before_server_starts():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RepositoryDataCache(temp_dir)
+        origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(
+                executable_path=sys.executable,
+                python_file=file_relative_path(__file__, "test_repository_data_cache.py"),
+            ),
+            location_name="test",
+        )
+
+        with ProcessGrpcServerRegistry(
+            reload_interval=0, heartbeat_ttl=30, startup_timeout=30
+        ) as grpc_server_registry:
+            with GrpcServerRepositoryLocation(
+                origin,
+                heartbeat=True,
+                watch_server=False,
+                grpc_server_registry=grpc_server_registry,
+                repository_data_cache=cache,
+                get_endpoint=lambda: grpc_server_registry.get_grpc_endpoint(origin),
+            ) as location:
+                assert location.has_repository("cached_repo")
+
+            # The cached location is served while its server is still starting up
+            server_can_start = threading.Event()
+
+            def _get_endpoint():
+                server_can_start.wait()
+                return grpc_server_registry.reload_grpc_endpoint(origin)
+
+            with GrpcServerRepositoryLocation(
+                origin,
+                heartbeat=True,
+                watch_server=False,
+                grpc_server_registry=grpc_server_registry,
+                repository_data_cache=cache,
+                get_endpoint=_get_endpoint,
+            ) as location:
+                assert location.get_repository("cached_repo").has_pipeline("foo_pipeline")
+                assert location.server_id is None
+
+                server_can_start.set()
+                assert location.client.ping("foo") == "foo"
+                assert location.server_id
+
+
+def test_cleanup_waits_for_cache_revalidation():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = RepositoryDataCache(temp_dir)
+        origin = ManagedGrpcPythonEnvRepositoryLocationOrigin(
+            LoadableTargetOrigin(
+                executable_path=sys.executable,
+                python_file=file_relative_path(__file__, "test_repository_data_cache.py"),
+            ),
+            location_name="test",
+        )
+
+        with ProcessGrpcServerRegistry(
+            reload_interval=0, heartbeat_ttl=30, startup_timeout=30
+        ) as grpc_server_registry:
+            with GrpcServerRepositoryLocation(
+                origin,
+                heartbeat=True,
+                watch_server=False,
+                grpc_server_registry=grpc_server_registry,
+                repository_data_cache=cache,
+                get_endpoint=lambda: grpc_server_registry.get_grpc_endpoint(origin),
+            ) as location:
+                assert location.has_repository("cached_repo")
+
+            server_can_start = threading.Event()
+
+            def _get_endpoint():
+                server_can_start.wait()
+                return grpc_server_registry.reload_grpc_endpoint(origin)
+
+            location = GrpcServerRepositoryLocation(
+                origin,
+                heartbeat=True,
+                watch_server=False,
+                grpc_server_registry=grpc_server_registry,
+                repository_data_cache=cache,
+                get_endpoint=_get_endpoint,
+            )
+            repositories = location.get_repositories()
+
+            cleanup_thread = threading.Thread(target=location.cleanup)
+            cleanup_thread.start()
+
+            # the cached data is still being revalidated, so the cleanup can't finish yet
+            cleanup_thread.join(timeout=1)
+            assert cleanup_thread.is_alive()
+
+            server_can_start.set()
+            cleanup_thread.join()
+
+            # a location that was cleaned up keeps the data it was loaded with
+            assert location.get_repositories() is repositories
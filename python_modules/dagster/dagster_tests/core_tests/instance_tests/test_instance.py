@@ -19,6 +19,7 @@
     create_pipeline_snapshot_id,
     snapshot_from_execution_plan,
 )
+from dagster.core.storage.pipeline_run import PipelineRunStatus
 from dagster.core.test_utils import create_run_for_test, environ, instance_for_test
 from dagster.serdes import ConfigurableClass
 from dagster.serdes.config_class import ConfigurableClassData
@@ -134,6 +135,135 @@ def test_submit_run():
             assert instance.run_coordinator.queue()[0].run_id == "foo-bar"
 
 
+def _run_kwargs(run_id, pipeline_snapshot=None, execution_plan_snapshot=None, **kwargs):
+    return dict(
+        pipeline_name="noop_pipeline",
+        run_id=run_id,
+        run_config=None,
+        mode=None,
+        solids_to_execute=None,
+        step_keys_to_execute=None,
+        status=None,
+        tags=None,
+        root_run_id=None,
+        parent_run_id=None,
+        pipeline_snapshot=pipeline_snapshot,
+        execution_plan_snapshot=execution_plan_snapshot,
+        parent_pipeline_snapshot=None,
+        **kwargs,
+    )
+
+
+def test_create_runs():
+    @solid
+    def noop_solid(_):
+        pass
+
+    @pipeline
+    def noop_pipeline():
+        noop_solid()
+
+    pipeline_snapshot = noop_pipeline.get_pipeline_snapshot()
+    ep_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(noop_pipeline), noop_pipeline.get_pipeline_snapshot_id()
+    )
+
+    with instance_for_test() as instance:
+        runs = instance.create_runs(
+            [
+                _run_kwargs(run_id, pipeline_snapshot, ep_snapshot)
+                for run_id in ["one", "two", "three"]
+            ]
+        )
+        assert [run.run_id for run in runs] == ["one", "two", "three"]
+        assert [run.run_id for run in instance.get_runs()] == ["three", "two", "one"]
+
+        for run in runs:
+            assert run.pipeline_snapshot_id == create_pipeline_snapshot_id(pipeline_snapshot)
+            assert run.execution_plan_snapshot_id == create_execution_plan_snapshot_id(ep_snapshot)
+        assert instance.has_pipeline_snapshot(create_pipeline_snapshot_id(pipeline_snapshot))
+        assert instance.has_snapshot(create_execution_plan_snapshot_id(ep_snapshot))
+
+        assert instance.create_runs([]) == []
+
+
+def test_submit_runs():
+    with instance_for_test(
+        overrides={
+            "run_coordinator": {
+                "module": "dagster.core.test_utils",
+                "class": "MockedRunCoordinator",
+            }
+        }
+    ) as instance:
+        with get_bar_workspace(instance) as workspace:
+            external_pipeline = (
+                workspace.get_repository_location("bar_repo_location")
+                .get_repository("bar_repo")
+                .get_full_external_pipeline("foo")
+            )
+
+            runs = instance.create_runs(
+                [
+                    _run_kwargs(
+                        run_id,
+                        external_pipeline_origin=external_pipeline.get_external_origin(),
+                        pipeline_code_origin=external_pipeline.get_python_origin(),
+                    )
+                    for run_id in ["foo", "bar"]
+                ]
+            )
+
+            submitted_runs = instance.submit_runs([run.run_id for run in runs], workspace)
+
+            assert [run.run_id for run in submitted_runs] == ["foo", "bar"]
+            assert [run.run_id for run in instance.run_coordinator.queue()] == ["foo", "bar"]
+
+            with pytest.raises(DagsterInvariantViolationError, match="missing"):
+                instance.submit_runs(["missing"], workspace)
+
+
+def test_launch_runs():
+    with instance_for_test(
+        overrides={
+            "run_launcher": {
+                "module": "dagster.core.test_utils",
+                "class": "MockedRunLauncher",
+                "config": {"bad_run_ids": ["bad"]},
+            }
+        }
+    ) as instance:
+        with get_bar_workspace(instance) as workspace:
+            external_pipeline = (
+                workspace.get_repository_location("bar_repo_location")
+                .get_repository("bar_repo")
+                .get_full_external_pipeline("foo")
+            )
+
+            runs = instance.create_runs(
+                [
+                    _run_kwargs(
+                        run_id,
+                        external_pipeline_origin=external_pipeline.get_external_origin(),
+                        pipeline_code_origin=external_pipeline.get_python_origin(),
+                    )
+                    for run_id in ["foo", "bad", "bar"]
+                ]
+            )
+
+            errors = instance.launch_runs([run.run_id for run in runs], workspace)
+
+            # the failed launch doesn't stop the rest of the batch
+            assert list(errors.keys()) == ["bad"]
+            assert "Bad run bad" in errors["bad"].message
+            assert [run.run_id for run in instance.run_launcher.queue()] == ["foo", "bar"]
+            assert instance.get_run_by_id("bad").status == PipelineRunStatus.FAILURE
+
+            assert instance.launch_runs([], workspace) == {}
+            with pytest.raises(DagsterInvariantViolationError, match="missing"):
+                instance.launch_runs(["missing"], workspace)
+
+
 def test_get_required_daemon_types():
     from dagster.daemon.daemon import (
         SensorDaemon,
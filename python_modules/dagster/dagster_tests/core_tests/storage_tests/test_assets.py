@@ -406,6 +406,42 @@ def gen_everything():
         ]
 
 
+@asset_test
+def test_iterate_asset_keys(asset_aware_context):
+    @op
+    def gen_op():
+        for i in range(10):
+            yield AssetMaterialization(asset_key=AssetKey(["my_prefix", f"asset_{i}"]))
+        yield AssetMaterialization(asset_key=AssetKey(["myXprefix", "other"]))
+        yield AssetMaterialization(asset_key=AssetKey(["wiped"]))
+        yield Output(1)
+
+    @job
+    def gen_everything():
+        gen_op()
+
+    with asset_aware_context() as ctx:
+        instance, event_log_storage = ctx
+        gen_everything.execute_in_process(instance=instance)
+        instance.wipe_assets([AssetKey(["wiped"])])
+
+        prefixed_keys = [AssetKey(["my_prefix", f"asset_{i}"]) for i in range(10)]
+        assert list(event_log_storage.iterate_asset_keys(batch_size=3)) == [
+            AssetKey(["myXprefix", "other"]),
+            *prefixed_keys,
+        ]
+
+        # `_` in the prefix must not match any character
+        assert (
+            list(event_log_storage.iterate_asset_keys(prefix=["my_prefix"], batch_size=4))
+            == prefixed_keys
+        )
+        assert event_log_storage.get_asset_keys(prefix=["my_prefix"]) == prefixed_keys
+        assert list(instance.iterate_asset_keys(prefix=["myXprefix"])) == [
+            AssetKey(["myXprefix", "other"])
+        ]
+
+
 def _materialization_event_record(run_id, asset_key):
     return EventLogEntry(
         None,
@@ -0,0 +1,142 @@
+import gzip
+import os
+import tempfile
+import time
+
+from dagster import DagsterEventType, job, op
+from dagster.core.storage import compressed_compute_logs
+from dagster.core.storage.compute_log_manager import ComputeIOType
+from dagster.core.storage.local_compute_log_manager import LocalComputeLogManager
+from dagster.core.storage.pipeline_run import PipelineRun
+from dagster.core.test_utils import instance_for_test
+from dagster.utils import ensure_dir, touch_file
+
+
+def test_compressed_compute_logs(monkeypatch):
+    monkeypatch.setattr(compressed_compute_logs, "SEGMENT_SIZE", 16)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir, compression="gzip")
+        pipeline_run = PipelineRun(pipeline_name="my_pipeline", run_id="my_run_id")
+        stdout_path = manager.get_local_path("my_run_id", "my_step", ComputeIOType.STDOUT)
+        log_data = "".join(f"line {i}\n" for i in range(100)).encode("utf-8")
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "wb") as f:
+            f.write(log_data)
+
+        manager.on_watch_finish(pipeline_run, "my_step")
+
+        # the raw log file is replaced by the compressed one, which is a valid gzip file
+        assert not os.path.exists(stdout_path)
+        compressed_path = manager.get_compressed_path("my_run_id", "my_step", ComputeIOType.STDOUT)
+        assert compressed_path.endswith(".out.gz")
+        with open(compressed_path, "rb") as f:
+            assert gzip.decompress(f.read()) == log_data
+        assert not manager.get_compressed_path("my_run_id", "my_step", ComputeIOType.STDERR)
+
+        # windows that start and end within segments, and span several of them
+        for cursor, max_bytes in [(0, 10), (5, 100), (30, 7), (len(log_data) - 3, 100)]:
+            chunk = manager.read_logs_file(
+                "my_run_id", "my_step", ComputeIOType.STDOUT, cursor=cursor, max_bytes=max_bytes
+            )
+            assert chunk.data == log_data[cursor : cursor + max_bytes].decode("utf-8")
+            assert chunk.cursor == min(cursor + max_bytes, len(log_data))
+            assert chunk.size == len(log_data)
+
+        chunk = manager.read_logs_file(
+            "my_run_id", "my_step", ComputeIOType.STDOUT, cursor=len(log_data) + 10
+        )
+        assert chunk.data == ""
+        assert chunk.cursor == len(log_data)
+
+
+def test_compressed_compute_logs_multi_byte_chars(monkeypatch):
+    monkeypatch.setattr(compressed_compute_logs, "SEGMENT_SIZE", 16)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir, compression="gzip")
+        pipeline_run = PipelineRun(pipeline_name="my_pipeline", run_id="my_run_id")
+        stdout_path = manager.get_local_path("my_run_id", "my_step", ComputeIOType.STDOUT)
+        log_text = "".join(f"línea {i} ✓ 🚀\n" for i in range(20))
+        ensure_dir(os.path.dirname(stdout_path))
+        with open(stdout_path, "wb") as f:
+            f.write(log_text.encode("utf-8"))
+
+        manager.on_watch_finish(pipeline_run, "my_step")
+
+        # windows that end within a character leave it to the next read
+        for max_bytes in [1, 2, 3, 5, 7]:
+            cursor = 0
+            chunks = []
+            while True:
+                chunk = manager.read_logs_file(
+                    "my_run_id", "my_step", ComputeIOType.STDOUT, cursor=cursor, max_bytes=max_bytes
+                )
+                if not chunk.data:
+                    break
+                chunks.append(chunk.data)
+                cursor = chunk.cursor
+
+            if max_bytes >= 4:
+                assert "".join(chunks) == log_text
+            else:
+                # the characters that don't fit in a window are replaced
+                assert cursor == len(log_text.encode("utf-8"))
+
+
+def test_compressed_compute_logs_from_execution():
+    @op
+    def spew():
+        print("HELLO")  # pylint: disable=print-call
+
+    @job
+    def spew_job():
+        spew()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                "compute_logs": {
+                    "module": "dagster.core.storage.local_compute_log_manager",
+                    "class": "LocalComputeLogManager",
+                    "config": {"base_dir": temp_dir, "compression": "gzip"},
+                }
+            }
+        ) as instance:
+            result = spew_job.execute_in_process(instance=instance)
+            assert result.success
+
+            step_key = next(
+                event.step_key
+                for event in result.all_node_events
+                if event.event_type == DagsterEventType.STEP_START
+            )
+            manager = instance.compute_log_manager
+            assert manager.get_compressed_path(result.run_id, step_key, ComputeIOType.STDOUT)
+            stdout = manager.read_logs_file(result.run_id, step_key, ComputeIOType.STDOUT)
+            assert stdout.data.strip() == "HELLO"
+
+
+def test_prune_compute_logs():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = LocalComputeLogManager(temp_dir, retention_days=7)
+        now = time.time()
+        old = now - 8 * 24 * 60 * 60
+
+        for run_id in ["old_run", "new_run", "old_run_with_artifacts"]:
+            touch_file(manager.get_local_path(run_id, "my_step", ComputeIOType.STDOUT))
+            touch_file(manager.complete_artifact_path(run_id, "my_step"))
+        touch_file(os.path.join(temp_dir, "old_run_with_artifacts", "my_step", "result"))
+
+        for run_id in ["old_run", "old_run_with_artifacts"]:
+            compute_logs_dir = os.path.join(temp_dir, run_id, "compute_logs")
+            for filename in os.listdir(compute_logs_dir):
+                os.utime(os.path.join(compute_logs_dir, filename), (old, old))
+            os.utime(compute_logs_dir, (old, old))
+
+        manager.prune_logs(now - 7 * 24 * 60 * 60)
+
+        assert not os.path.exists(os.path.join(temp_dir, "old_run"))
+        assert os.path.exists(manager.get_local_path("new_run", "my_step", ComputeIOType.STDOUT))
+        assert not os.path.exists(os.path.join(temp_dir, "old_run_with_artifacts", "compute_logs"))
+        assert os.path.exists(os.path.join(temp_dir, "old_run_with_artifacts", "my_step", "result"))
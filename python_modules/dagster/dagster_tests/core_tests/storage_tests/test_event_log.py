@@ -108,6 +108,19 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_secondary_index_built_by_other_storage(self, storage):
+        assert not storage.has_secondary_index("some_index")
+
+        # e.g. `dagster instance reindex` in another process
+        tmpdir_path = storage._base_dir  # pylint: disable=protected-access
+        other_storage = SqliteEventLogStorage(tmpdir_path)
+        try:
+            other_storage.enable_secondary_index("some_index")
+        finally:
+            other_storage.dispose()
+
+        assert storage.has_secondary_index("some_index")
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -1,5 +1,6 @@
 import tempfile
 from contextlib import contextmanager
+from unittest import mock
 
 import pytest
 from dagster.core.storage.runs import InMemoryRunStorage, SqliteRunStorage
@@ -25,6 +26,21 @@ def run_storage(self, request):
         with request.param() as s:
             yield s
 
+    def test_backfill_id_column_check_is_cached(self, storage):
+        assert storage.has_backfill_id_column()
+
+        # the runs table isn't inspected again once the column has been found
+        with mock.patch("dagster.core.storage.runs.sql_run_storage.db.inspect") as inspect:
+            assert storage.has_backfill_id_column()
+            assert not inspect.called
+
+        # the revision before the backfill id column was added
+        storage._alembic_downgrade(rev="f4eed4c26e2c")  # pylint: disable=protected-access
+        assert not storage.has_backfill_id_column()
+
+        storage._alembic_upgrade()  # pylint: disable=protected-access
+        assert storage.has_backfill_id_column()
+
 
 class TestInMemoryImplementation(TestRunStorage):
     __test__ = True
@@ -41,9 +41,12 @@
     RunShardedEventsCursor,
 )
 from dagster.core.storage.event_log.migration import (
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITIONS,
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
 )
+from dagster.core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster.core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster.core.test_utils import instance_for_test
 from dagster.core.utils import make_new_run_id
@@ -479,6 +482,29 @@ def test_event_log_step_stats(self, storage):
         assert len(d_stats.expectation_results) == 2
         assert len(c_stats.attempts_list) == 1
 
+    def test_event_log_stats_for_runs(self, storage):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for run_id in run_ids[:2]:
+            for record in _stats_records(run_id=run_id):
+                storage.store_event(record)
+
+        stats_by_run_id = storage.get_stats_for_runs(run_ids)
+        assert set(stats_by_run_id.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert stats_by_run_id[run_id] == storage.get_stats_for_run(run_id)
+        assert stats_by_run_id[run_ids[0]].steps_succeeded == 2
+        assert stats_by_run_id[run_ids[2]].steps_succeeded == 0
+
+        step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids)
+        assert set(step_stats_by_run_id.keys()) == set(run_ids)
+        for run_id in run_ids:
+            assert step_stats_by_run_id[run_id] == storage.get_step_stats_for_run(run_id)
+        assert len(step_stats_by_run_id[run_ids[1]]) == 4
+        assert step_stats_by_run_id[run_ids[2]] == []
+
+        step_stats_by_run_id = storage.get_step_stats_for_runs(run_ids, step_keys=["A"])
+        assert [stats.step_key for stats in step_stats_by_run_id[run_ids[0]]] == ["A"]
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlEventLogStorage):
             pytest.skip("This test is for SQL-backed Event Log behavior")
@@ -1520,3 +1546,113 @@ def _fetch_counts(storage):
             assert materialization_count_by_partition[a]["d"] == 1
             assert len(materialization_count_by_partition[a]) == 1
             assert materialization_count_by_partition[b]["b"] == 2
+
+    def test_get_latest_materialization_events_by_partition(self, storage):
+        a = AssetKey("a")
+        b = AssetKey("b")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(a, partition="x", description="1")
+            yield AssetMaterialization(a, partition="x", description="2")
+            yield AssetMaterialization(a, partition="y", description="3")
+            yield AssetMaterialization(b, description="4")
+            yield Output(1)
+
+        events, _ = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        def _descriptions(events_by_partition):
+            return {
+                partition: event.dagster_event.step_materialization_data.materialization.description
+                for partition, event in events_by_partition.items()
+            }
+
+        events_by_partition = storage.get_latest_materialization_events_by_partition([a, b])
+        assert _descriptions(events_by_partition[a]) == {"x": "2", "y": "3"}
+        assert _descriptions(events_by_partition[b]) == {None: "4"}
+
+        if self.can_wipe():
+            storage.wipe_asset(a)
+            events_by_partition = storage.get_latest_materialization_events_by_partition([a, b])
+            assert events_by_partition[a] == {}
+            assert _descriptions(events_by_partition[b]) == {None: "4"}
+
+    def test_wipe_legacy_asset_key_events(self, storage):
+        if not isinstance(storage, SqlEventLogStorage) or not self.can_wipe():
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        if isinstance(storage, SqliteEventLogStorage):
+            # the run-sharded storage only queries events across the runs of its instance
+            pytest.skip()
+
+        a = AssetKey(["path", "a"])
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(a, partition="x")
+            yield Output(1)
+
+        events, _ = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        # events stored by older versions used the legacy dotted form of the asset key
+        with storage.index_connection() as conn:
+            conn.execute(
+                SqlEventLogStorageTable.update()  # pylint: disable=no-value-for-parameter
+                .where(SqlEventLogStorageTable.c.asset_key == a.to_string())
+                .values(asset_key=a.to_string(legacy=True))
+            )
+
+        # marks the asset key index columns as migrated, so that the wipe filter is joined
+        storage.all_asset_keys()
+        if storage.has_asset_key_index_cols():
+            assert storage.has_secondary_index(ASSET_KEY_INDEX_COLS)
+
+        assert len(storage.get_event_records(EventRecordsFilter(asset_key=a))) == 1
+        assert len(storage.get_asset_run_ids(a)) == 1
+        assert storage.get_latest_storage_id_by_partition([a])[a].keys() == {"x"}
+
+        storage.wipe_asset(a)
+
+        assert storage.get_event_records(EventRecordsFilter(asset_key=a)) == []
+        assert storage.get_asset_run_ids(a) == []
+        assert not storage.get_latest_storage_id_by_partition([a]).get(a)
+        assert not storage.get_materialization_count_by_partition([a]).get(a)
+
+    def test_asset_partitions_index(self, storage):
+        if not isinstance(storage, SqlEventLogStorage):
+            pytest.skip("This test is for SQL-backed Event Log behavior")
+
+        a = AssetKey("a")
+
+        @solid
+        def materialize(_):
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield Output(1)
+
+        # newly initialized DBs have the asset partitions table built
+        assert storage.has_secondary_index(ASSET_PARTITIONS)
+
+        events, _ = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        assert storage.get_materialization_count_by_partition([a]) == {a: {"x": 2, "y": 1}}
+
+        # rebuilding the table from the event log results in the same counts
+        storage.reindex_assets(force=True)
+        assert storage.get_materialization_count_by_partition([a]) == {a: {"x": 2, "y": 1}}
+
+        events, result = _synthesize_events(lambda: materialize())
+        for event in events:
+            storage.store_event(event)
+
+        assert storage.get_materialization_count_by_partition([a]) == {a: {"x": 4, "y": 2}}
+
+        storage.delete_events(result.run_id)
+        assert storage.get_materialization_count_by_partition([a]) == {a: {"x": 2, "y": 1}}
@@ -22,11 +22,20 @@
     JobBucket,
     PipelineRunStatus,
     PipelineRunsFilter,
+    RunPartitionData,
     TagBucket,
 )
 from dagster.core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
 from dagster.core.storage.runs.sql_run_storage import SqlRunStorage
-from dagster.core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
+from dagster.core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+    PARENT_RUN_ID_TAG,
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+)
 from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster.core.utils import make_new_run_id
 from dagster.daemon.daemon import SensorDaemon
@@ -124,6 +133,45 @@ def test_basic_storage(self, storage):
         assert fetched_run.run_id == run_id
         assert fetched_run.pipeline_name == "some_pipeline"
 
+    def test_add_runs(self, storage):
+        run_ids = [make_new_run_id() for _ in range(3)]
+        added = storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=run_id, pipeline_name="some_pipeline", tags={"foo": str(i)}
+                )
+                for i, run_id in enumerate(run_ids)
+            ]
+        )
+        assert [run.run_id for run in added] == run_ids
+
+        # runs are fetched newest first, so the batch is stored in order
+        runs = storage.get_runs()
+        assert [run.run_id for run in runs] == list(reversed(run_ids))
+        assert [run.tags["foo"] for run in runs] == ["2", "1", "0"]
+        assert len(storage.get_runs(filters=PipelineRunsFilter(tags={"foo": "1"}))) == 1
+
+        assert storage.add_runs([]) == []
+
+        with pytest.raises(DagsterRunAlreadyExists):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name="other"),
+                    TestRunStorage.build_run(run_id=run_ids[0], pipeline_name="some_pipeline"),
+                ]
+            )
+
+        with pytest.raises(DagsterSnapshotDoesNotExist):
+            storage.add_runs(
+                [
+                    TestRunStorage.build_run(
+                        run_id=make_new_run_id(),
+                        pipeline_name="some_pipeline",
+                        pipeline_snapshot_id="nope",
+                    )
+                ]
+            )
+
     def test_clear(self, storage):
         if not self.can_delete_runs():
             pytest.skip("storage cannot delete")
@@ -153,6 +201,26 @@ def test_fetch_by_pipeline(self, storage):
         assert len(some_runs) == 1
         assert some_runs[0].run_id == one
 
+    def test_fetch_by_pipeline_names(self, storage):
+        assert storage
+        one = make_new_run_id()
+        two = make_new_run_id()
+        three = make_new_run_id()
+        storage.add_run(TestRunStorage.build_run(run_id=one, pipeline_name="some_pipeline"))
+        storage.add_run(TestRunStorage.build_run(run_id=two, pipeline_name="some_other_pipeline"))
+        storage.add_run(TestRunStorage.build_run(run_id=three, pipeline_name="another_pipeline"))
+        assert len(storage.get_runs()) == 3
+        some_runs = storage.get_runs(
+            PipelineRunsFilter(pipeline_names=["some_pipeline", "some_other_pipeline"])
+        )
+        assert {run.run_id for run in some_runs} == {one, two}
+        assert (
+            storage.get_runs_count(
+                PipelineRunsFilter(pipeline_names=["some_pipeline", "some_other_pipeline"])
+            )
+            == 2
+        )
+
     def test_fetch_by_snapshot_id(self, storage):
         assert storage
         pipeline_def_a = PipelineDefinition(name="some_pipeline", solid_defs=[])
@@ -469,6 +537,55 @@ def test_fetch_by_tags(self, storage):
         some_runs = storage.get_runs(PipelineRunsFilter(tags={}))
         assert len(some_runs) == 3
 
+    def test_get_latest_runs_by_run_key(self, storage):
+        assert storage
+        old_run_id, new_run_id, other_sensor_run_id, other_key_run_id = [
+            make_new_run_id() for _ in range(4)
+        ]
+        for run_id, sensor_name, run_key in [
+            (old_run_id, "my_sensor", "a"),
+            (new_run_id, "my_sensor", "a"),
+            (other_sensor_run_id, "other_sensor", "b"),
+            (other_key_run_id, "my_sensor", "c"),
+        ]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="some_pipeline",
+                    tags={"sensor": sensor_name, RUN_KEY_TAG: run_key},
+                )
+            )
+        storage.add_run(TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name="foo"))
+
+        runs_by_run_key = storage.get_latest_runs_by_run_key(
+            ["a", "b", "c", "d"], tags={"sensor": "my_sensor"}
+        )
+        assert {run_key: run.run_id for run_key, run in runs_by_run_key.items()} == {
+            "a": new_run_id,
+            "c": other_key_run_id,
+        }
+
+        runs_by_run_key = storage.get_latest_runs_by_run_key(["b"])
+        assert {run_key: run.run_id for run_key, run in runs_by_run_key.items()} == {
+            "b": other_sensor_run_id
+        }
+
+        assert storage.get_latest_runs_by_run_key([]) == {}
+
+        # more run keys than fit in a single query
+        run_keys = [f"key_{i}" for i in range(1200)]
+        storage.add_runs(
+            [
+                TestRunStorage.build_run(
+                    run_id=make_new_run_id(),
+                    pipeline_name="some_pipeline",
+                    tags={RUN_KEY_TAG: run_key},
+                )
+                for run_key in run_keys
+            ]
+        )
+        assert set(storage.get_latest_runs_by_run_key(run_keys).keys()) == set(run_keys)
+
     def test_paginated_fetch(self, storage):
         assert storage
         one, two, three = [make_new_run_id(), make_new_run_id(), make_new_run_id()]
@@ -810,6 +927,10 @@ def test_add_get_execution_snapshot(self, storage):
         assert storage.has_execution_plan_snapshot(snapshot_id)
         assert not storage.has_execution_plan_snapshot("nope")
 
+        fetched_ep_snapshots = storage.get_execution_plan_snapshots([snapshot_id, "nope"])
+        assert list(fetched_ep_snapshots.keys()) == [snapshot_id]
+        assert serialize_pp(fetched_ep_snapshots[snapshot_id]) == serialize_pp(ep_snapshot)
+
         if self.can_delete_runs():
 
             storage.wipe()
@@ -1096,6 +1217,131 @@ def test_backfill(self, storage):
         assert len(storage.get_backfills()) == 1
         assert len(storage.get_backfills(status=BulkActionStatus.REQUESTED)) == 0
 
+    def test_backfill_run_partition_names(self, storage):
+        def _build_backfill_run(backfill_id, partition_name, status=PipelineRunStatus.STARTED):
+            return TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                pipeline_name="some_pipeline",
+                tags={
+                    **DagsterRun.tags_for_backfill_id(backfill_id),
+                    PARTITION_NAME_TAG: partition_name,
+                },
+                status=status,
+            )
+
+        storage.add_runs([_build_backfill_run("one", "a"), _build_backfill_run("one", "b")])
+        storage.add_run(_build_backfill_run("one", "c"))
+        storage.add_run(_build_backfill_run("two", "d"))
+        # runs that were created but never submitted don't count
+        storage.add_run(_build_backfill_run("two", "e", status=PipelineRunStatus.NOT_STARTED))
+        storage.add_run(
+            TestRunStorage.build_run(run_id=make_new_run_id(), pipeline_name="some_pipeline")
+        )
+
+        assert storage.get_backfill_run_partition_names("one") == {"a", "b", "c"}
+        assert storage.get_backfill_run_partition_names("one", ["b", "c", "d"]) == {"b", "c"}
+        assert storage.get_backfill_run_partition_names("one", []) == set()
+        assert storage.get_backfill_run_partition_names("two") == {"d"}
+        assert storage.get_backfill_run_partition_names("three") == set()
+
+        # the runs that were never submitted are looked up to be submitted by the next attempt
+        [unsubmitted_run] = storage.get_backfill_unsubmitted_runs("two")
+        assert unsubmitted_run.tags[PARTITION_NAME_TAG] == "e"
+        assert storage.get_backfill_unsubmitted_runs("two", ["d", "e"]) == [unsubmitted_run]
+        assert storage.get_backfill_unsubmitted_runs("two", ["d"]) == []
+        assert storage.get_backfill_unsubmitted_runs("two", []) == []
+        assert storage.get_backfill_unsubmitted_runs("one") == []
+
+    def test_get_run_partition_data(self, storage):
+        def _add_partition_run(partition_set_name, partition_name, status, pipeline_name="foo"):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name=pipeline_name,
+                    tags={
+                        PARTITION_SET_TAG: partition_set_name,
+                        PARTITION_NAME_TAG: partition_name,
+                    },
+                    status=status,
+                )
+            )
+            return run_id
+
+        _add_partition_run("foo_set", "a", PipelineRunStatus.FAILURE)
+        a_run_id = _add_partition_run("foo_set", "a", PipelineRunStatus.SUCCESS)
+        b_run_id = _add_partition_run("foo_set", "b", PipelineRunStatus.FAILURE)
+        c_run_id = _add_partition_run("foo_set", "c", PipelineRunStatus.STARTED, "bar")
+        _add_partition_run("bar_set", "a", PipelineRunStatus.FAILURE)
+
+        def _get_run_partition_data(*args, **kwargs):
+            return sorted(
+                storage.get_run_partition_data(*args, **kwargs), key=lambda data: data.partition
+            )
+
+        assert _get_run_partition_data("foo_set") == [
+            RunPartitionData(a_run_id, "a", PipelineRunStatus.SUCCESS),
+            RunPartitionData(b_run_id, "b", PipelineRunStatus.FAILURE),
+            RunPartitionData(c_run_id, "c", PipelineRunStatus.STARTED),
+        ]
+        assert _get_run_partition_data("foo_set", job_name="foo") == [
+            RunPartitionData(a_run_id, "a", PipelineRunStatus.SUCCESS),
+            RunPartitionData(b_run_id, "b", PipelineRunStatus.FAILURE),
+        ]
+        assert _get_run_partition_data("foo_set", partition_names=["b", "d"]) == [
+            RunPartitionData(b_run_id, "b", PipelineRunStatus.FAILURE),
+        ]
+        assert _get_run_partition_data("foo_set", partition_names=[]) == []
+        assert _get_run_partition_data("baz_set") == []
+
+    def test_get_run_partition_data_with_range_runs(self, storage):
+        def _add_run(status, tags):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    pipeline_name="foo",
+                    tags={PARTITION_SET_TAG: "foo_set", **tags},
+                    status=status,
+                )
+            )
+            return run_id
+
+        def _add_range_run(status, start, end):
+            return _add_run(
+                status, {ASSET_PARTITION_RANGE_START_TAG: start, ASSET_PARTITION_RANGE_END_TAG: end}
+            )
+
+        # the keys are not in lexicographic order
+        partition_keys = ["9", "10", "11", "12"]
+
+        earlier_run_id = _add_run(PipelineRunStatus.FAILURE, {PARTITION_NAME_TAG: "10"})
+        range_run_id = _add_range_run(PipelineRunStatus.SUCCESS, "9", "11")
+        later_run_id = _add_run(PipelineRunStatus.FAILURE, {PARTITION_NAME_TAG: "11"})
+        _add_range_run(PipelineRunStatus.SUCCESS, "12", "13")
+
+        def _get_run_partition_data(*args, **kwargs):
+            return sorted(
+                storage.get_run_partition_data(*args, **kwargs),
+                key=lambda data: partition_keys.index(data.partition),
+            )
+
+        # range runs are only counted when the order of the partition keys is known
+        assert _get_run_partition_data("foo_set") == [
+            RunPartitionData(earlier_run_id, "10", PipelineRunStatus.FAILURE),
+            RunPartitionData(later_run_id, "11", PipelineRunStatus.FAILURE),
+        ]
+        assert _get_run_partition_data("foo_set", partition_keys=partition_keys) == [
+            RunPartitionData(range_run_id, "9", PipelineRunStatus.SUCCESS),
+            RunPartitionData(range_run_id, "10", PipelineRunStatus.SUCCESS),
+            RunPartitionData(later_run_id, "11", PipelineRunStatus.FAILURE),
+        ]
+        assert _get_run_partition_data(
+            "foo_set", partition_names=["10", "12"], partition_keys=partition_keys
+        ) == [
+            RunPartitionData(range_run_id, "10", PipelineRunStatus.SUCCESS),
+        ]
+
     def test_secondary_index(self, storage):
         if not isinstance(storage, SqlRunStorage):
             return
@@ -1,8 +1,12 @@
+import os
+import subprocess
 import sys
+import time
 
 import pytest
 from dagster.core.execution.compute_logs import (
     mirror_stream_to_file,
+    pipe_stream_to_file,
     should_disable_io_stream_redirect,
 )
 from dagster.utils.test import get_temp_file_name
@@ -18,3 +22,50 @@ def test_capture():
 
         with open(capture_filepath, "r") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_pipe_capture():
+    with get_temp_file_name() as capture_filepath:
+        with pipe_stream_to_file(sys.stdout, capture_filepath):
+            print("HELLO")  # pylint: disable=print-call
+            sys.stdout.flush()
+            os.write(sys.stdout.fileno(), b"FROM FD\n")
+            subprocess.check_call([sys.executable, "-c", "print('FROM SUBPROCESS')"])
+
+        # everything written while capturing is in the file once capture ends
+        with open(capture_filepath, "r") as capture_stream:
+            assert capture_stream.read() == "HELLO\nFROM FD\nFROM SUBPROCESS\n"
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect() or sys.platform == "win32",
+    reason="compute logs disabled for win / py3.6+",
+)
+@pytest.mark.skipif(
+    not os.getenv("DAGSTER_RUN_BENCHMARKS"),
+    reason="timing benchmark, set DAGSTER_RUN_BENCHMARKS to run it",
+)
+def test_pipe_capture_benchmark():
+    # Captures the output of many short steps with both capture modes. Piping doesn't start any
+    # subprocesses, so it should be much faster than tailing.
+    num_steps = 50
+
+    def _capture_steps(mirror):
+        start = time.time()
+        for _ in range(num_steps):
+            with get_temp_file_name() as stdout_filepath, get_temp_file_name() as stderr_filepath:
+                with mirror(sys.stdout, stdout_filepath):
+                    with mirror(sys.stderr, stderr_filepath):
+                        print("HELLO")  # pylint: disable=print-call
+                        print("WORLD", file=sys.stderr)  # pylint: disable=print-call
+        return time.time() - start
+
+    pipe_seconds = _capture_steps(pipe_stream_to_file)
+    tail_seconds = _capture_steps(mirror_stream_to_file)
+    assert pipe_seconds < tail_seconds, (
+        f"Capturing {num_steps} steps took {pipe_seconds:.2f}s with pipes and "
+        f"{tail_seconds:.2f}s with tail"
+    )
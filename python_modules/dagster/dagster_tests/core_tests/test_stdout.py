@@ -85,6 +85,41 @@ def test_compute_log_to_disk():
                 assert normalize_file_content(stdout_file.read()) == HELLO_SOLID
 
 
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_compute_log_to_disk_pipe_capture():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with instance_for_test(
+            overrides={
+                "compute_logs": {
+                    "module": "dagster.core.storage.local_compute_log_manager",
+                    "class": "LocalComputeLogManager",
+                    "config": {"base_dir": temp_dir, "capture_mode": "pipe"},
+                }
+            }
+        ) as instance:
+            spew_pipeline = define_pipeline()
+            manager = instance.compute_log_manager
+            result = execute_pipeline(spew_pipeline, instance=instance)
+            assert result.success
+
+            compute_steps = [
+                event.step_key
+                for event in result.step_event_list
+                if event.event_type == DagsterEventType.STEP_START
+            ]
+            for step_key in compute_steps:
+                if step_key.startswith("spawn"):
+                    continue
+                compute_io_path = manager.get_local_path(
+                    result.run_id, step_key, ComputeIOType.STDOUT
+                )
+                assert os.path.exists(compute_io_path)
+                with open(compute_io_path, "r") as stdout_file:
+                    assert normalize_file_content(stdout_file.read()) == HELLO_SOLID
+
+
 @pytest.mark.skipif(
     should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
 )
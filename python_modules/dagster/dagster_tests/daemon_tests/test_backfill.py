@@ -5,6 +5,7 @@
 import time
 from collections import defaultdict
 from contextlib import contextmanager
+from unittest import mock
 
 import pendulum
 import pytest
@@ -566,6 +567,48 @@ def test_large_backfill(external_repo_context):
         assert instance.get_runs_count() == 3
 
 
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_backfill_interrupted_before_submit(external_repo_context):
+    with instance_for_context(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        external_partition_set = external_repo.get_external_partition_set("simple_partition_set")
+        backfill = PartitionBackfill(
+            backfill_id="simple",
+            partition_set_origin=external_partition_set.get_external_origin(),
+            status=BulkActionStatus.REQUESTED,
+            partition_names=["one", "two", "three"],
+            from_failure=False,
+            reexecution_steps=None,
+            tags=None,
+            backfill_timestamp=pendulum.now().timestamp(),
+        )
+        instance.add_backfill(backfill)
+
+        # the runs of the chunk are created, but the iteration fails before submitting them
+        with mock.patch.object(instance, "submit_runs", side_effect=Exception("interrupted")):
+            list(
+                execute_backfill_iteration(
+                    instance, workspace, get_default_daemon_logger("BackfillDaemon")
+                )
+            )
+        assert instance.get_runs_count() == 3
+        assert all(run.status == PipelineRunStatus.NOT_STARTED for run in instance.get_runs())
+
+        # the unsubmitted partitions aren't treated as done, and their runs are submitted
+        instance.update_backfill(backfill)
+        list(
+            execute_backfill_iteration(
+                instance, workspace, get_default_daemon_logger("BackfillDaemon")
+            )
+        )
+        assert instance.get_runs_count() == 3
+        assert all(run.status != PipelineRunStatus.NOT_STARTED for run in instance.get_runs())
+        assert instance.get_backfill("simple").status == BulkActionStatus.COMPLETED
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_unloadable_backfill(external_repo_context):
     with instance_for_context(external_repo_context) as (
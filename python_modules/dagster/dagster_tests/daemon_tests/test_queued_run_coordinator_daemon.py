@@ -532,3 +532,79 @@ def test_key_limit_with_extra_tags(workspace, daemon):
 
         list(daemon.run_iteration(instance, workspace))
         assert get_run_ids(instance.run_launcher.queue()) == ["run-1"]
+
+
+def test_tag_limits_skip_runs_no_longer_queued(workspace, daemon, monkeypatch):
+    with instance_for_queued_run_coordinator(
+        max_concurrent_runs=10,
+        tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+    ) as instance:
+        create_run(
+            instance,
+            run_id="tiny-1",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "tiny"},
+        )
+        create_run(
+            instance,
+            run_id="tiny-2",
+            status=PipelineRunStatus.QUEUED,
+            tags={"database": "tiny"},
+        )
+
+        # the first run is canceled after the daemon fetched the queued runs
+        queued_runs = daemon._get_queued_runs(instance)  # pylint: disable=protected-access
+        monkeypatch.setattr(daemon, "_get_queued_runs", lambda _instance: queued_runs)
+        instance.report_run_canceled(instance.get_run_by_id("tiny-1"))
+
+        list(daemon.run_iteration(instance, workspace))
+
+        assert get_run_ids(instance.run_launcher.queue()) == ["tiny-2"]
+
+
+def test_dequeue_error_fails_runs(instance, workspace, daemon, monkeypatch):
+    create_run(
+        instance,
+        run_id="queued-run",
+        status=PipelineRunStatus.QUEUED,
+    )
+
+    def _raise(*_args, **_kwargs):
+        raise Exception("Dequeue failed")
+
+    monkeypatch.setattr(daemon, "_dequeue_runs", _raise)
+
+    errors = [error for error in list(daemon.run_iteration(instance, workspace)) if error]
+
+    assert len(errors) == 1
+    assert "Dequeue failed" in errors[0].message
+    assert instance.run_launcher.queue() == []
+    assert instance.get_run_by_id("queued-run").status == PipelineRunStatus.FAILURE
+
+
+def test_run_launcher_error_does_not_fail_runs(instance, workspace, daemon, monkeypatch):
+    create_run(
+        instance,
+        run_id="queued-run",
+        status=PipelineRunStatus.QUEUED,
+    )
+    create_run(
+        instance,
+        run_id="queued-run-2",
+        status=PipelineRunStatus.QUEUED,
+    )
+
+    def _launch_runs(contexts):
+        # the first run is launched before the run launcher raises
+        instance.run_launcher.launch_run(contexts[0])
+        raise Exception("Launcher failed")
+
+    monkeypatch.setattr(instance.run_launcher, "launch_runs", _launch_runs)
+
+    errors = [error for error in list(daemon.run_iteration(instance, workspace)) if error]
+
+    assert len(errors) == 2
+    assert all("Launcher failed" in error.message for error in errors)
+    assert get_run_ids(instance.run_launcher.queue()) == ["queued-run"]
+    assert instance.get_run_by_id("queued-run").status == PipelineRunStatus.STARTING
+    assert instance.get_run_by_id("queued-run-2").status == PipelineRunStatus.STARTING
@@ -41,6 +41,7 @@
 from dagster.core.scheduler.instigation import InstigatorState, InstigatorStatus, TickStatus
 from dagster.core.storage.event_log.base import EventRecordsFilter
 from dagster.core.storage.pipeline_run import PipelineRunStatus
+from dagster.core.storage.tags import RUN_KEY_TAG
 from dagster.core.test_utils import (
     create_test_daemon_workspace,
     get_logger_output_from_capfd,
@@ -199,6 +200,32 @@ def run_cursor_sensor(context):
     return RunRequest(run_key=None, run_config={}, tags={})
 
 
+@sensor(pipeline_name="the_pipeline")
+def batched_run_key_sensor(context):
+    start = int(context.cursor) if context.cursor else 0
+    for i in range(start + 1, start + 5):
+        context.update_cursor(str(i))
+        yield RunRequest(run_key=str(i), run_config={}, tags={})
+
+
+@sensor(pipeline_name="the_pipeline")
+def batched_error_sensor(context):
+    for i in range(1, 4):
+        context.update_cursor(str(i))
+        yield RunRequest(run_key=str(i), run_config={}, tags={})
+
+    raise Exception("womp womp")
+
+
+@sensor(pipeline_name="the_pipeline")
+def batched_early_cursor_error_sensor(context):
+    context.update_cursor("3")
+    for i in range(1, 4):
+        yield RunRequest(run_key=str(i), run_config={}, tags={})
+
+    raise Exception("womp womp")
+
+
 def _random_string(length):
     return "".join(random.choice(string.ascii_lowercase) for x in range(length))
 
@@ -293,6 +320,9 @@ def the_repo():
         custom_interval_sensor,
         skip_cursor_sensor,
         run_cursor_sensor,
+        batched_run_key_sensor,
+        batched_error_sensor,
+        batched_early_cursor_error_sensor,
         asset_foo_sensor,
         asset_job_sensor,
         my_pipeline_failure_sensor,
@@ -1164,6 +1194,141 @@ def test_cursor_sensor(external_repo_context):
             assert run_ticks[0].cursor == "2"
 
 
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_batched_run_requests(external_repo_context, monkeypatch):
+    monkeypatch.setattr("dagster.daemon.sensor.SENSOR_RUN_REQUEST_BATCH_SIZE", 2)
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("batched_run_key_sensor")
+            instance.start_sensor(external_sensor)
+            evaluate_sensors(instance, workspace)
+
+            wait_for_all_runs_to_start(instance)
+            runs = instance.get_runs()
+            assert len(runs) == 4
+            assert sorted(run.tags[RUN_KEY_TAG] for run in runs) == ["1", "2", "3", "4"]
+
+            # the runs of both batches are launched in the same tick
+            ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.SUCCESS,
+                [run.run_id for run in runs],
+            )
+            assert ticks[0].cursor == "4"
+
+            job_state = instance.get_job_state(external_sensor.get_external_origin_id())
+            assert job_state.job_specific_data.cursor == "4"
+            assert job_state.job_specific_data.last_run_key == "4"
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_batched_run_requests_checkpoint(external_repo_context, monkeypatch):
+    monkeypatch.setattr("dagster.daemon.sensor.SENSOR_RUN_REQUEST_BATCH_SIZE", 2)
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("batched_error_sensor")
+            instance.start_sensor(external_sensor)
+            evaluate_sensors(instance, workspace)
+
+            wait_for_all_runs_to_start(instance)
+            runs = instance.get_runs()
+            assert len(runs) == 2
+
+            ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [run.run_id for run in runs],
+                expected_error="womp womp",
+            )
+
+            # the runs of the first batch were launched before the sensor failed, and the sensor
+            # moved its cursor on before requesting the next run, so the cursor of the first batch
+            # is kept for the next tick
+            job_state = instance.get_job_state(external_sensor.get_external_origin_id())
+            assert job_state.job_specific_data.cursor == "2"
+            assert job_state.job_specific_data.last_run_key == "2"
+            assert job_state.job_specific_data.last_tick_timestamp is None
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime):
+            evaluate_sensors(instance, workspace)
+
+            # the run keys of the runs that were already launched are skipped
+            assert len(instance.get_runs()) == 2
+            ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 2
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [],
+                expected_error="womp womp",
+            )
+
+
+@pytest.mark.parametrize("external_repo_context", repos())
+def test_batched_run_requests_unsafe_checkpoint(external_repo_context, monkeypatch):
+    monkeypatch.setattr("dagster.daemon.sensor.SENSOR_RUN_REQUEST_BATCH_SIZE", 2)
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_with_sensors(external_repo_context) as (
+        instance,
+        workspace,
+        external_repo,
+    ):
+        with pendulum.test(freeze_datetime):
+            external_sensor = external_repo.get_external_sensor("batched_early_cursor_error_sensor")
+            instance.start_sensor(external_sensor)
+            evaluate_sensors(instance, workspace)
+
+            wait_for_all_runs_to_start(instance)
+            runs = instance.get_runs()
+            assert len(runs) == 2
+
+            ticks = instance.get_job_ticks(external_sensor.get_external_origin_id())
+            assert len(ticks) == 1
+            validate_tick(
+                ticks[0],
+                external_sensor,
+                freeze_datetime,
+                TickStatus.FAILURE,
+                [run.run_id for run in runs],
+                expected_error="womp womp",
+            )
+
+            # the sensor set its cursor before requesting the run of the second batch, so the
+            # cursor isn't checkpointed after the first batch
+            job_state = instance.get_job_state(external_sensor.get_external_origin_id())
+            assert not job_state.job_specific_data or job_state.job_specific_data.cursor is None
+
+
 @pytest.mark.parametrize("external_repo_context", repos())
 def test_asset_sensor(external_repo_context):
     freeze_datetime = to_timezone(
@@ -16,6 +16,11 @@
 from dagster.core.definitions.events import Output
 from dagster.core.definitions.output import DynamicOut, Out
 from dagster.core.errors import DagsterExecutionStepNotFoundError, DagsterInvariantViolationError
+from dagster.core.execution.api import create_execution_plan
+from dagster.core.execution.plan.handle import StepHandle
+from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.state import KnownExecutionState
+from dagster.core.snap import snapshot_from_execution_plan
 from dagster.core.test_utils import default_mode_def_for_test, instance_for_test
 
 
@@ -94,6 +99,35 @@ def test_reexec_from_parent_1():
         }
 
 
+def test_reexec_plan_snapshot_omits_resolved_steps():
+    known_state = KnownExecutionState(
+        previous_retry_attempts={}, dynamic_mappings={"emit": {"result": ["0", "1", "2"]}}
+    )
+    plan = create_execution_plan(dynamic_pipeline, known_state=known_state)
+    assert plan.has_step(StepHandle.parse_from_key("multiply_inputs[1]"))
+
+    # the resolved steps are rebuilt from the unresolved steps and the known state
+    snapshot = snapshot_from_execution_plan(plan, "pipeline_snapshot_id")
+    assert [step.key for step in snapshot.steps] == [
+        "emit",
+        "emit_ten",
+        "multiply_by_two[?]",
+        "multiply_inputs[?]",
+    ]
+    rebuilt_plan = ExecutionPlan.rebuild_from_snapshot("dynamic_pipeline", snapshot)
+    assert rebuilt_plan.get_executable_step_deps() == plan.get_executable_step_deps()
+
+    # resolved steps that are selected directly are kept
+    subset_plan = create_execution_plan(
+        dynamic_pipeline, step_keys_to_execute=["multiply_inputs[1]"], known_state=known_state
+    )
+    subset_snapshot = snapshot_from_execution_plan(subset_plan, "pipeline_snapshot_id")
+    assert "multiply_inputs[1]" in [step.key for step in subset_snapshot.steps]
+    assert "multiply_inputs[0]" not in [step.key for step in subset_snapshot.steps]
+    rebuilt_subset_plan = ExecutionPlan.rebuild_from_snapshot("dynamic_pipeline", subset_snapshot)
+    assert rebuilt_subset_plan.step_keys_to_execute == ["multiply_inputs[1]"]
+
+
 def test_reexec_from_parent_dynamic_fails():
     with instance_for_test() as instance:
         parent_result = execute_pipeline(dynamic_pipeline, instance=instance)
@@ -0,0 +1,33 @@
+import os
+
+from dagster import SkipReason, pipeline, repository, sensor, solid
+
+
+@solid
+def do_something():
+    return 1
+
+
+@pipeline
+def foo_pipeline():
+    do_something()
+
+
+@sensor(pipeline_name="foo_pipeline")
+def pid_sensor(_):
+    yield SkipReason(str(os.getpid()))
+
+
+@sensor(pipeline_name="foo_pipeline")
+def crashing_sensor(_):
+    os._exit(1)  # pylint: disable=protected-access
+
+
+@sensor(pipeline_name="foo_pipeline")
+def error_sensor(_):
+    raise Exception("womp womp")
+
+
+@repository
+def worker_processes_repo():
+    return [foo_pipeline, pid_sensor, crashing_sensor, error_sensor]
@@ -0,0 +1,74 @@
+import re
+import threading
+import time
+
+import pytest
+from dagster import check
+from dagster.grpc import DagsterGrpcServer, ephemeral_grpc_api_client
+from dagster.grpc.metrics import RpcMetricsRecorder
+from dagster.grpc.types import GrpcServerMetrics
+from dagster.serdes import deserialize_as
+from dagster.utils import find_free_port
+
+
+def test_rpc_metrics_recorder():
+    recorder = RpcMetricsRecorder(bucket_upper_bounds=[0.1, 1.0])
+
+    with recorder.record("Ping"):
+        assert recorder.get_in_flight_counts() == {"Ping": 1}
+
+    with pytest.raises(Exception, match="oops"):
+        with recorder.record("ExternalSensorExecution"):
+            raise Exception("oops")
+
+    assert recorder.get_in_flight_counts() == {}
+
+    histograms = recorder.get_latency_histograms()
+    assert histograms["Ping"].count == 1
+    assert histograms["Ping"].error_count == 0
+    assert histograms["Ping"].bucket_counts == [1, 0, 0]
+    assert histograms["Ping"].percentile_upper_bound(99) == 0.1
+
+    assert histograms["ExternalSensorExecution"].count == 1
+    assert histograms["ExternalSensorExecution"].error_count == 1
+
+
+def test_server_metrics():
+    with ephemeral_grpc_api_client() as api_client:
+        assert api_client.ping("foobar") == "foobar"
+        assert len(list(api_client.streaming_ping(sequence_length=3, echo="foo"))) == 3
+
+        metrics = deserialize_as(api_client.get_server_metrics(), GrpcServerMetrics)
+        assert metrics.server_id == api_client.get_server_id()
+        assert metrics.rpc_latencies["Ping"].count == 1
+        assert metrics.rpc_latencies["StreamingPing"].count == 1
+        # The GetServerMetrics call itself is in flight while the metrics are collected
+        assert metrics.rpcs_in_flight.get("GetServerMetrics") == 1
+
+
+def test_control_rpcs_not_blocked_by_user_code_rpcs():
+    with ephemeral_grpc_api_client(max_workers=2) as api_client:
+        started_streams = []
+
+        def _stream():
+            for _ in api_client.streaming_ping(sequence_length=1000000, echo="foo"):
+                if not threading.current_thread() in started_streams:
+                    started_streams.append(threading.current_thread())
+
+        # Occupy every worker in the main pool with a long-running stream
+        threads = [threading.Thread(target=_stream, daemon=True) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+
+        start_time = time.time()
+        while len(started_streams) < 2:
+            assert time.time() - start_time < 30
+            time.sleep(0.01)
+
+        assert api_client.heartbeat("foobar") == "foobar"
+        assert api_client.get_server_id()
+
+
+def test_invalid_rpc_max_workers():
+    with pytest.raises(check.CheckError, match=re.escape("Unknown RPC method NotAMethod")):
+        DagsterGrpcServer(port=find_free_port(), rpc_max_workers={"NotAMethod": 1})
@@ -0,0 +1,117 @@
+import sys
+
+import pytest
+from dagster import check
+from dagster.core.errors import DagsterUserCodeUnreachableError
+from dagster.core.host_representation.origin import (
+    ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocationOrigin,
+)
+from dagster.core.test_utils import instance_for_test
+from dagster.core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster.grpc import DagsterGrpcServer
+from dagster.grpc.server import GrpcServerProcess
+from dagster.grpc.types import SensorExecutionArgs
+from dagster.serdes import deserialize_json_to_dagster_namedtuple
+from dagster.utils import file_relative_path, find_free_port
+
+
+def _repository_origin():
+    return ExternalRepositoryOrigin(
+        repository_location_origin=GrpcServerRepositoryLocationOrigin(
+            port=1234, host="localhost", location_name="test"
+        ),
+        repository_name="worker_processes_repo",
+    )
+
+
+def _sensor_execution_args(instance, sensor_name):
+    return SensorExecutionArgs(
+        repository_origin=_repository_origin(),
+        instance_ref=instance.get_ref(),
+        sensor_name=sensor_name,
+        last_completion_time=None,
+        last_run_key=None,
+        cursor=None,
+    )
+
+
+def _server_process(num_worker_processes):
+    return GrpcServerProcess(
+        loadable_target_origin=LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "grpc_repo_with_worker_processes.py"),
+        ),
+        num_worker_processes=num_worker_processes,
+    )
+
+
+def _sensor_pid(client, instance):
+    sensor_data = deserialize_json_to_dagster_namedtuple(
+        client.external_sensor_execution(
+            sensor_execution_args=_sensor_execution_args(instance, "pid_sensor")
+        )
+    )
+    return int(sensor_data.skip_message)
+
+
+def test_user_code_rpcs_served_by_worker_processes():
+    with instance_for_test() as instance:
+        server_process = _server_process(num_worker_processes=2)
+        with server_process.create_ephemeral_client() as client:
+            sensor_pids = {_sensor_pid(client, instance) for _ in range(10)}
+            assert server_process.pid not in sensor_pids
+            assert 1 <= len(sensor_pids) <= 2
+
+            # Errors raised in a worker are reported back to the client
+            sensor_data = deserialize_json_to_dagster_namedtuple(
+                client.external_sensor_execution(
+                    sensor_execution_args=_sensor_execution_args(instance, "error_sensor")
+                )
+            )
+            assert "womp womp" in sensor_data.error.to_string()
+
+            # Control RPCs are still answered by the server process itself
+            assert client.ping("foobar") == "foobar"
+
+        server_process.wait()
+
+
+def test_streaming_rpcs_served_by_worker_processes():
+    with instance_for_test() as instance:
+        server_process = _server_process(num_worker_processes=1)
+        with server_process.create_ephemeral_client() as client:
+            chunks = list(client.streaming_external_repository(_repository_origin()))
+            external_repository_data = deserialize_json_to_dagster_namedtuple(
+                "".join(chunk["serialized_external_repository_chunk"] for chunk in chunks)
+            )
+            assert external_repository_data.name == "worker_processes_repo"
+
+            # A stream that the client stops reading early doesn't leave replies behind for the
+            # next call that the worker serves
+            next(iter(client.streaming_external_repository(_repository_origin())))
+            assert _sensor_pid(client, instance) != server_process.pid
+
+        server_process.wait()
+
+
+def test_worker_process_crash():
+    with instance_for_test() as instance:
+        server_process = _server_process(num_worker_processes=1)
+        with server_process.create_ephemeral_client() as client:
+            pid_before_crash = _sensor_pid(client, instance)
+
+            with pytest.raises(DagsterUserCodeUnreachableError):
+                client.external_sensor_execution(
+                    sensor_execution_args=_sensor_execution_args(instance, "crashing_sensor")
+                )
+
+            # The pool is replaced with fresh worker processes
+            assert _sensor_pid(client, instance) != pid_before_crash
+
+        server_process.wait()
+
+
+def test_invalid_num_worker_processes():
+    with pytest.raises(check.CheckError, match="num_worker_processes must be greater than 0"):
+        DagsterGrpcServer(port=find_free_port(), num_worker_processes=0)
@@ -0,0 +1,93 @@
+import re
+import subprocess
+import sys
+
+import dagster
+from dagster.core.host_representation.origin import (
+    ExternalPipelineOrigin,
+    ExternalRepositoryOrigin,
+    GrpcServerRepositoryLocationOrigin,
+)
+from dagster.serdes import serialize_dagster_namedtuple
+
+# Cumulative time that `import dagster` may take in a fresh interpreter, as reported by
+# `python -X importtime`. Generous enough to not be flaky on slow CI machines, but catches
+# regressions like eagerly importing the storage or grpc machinery again.
+IMPORT_TIME_BUDGET_SECONDS = 5.0
+
+
+def _run_python(code, python_args=None, script_args=None):
+    return subprocess.run(
+        [sys.executable, *(python_args or []), "-c", code, *(script_args or [])],
+        check=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+
+
+def test_import_dagster_defers_heavy_dependencies():
+    result = _run_python(
+        "import sys; import dagster; "
+        "print(','.join(sorted(m for m in ['sqlalchemy', 'alembic', 'grpc'] if m in sys.modules)))"
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_import_dagster_defers_instance():
+    # DagsterInstance is only imported on first access, so nothing that `import dagster` loads may
+    # import dagster.core.instance at module level
+    result = _run_python(
+        "import sys; import dagster; print('dagster.core.instance' in sys.modules)"
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_import_time_budget():
+    result = _run_python("import dagster", python_args=["-X", "importtime"])
+
+    # Lines look like `import time:  self [us] | cumulative | imported package`
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*dagster$", line)
+        if match:
+            cumulative_us = int(match.group(1))
+
+    assert cumulative_us is not None
+    assert cumulative_us / 1e6 < IMPORT_TIME_BUDGET_SECONDS, (
+        f"`import dagster` took {cumulative_us / 1e6:.2f}s, "
+        f"over the budget of {IMPORT_TIME_BUDGET_SECONDS}s"
+    )
+
+
+def test_deferred_imports():
+    for name in dagster._DEFERRED_IMPORTS:  # pylint: disable=protected-access
+        assert name in dir(dagster)
+        assert hasattr(dagster, name)
+
+    for name in dagster.__all__:
+        assert hasattr(dagster, name)
+
+    from dagster import DagsterInstance  # pylint: disable=reimported
+    from dagster.core.instance import DagsterInstance as CoreDagsterInstance
+
+    assert DagsterInstance is CoreDagsterInstance
+
+
+def test_deserialize_class_from_deferred_module():
+    # The origin classes are only whitelisted once dagster.core.host_representation is imported,
+    # which `import dagster` no longer does eagerly
+    serialized = serialize_dagster_namedtuple(
+        ExternalPipelineOrigin(
+            ExternalRepositoryOrigin(
+                GrpcServerRepositoryLocationOrigin(port=1234, host="localhost"), "repo"
+            ),
+            "pipeline",
+        )
+    )
+    result = _run_python(
+        "import sys; from dagster.serdes import deserialize_json_to_dagster_namedtuple; "
+        "print(deserialize_json_to_dagster_namedtuple(sys.argv[1]).pipeline_name)",
+        script_args=[serialized],
+    )
+    assert result.stdout.strip() == "pipeline"
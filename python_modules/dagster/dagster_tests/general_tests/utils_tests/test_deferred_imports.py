@@ -0,0 +1,28 @@
+import sys
+import types
+
+import pytest
+from dagster.utils.deferred_imports import deferred_imports
+
+
+def test_deferred_imports():
+    module = types.ModuleType("some_package")
+    sys.modules["some_package"] = module
+    try:
+        module.__getattr__, module.__dir__ = deferred_imports(
+            "some_package", {"OrderedDict": "collections"}
+        )
+
+        assert "OrderedDict" not in vars(module)
+        assert "OrderedDict" in module.__dir__()
+
+        from collections import OrderedDict
+
+        assert module.OrderedDict is OrderedDict
+        # the name is set on the module once it has been imported
+        assert vars(module)["OrderedDict"] is OrderedDict
+
+        with pytest.raises(AttributeError, match="has no attribute 'defaultdict'"):
+            module.defaultdict  # pylint: disable=pointless-statement
+    finally:
+        del sys.modules["some_package"]
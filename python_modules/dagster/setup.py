@@ -89,6 +89,7 @@ def get_version() -> str:
         ],
         extras_require={
             "docker": ["docker"],
+            "zstd": ["zstandard"],
             "test": [
                 "astroid>=2.3.3,<2.5",
                 "black==20.8b1",
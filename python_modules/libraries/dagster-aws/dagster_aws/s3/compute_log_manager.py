@@ -1,4 +1,6 @@
 import os
+import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 
 import boto3
@@ -12,7 +14,18 @@
 )
 from dagster.core.storage.local_compute_log_manager import IO_TYPE_EXTENSION, LocalComputeLogManager
 from dagster.serdes import ConfigurableClass, ConfigurableClassData
-from dagster.utils import ensure_dir, ensure_file
+from dagster.utils import ensure_file
+
+# Upper bound on the size of a single segment object, so that a burst of output between two
+# periodic uploads is never read into memory all at once
+MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+# The number of keys that a single DeleteObjects request can delete
+S3_DELETE_OBJECTS_BATCH_SIZE = 1000
+
+# The number of logs whose segments are remembered between reads, so that reading the logs of a
+# running step again only lists the segments that were uploaded since the previous read
+MAX_CACHED_SEGMENT_LISTS = 128
 
 
 class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
@@ -35,6 +48,7 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             verify_cert_path: "/path/to/cert/bundle.pem"
             endpoint_url: "http://alternate-s3-host.io"
             skip_empty_files: true
+            upload_interval: 30
 
     Args:
         bucket (str): The name of the s3 bucket to which to log.
@@ -47,6 +61,10 @@ class S3ComputeLogManager(ComputeLogManager, ConfigurableClass):
             `verify` set to False.
         endpoint_url (Optional[str]): Override for the S3 endpoint url.
         skip_empty_files: (Optional[bool]): Skip upload of empty log files.
+        upload_interval: (Optional[int]): Interval in seconds at which to upload the output that
+            a step has written so far, while the step is running. Each upload writes the new output
+            as a separate segment object, which is replaced by the complete log file once the step
+            finishes. By default, logs are only uploaded once the step finishes.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -62,6 +80,7 @@ def __init__(
         verify_cert_path=None,
         endpoint_url=None,
         skip_empty_files=False,
+        upload_interval=None,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -77,14 +96,42 @@ def __init__(
         self.local_manager = LocalComputeLogManager(local_dir)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._skip_empty_files = check.bool_param(skip_empty_files, "skip_empty_files")
+        self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        check.invariant(
+            self._upload_interval is None or self._upload_interval > 0,
+            "upload_interval must be positive",
+        )
+        self._segments_cache = OrderedDict()
+        self._segments_cache_lock = threading.Lock()
 
     @contextmanager
     def _watch_logs(self, pipeline_run, step_key=None):
-        # proxy watching to the local compute log manager, interacting with the filesystem
-        with self.local_manager._watch_logs(  # pylint: disable=protected-access
-            pipeline_run, step_key
-        ):
-            yield
+        if not self._upload_interval:
+            # proxy watching to the local compute log manager, interacting with the filesystem
+            with self.local_manager._watch_logs(  # pylint: disable=protected-access
+                pipeline_run, step_key
+            ):
+                yield
+            return
+
+        key = self.local_manager.get_key(pipeline_run, step_key)
+        try:
+            with self.local_manager._watch_logs(  # pylint: disable=protected-access
+                pipeline_run, step_key
+            ):
+                uploader = S3ComputeLogSegmentUploader(
+                    self, pipeline_run.run_id, key, self._upload_interval
+                )
+                uploader.start()
+                try:
+                    yield
+                finally:
+                    uploader.stop()
+        except BaseException:
+            # on_watch_finish isn't called when the step raises, so its complete log files replace
+            # its segments here instead
+            self._upload_logs_and_delete_segments(pipeline_run.run_id, key)
+            raise
 
     @property
     def inst_data(self):
@@ -101,6 +148,7 @@ def config_type(cls):
             "verify_cert_path": Field(StringSource, is_required=False),
             "endpoint_url": Field(StringSource, is_required=False),
             "skip_empty_files": Field(bool, is_required=False, default_value=False),
+            "upload_interval": Field(int, is_required=False),
         }
 
     @staticmethod
@@ -115,9 +163,9 @@ def on_watch_start(self, pipeline_run, step_key):
 
     def on_watch_finish(self, pipeline_run, step_key):
         self.local_manager.on_watch_finish(pipeline_run, step_key)
-        key = self.local_manager.get_key(pipeline_run, step_key)
-        self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDOUT)
-        self._upload_from_local(pipeline_run.run_id, key, ComputeIOType.STDERR)
+        self._upload_logs_and_delete_segments(
+            pipeline_run.run_id, self.local_manager.get_key(pipeline_run, step_key)
+        )
 
     def is_watch_completed(self, run_id, key):
         return self.local_manager.is_watch_completed(run_id, key)
@@ -125,17 +173,15 @@ def is_watch_completed(self, run_id, key):
     def download_url(self, run_id, key, io_type):
         if not self.is_watch_completed(run_id, key):
             return self.local_manager.download_url(run_id, key, io_type)
-        key = self._bucket_key(run_id, key, io_type)
-
-        url = self._s3_session.generate_presigned_url(
-            ClientMethod="get_object", Params={"Bucket": self._s3_bucket, "Key": key}
-        )
-
-        return url
+        return self._presigned_url(self._bucket_key(run_id, key, io_type))
 
     def read_logs_file(self, run_id, key, io_type, cursor=0, max_bytes=MAX_BYTES_FILE_READ):
-        if self._should_download(run_id, key, io_type):
-            self._download_to_local(run_id, key, io_type)
+        if not os.path.exists(self.get_local_path(run_id, key, io_type)):
+            # only fetch the requested range of the logs, instead of downloading all of them
+            remote_data = self._read_remote_logs(run_id, key, io_type, cursor, max_bytes)
+            if remote_data:
+                return remote_data
+
         data = self.local_manager.read_logs_file(run_id, key, io_type, cursor, max_bytes)
         return self._from_local_file_data(run_id, key, io_type, data)
 
@@ -145,19 +191,120 @@ def on_subscribe(self, subscription):
     def on_unsubscribe(self, subscription):
         self.local_manager.on_unsubscribe(subscription)
 
-    def _should_download(self, run_id, key, io_type):
-        local_path = self.get_local_path(run_id, key, io_type)
-        if os.path.exists(local_path):
-            return False
-
+    def _read_remote_logs(self, run_id, key, io_type, cursor, max_bytes):
+        # Returns the requested range of the logs from the complete log file in s3 if the step has
+        # finished, or else from the segments uploaded so far. Returns None if neither exist.
+        bucket_key = self._bucket_key(run_id, key, io_type)
         try:  # https://stackoverflow.com/a/38376288/14656695
-            self._s3_session.head_object(
-                Bucket=self._s3_bucket, Key=self._bucket_key(run_id, key, io_type)
-            )
+            size = self._s3_session.head_object(Bucket=self._s3_bucket, Key=bucket_key)[
+                "ContentLength"
+            ]
+            objects = [(0, bucket_key, size)]
+            download_url = self._presigned_url(bucket_key)
+            # the segments aren't read once the complete log file exists
+            self._forget_segments(run_id, key, io_type)
         except ClientError:
-            return False
+            objects = self._list_segments(run_id, key, io_type)
+            if not objects:
+                return None
+            last_offset, _, last_size = objects[-1]
+            size = last_offset + last_size
+            # the logs are only complete once the step finishes, and aren't stored in a single
+            # object or on local disk until then, so there is nothing to download yet
+            download_url = None
+
+        cursor = min(cursor, size)
+        data = self._read_range(objects, cursor, min(cursor + max_bytes, size))
+        if cursor + len(data) < size:
+            # leave a multi-byte character that is cut off by the range for the next read, unless
+            # the range holds nothing but that partial character. The cursor always moves past the
+            # bytes that are returned, so a reader can't get stuck on a range that is too small.
+            data = _trim_partial_utf8_char(data) or data
+        return ComputeLogFileData(
+            "s3://{}/{}".format(self._s3_bucket, bucket_key),
+            data.decode("utf-8", errors="replace"),
+            cursor + len(data),
+            size,
+            download_url,
+        )
+
+    def _read_range(self, objects, start, end):
+        # Reads bytes [start, end) of the logs, from the objects that hold them as
+        # (offset, key, size) tuples sorted by offset
+        chunks = []
+        for offset, bucket_key, size in objects:
+            range_start = max(start, offset)
+            range_end = min(end, offset + size)
+            if range_start >= range_end:
+                continue
+
+            response = self._s3_session.get_object(
+                Bucket=self._s3_bucket,
+                Key=bucket_key,
+                Range="bytes={}-{}".format(range_start - offset, range_end - offset - 1),
+            )
+            chunks.append(response["Body"].read())
 
-        return True
+        return b"".join(chunks)
+
+    def _list_segments(self, run_id, key, io_type):
+        segment_prefix = self._segment_prefix(run_id, key, io_type)
+        with self._segments_cache_lock:
+            segments = list(self._segments_cache.get(segment_prefix, []))
+
+        # a segment is never changed once it is uploaded, and the segment keys are listed in order
+        # of their offsets, so only the segments after the last one that was listed are new
+        paginate_kwargs = {"StartAfter": segments[-1][1]} if segments else {}
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self._s3_bucket, Prefix=segment_prefix, **paginate_kwargs
+        ):
+            for obj in page.get("Contents", []):
+                offset = int(obj["Key"][len(segment_prefix) :])
+                segments.append((offset, obj["Key"], obj["Size"]))
+        segments.sort()
+
+        if segments:
+            with self._segments_cache_lock:
+                self._segments_cache[segment_prefix] = segments
+                self._segments_cache.move_to_end(segment_prefix)
+                while len(self._segments_cache) > MAX_CACHED_SEGMENT_LISTS:
+                    self._segments_cache.popitem(last=False)
+
+        return segments
+
+    def _forget_segments(self, run_id, key, io_type):
+        with self._segments_cache_lock:
+            self._segments_cache.pop(self._segment_prefix(run_id, key, io_type), None)
+
+    def _upload_segment(self, run_id, key, io_type, offset, data):
+        self._s3_session.put_object(
+            Bucket=self._s3_bucket,
+            # zero-padded, so that the segments are listed in order
+            Key="{}{:020d}".format(self._segment_prefix(run_id, key, io_type), offset),
+            Body=data,
+        )
+
+    def _delete_segments(self, run_id, key, io_type):
+        segment_keys = [
+            segment_key for _, segment_key, _ in self._list_segments(run_id, key, io_type)
+        ]
+        self._forget_segments(run_id, key, io_type)
+        for i in range(0, len(segment_keys), S3_DELETE_OBJECTS_BATCH_SIZE):
+            self._s3_session.delete_objects(
+                Bucket=self._s3_bucket,
+                Delete={
+                    "Objects": [
+                        {"Key": segment_key}
+                        for segment_key in segment_keys[i : i + S3_DELETE_OBJECTS_BATCH_SIZE]
+                    ]
+                },
+            )
+
+    def _presigned_url(self, bucket_key):
+        return self._s3_session.generate_presigned_url(
+            ClientMethod="get_object", Params={"Bucket": self._s3_bucket, "Key": bucket_key}
+        )
 
     def _from_local_file_data(self, run_id, key, io_type, local_file_data):
         is_complete = self.is_watch_completed(run_id, key)
@@ -175,6 +322,12 @@ def _from_local_file_data(self, run_id, key, io_type, local_file_data):
             self.download_url(run_id, key, io_type),
         )
 
+    def _upload_logs_and_delete_segments(self, run_id, key):
+        for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+            self._upload_from_local(run_id, key, io_type)
+            if self._upload_interval:
+                self._delete_segments(run_id, key, io_type)
+
     def _upload_from_local(self, run_id, key, io_type):
         path = self.get_local_path(run_id, key, io_type)
         ensure_file(path)
@@ -185,14 +338,6 @@ def _upload_from_local(self, run_id, key, io_type):
         with open(path, "rb") as data:
             self._s3_session.upload_fileobj(data, self._s3_bucket, key)
 
-    def _download_to_local(self, run_id, key, io_type):
-        path = self.get_local_path(run_id, key, io_type)
-        ensure_dir(os.path.dirname(path))
-        with open(path, "wb") as fileobj:
-            self._s3_session.download_fileobj(
-                self._s3_bucket, self._bucket_key(run_id, key, io_type), fileobj
-            )
-
     def _bucket_key(self, run_id, key, io_type):
         check.inst_param(io_type, "io_type", ComputeIOType)
         extension = IO_TYPE_EXTENSION[io_type]
@@ -205,5 +350,80 @@ def _bucket_key(self, run_id, key, io_type):
         ]
         return "/".join(paths)  # s3 path delimiter
 
+    def _segment_prefix(self, run_id, key, io_type):
+        return "{}.segments/".format(self._bucket_key(run_id, key, io_type))
+
     def dispose(self):
         self.local_manager.dispose()
+
+
+class S3ComputeLogSegmentUploader:
+    """Periodically uploads the output that a step has written to its local log files so far, as
+    segment objects holding the bytes written since the previous upload.
+    """
+
+    def __init__(self, manager, run_id, key, upload_interval):
+        self._manager = check.inst_param(manager, "manager", S3ComputeLogManager)
+        self._run_id = check.str_param(run_id, "run_id")
+        self._key = check.str_param(key, "key")
+        self._upload_interval = check.int_param(upload_interval, "upload_interval")
+        self._offsets = {io_type: 0 for io_type in ComputeIOType}
+        self._shutdown_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="s3-compute-log-uploader", daemon=True
+        )
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._shutdown_event.set()
+        self._thread.join()
+
+    def upload(self):
+        for io_type in ComputeIOType:
+            path = self._manager.get_local_path(self._run_id, self._key, io_type)
+            if not os.path.exists(path):
+                continue
+
+            with open(path, "rb") as f:
+                f.seek(self._offsets[io_type])
+                while True:
+                    data = f.read(MAX_SEGMENT_BYTES)
+                    if not data:
+                        break
+                    self._manager._upload_segment(  # pylint: disable=protected-access
+                        self._run_id, self._key, io_type, self._offsets[io_type], data
+                    )
+                    self._offsets[io_type] += len(data)
+
+    def _run(self):
+        while not self._shutdown_event.wait(self._upload_interval):
+            try:
+                self.upload()
+            except Exception:  # pylint: disable=broad-except
+                # uploads while the step is running are best effort, the output that failed to
+                # upload is retried in the next interval
+                pass
+
+
+def _trim_partial_utf8_char(data):
+    # Drops a multi-byte utf-8 character that is cut off at the end of the data, so that it is
+    # read in full by the next read instead
+    for num_trailing_bytes in range(1, min(4, len(data)) + 1):
+        byte = data[-num_trailing_bytes]
+        if byte & 0xC0 == 0x80:
+            # continuation byte
+            continue
+
+        if byte >= 0xF0:
+            char_length = 4
+        elif byte >= 0xE0:
+            char_length = 3
+        elif byte >= 0xC0:
+            char_length = 2
+        else:
+            char_length = 1
+        return data[:-num_trailing_bytes] if char_length > num_trailing_bytes else data
+
+    return data
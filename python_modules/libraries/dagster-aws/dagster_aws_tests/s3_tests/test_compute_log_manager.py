@@ -1,6 +1,7 @@
 import os
 import sys
 import tempfile
+import time
 
 import pytest
 from botocore.exceptions import ClientError
@@ -10,6 +11,7 @@
 from dagster.core.run_coordinator import DefaultRunCoordinator
 from dagster.core.storage.compute_log_manager import ComputeIOType
 from dagster.core.storage.event_log import SqliteEventLogStorage
+from dagster.core.storage.pipeline_run import PipelineRun
 from dagster.core.storage.root import LocalArtifactStorage
 from dagster.core.storage.runs import SqliteRunStorage
 from dagster.core.test_utils import environ
@@ -169,3 +171,182 @@ def test_blank_compute_logs(mock_s3_bucket):
 
         assert not stdout.data
         assert not stderr.data
+
+
+def test_compute_log_manager_upload_interval(mock_s3_bucket):
+    uploaded_segments = []
+
+    @op
+    def long_running():
+        print(HELLO_WORLD)  # pylint: disable=print-call
+        sys.stdout.flush()
+
+        # wait for the output to be uploaded while the step is still running
+        start = time.time()
+        while not uploaded_segments and time.time() - start < 15:
+            uploaded_segments.extend(
+                obj.key for obj in mock_s3_bucket.objects.filter(Prefix="my_prefix/storage")
+            )
+            time.sleep(0.1)
+
+    @job
+    def long_running_job():
+        long_running()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with environ({"DAGSTER_HOME": temp_dir}):
+            manager = S3ComputeLogManager(
+                bucket=mock_s3_bucket.name,
+                prefix="my_prefix",
+                local_dir=temp_dir,
+                upload_interval=1,
+            )
+            instance = DagsterInstance(
+                instance_type=InstanceType.PERSISTENT,
+                local_artifact_storage=LocalArtifactStorage(temp_dir),
+                run_storage=SqliteRunStorage.from_local(temp_dir),
+                event_storage=SqliteEventLogStorage(temp_dir),
+                compute_log_manager=manager,
+                run_coordinator=DefaultRunCoordinator(),
+                run_launcher=DefaultRunLauncher(),
+                ref=InstanceRef.from_dir(temp_dir),
+            )
+            result = long_running_job.execute_in_process(instance=instance)
+
+            compute_logs_key = f"my_prefix/storage/{result.run_id}/compute_logs"
+            assert f"{compute_logs_key}/long_running.out.segments/{0:020d}" in uploaded_segments
+
+            # the segments are replaced by the complete log files once the step finishes
+            assert sorted(
+                obj.key for obj in mock_s3_bucket.objects.filter(Prefix=compute_logs_key)
+            ) == [f"{compute_logs_key}/long_running.err", f"{compute_logs_key}/long_running.out"]
+            stdout_s3 = (
+                mock_s3_bucket.Object(key=f"{compute_logs_key}/long_running.out")
+                .get()["Body"]
+                .read()
+                .decode("utf-8")
+            )
+            assert stdout_s3 == HELLO_WORLD + SEPARATOR
+
+
+def test_read_logs_file_byte_range(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir
+        )
+        data = "hello wörld"
+        mock_s3_bucket.put_object(
+            Key="my_prefix/storage/my_run_id/compute_logs/my_step_key.out",
+            Body=data.encode("utf-8"),
+        )
+
+        stdout = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDOUT, cursor=0, max_bytes=6
+        )
+        assert stdout.data == "hello "
+        assert stdout.cursor == 6
+        assert stdout.size == len(data.encode("utf-8"))
+        assert (
+            stdout.path
+            == "s3://test-bucket/my_prefix/storage/my_run_id/compute_logs/my_step_key.out"
+        )
+
+        # a multi-byte character that is cut off by the range is left for the next read
+        stdout = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDOUT, cursor=6, max_bytes=2
+        )
+        assert stdout.data == "w"
+        assert stdout.cursor == 7
+
+        stdout = manager.read_logs_file("my_run_id", "my_step_key", ComputeIOType.STDOUT, cursor=7)
+        assert stdout.data == "örld"
+        assert stdout.cursor == stdout.size
+
+        # a range that is too small to hold the whole character still moves the cursor forward
+        stdout = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDOUT, cursor=7, max_bytes=1
+        )
+        assert stdout.cursor == 8
+
+        # nothing is downloaded to the local directory
+        assert not os.path.exists(
+            manager.get_local_path("my_run_id", "my_step_key", ComputeIOType.STDOUT)
+        )
+
+
+def test_read_logs_file_from_segments(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name, prefix="my_prefix", local_dir=temp_dir
+        )
+
+        # simulate reading the logs of a step that is running on another machine
+        segments_prefix = "my_prefix/storage/my_run_id/compute_logs/my_step_key.err.segments"
+        for offset, segment in [(0, "first "), (6, "second "), (13, "third")]:
+            mock_s3_bucket.put_object(
+                Key=f"{segments_prefix}/{offset:020d}", Body=segment.encode("utf-8")
+            )
+
+        stderr = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDERR, cursor=3, max_bytes=12
+        )
+        assert stderr.data == "st second th"
+        assert stderr.cursor == 15
+        assert stderr.size == 18
+        # the logs aren't on local disk to be downloaded from
+        assert stderr.download_url is None
+
+        stderr = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDERR, cursor=stderr.cursor
+        )
+        assert stderr.data == "ird"
+        assert stderr.cursor == 18
+
+        # the segments that are uploaded after a read are picked up by the next read
+        mock_s3_bucket.put_object(Key=f"{segments_prefix}/{18:020d}", Body=b" fourth")
+        stderr = manager.read_logs_file(
+            "my_run_id", "my_step_key", ComputeIOType.STDERR, cursor=stderr.cursor
+        )
+        assert stderr.data == " fourth"
+        assert stderr.cursor == 25
+        assert stderr.size == 25
+
+
+def test_segments_replaced_when_watch_raises(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=temp_dir,
+            upload_interval=1,
+        )
+        pipeline_run = PipelineRun(pipeline_name="my_job", run_id="my_run_id")
+        compute_logs_key = "my_prefix/storage/my_run_id/compute_logs"
+
+        with pytest.raises(KeyboardInterrupt):
+            with manager.watch(pipeline_run, "my_step_key"):
+                print(HELLO_WORLD)  # pylint: disable=print-call
+                sys.stdout.flush()
+
+                # wait for the output to be uploaded as a segment
+                start = time.time()
+                while (
+                    not list(mock_s3_bucket.objects.filter(Prefix=compute_logs_key))
+                    and time.time() - start < 15
+                ):
+                    time.sleep(0.1)
+
+                raise KeyboardInterrupt()
+
+        # the complete log files are uploaded, and the segments deleted, even though the watch
+        # didn't finish
+        assert sorted(
+            obj.key for obj in mock_s3_bucket.objects.filter(Prefix=compute_logs_key)
+        ) == [f"{compute_logs_key}/my_step_key.err", f"{compute_logs_key}/my_step_key.out"]
+        stdout_s3 = (
+            mock_s3_bucket.Object(key=f"{compute_logs_key}/my_step_key.out")
+            .get()["Body"]
+            .read()
+            .decode("utf-8")
+        )
+        assert stdout_s3 == HELLO_WORLD + SEPARATOR
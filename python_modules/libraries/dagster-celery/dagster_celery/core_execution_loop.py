@@ -1,7 +1,10 @@
+import socket
 import sys
 import time
 
 from celery.exceptions import TaskRevokedError
+from celery.exceptions import TimeoutError as CeleryTimeoutError
+from celery.result import EagerResult, ResultSet
 from dagster import check
 from dagster.core.errors import DagsterSubprocessError
 from dagster.core.events import DagsterEvent, EngineEventData
@@ -20,6 +23,7 @@
 )
 
 TICK_SECONDS = 1
+RESULT_POLL_INTERVAL_SECONDS = 0.1
 DELEGATE_MARKER = "celery_queue_wait"
 
 
@@ -62,6 +66,11 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
         stopping = False
 
         while (not active_execution.is_complete and not stopping) or step_results:
+            # wait for some of the submitted tasks to finish
+            ready_step_keys = (
+                _wait_for_ready_step_keys(step_results, TICK_SECONDS) if step_results else []
+            )
+
             if active_execution.check_for_interrupts():
                 yield DagsterEvent.engine_event(
                     pipeline_context,
@@ -73,35 +82,31 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                 for result in step_results.values():
                     result.revoke()
             results_to_pop = []
-            for step_key, result in sorted(
-                step_results.items(), key=lambda x: priority_for_key(x[0])
-            ):
-                if result.ready():
-                    try:
-                        step_events = result.get()
-                    except TaskRevokedError:
-                        step_events = []
-                        yield DagsterEvent.engine_event(
-                            pipeline_context,
-                            'celery task for running step "{step_key}" was revoked.'.format(
-                                step_key=step_key,
-                            ),
-                            EngineEventData(marker_end=DELEGATE_MARKER),
-                            step_handle=active_execution.get_step_by_key(step_key).handle,
-                        )
-                    except Exception:
-                        # We will want to do more to handle the exception here.. maybe subclass Task
-                        # Certainly yield an engine or pipeline event
-                        step_events = []
-                        step_errors[step_key] = serializable_error_info_from_exc_info(
-                            sys.exc_info()
-                        )
-                    for step_event in step_events:
-                        event = deserialize_json_to_dagster_namedtuple(step_event)
-                        yield event
-                        active_execution.handle_event(event)
-
-                    results_to_pop.append(step_key)
+            for step_key in sorted(ready_step_keys, key=priority_for_key):
+                result = step_results[step_key]
+                try:
+                    step_events = result.get()
+                except TaskRevokedError:
+                    step_events = []
+                    yield DagsterEvent.engine_event(
+                        pipeline_context,
+                        'celery task for running step "{step_key}" was revoked.'.format(
+                            step_key=step_key,
+                        ),
+                        EngineEventData(marker_end=DELEGATE_MARKER),
+                        step_handle=active_execution.get_step_by_key(step_key).handle,
+                    )
+                except Exception:
+                    # We will want to do more to handle the exception here.. maybe subclass Task
+                    # Certainly yield an engine or pipeline event
+                    step_events = []
+                    step_errors[step_key] = serializable_error_info_from_exc_info(sys.exc_info())
+                for step_event in step_events:
+                    event = deserialize_json_to_dagster_namedtuple(step_event)
+                    yield event
+                    active_execution.handle_event(event)
+
+                results_to_pop.append(step_key)
 
             for step_key in results_to_pop:
                 if step_key in step_results:
@@ -156,7 +161,9 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
                     )
                     raise
 
-            time.sleep(TICK_SECONDS)
+            # wait for the next tick if there are no running tasks to wait for
+            if not step_results:
+                time.sleep(TICK_SECONDS)
 
         if step_errors:
             raise DagsterSubprocessError(
@@ -172,6 +179,52 @@ def core_celery_execution_loop(pipeline_context, execution_plan, step_execution_
             )
 
 
+class _ResultsReady(Exception):
+    pass
+
+
+def _wait_for_ready_step_keys(step_results, timeout):
+    """Waits up to timeout seconds for some of the celery tasks to finish, and returns the keys
+    of the steps whose tasks have finished.
+
+    Where the result backend supports it, the results are collected with its native mechanism
+    (pub/sub for the redis and rpc backends, and a single bulk fetch of all of the results per poll
+    for other key/value backends), rather than a round trip per task. The fetched results are
+    cached by the backend, so getting them afterwards doesn't fetch them again. Other backends are
+    polled once per task.
+    """
+    step_keys_by_task_id = {result.id: step_key for step_key, result in step_results.items()}
+    result_set = ResultSet(list(step_results.values()))
+
+    # the results of eagerly executed tasks are local, so checking them is cheap
+    if (
+        any(isinstance(result, EagerResult) for result in result_set.results)
+        or not result_set.supports_native_join
+    ):
+        ready_step_keys = [step_key for step_key, result in step_results.items() if result.ready()]
+        if not ready_step_keys:
+            time.sleep(timeout)
+        return ready_step_keys
+
+    ready_step_keys = []
+
+    def _on_interval():
+        # stop waiting once some results have arrived, so that the steps that depend on them can
+        # be submitted right away
+        if ready_step_keys:
+            raise _ResultsReady()
+
+    try:
+        for task_id, _meta in result_set.iter_native(
+            timeout=timeout, interval=RESULT_POLL_INTERVAL_SECONDS, on_interval=_on_interval
+        ):
+            ready_step_keys.append(step_keys_by_task_id[task_id])
+    except (_ResultsReady, CeleryTimeoutError, socket.timeout):
+        pass
+
+    return ready_step_keys
+
+
 def _get_step_priority(context, step):
     """Step priority is (currently) set as the overall pipeline run priority plus the individual
     step priority.
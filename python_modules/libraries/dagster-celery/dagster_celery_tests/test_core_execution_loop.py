@@ -0,0 +1,29 @@
+import time
+
+from celery import Celery
+from celery.result import AsyncResult
+from dagster_celery.core_execution_loop import _wait_for_ready_step_keys
+
+
+def test_wait_for_ready_step_keys():
+    app = Celery(backend="cache+memory://")
+    step_results = {
+        step_key: AsyncResult(f"{step_key}_task_id", app=app) for step_key in ["foo", "bar", "baz"]
+    }
+
+    start = time.time()
+    assert _wait_for_ready_step_keys(step_results, timeout=0.5) == []
+    assert time.time() - start >= 0.5
+
+    app.backend.store_result("foo_task_id", ["foo_event"], "SUCCESS")
+    app.backend.store_result("baz_task_id", ["baz_event"], "SUCCESS")
+
+    mget_calls = []
+    original_mget = app.backend.mget
+    app.backend.mget = lambda keys: mget_calls.append(keys) or original_mget(keys)
+
+    assert set(_wait_for_ready_step_keys(step_results, timeout=5)) == {"foo", "baz"}
+    # the results of all of the tasks are fetched at once
+    assert len(mget_calls) == 1
+    assert step_results["foo"].get() == ["foo_event"]
+    assert step_results["baz"].get() == ["baz_event"]
@@ -4,10 +4,12 @@
 from .executor import dask_executor
 from .resources import dask_resource
 from .version import __version__
+from .worker_io_manager import dask_worker_io_manager
 
 check_dagster_package_version("dagster-dask", __version__)
 
 __all__ = [
     "DataFrame",
     "dask_executor",
+    "dask_worker_io_manager",
 ]
@@ -1,3 +1,8 @@
+import sys
+import threading
+from collections import defaultdict
+from typing import Dict
+
 import dask
 import dask.distributed
 from dagster import (
@@ -12,13 +17,20 @@
 )
 from dagster.core.definitions.executor_definition import executor
 from dagster.core.errors import raise_execution_interrupts
-from dagster.core.events import DagsterEvent
+from dagster.core.events import DagsterEvent, EngineEventData
 from dagster.core.execution.api import create_execution_plan, execute_plan
 from dagster.core.execution.context.system import PlanOrchestrationContext
+from dagster.core.execution.plan.handle import ResolvedFromDynamicStepHandle, StepHandle
+from dagster.core.execution.plan.objects import StepFailureData
 from dagster.core.execution.plan.plan import ExecutionPlan
+from dagster.core.execution.plan.step import ExecutionStep, UnresolvedMappedExecutionStep
 from dagster.core.execution.retries import RetryMode
 from dagster.core.instance import DagsterInstance
+from dagster.serdes import serialize_dagster_namedtuple
 from dagster.utils import frozentags, iterate_with_context
+from dagster.utils.error import serializable_error_info_from_exc_info
+
+from .worker_io_manager import get_step_outputs, set_step_outputs
 
 # Dask resource requirements are specified under this key
 DASK_RESOURCE_REQUIREMENTS_KEY = "dagster-dask/resource_requirements"
@@ -69,7 +81,16 @@
                     ),
                 }
             )
-        )
+        ),
+        "dag_submission": Field(
+            bool,
+            is_required=False,
+            default_value=False,
+            description="Submit each step to Dask once its upstream steps have completed, "
+            "instead of submitting all of the steps up front. Supports dynamic outputs, and "
+            "passes the outputs stored with the dask_worker_io_manager between steps through "
+            "Dask.",
+        ),
     },
 )
 def dask_executor(init_context):
@@ -95,6 +116,14 @@ def dask_executor(init_context):
                         threads_per_worker?: 1 # Number of threads per each worker
                     }
             }
+        dag_submission?: false
+
+    By default, all of the steps are submitted to Dask up front, level by level, and each step
+    loads its inputs with its IO manager. With ``dag_submission: true``, each step is submitted
+    once its upstream steps have completed, which supports jobs with dynamic outputs. Outputs
+    stored with the :py:func:`dask_worker_io_manager` then stay in the memory of the worker that
+    computed them, and Dask hands them to the downstream steps, scheduling them on the workers
+    that hold their inputs when it can.
 
     To use the `dask_executor`, set it as the `executor_def` when defining a job:
 
@@ -109,7 +138,11 @@ def dask_enabled_job():
 
     """
     ((cluster_type, cluster_configuration),) = init_context.executor_config["cluster"].items()
-    return DaskExecutor(cluster_type, cluster_configuration)
+    return DaskExecutor(
+        cluster_type,
+        cluster_configuration,
+        dag_submission=init_context.executor_config.get("dag_submission", False),
+    )
 
 
 def query_on_dask_worker(
@@ -144,6 +177,75 @@ def query_on_dask_worker(
         )
 
 
+# instances of each dask worker process, keyed by serialized instance ref, so that each step
+# doesn't need to connect to the instance's storage again
+_worker_instances: Dict[str, DagsterInstance] = {}
+_worker_instances_lock = threading.Lock()
+
+
+def _get_worker_instance(instance_ref):
+    key = serialize_dagster_namedtuple(instance_ref)
+    with _worker_instances_lock:
+        if key not in _worker_instances:
+            _worker_instances[key] = DagsterInstance.from_ref(instance_ref)
+        return _worker_instances[key]
+
+
+def execute_step_on_dask_worker(
+    upstream_results,
+    recon_pipeline,
+    pipeline_run,
+    run_config,
+    step_key,
+    mode,
+    instance_ref,
+    known_state,
+):
+    """Executes a single step, with the outputs in the results of its upstream steps' tasks
+    available to the dask_worker_io_manager.
+
+    Returns the events of the step, along with the outputs that it stored with the
+    dask_worker_io_manager, which dask keeps in the worker's memory for the downstream steps.
+    """
+    outputs = {}
+    for _events, upstream_outputs in upstream_results:
+        outputs.update(upstream_outputs)
+    set_step_outputs(dict(outputs))
+
+    try:
+        # pipeline definitions are cached per process by ReconstructablePipeline.get_definition
+        subset_pipeline = recon_pipeline.subset_for_execution_from_existing_pipeline(
+            pipeline_run.solids_to_execute
+        )
+
+        execution_plan = create_execution_plan(
+            subset_pipeline,
+            run_config=run_config,
+            step_keys_to_execute=[step_key],
+            mode=mode,
+            known_state=known_state,
+        )
+
+        events = execute_plan(
+            execution_plan,
+            subset_pipeline,
+            _get_worker_instance(instance_ref),
+            pipeline_run,
+            run_config=run_config,
+        )
+
+        step_outputs = {
+            keys: value for keys, value in get_step_outputs().items() if keys not in outputs
+        }
+        return events, step_outputs
+    finally:
+        set_step_outputs(None)
+
+
+def get_step_events(step_result):
+    return step_result[0]
+
+
 def get_dask_resource_requirements(tags):
     check.inst_param(tags, "tags", frozentags)
     req_str = tags.get(DASK_RESOURCE_REQUIREMENTS_KEY)
@@ -153,12 +255,125 @@ def get_dask_resource_requirements(tags):
     return {}
 
 
+def _get_unresolved_step_key(step_key):
+    handle = StepHandle.parse_from_key(step_key)
+    if isinstance(handle, ResolvedFromDynamicStepHandle):
+        return handle.unresolved_form.to_key()
+    return step_key
+
+
+class _StepFutures:
+    """The futures of the tasks of the steps of a run, each of which is released once all of the
+    steps downstream of its step have finished, so that dask can free the outputs that the task
+    holds in the memory of its worker.
+
+    Mapped steps aren't known until the dynamic outputs that they are mapped over have been
+    yielded, so steps are tracked by the key of the unresolved step that they are resolved from.
+    """
+
+    def __init__(self, execution_plan):
+        self._execution_plan = check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+
+        self._futures = {}
+        self._step_keys_with_futures = defaultdict(set)
+
+        self._dependency_keys = defaultdict(set)
+        self._unfinished_dependent_keys = defaultdict(set)
+        self._unfinished_step_keys = defaultdict(set)
+        self._unresolved_steps = {}
+        self._finished_keys = set()
+
+        for handle in execution_plan.step_handles_to_execute:
+            step = execution_plan.get_step(handle)
+            key = _get_unresolved_step_key(step.key)
+            if isinstance(step, ExecutionStep):
+                dependency_keys = step.get_execution_dependency_keys()
+            else:
+                dependency_keys = step.get_all_dependency_keys()
+
+            if isinstance(step, UnresolvedMappedExecutionStep):
+                self._unresolved_steps[key] = step
+            else:
+                self._unfinished_step_keys[key].add(step.key)
+
+            for dependency_key in dependency_keys:
+                dependency_key = _get_unresolved_step_key(dependency_key)
+                self._dependency_keys[key].add(dependency_key)
+                self._unfinished_dependent_keys[dependency_key].add(key)
+
+    def add(self, step_key, future):
+        self._futures[step_key] = future
+        self._step_keys_with_futures[_get_unresolved_step_key(step_key)].add(step_key)
+
+    def get(self, step_keys):
+        return [self._futures[key] for key in sorted(step_keys) if key in self._futures]
+
+    def mark_finished(self, step_key, failed=False):
+        key = _get_unresolved_step_key(step_key)
+        self._unfinished_step_keys[key].discard(step_key)
+
+        # the steps downstream of a failed step are abandoned. A failed mapped step only abandons
+        # the downstream steps of its own mapping key, so the futures of its upstream steps are
+        # held until the run finishes.
+        if failed and key == step_key:
+            keys_to_abandon = list(self._unfinished_dependent_keys[key])
+            while keys_to_abandon:
+                abandoned_key = keys_to_abandon.pop()
+                if abandoned_key not in self._finished_keys:
+                    keys_to_abandon.extend(self._unfinished_dependent_keys[abandoned_key])
+                    self._finish(abandoned_key)
+
+        self._finish_if_done(key)
+
+    def update_resolved_steps(self):
+        """Tracks the steps that mapped steps were resolved to, once the steps whose dynamic
+        outputs they are mapped over have finished. Steps that are never resolved, because those
+        steps failed or were skipped, are finished.
+        """
+        for key, step in list(self._unresolved_steps.items()):
+            if any(
+                _get_unresolved_step_key(resolved_by_step_key) not in self._finished_keys
+                for resolved_by_step_key in step.resolved_by_step_keys
+            ):
+                continue
+
+            del self._unresolved_steps[key]
+            for handle in self._execution_plan.step_dict:
+                if (
+                    isinstance(handle, ResolvedFromDynamicStepHandle)
+                    and handle.unresolved_form == step.handle
+                ):
+                    self._unfinished_step_keys[key].add(handle.to_key())
+            self._finish_if_done(key)
+
+    def _finish_if_done(self, key):
+        if key not in self._unresolved_steps and not self._unfinished_step_keys[key]:
+            self._finish(key)
+
+    def _finish(self, key):
+        if key in self._finished_keys:
+            return
+
+        self._finished_keys.add(key)
+        self._unresolved_steps.pop(key, None)
+        for dependency_key in self._dependency_keys[key]:
+            self._unfinished_dependent_keys[dependency_key].discard(key)
+            self._release_if_unused(dependency_key)
+        self._release_if_unused(key)
+
+    def _release_if_unused(self, key):
+        if key in self._finished_keys and not self._unfinished_dependent_keys[key]:
+            for step_key in self._step_keys_with_futures.pop(key, ()):
+                del self._futures[step_key]
+
+
 class DaskExecutor(Executor):
-    def __init__(self, cluster_type, cluster_configuration):
+    def __init__(self, cluster_type, cluster_configuration, dag_submission=False):
         self.cluster_type = check.opt_str_param(cluster_type, "cluster_type", default="local")
         self.cluster_configuration = check.opt_dict_param(
             cluster_configuration, "cluster_configuration"
         )
+        self.dag_submission = check.bool_param(dag_submission, "dag_submission")
 
     @property
     def retries(self):
@@ -178,8 +393,6 @@ def execute(self, plan_context, execution_plan):
             "Dask execution requires a persistent DagsterInstance",
         )
 
-        step_levels = execution_plan.get_steps_to_execute_by_level()
-
         pipeline_name = plan_context.pipeline_name
 
         instance = plan_context.instance
@@ -233,6 +446,18 @@ def execute(self, plan_context, execution_plan):
                 f"Must be providing one of the following ('existing', 'local', 'yarn', 'ssh', 'pbs', 'moab', 'sge', 'lsf', 'slurm', 'oar', 'kube') not {cluster_type}"
             )
 
+        if plan_context.pipeline.get_definition().is_job:
+            run_config = plan_context.run_config
+        else:
+            run_config = dict(plan_context.run_config, execution={"in_process": {}})
+
+        if self.dag_submission:
+            with dask.distributed.Client(cluster) as client:
+                yield from self._execute_dag(plan_context, execution_plan, client, run_config)
+            return
+
+        step_levels = execution_plan.get_steps_to_execute_by_level()
+
         with dask.distributed.Client(cluster) as client:
             execution_futures = []
             execution_futures_dict = {}
@@ -246,11 +471,6 @@ def execute(self, plan_context, execution_plan):
                         for key in step_input.dependency_keys:
                             dependencies.append(execution_futures_dict[key])
 
-                    if plan_context.pipeline.get_definition().is_job:
-                        run_config = plan_context.run_config
-                    else:
-                        run_config = dict(plan_context.run_config, execution={"in_process": {}})
-
                     dask_task_name = "%s.%s" % (pipeline_name, step.key)
 
                     recon_pipeline = plan_context.reconstructable_pipeline
@@ -282,6 +502,99 @@ def execute(self, plan_context, execution_plan):
                     check.inst(step_event, DagsterEvent)
                     yield step_event
 
+    def _execute_dag(self, plan_context, execution_plan, client, run_config):
+        pipeline_name = plan_context.pipeline_name
+        instance_ref = plan_context.instance.get_ref()
+
+        with execution_plan.start(retry_mode=self.retries) as active_execution:
+            # futures of the results of each step's task, which hold the step's outputs in the
+            # memory of the worker that executed it
+            step_futures = _StepFutures(execution_plan)
+            # futures of the events of each step's task, which are small enough to gather
+            step_keys_by_events_future = {}
+            events_futures = dask.distributed.as_completed()
+
+            while not active_execution.is_complete:
+                for step in active_execution.get_steps_to_execute():
+                    dask_task_name = "%s.%s" % (pipeline_name, step.key)
+                    future = client.submit(
+                        execute_step_on_dask_worker,
+                        step_futures.get(step.get_execution_dependency_keys()),
+                        plan_context.reconstructable_pipeline,
+                        plan_context.pipeline_run,
+                        run_config,
+                        step.key,
+                        plan_context.pipeline_run.mode,
+                        instance_ref,
+                        active_execution.get_known_state(),
+                        key=dask_task_name,
+                        resources=get_dask_resource_requirements(step.tags),
+                    )
+                    step_futures.add(step.key, future)
+
+                    # runs on the worker that holds the step's result, so that only its events
+                    # are sent back
+                    events_future = client.submit(
+                        get_step_events, future, key=f"{dask_task_name}.events"
+                    )
+                    step_keys_by_events_future[events_future] = step.key
+                    events_futures.add(events_future)
+
+                if not step_keys_by_events_future:
+                    # nothing is running, process the steps that were skipped or abandoned
+                    yield from self._plan_events_iterator(
+                        plan_context, active_execution, step_futures
+                    )
+                    continue
+
+                # Allow interrupts while waiting for the results from Dask
+                with raise_execution_interrupts():
+                    completed_futures = events_futures.next_batch(block=True)
+
+                for events_future in completed_futures:
+                    step_key = step_keys_by_events_future.pop(events_future)
+                    try:
+                        step_events = events_future.result()
+                    except Exception:
+                        step = active_execution.get_step_by_key(step_key)
+                        serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
+                        yield DagsterEvent.engine_event(
+                            plan_context,
+                            f"Dask task for step {step_key} failed",
+                            EngineEventData.engine_error(serializable_error),
+                            step_handle=step.handle,
+                        )
+                        step_events = [
+                            DagsterEvent.step_failure_event(
+                                step_context=plan_context.for_step(step),
+                                step_failure_data=StepFailureData(
+                                    error=serializable_error, user_failure_data=None
+                                ),
+                            )
+                        ]
+
+                    for step_event in step_events:
+                        check.inst(step_event, DagsterEvent)
+                        yield step_event
+                        active_execution.handle_event(step_event)
+
+                    active_execution.verify_complete(plan_context, step_key)
+                    step_futures.mark_finished(
+                        step_key, failed=any(event.is_step_failure for event in step_events)
+                    )
+
+                # process skipped and abandoned steps
+                yield from self._plan_events_iterator(plan_context, active_execution, step_futures)
+
+    def _plan_events_iterator(self, plan_context, active_execution, step_futures):
+        for event in active_execution.plan_events_iterator(plan_context):
+            yield event
+            if event.is_step_skipped:
+                step_futures.mark_finished(event.step_key)
+
+        # the mapped steps are resolved while the skipped and abandoned steps are processed
+        step_futures.update_resolved_steps()
+
     def build_dict(self, pipeline_name):
         """Returns a dict we can use for kwargs passed to dask client instantiation.
 
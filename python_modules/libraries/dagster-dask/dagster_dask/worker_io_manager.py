@@ -0,0 +1,61 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from dagster import IOManager, check, io_manager
+from dagster.core.errors import DagsterInvariantViolationError
+
+# The outputs that the step executing in the current thread of a dask worker has access to, keyed
+# by output identifier. They are seeded with the outputs of the upstream steps before the step is
+# executed, and the outputs of the step are handed back to dask once it's done. They are unset
+# outside of the steps that are executed by the dask executor with dag_submission enabled.
+_step_outputs = threading.local()
+
+
+def get_step_outputs() -> Optional[Dict[Tuple[str, ...], Any]]:
+    return getattr(_step_outputs, "values", None)
+
+
+def set_step_outputs(values: Optional[Dict[Tuple[str, ...], Any]]):
+    check.opt_dict_param(values, "values")
+    _step_outputs.values = values
+
+
+def _get_step_outputs_or_error() -> Dict[Tuple[str, ...], Any]:
+    values = get_step_outputs()
+    if values is None:
+        raise DagsterInvariantViolationError(
+            "The dask_worker_io_manager can only be used with the dask executor when "
+            "dag_submission is enabled."
+        )
+    return values
+
+
+class DaskWorkerIOManager(IOManager):
+    def handle_output(self, context, obj):
+        _get_step_outputs_or_error()[tuple(context.get_output_identifier())] = obj
+
+    def load_input(self, context):
+        keys = tuple(context.upstream_output.get_output_identifier())
+        values = _get_step_outputs_or_error()
+        if keys not in values:
+            raise DagsterInvariantViolationError(
+                f"Output {keys} is not in the memory of this dask worker. The "
+                "dask_worker_io_manager can only be used with the dask executor when "
+                "dag_submission is enabled."
+            )
+        return values[keys]
+
+
+@io_manager
+def dask_worker_io_manager(_):
+    """IO manager that keeps outputs in the memory of the dask worker that computed them.
+
+    When the :py:func:`dask_executor` is configured with ``dag_submission: true``, each output is
+    handed to dask as part of the result of its step's task, and passed to the tasks of the
+    downstream steps that load it. Dask schedules those tasks on the workers that already hold
+    their inputs when it can, and otherwise moves the data between workers, so no output ever
+    needs to be written to external storage.
+
+    Outputs are held by dask until the run finishes, and can't be loaded outside of the run.
+    """
+    return DaskWorkerIOManager()
@@ -7,8 +7,11 @@
 import pytest
 from dagster import (
     DagsterUnmetExecutorRequirementsError,
+    DynamicOut,
+    DynamicOutput,
     InputDefinition,
     ModeDefinition,
+    Out,
     VersionStrategy,
     execute_pipeline,
     execute_pipeline_iterator,
@@ -23,9 +26,11 @@
 from dagster.core.definitions.executor_definition import default_executors
 from dagster.core.definitions.reconstructable import ReconstructablePipeline
 from dagster.core.events import DagsterEventType
+from dagster.core.execution.api import create_execution_plan
 from dagster.core.test_utils import instance_for_test, nesting_composite_pipeline
 from dagster.utils import send_interrupt
-from dagster_dask import DataFrame, dask_executor
+from dagster_dask import DataFrame, dask_executor, dask_worker_io_manager
+from dagster_dask.executor import _StepFutures
 from dask.distributed import Scheduler, Worker
 
 
@@ -334,3 +339,110 @@ def test_dask_executor_job():
         )
         assert result.success
         assert result.output_for_solid("the_op") == 5
+
+
+DAG_SUBMISSION_RUN_CONFIG = {
+    "execution": {"config": {"cluster": {"local": {"timeout": 30}}, "dag_submission": True}}
+}
+
+
+@op(out=DynamicOut())
+def emit_numbers():
+    for i in range(3):
+        yield DynamicOutput(i, mapping_key=str(i))
+
+
+@op
+def double(num):
+    return num * 2
+
+
+@op
+def total(nums):
+    return sum(nums)
+
+
+@job(executor_def=dask_executor)
+def dynamic_job():
+    total(emit_numbers().map(double).collect())
+
+
+def test_dask_executor_dag_submission_dynamic():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(dynamic_job), instance=instance, run_config=DAG_SUBMISSION_RUN_CONFIG
+        )
+        assert result.success
+        assert result.output_for_solid("total") == 6
+
+
+def test_dag_submission_releases_step_futures():
+    execution_plan = create_execution_plan(dynamic_job, run_config=DAG_SUBMISSION_RUN_CONFIG)
+    step_futures = _StepFutures(execution_plan)
+
+    step_futures.add("emit_numbers", "emit_numbers_future")
+    step_futures.mark_finished("emit_numbers")
+    execution_plan.resolve({"emit_numbers": {"result": ["0", "1"]}})
+    step_futures.update_resolved_steps()
+
+    step_futures.add("double[0]", "double_0_future")
+    step_futures.mark_finished("double[0]")
+    # held until all of the steps mapped over its dynamic output have finished
+    assert step_futures.get({"emit_numbers"}) == ["emit_numbers_future"]
+
+    step_futures.add("double[1]", "double_1_future")
+    step_futures.mark_finished("double[1]")
+    assert step_futures.get({"emit_numbers"}) == []
+    assert step_futures.get({"double[0]", "double[1]"}) == ["double_0_future", "double_1_future"]
+
+    step_futures.add("total", "total_future")
+    step_futures.mark_finished("total")
+    assert step_futures.get({"double[0]", "double[1]", "total"}) == []
+
+
+def test_dag_submission_releases_step_futures_after_failure():
+    execution_plan = create_execution_plan(dynamic_job, run_config=DAG_SUBMISSION_RUN_CONFIG)
+    step_futures = _StepFutures(execution_plan)
+
+    step_futures.add("emit_numbers", "emit_numbers_future")
+    step_futures.mark_finished("emit_numbers", failed=True)
+    step_futures.update_resolved_steps()
+    assert step_futures.get({"emit_numbers"}) == []
+
+
+@op(out=Out(io_manager_key="dask_worker_io_manager"))
+def in_worker_memory_op():
+    return [1, 2, 3]
+
+
+@op
+def sum_op(nums):
+    return sum(nums)
+
+
+@job(
+    executor_def=dask_executor,
+    resource_defs={"dask_worker_io_manager": dask_worker_io_manager},
+)
+def worker_io_manager_job():
+    sum_op(in_worker_memory_op())
+
+
+def test_dask_executor_dag_submission_worker_io_manager():
+    with instance_for_test() as instance:
+        result = execute_pipeline(
+            reconstructable(worker_io_manager_job),
+            instance=instance,
+            run_config=DAG_SUBMISSION_RUN_CONFIG,
+        )
+        assert result.success
+        assert result.output_for_solid("sum_op") == 6
+
+        # without dag submission, the output isn't available to the downstream step
+        result = execute_pipeline(
+            reconstructable(worker_io_manager_job),
+            instance=instance,
+            run_config={"execution": {"config": {"cluster": {"local": {"timeout": 30}}}}},
+            raise_on_error=False,
+        )
+        assert not result.success
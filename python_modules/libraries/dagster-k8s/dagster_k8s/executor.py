@@ -1,3 +1,6 @@
+import threading
+from typing import Dict, Set
+
 import kubernetes
 from dagster import Field, StringSource, check, executor
 from dagster.core.definitions.executor_definition import multiple_process_executor_requirements
@@ -20,8 +23,11 @@
     get_k8s_job_name,
     get_user_defined_k8s_config,
 )
+from .job_informer import K8sJobInformer
 from .utils import delete_job
 
+RUN_ID_LABEL = "dagster/run-id"
+
 
 @executor(
     name="k8s",
@@ -121,12 +127,21 @@ def __init__(
         load_incluster_config: bool,
         kubeconfig_file: Optional[str],
         k8s_client_batch_api=None,
+        k8s_watch_factory=None,
     ):
         super().__init__()
 
         self._job_config = job_config
         self._job_namespace = job_namespace
         self._fixed_k8s_client_batch_api = k8s_client_batch_api
+        self._k8s_watch_factory = k8s_watch_factory
+
+        # informers of the step jobs of each run, so that step health checks are answered from
+        # memory rather than with a request per step. A run's informer is stopped once every step
+        # job that was launched for the run has finished.
+        self._job_informers_lock = threading.Lock()
+        self._job_informers: Dict[str, K8sJobInformer] = {}
+        self._unfinished_job_names: Dict[str, Set[str]] = {}
 
         if load_incluster_config:
             check.invariant(
@@ -157,6 +172,45 @@ def _get_k8s_step_job_name(self, step_handler_context):
 
         return "dagster-job-%s" % (name_key)
 
+    def _watch_step_job(self, run_id: str, job_name: str):
+        with self._job_informers_lock:
+            self._unfinished_job_names.setdefault(run_id, set()).add(job_name)
+            if run_id in self._job_informers:
+                return
+
+            informer = K8sJobInformer(
+                self._batch_api,
+                namespace=self._job_namespace,
+                label_selector=f"{RUN_ID_LABEL}={run_id}",
+                watch_factory=self._k8s_watch_factory,
+                on_job_update=lambda job: self._handle_step_job_update(run_id, job),
+            )
+            self._job_informers[run_id] = informer
+        informer.start()
+
+    def _handle_step_job_update(self, run_id: str, job):
+        if job.status.succeeded or job.status.failed:
+            self._unwatch_step_job(run_id, job.metadata.name)
+
+    def _unwatch_step_job(self, run_id: str, job_name: str):
+        with self._job_informers_lock:
+            unfinished_job_names = self._unfinished_job_names.get(run_id)
+            if unfinished_job_names is None:
+                return
+
+            unfinished_job_names.discard(job_name)
+            if unfinished_job_names:
+                return
+
+            del self._unfinished_job_names[run_id]
+            informer = self._job_informers.pop(run_id)
+        informer.stop()
+
+    def _get_synced_job_informer(self, run_id: str) -> Optional[K8sJobInformer]:
+        with self._job_informers_lock:
+            informer = self._job_informers.get(run_id)
+        return informer if informer and informer.has_synced else None
+
     def launch_step(self, step_handler_context: StepHandlerContext):
         events = []
 
@@ -193,6 +247,7 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             labels={
                 "dagster/job": step_handler_context.execute_step_args.pipeline_origin.pipeline_name,
                 "dagster/op": step_key,
+                RUN_ID_LABEL: step_handler_context.execute_step_args.pipeline_run_id,
             },
         )
 
@@ -211,7 +266,13 @@ def launch_step(self, step_handler_context: StepHandlerContext):
             )
         )
 
-        self._batch_api.create_namespaced_job(body=job, namespace=self._job_namespace)
+        run_id = step_handler_context.execute_step_args.pipeline_run_id
+        self._watch_step_job(run_id, job_name)
+        try:
+            self._batch_api.create_namespaced_job(body=job, namespace=self._job_namespace)
+        except Exception:
+            self._unwatch_step_job(run_id, job_name)
+            raise
 
         return events
 
@@ -223,7 +284,15 @@ def check_step_health(self, step_handler_context: StepHandlerContext):
 
         job_name = self._get_k8s_step_job_name(step_handler_context)
 
-        job = self._batch_api.read_namespaced_job(namespace=self._job_namespace, name=job_name)
+        informer = self._get_synced_job_informer(
+            step_handler_context.execute_step_args.pipeline_run_id
+        )
+        job = informer.get_job(job_name) if informer else None
+        if not job:
+            # the informer hasn't observed the job yet, isn't able to watch the jobs, or has been
+            # stopped since every job of the run finished
+            job = self._batch_api.read_namespaced_job(namespace=self._job_namespace, name=job_name)
+
         if job.status.failed:
             return [
                 DagsterEvent(
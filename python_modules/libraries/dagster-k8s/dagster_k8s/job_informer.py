@@ -0,0 +1,163 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import kubernetes
+from dagster import check
+
+DEFAULT_WATCH_TIMEOUT_SECONDS = 60
+DEFAULT_WAIT_AFTER_WATCH_ERROR = 5.0
+
+# the resource version of a watch is too old to resume from, so the jobs need to be listed again
+HTTP_GONE = 410
+
+
+class K8sJobInformer:
+    """Keeps an in-memory view of the Kubernetes jobs in a namespace that match a label selector.
+
+    The jobs are listed once, and then kept up to date by a watch that resumes from the resource
+    version of the list. Checking the status of any number of jobs then costs a single watch
+    connection to the API server instead of a request per job.
+
+    Args:
+        batch_api: The Kubernetes BatchV1Api to list and watch the jobs with.
+        namespace (str): The namespace of the jobs.
+        label_selector (str): The label selector of the jobs, e.g. "dagster/run-id=<run_id>".
+        watch_factory: Creates the watch that streams the job events. Defaults to
+            ``kubernetes.watch.Watch``.
+        logger: Called with a message when the watch fails.
+        sleeper: Called with a number of seconds to wait after the watch fails.
+        watch_timeout_seconds (int): How long each watch request lasts before it is restarted.
+        on_job_update (Callable[[V1Job], None]): Called from the background thread with each job
+            that is listed, added or modified.
+    """
+
+    def __init__(
+        self,
+        batch_api,
+        namespace: str,
+        label_selector: str,
+        watch_factory=None,
+        logger=None,
+        sleeper=None,
+        watch_timeout_seconds: int = DEFAULT_WATCH_TIMEOUT_SECONDS,
+        on_job_update: Optional[Callable[[kubernetes.client.V1Job], None]] = None,
+    ):
+        self._batch_api = batch_api
+        self._namespace = check.str_param(namespace, "namespace")
+        self._label_selector = check.str_param(label_selector, "label_selector")
+        self._watch_factory = watch_factory or kubernetes.watch.Watch
+        self._logger = logger or logging.warning
+        self._sleeper = sleeper or time.sleep
+        self._watch_timeout_seconds = check.int_param(
+            watch_timeout_seconds, "watch_timeout_seconds"
+        )
+        self._on_job_update = check.opt_callable_param(on_job_update, "on_job_update")
+
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, kubernetes.client.V1Job] = {}
+        self._resource_version: Optional[str] = None
+        self._has_synced = False
+
+        self._watch = None
+        self._shutdown_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def has_synced(self) -> bool:
+        """Whether the jobs have been listed and are being watched."""
+        return (
+            self._has_synced
+            and not self._shutdown_event.is_set()
+            and self._thread is not None
+            and self._thread.is_alive()
+        )
+
+    def get_job(self, job_name: str) -> Optional[kubernetes.client.V1Job]:
+        """Returns the last observed state of the job, or None if it hasn't been observed."""
+        check.str_param(job_name, "job_name")
+        with self._lock:
+            return self._jobs.get(job_name)
+
+    def start(self):
+        """Lists and watches the jobs in a background thread."""
+        check.invariant(self._thread is None, "K8sJobInformer has already been started")
+        self._thread = threading.Thread(target=self._run, name="k8s-job-informer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops watching the jobs. The background thread exits once the current watch request
+        returns."""
+        self._shutdown_event.set()
+        watch = self._watch
+        if watch:
+            watch.stop()
+
+    def list_jobs(self):
+        jobs = self._batch_api.list_namespaced_job(
+            namespace=self._namespace, label_selector=self._label_selector
+        )
+        with self._lock:
+            self._jobs = {job.metadata.name: job for job in jobs.items}
+            self._resource_version = jobs.metadata.resource_version
+            self._has_synced = True
+
+        for job in jobs.items:
+            self._job_updated(job)
+
+    def watch_jobs(self):
+        """Applies the job events of a single watch request, which lasts until the watch times
+        out or is stopped."""
+        self._watch = self._watch_factory()
+        try:
+            if self._shutdown_event.is_set():
+                return
+
+            for event in self._watch.stream(
+                self._batch_api.list_namespaced_job,
+                namespace=self._namespace,
+                label_selector=self._label_selector,
+                resource_version=self._resource_version,
+                timeout_seconds=self._watch_timeout_seconds,
+            ):
+                self._handle_event(event)
+        finally:
+            self._watch = None
+
+    def _handle_event(self, event):
+        job = event["object"]
+        with self._lock:
+            if event["type"] == "DELETED":
+                self._jobs.pop(job.metadata.name, None)
+            else:
+                self._jobs[job.metadata.name] = job
+            self._resource_version = job.metadata.resource_version
+
+        if event["type"] != "DELETED":
+            self._job_updated(job)
+
+    def _job_updated(self, job):
+        # called without holding the lock, so that the callback can read or stop the informer
+        if self._on_job_update:
+            self._on_job_update(job)
+
+    def _run(self):
+        while not self._shutdown_event.is_set():
+            try:
+                if not self._has_synced:
+                    self.list_jobs()
+                self.watch_jobs()
+            except Exception as e:  # pylint: disable=broad-except
+                if self._shutdown_event.is_set():
+                    break
+
+                # events may have been missed, so the jobs are listed again
+                with self._lock:
+                    self._has_synced = False
+
+                if not (
+                    isinstance(e, kubernetes.client.rest.ApiException) and e.status == HTTP_GONE
+                ):
+                    self._logger(f"Error while watching Kubernetes jobs: {e}")
+                    self._sleeper(DEFAULT_WAIT_AFTER_WATCH_ERROR)
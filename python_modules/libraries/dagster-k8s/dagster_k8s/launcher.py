@@ -1,7 +1,9 @@
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import kubernetes
-from dagster import EventMetadataEntry, Field, StringSource, check
+from dagster import EventMetadataEntry, Field, IntSource, StringSource, check
 from dagster.cli.api import ExecuteRunArgs
 from dagster.core.events import EngineEventData
 from dagster.core.launcher import LaunchRunContext, ResumeRunContext, RunLauncher
@@ -21,6 +23,8 @@
 )
 from .utils import delete_job
 
+DEFAULT_MAX_CONCURRENT_LAUNCHES = 16
+
 
 class K8sRunLauncher(RunLauncher, ConfigurableClass):
     """RunLauncher that starts a Kubernetes Job for each Dagster job run.
@@ -97,6 +101,10 @@ class K8sRunLauncher(RunLauncher, ConfigurableClass):
             https://v1-18.docs.kubernetes.io/docs/reference/generated/kubernetes-api/v1.18/#volume-v1-core
         labels (Optional[Dict[str, str]]): Additional labels that should be included in the Job's Pod. See:
             https://kubernetes.io/docs/concepts/overview/working-with-objects/labels
+        max_concurrent_launches (Optional[int]): The maximum number of Kubernetes Jobs that are
+            created at once when a batch of runs is launched, e.g. by the queued run coordinator
+            daemon. This is also the size of the launcher's pool of connections to the Kubernetes
+            API server. Default: ``16``.
     """
 
     def __init__(
@@ -119,6 +127,7 @@ def __init__(
         volume_mounts=None,
         volumes=None,
         labels=None,
+        max_concurrent_launches=DEFAULT_MAX_CONCURRENT_LAUNCHES,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.job_namespace = check.str_param(job_namespace, "job_namespace")
@@ -136,8 +145,17 @@ def __init__(
             kubernetes.config.load_kube_config(kubeconfig_file)
 
         self._fixed_batch_api = k8s_client_batch_api
+        self._max_concurrent_launches = check.int_param(
+            max_concurrent_launches, "max_concurrent_launches"
+        )
+        check.invariant(
+            self._max_concurrent_launches > 0, "max_concurrent_launches must be positive"
+        )
+        self._pooled_batch_api = None
+        self._batch_api_lock = threading.Lock()
 
         self._job_config = None
+        self._grpc_job_configs = {}
         self._job_image = check.opt_str_param(job_image, "job_image")
         self.dagster_home = check.str_param(dagster_home, "dagster_home")
         self._image_pull_policy = check.opt_str_param(
@@ -196,7 +214,19 @@ def labels(self):
 
     @property
     def _batch_api(self):
-        return self._fixed_batch_api if self._fixed_batch_api else kubernetes.client.BatchV1Api()
+        if self._fixed_batch_api:
+            return self._fixed_batch_api
+
+        # a single API client is shared by all of the launches, so that connections to the API
+        # server are reused instead of being opened for every run
+        with self._batch_api_lock:
+            if not self._pooled_batch_api:
+                configuration = kubernetes.client.Configuration.get_default_copy()
+                configuration.connection_pool_maxsize = self._max_concurrent_launches
+                self._pooled_batch_api = kubernetes.client.BatchV1Api(
+                    kubernetes.client.ApiClient(configuration)
+                )
+            return self._pooled_batch_api
 
     @classmethod
     def config_type(cls):
@@ -207,6 +237,9 @@ def config_type(cls):
 
         run_launcher_extra_cfg = {
             "job_namespace": Field(StringSource, is_required=False, default_value="default"),
+            "max_concurrent_launches": Field(
+                IntSource, is_required=False, default_value=DEFAULT_MAX_CONCURRENT_LAUNCHES
+            ),
         }
         return merge_dicts(job_cfg, run_launcher_extra_cfg)
 
@@ -250,6 +283,11 @@ def get_static_job_config(self):
             return self._job_config
 
     def _get_grpc_job_config(self, job_image):
+        if job_image not in self._grpc_job_configs:
+            self._grpc_job_configs[job_image] = self._build_grpc_job_config(job_image)
+        return self._grpc_job_configs[job_image]
+
+    def _build_grpc_job_config(self, job_image):
         return DagsterK8sJobConfig(
             job_image=check.str_param(job_image, "job_image"),
             dagster_home=check.str_param(self.dagster_home, "dagster_home"),
@@ -275,6 +313,11 @@ def _get_grpc_job_config(self, job_image):
         )
 
     def _launch_k8s_job_with_args(self, job_name, args, run, pipeline_origin):
+        job = self._construct_k8s_job_with_args(job_name, args, run, pipeline_origin)
+        self._batch_api.create_namespaced_job(body=job, namespace=self.job_namespace)
+        self._report_k8s_job_created(job_name, run)
+
+    def _construct_k8s_job_with_args(self, job_name, args, run, pipeline_origin):
         pod_name = job_name
 
         user_defined_k8s_config = get_user_defined_k8s_config(frozentags(run.tags))
@@ -315,8 +358,9 @@ def _launch_k8s_job_with_args(self, job_name, args, run, pipeline_origin):
             ),
             cls=self.__class__,
         )
+        return job
 
-        self._batch_api.create_namespaced_job(body=job, namespace=self.job_namespace)
+    def _report_k8s_job_created(self, job_name, run):
         self._instance.report_engine_event(
             "Kubernetes run worker job created",
             run,
@@ -330,18 +374,68 @@ def _launch_k8s_job_with_args(self, job_name, args, run, pipeline_origin):
             cls=self.__class__,
         )
 
+    def _get_execute_run_args(self, context: LaunchRunContext, instance_ref):
+        return ExecuteRunArgs(
+            pipeline_origin=context.pipeline_code_origin,
+            pipeline_run_id=context.pipeline_run.run_id,
+            instance_ref=instance_ref,
+        ).get_command_args()
+
     def launch_run(self, context: LaunchRunContext) -> None:
         run = context.pipeline_run
         job_name = get_job_name_from_run_id(run.run_id)
-        pipeline_origin = context.pipeline_code_origin
-
-        args = ExecuteRunArgs(
-            pipeline_origin=pipeline_origin,
-            pipeline_run_id=run.run_id,
-            instance_ref=self._instance.get_ref(),
-        ).get_command_args()
-
-        self._launch_k8s_job_with_args(job_name, args, run, pipeline_origin)
+        args = self._get_execute_run_args(context, self._instance.get_ref())
+
+        self._launch_k8s_job_with_args(job_name, args, run, context.pipeline_code_origin)
+
+    def launch_runs(self, contexts):
+        """Creates the Kubernetes Jobs of a batch of runs concurrently, on a bounded pool of
+        threads that share the launcher's API client. The job specs are built, and the engine
+        events reported, on the calling thread."""
+        errors = {}
+        jobs = {}
+        instance_ref = self._instance.get_ref()
+
+        for context in contexts:
+            run = context.pipeline_run
+            try:
+                job_name = get_job_name_from_run_id(run.run_id)
+                args = self._get_execute_run_args(context, instance_ref)
+                jobs[run.run_id] = (
+                    run,
+                    job_name,
+                    self._construct_k8s_job_with_args(
+                        job_name, args, run, context.pipeline_code_origin
+                    ),
+                )
+            except Exception:
+                errors[run.run_id] = serializable_error_info_from_exc_info(sys.exc_info())
+
+        if not jobs:
+            return errors
+
+        batch_api = self._batch_api
+        with ThreadPoolExecutor(
+            max_workers=min(len(jobs), self._max_concurrent_launches),
+            thread_name_prefix="k8s_run_launcher",
+        ) as executor:
+            futures = {
+                run_id: executor.submit(
+                    batch_api.create_namespaced_job, body=job, namespace=self.job_namespace
+                )
+                for run_id, (_run, _job_name, job) in jobs.items()
+            }
+
+            for run_id, future in futures.items():
+                run, job_name, _job = jobs[run_id]
+                try:
+                    future.result()
+                except Exception:
+                    errors[run_id] = serializable_error_info_from_exc_info(sys.exc_info())
+                else:
+                    self._report_k8s_job_created(job_name, run)
+
+        return errors
 
     def resume_run(self, context: ResumeRunContext) -> None:
         run = context.pipeline_run
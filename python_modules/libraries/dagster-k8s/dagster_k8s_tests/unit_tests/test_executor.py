@@ -1,4 +1,5 @@
 import json
+import queue
 from unittest import mock
 
 import pytest
@@ -13,6 +14,8 @@
 from dagster_k8s.executor import K8sStepHandler, k8s_job_executor
 from dagster_k8s.job import DagsterK8sJobConfig, UserDefinedDagsterK8sConfig
 
+from .utils import FakeWatch, create_job, create_job_list, wait_for
+
 
 @solid
 def foo():
@@ -159,3 +162,80 @@ def test_step_handler_image_override(kubeconfig_file):
         method_name, _args, kwargs = mock_method_calls[0]
         assert method_name == "create_namespaced_job"
         assert kwargs["body"].spec.template.spec.containers[0].image == "new-image"
+
+
+def test_step_handler_check_step_health(kubeconfig_file):
+    mock_k8s_client_batch_api = mock.MagicMock()
+    events = queue.Queue()
+    handler = K8sStepHandler(
+        job_config=DagsterK8sJobConfig(instance_config_map="foobar", job_image="bizbuz"),
+        job_namespace="foo",
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+        k8s_watch_factory=FakeWatch(events),
+    )
+
+    with instance_for_test() as instance:
+        run = create_run_for_test(
+            instance,
+            pipeline_name="bar",
+        )
+        step_handler_contexts = [
+            StepHandlerContext(
+                instance,
+                ExecuteStepArgs(reconstructable(bar).get_python_origin(), run.run_id, [step_key]),
+                {step_key: {}},
+            )
+            for step_key in ["foo_solid", "bar_solid"]
+        ]
+        job_names = [
+            handler._get_k8s_step_job_name(context)  # pylint: disable=protected-access
+            for context in step_handler_contexts
+        ]
+
+        mock_k8s_client_batch_api.list_namespaced_job.return_value = create_job_list(
+            [create_job(job_name, "1") for job_name in job_names], "1"
+        )
+
+        # launching the first step of the run starts watching the step jobs of the run
+        for context in step_handler_contexts:
+            handler.launch_step(context)
+        _args, kwargs = mock_k8s_client_batch_api.create_namespaced_job.call_args
+        assert kwargs["body"].metadata.labels["dagster/run-id"] == run.run_id
+
+        informer = handler._job_informers[run.run_id]  # pylint: disable=protected-access
+        try:
+            wait_for(lambda: informer.has_synced)
+
+            for _ in range(3):
+                for context in step_handler_contexts:
+                    assert handler.check_step_health(context) == []
+
+            events.put({"type": "MODIFIED", "object": create_job(job_names[1], "2", failed=1)})
+            wait_for(lambda: informer.get_job(job_names[1]).status.failed)
+            assert handler.check_step_health(step_handler_contexts[0]) == []
+            failure_events = handler.check_step_health(step_handler_contexts[1])
+            assert len(failure_events) == 1
+            assert failure_events[0].is_step_failure
+
+            # health checks are answered by a single label-selected list and watch
+            assert not mock_k8s_client_batch_api.read_namespaced_job.called
+            assert mock_k8s_client_batch_api.list_namespaced_job.call_count == 1
+            _args, kwargs = mock_k8s_client_batch_api.list_namespaced_job.call_args
+            assert kwargs["label_selector"] == f"dagster/run-id={run.run_id}"
+
+            # the informer is stopped once the last step job of the run finishes
+            assert informer.has_synced
+            events.put({"type": "MODIFIED", "object": create_job(job_names[0], "3", succeeded=1)})
+            wait_for(lambda: not informer.has_synced)
+            assert run.run_id not in handler._job_informers  # pylint: disable=protected-access
+
+            # and health checks read the job directly from then on
+            mock_k8s_client_batch_api.read_namespaced_job.return_value = create_job(
+                job_names[0], "3", succeeded=1
+            )
+            assert handler.check_step_health(step_handler_contexts[0]) == []
+            assert mock_k8s_client_batch_api.read_namespaced_job.call_count == 1
+        finally:
+            informer.stop()
@@ -0,0 +1,61 @@
+import queue
+from unittest import mock
+
+import kubernetes
+from dagster_k8s.job_informer import K8sJobInformer
+
+from .utils import FakeWatch, create_job, create_job_list, wait_for
+
+
+def test_job_informer():
+    batch_api = mock.MagicMock()
+    batch_api.list_namespaced_job.side_effect = [
+        create_job_list([create_job("a", "1")], "2"),
+        create_job_list([create_job("a", "5", failed=1)], "6"),
+    ]
+    events = queue.Queue()
+    watch = FakeWatch(events)
+
+    informer = K8sJobInformer(
+        batch_api,
+        namespace="foo",
+        label_selector="dagster/run-id=bar",
+        watch_factory=watch,
+        sleeper=mock.MagicMock(),
+    )
+    assert not informer.has_synced
+    informer.start()
+    try:
+        wait_for(lambda: informer.has_synced)
+        assert informer.get_job("a").status.failed == 0
+        assert informer.get_job("b") is None
+
+        events.put({"type": "ADDED", "object": create_job("b", "3")})
+        events.put({"type": "MODIFIED", "object": create_job("a", "4", failed=1)})
+        wait_for(lambda: informer.get_job("b"))
+        wait_for(lambda: informer.get_job("a").status.failed == 1)
+
+        events.put({"type": "DELETED", "object": create_job("b", "5")})
+        wait_for(lambda: informer.get_job("b") is None)
+
+        # the watch is resumed from the last resource version that was observed
+        events.put(None)
+        wait_for(lambda: len(watch.stream_kwargs) == 2)
+        assert watch.stream_kwargs[0]["resource_version"] == "2"
+        assert watch.stream_kwargs[1]["resource_version"] == "5"
+
+        # jobs are listed again when the resource version is too old to watch from
+        events.put(kubernetes.client.rest.ApiException(status=410, reason="Gone"))
+        wait_for(lambda: len(watch.stream_kwargs) == 3)
+        assert watch.stream_kwargs[2]["resource_version"] == "6"
+        assert informer.has_synced
+
+        # a single list and watch of the jobs that match the label selector
+        assert batch_api.list_namespaced_job.call_count == 2
+        for call in batch_api.list_namespaced_job.call_args_list:
+            assert call[1] == {"namespace": "foo", "label_selector": "dagster/run-id=bar"}
+        assert not batch_api.read_namespaced_job.called
+    finally:
+        informer.stop()
+
+    assert not informer.has_synced
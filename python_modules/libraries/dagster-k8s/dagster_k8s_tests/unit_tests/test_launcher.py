@@ -12,7 +12,11 @@
 )
 from dagster.utils.hosted_user_process import external_pipeline_from_recon_pipeline
 from dagster_k8s import K8sRunLauncher
-from dagster_k8s.job import DAGSTER_PG_PASSWORD_ENV_VAR, UserDefinedDagsterK8sConfig
+from dagster_k8s.job import (
+    DAGSTER_PG_PASSWORD_ENV_VAR,
+    UserDefinedDagsterK8sConfig,
+    get_job_name_from_run_id,
+)
 
 
 def test_user_defined_k8s_config_in_run_tags(kubeconfig_file):
@@ -146,6 +150,86 @@ def test_no_postgres(kubeconfig_file):
         ]
 
 
+def test_launch_runs(kubeconfig_file):
+    # Construct a K8s run launcher in a fake k8s environment.
+    mock_k8s_client_batch_api = mock.MagicMock()
+    k8s_run_launcher = K8sRunLauncher(
+        service_account_name="dagit-admin",
+        instance_config_map="dagster-instance",
+        dagster_home="/opt/dagster/dagster_home",
+        job_image="fake_job_image",
+        load_incluster_config=False,
+        kubeconfig_file=kubeconfig_file,
+        k8s_client_batch_api=mock_k8s_client_batch_api,
+        max_concurrent_launches=2,
+    )
+
+    bad_job_name = get_job_name_from_run_id("bad-run")
+
+    def create_namespaced_job(body, namespace):
+        assert namespace == "default"
+        if body.metadata.name == bad_job_name:
+            raise Exception("Failed to create job")
+
+    mock_k8s_client_batch_api.create_namespaced_job.side_effect = create_namespaced_job
+
+    # Create fake external pipeline.
+    recon_pipeline = reconstructable(fake_pipeline)
+    recon_repo = recon_pipeline.repository
+    repo_def = recon_repo.get_definition()
+
+    with instance_for_test() as instance:
+        with in_process_test_workspace(instance, recon_repo) as workspace:
+            location = workspace.get_repository_location(workspace.repository_location_names[0])
+            repo_handle = RepositoryHandle(
+                repository_name=repo_def.name,
+                repository_location=location,
+            )
+            fake_external_pipeline = external_pipeline_from_recon_pipeline(
+                recon_pipeline,
+                solid_selection=None,
+                repository_handle=repo_handle,
+            )
+
+            runs = [
+                create_run_for_test(
+                    instance,
+                    run_id=run_id,
+                    pipeline_name="demo_pipeline",
+                    external_pipeline_origin=fake_external_pipeline.get_external_origin(),
+                    pipeline_code_origin=fake_external_pipeline.get_python_origin(),
+                )
+                for run_id in ["run-1", "bad-run", "run-2", "run-3"]
+            ]
+            k8s_run_launcher.register_instance(instance)
+            errors = k8s_run_launcher.launch_runs(
+                [LaunchRunContext(run, workspace) for run in runs]
+            )
+
+            # only the run whose job couldn't be created failed to launch
+            assert list(errors.keys()) == ["bad-run"]
+            assert "Failed to create job" in errors["bad-run"].message
+
+            for run in runs:
+                updated_run = instance.get_run_by_id(run.run_id)
+                assert updated_run.tags[DOCKER_IMAGE_TAG] == "fake_job_image"
+
+                created_messages = [
+                    event.message
+                    for event in instance.all_logs(run.run_id)
+                    if event.message == "Kubernetes run worker job created"
+                ]
+                assert len(created_messages) == (0 if run.run_id == "bad-run" else 1)
+
+        created_job_names = {
+            call[1]["body"].metadata.name
+            for call in mock_k8s_client_batch_api.create_namespaced_job.call_args_list
+        }
+        assert created_job_names == {
+            get_job_name_from_run_id(run_id) for run_id in ["run-1", "bad-run", "run-2", "run-3"]
+        }
+
+
 @pipeline
 def fake_pipeline():
     pass
@@ -0,0 +1,45 @@
+import time
+
+from kubernetes.client.models import V1Job, V1JobList, V1JobStatus, V1ListMeta, V1ObjectMeta
+
+
+def create_job(name, resource_version, failed=0, succeeded=0):
+    return V1Job(
+        metadata=V1ObjectMeta(name=name, resource_version=resource_version),
+        status=V1JobStatus(failed=failed, succeeded=succeeded),
+    )
+
+
+def create_job_list(jobs, resource_version):
+    return V1JobList(items=jobs, metadata=V1ListMeta(resource_version=resource_version))
+
+
+class FakeWatch:
+    """Streams the events that are put on its queue, until it is stopped or a None is put."""
+
+    def __init__(self, events):
+        self._events = events
+        self.stream_kwargs = []
+
+    def __call__(self):
+        return self
+
+    def stream(self, _func, **kwargs):
+        self.stream_kwargs.append(kwargs)
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+    def stop(self):
+        self._events.put(None)
+
+
+def wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition():
+        assert time.time() - start < timeout, "Timed out"
+        time.sleep(0.01)
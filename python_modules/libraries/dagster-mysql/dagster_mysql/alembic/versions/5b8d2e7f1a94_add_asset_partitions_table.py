@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: 5b8d2e7f1a94
+Revises: 9c2e5f4a81d3
+Create Date: 2022-02-16 14:03:27.518442
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "5b8d2e7f1a94"
+down_revision = "9c2e5f4a81d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
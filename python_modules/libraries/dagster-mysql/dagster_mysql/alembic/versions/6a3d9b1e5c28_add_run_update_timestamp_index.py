@@ -0,0 +1,22 @@
+"""add run update timestamp index
+
+Revision ID: 6a3d9b1e5c28
+Revises: 5b8d2e7f1a94
+Create Date: 2022-02-21 09:27:14.603118
+
+"""
+from dagster.core.storage.migration.utils import create_run_update_timestamp_index
+
+# revision identifiers, used by Alembic.
+revision = "6a3d9b1e5c28"
+down_revision = "5b8d2e7f1a94"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_update_timestamp_index()
+
+
+def downgrade():
+    pass
@@ -0,0 +1,48 @@
+"""add backfill id column
+
+Revision ID: 9c2e5f4a81d3
+Revises: f78059038d01
+Create Date: 2022-02-14 10:12:41.204551
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.engine import reflection
+
+# revision identifiers, used by Alembic.
+revision = "9c2e5f4a81d3"
+down_revision = "f78059038d01"
+branch_labels = None
+depends_on = None
+
+# pylint: disable=no-member
+
+
+def upgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+
+    if "runs" in has_tables:
+        columns = [x.get("name") for x in inspector.get_columns("runs")]
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+        with op.batch_alter_table("runs") as batch_op:
+            if "backfill_id" not in columns:
+                batch_op.add_column(sa.Column("backfill_id", sa.String(255)))
+            if "idx_run_backfill_id" not in indices:
+                batch_op.create_index("idx_run_backfill_id", ["backfill_id"], unique=False)
+
+
+def downgrade():
+    bind = op.get_context().bind
+    inspector = reflection.Inspector.from_engine(bind)
+    has_tables = inspector.get_table_names()
+    if "runs" in has_tables:
+        columns = [x.get("name") for x in inspector.get_columns("runs")]
+        indices = [x.get("name") for x in inspector.get_indexes("runs")]
+
+        with op.batch_alter_table("runs") as batch_op:
+            if "idx_run_backfill_id" in indices:
+                batch_op.drop_index("idx_run_backfill_id")
+            if "backfill_id" in columns:
+                batch_op.drop_column("backfill_id")
@@ -3,11 +3,12 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import (
     AssetKeyTable,
+    AssetPartitionsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlPollingEventWatcher,
 )
-from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS, ASSET_PARTITIONS
 from dagster.core.storage.sql import stamp_alembic_rev  # pylint: disable=unused-import
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade
 from dagster.serdes import ConfigurableClass, ConfigurableClassData, serialize_dagster_namedtuple
@@ -121,8 +122,9 @@ def create_clean_storage(conn_string):
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
-    def store_asset(self, event):
+    def store_asset(self, event, storage_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(storage_id, "storage_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -165,6 +167,27 @@ def store_asset(self, event):
                     )
                 )
 
+        if event.dagster_event.partition and self.has_secondary_index(ASSET_PARTITIONS):
+            self.store_asset_partition(event, storage_id)
+
+    def store_asset_partition(self, event, storage_id):
+        with self.index_connection() as conn:
+            conn.execute(
+                db.dialects.mysql.insert(AssetPartitionsTable)
+                .values(
+                    asset_key=event.dagster_event.asset_key.to_string(),
+                    partition=event.dagster_event.partition,
+                    materialization_count=1,
+                    last_storage_id=storage_id,
+                    last_run_id=event.run_id,
+                )
+                .on_duplicate_key_update(
+                    materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                    last_storage_id=storage_id,
+                    last_run_id=event.run_id,
+                )
+            )
+
     def _connect(self):
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -175,10 +198,12 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
+        # only built indexes are cached, since an index can be built by another process (e.g. by
+        # `dagster instance reindex`) while this storage is in use
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                MySQLEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(MySQLEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):
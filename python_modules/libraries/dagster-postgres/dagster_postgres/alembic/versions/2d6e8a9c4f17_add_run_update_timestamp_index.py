@@ -0,0 +1,22 @@
+"""add run update timestamp index
+
+Revision ID: 2d6e8a9c4f17
+Revises: 7f2b9c4d1e86
+Create Date: 2022-02-21 09:27:14.603118
+
+"""
+from dagster.core.storage.migration.utils import create_run_update_timestamp_index
+
+# revision identifiers, used by Alembic.
+revision = "2d6e8a9c4f17"
+down_revision = "7f2b9c4d1e86"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_run_update_timestamp_index()
+
+
+def downgrade():
+    pass
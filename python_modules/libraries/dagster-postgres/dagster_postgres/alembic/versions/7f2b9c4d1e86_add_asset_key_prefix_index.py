@@ -0,0 +1,22 @@
+"""add asset key prefix index
+
+Revision ID: 7f2b9c4d1e86
+Revises: e3c4b5d6f708
+Create Date: 2022-02-18 11:42:09.361205
+
+"""
+from dagster.core.storage.migration.utils import create_asset_key_prefix_index
+
+# revision identifiers, used by Alembic.
+revision = "7f2b9c4d1e86"
+down_revision = "e3c4b5d6f708"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_key_prefix_index()
+
+
+def downgrade():
+    pass
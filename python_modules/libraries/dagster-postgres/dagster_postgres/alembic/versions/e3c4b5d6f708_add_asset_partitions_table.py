@@ -0,0 +1,22 @@
+"""add asset partitions table
+
+Revision ID: e3c4b5d6f708
+Revises: b3f1d5e2a7c9
+Create Date: 2022-02-16 14:03:27.518442
+
+"""
+from dagster.core.storage.migration.utils import create_asset_partitions_table
+
+# revision identifiers, used by Alembic.
+revision = "e3c4b5d6f708"
+down_revision = "b3f1d5e2a7c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_asset_partitions_table()
+
+
+def downgrade():
+    pass
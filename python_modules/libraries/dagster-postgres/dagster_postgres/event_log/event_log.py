@@ -8,11 +8,12 @@
 from dagster.core.events.log import EventLogEntry
 from dagster.core.storage.event_log import (
     AssetKeyTable,
+    AssetPartitionsTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
-from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster.core.storage.event_log.migration import ASSET_KEY_INDEX_COLS, ASSET_PARTITIONS
 from dagster.core.storage.event_log.polling_event_watcher import CallbackAfterCursor
 from dagster.core.storage.sql import create_engine, run_alembic_upgrade, stamp_alembic_rev
 from dagster.serdes import (
@@ -158,10 +159,11 @@ def store_event(self, event):
             and event.dagster_event.is_step_materialization
             and event.dagster_event.asset_key
         ):
-            self.store_asset(event)
+            self.store_asset(event, res[1])
 
-    def store_asset(self, event):
+    def store_asset(self, event, storage_id=None):
         check.inst_param(event, "event", EventLogEntry)
+        check.opt_int_param(storage_id, "storage_id")
         if not event.is_dagster_event or not event.dagster_event.asset_key:
             return
 
@@ -212,6 +214,33 @@ def store_asset(self, event):
                     )
                 )
 
+        if event.dagster_event.partition and self.has_secondary_index(ASSET_PARTITIONS):
+            self.store_asset_partition(event, storage_id)
+
+    def store_asset_partition(self, event, storage_id):
+        with self.index_connection() as conn:
+            conn.execute(
+                db.dialects.postgresql.insert(AssetPartitionsTable)
+                .values(
+                    asset_key=event.dagster_event.asset_key.to_string(),
+                    partition=event.dagster_event.partition,
+                    materialization_count=1,
+                    last_storage_id=storage_id,
+                    last_run_id=event.run_id,
+                )
+                .on_conflict_do_update(
+                    index_elements=[
+                        AssetPartitionsTable.c.asset_key,
+                        AssetPartitionsTable.c.partition,
+                    ],
+                    set_=dict(
+                        materialization_count=AssetPartitionsTable.c.materialization_count + 1,
+                        last_storage_id=storage_id,
+                        last_run_id=event.run_id,
+                    ),
+                )
+            )
+
     def _connect(self):
         return create_pg_connection(self._engine, __file__, "event log")
 
@@ -222,10 +251,12 @@ def index_connection(self):
         return self._connect()
 
     def has_secondary_index(self, name):
+        # only built indexes are cached, since an index can be built by another process (e.g. by
+        # `dagster instance reindex`) while this storage is in use
         if name not in self._secondary_index_cache:
-            self._secondary_index_cache[name] = super(
-                PostgresEventLogStorage, self
-            ).has_secondary_index(name)
+            if not super(PostgresEventLogStorage, self).has_secondary_index(name):
+                return False
+            self._secondary_index_cache[name] = True
         return self._secondary_index_cache[name]
 
     def enable_secondary_index(self, name):